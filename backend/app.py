@@ -1,62 +1,145 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
-import lgpio
-import adafruit_dht
-import board
+import os
+import sys
 import time
 import threading
 
+# Permite importar os módulos compartilhados da raiz do projeto (libs/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from libs.hal import get_hal  # noqa: E402
+from libs.sensors.hub import SensorHub  # noqa: E402
+from libs.sensors.ldr import LdrSensor  # noqa: E402
+from libs.sensors.ultrasonic import UltrasonicSensor  # noqa: E402
+from app.history import HistoryStore  # noqa: E402
+from app.live_state import LiveState  # noqa: E402
+from app.telemetry import TelemetryWriter  # noqa: E402
+from utils.link_monitor import LinkMonitor  # noqa: E402
+from utils.ssh_sessions import SessionTracker  # noqa: E402
+from utils.wifi_connect import ConnectionManager  # noqa: E402
+from utils.wifi_profiles import get_profile_registry  # noqa: E402
+from utils.wifi_scanner import WifiScanner  # noqa: E402
+from utils.wifi_survey import SiteSurvey  # noqa: E402
+
 # --- Configurações de pinos ---
 LED_PIN = 18
 PUMP_RELAY_PIN = 6
 TRIGGER_PIN = 24
 ECHO_PIN = 25
 LDR_PIN = 21
-DHT_PIN = board.D12
+DHT_PIN = 12  # BCM (board.D12)
 READ_INTERVAL = 1.0
+LDR_BRIGHT_US = 500  # Tempo de carga com luz forte (calibração 100%)
+LDR_DARK_US = 300000  # Tempo de carga no escuro (calibração 0%)
+DHT_INTERVAL = 2.5  # DHT11 só aceita uma leitura a cada ~2 s
+ULTRASONIC_INTERVAL = 0.5
+ULTRASONIC_TIMEOUT = 0.03  # ~5 m ida e volta
+ULTRASONIC_BURST = 5  # Pings por medição (retorna a mediana)
+MAX_READING_AGE = 30  # Leituras mais antigas que isso são descartadas
 HUMIDITY_SETPOINT = 40
 
+# --- Telemetria (histórico em SQLite) ---
+DB_PATH = os.environ.get('HARVEST_DB', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'sensor_data.db'))
+TELEMETRY_BATCH_SIZE = 500
+TELEMETRY_FLUSH_INTERVAL = 5.0  # Segundos máximos de uma amostra na fila
+TELEMETRY_MAX_QUEUE = 10000
+
+# Métricas persistidas: sensor do hub -> {campo da leitura: nome da métrica}
+TELEMETRY_METRICS = {
+    'dht11': {'temperature': 'temperature', 'humidity': 'humidity'},
+    'ldr': {'light_pct': 'light'},
+    'ultrasonic': {'distance_cm': 'distance'},
+}
+HISTORY_METRICS = {metric for fields in TELEMETRY_METRICS.values()
+                   for metric in fields.values()}
+HISTORY_DEFAULT_RANGE = 3600  # Última hora quando 'from' não é informado
+HISTORY_DEFAULT_POINTS = 500
+HISTORY_MAX_POINTS = 5000
+
+# --- Stream de eventos (SSE) ---
+STREAM_HEARTBEAT = 15  # Comentário keep-alive quando não há mudanças
+STREAM_COALESCE = 0.25  # Janela mínima entre envios para um mesmo cliente
+SNAPSHOT_FIELDS = ('dht11', 'ldr', 'ultrasonic', 'led', 'pump')
+
+# --- Enlace Wi-Fi ---
+WIFI_INTERFACE = 'wlan0'
+LINK_RATE_HZ = 1.0
+LINK_WINDOW = 300  # Amostras guardadas (5 min a 1 Hz)
+
+
+# --- HAL: hardware real ou simulado (variável de ambiente HARVEST_HAL) ---
+hal = get_hal()
+gpio = hal.gpio
+print(f"[INFO] HAL: {hal.name}")
 
 # --- Inicialização do GPIO ---
-h = lgpio.gpiochip_open(0)
-lgpio.gpio_claim_output(h, LED_PIN)
-lgpio.gpio_claim_output(h, PUMP_RELAY_PIN)
-lgpio.gpio_write(h, PUMP_RELAY_PIN, 1)
-lgpio.gpio_claim_output(h, TRIGGER_PIN)
-lgpio.gpio_claim_input(h, ECHO_PIN)
-lgpio.gpio_claim_input(h, LDR_PIN)
+h = gpio.gpiochip_open(0)
+gpio.gpio_claim_output(h, LED_PIN)
+gpio.gpio_claim_output(h, PUMP_RELAY_PIN)
+gpio.gpio_write(h, PUMP_RELAY_PIN, 1)
 
-# --- Inicialização do DHT11 ---
-dht_sensor = adafruit_dht.DHT11(DHT_PIN)
+# --- Inicialização do LDR (RC timing por alerta de borda) ---
+ldr_sensor = LdrSensor(h, LDR_PIN, bright_us=LDR_BRIGHT_US,
+                       dark_us=LDR_DARK_US, gpio=gpio)
+
+# --- Inicialização do HC-SR04 (TRIGGER/ECHO ficam com o driver) ---
+ultrasonic = UltrasonicSensor(h, TRIGGER_PIN, ECHO_PIN,
+                              timeout=ULTRASONIC_TIMEOUT,
+                              burst=ULTRASONIC_BURST, gpio=gpio)
 
-# --- Variáveis globais ---
-latest_ldr_value = None
-stop_thread = False
+# --- Inicialização do DHT11 ---
+dht_sensor = hal.dht11(DHT_PIN)
 
 app = Flask(__name__)
 CORS(app)
 
 pump_last_off = 0
-pump_on = False
+pump_running = False
+
+# --- Estado ao vivo (alimenta o stream SSE) ---
+live_state = LiveState()
+
+
+def publish_led(level):
+    live_state.publish('led', {'status': 'on' if level else 'off'})
+
+
+def pump_state(level):
+    """Estado da bomba para o nível do relé (nível 1 = ligada, como nas escritas)."""
+    return 'on' if level else 'off'
+
+
+def publish_pump(level):
+    live_state.publish('pump', {'status': pump_state(level)})
+
+
+publish_led(gpio.gpio_read(h, LED_PIN))
+publish_pump(gpio.gpio_read(h, PUMP_RELAY_PIN))
 
 
 def bomba_auto_control():
-    global pump_on, pump_last_off
+    global pump_running, pump_last_off
     while True:
         try:
-            humid = dht_sensor.humidity
-            # Se leitura falhar, ignora este ciclo
-            if humid is None:
+            # Usa a última leitura do hub, sem acessar o sensor diretamente
+            dht = sensor_hub.value('dht11', max_age=MAX_READING_AGE)
+            # Se não há leitura recente, ignora este ciclo
+            if dht is None:
                 time.sleep(3)
                 continue
+            humid = dht['humidity']
             # Lógica: liga se abaixo do setpoint, desliga se acima
-            if humid < HUMIDITY_SETPOINT and not pump_on:
-                lgpio.gpio_write(h, PUMP_RELAY_PIN, 1)
-                pump_on = True
+            if humid < HUMIDITY_SETPOINT and not pump_running:
+                gpio.gpio_write(h, PUMP_RELAY_PIN, 1)
+                publish_pump(1)
+                pump_running = True
                 print(f"BOMBA: LIGADA (umidade={humid:.1f}%)")
-            elif humid >= HUMIDITY_SETPOINT and pump_on:
-                lgpio.gpio_write(h, PUMP_RELAY_PIN, 0)
-                pump_on = False
+            elif humid >= HUMIDITY_SETPOINT and pump_running:
+                gpio.gpio_write(h, PUMP_RELAY_PIN, 0)
+                publish_pump(0)
+                pump_running = False
                 pump_last_off = time.time()
                 print(f"BOMBA: DESLIGADA (umidade={humid:.1f}%)")
         except Exception as e:
@@ -64,130 +147,417 @@ def bomba_auto_control():
         time.sleep(3)  # Delay entre leituras
 
 
+# --- Funções de leitura física (executadas apenas pelo hub) ---
+def read_dht11():
+    temp = dht_sensor.temperature
+    humid = dht_sensor.humidity
+    if temp is None or humid is None:
+        raise RuntimeError("Leitura inválida")
+    return {'temperature': temp, 'humidity': humid}
+
+
+# --- Hub de aquisição: único dono dos sensores ---
+sensor_hub = SensorHub()
+sensor_hub.add_source('dht11', read_dht11, DHT_INTERVAL)
+sensor_hub.add_source('ldr', ldr_sensor.read, READ_INTERVAL)
+sensor_hub.add_source('ultrasonic', ultrasonic.measure, ULTRASONIC_INTERVAL)
+
+# --- Telemetria: o hub só enfileira, a gravação é feita em lote ---
+telemetry = TelemetryWriter(f"sqlite:///{DB_PATH}",
+                            batch_size=TELEMETRY_BATCH_SIZE,
+                            flush_interval=TELEMETRY_FLUSH_INTERVAL,
+                            max_queue=TELEMETRY_MAX_QUEUE)
+# Rollups de minuto/hora atualizados na mesma transação de cada lote
+history = HistoryStore(telemetry.engine)
+telemetry.add_batch_listener(history.update_rollups)
+
+
+def persist_reading(name, reading):
+    fields = TELEMETRY_METRICS.get(name)
+    if not fields:
+        return
+    value = reading.value
+    if hasattr(value, '_asdict'):
+        value = value._asdict()
+    for field, metric in fields.items():
+        telemetry.submit(metric, value[field], reading.timestamp)
+
+
+sensor_hub.subscribe(persist_reading)
+
+
+# --- Payloads públicos de cada sensor (rotas REST e stream) ---
+def dht11_payload(value):
+    return {'temperature': value['temperature'],
+            'humidity': value['humidity'],
+            'unit_temp': '°C', 'unit_humid': '%'}
+
+
+def ldr_payload(measurement):
+    # 'ldr' mantém a semântica antiga (maior = mais escuro), agora em us
+    return {'ldr': measurement.charge_us,
+            'charge_us': measurement.charge_us,
+            'light_pct': measurement.light_pct}
+
+
+def ultrasonic_payload(measurement):
+    return {'distance_cm': round(measurement.distance_cm, 2),
+            'quality': measurement.quality,
+            'valid': measurement.valid,
+            'samples': measurement.samples}
+
+
+SENSOR_PAYLOADS = {
+    'dht11': dht11_payload,
+    'ldr': ldr_payload,
+    'ultrasonic': ultrasonic_payload,
+}
+
+
+def publish_reading(name, reading):
+    payload_fn = SENSOR_PAYLOADS.get(name)
+    if payload_fn:
+        live_state.publish(name, payload_fn(reading.value), reading.timestamp)
+
+
+sensor_hub.subscribe(publish_reading)
+
 t_bomba = threading.Thread(target=bomba_auto_control, daemon=True)
 t_bomba.start()
 
-# --- Função de leitura simples de LDR (RC timing) ---
+# --- Sessões SSH (utmp observado com inotify) ---
+ssh_sessions = SessionTracker()
 
+# --- Qualidade do enlace Wi-Fi (amostragem contínua) ---
+link_monitor = LinkMonitor(WIFI_INTERFACE, rate_hz=LINK_RATE_HZ,
+                           size=LINK_WINDOW)
 
-def read_ldr():
-    lgpio.gpio_claim_output(h, LDR_PIN)
-    lgpio.gpio_write(h, LDR_PIN, 0)
-    time.sleep(0.1)
-    lgpio.gpio_claim_input(h, LDR_PIN)
-    count = 0
-    while lgpio.gpio_read(h, LDR_PIN) == 0 and count < 100000:
-        count += 1
-    return count
+# --- Perfis Wi-Fi salvos (relidos só quando o NetworkManager avisa) ---
+wifi_profiles = get_profile_registry()
 
+# --- Conexões Wi-Fi (jobs em segundo plano, consultados por polling) ---
+wifi_connections = ConnectionManager(profiles=wifi_profiles)
 
-# --- Thread para leitura contínua do LDR ---
-def ldr_background_task():
-    global latest_ldr_value, stop_thread
-    print("[INFO] Thread LDR iniciada.")
-    while not stop_thread:
-        try:
-            latest_ldr_value = read_ldr()
-            print(f"[LDR] {latest_ldr_value}")
-        except Exception as e:
-            print(f"[ERRO] Falha LDR: {e}")
-        time.sleep(READ_INTERVAL)
-    print("[INFO] Thread LDR encerrada.")
+# --- Site survey (o scanner só escaneia enquanto o survey está ligado) ---
+survey_scanner = WifiScanner()
+wifi_survey = SiteSurvey(survey_scanner)
 
 
 # --- Rotas da API ---
 @app.route('/api/led/on', methods=['POST'])
 def led_on():
-    lgpio.gpio_write(h, LED_PIN, 1)
+    gpio.gpio_write(h, LED_PIN, 1)
+    publish_led(1)
     return jsonify({'status': 'on'})
 
 
 @app.route('/api/led/off', methods=['POST'])
 def led_off():
-    lgpio.gpio_write(h, LED_PIN, 0)
+    gpio.gpio_write(h, LED_PIN, 0)
+    publish_led(0)
     return jsonify({'status': 'off'})
 
 
 @app.route('/api/led/status', methods=['GET'])
 def led_status():
-    state = lgpio.gpio_read(h, LED_PIN)
+    state = gpio.gpio_read(h, LED_PIN)
     return jsonify({'status': 'on' if state else 'off'})
 
 
 @app.route('/api/pump/on', methods=['POST'])
 def pump_on():
     """Liga a bomba de irrigação"""
-    lgpio.gpio_write(h, PUMP_RELAY_PIN, 1)  # LOW = LIGA relé
+    gpio.gpio_write(h, PUMP_RELAY_PIN, 1)  # Nível 1 = LIGA relé
+    publish_pump(1)
     return jsonify({'status': 'on'})
 
 
 @app.route('/api/pump/off', methods=['POST'])
 def pump_off():
     """Desliga a bomba de irrigação"""
-    lgpio.gpio_write(h, PUMP_RELAY_PIN, 0)  # HIGH = DESLIGA relé
+    gpio.gpio_write(h, PUMP_RELAY_PIN, 0)  # Nível 0 = DESLIGA relé
+    publish_pump(0)
     return jsonify({'status': 'off'})
 
 
 @app.route('/api/pump/status', methods=['GET'])
 def pump_status():
     """Retorna o estado atual da bomba"""
-    state = lgpio.gpio_read(h, PUMP_RELAY_PIN)
-    # Se ativo-baixo: 0=on, 1=off
-    return jsonify({'status': 'off' if state else 'on'})
+    # Mesmo mapeamento do stream e do /api/snapshot
+    return jsonify({'status': pump_state(gpio.gpio_read(h, PUMP_RELAY_PIN))})
 
 
 @app.route('/api/ldr', methods=['GET'])
 def get_ldr_value():
-    return jsonify({'ldr': latest_ldr_value})
+    reading = sensor_hub.get('ldr')
+    if reading is None:
+        return jsonify({'ldr': None, 'status': 'aguardando leitura'})
+    if sensor_hub.age('ldr') > MAX_READING_AGE:
+        return jsonify({'ldr': None, 'status': 'leitura desatualizada',
+                        'error': 'Leitura desatualizada'}), 503
+    return jsonify({**ldr_payload(reading.value),
+                    'timestamp': reading.timestamp})
 
 
 @app.route('/api/ultrasonic', methods=['GET'])
 def get_distance():
-    try:
-        lgpio.gpio_write(h, TRIGGER_PIN, 1)
-        time.sleep(0.00001)
-        lgpio.gpio_write(h, TRIGGER_PIN, 0)
-
-        while lgpio.gpio_read(h, ECHO_PIN) == 0:
-            pulse_start = time.time()
-        while lgpio.gpio_read(h, ECHO_PIN) == 1:
-            pulse_end = time.time()
-
-        pulse_duration = pulse_end - pulse_start
-        distance = pulse_duration * 34300 / 2
-        return jsonify({'distance_cm': round(distance, 2)})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    reading = sensor_hub.get('ultrasonic')
+    if reading is None:
+        return jsonify({'error': 'Aguardando leitura'}), 503
+    if sensor_hub.age('ultrasonic') > MAX_READING_AGE:
+        return jsonify({'error': 'Leitura desatualizada'}), 503
+    return jsonify({**ultrasonic_payload(reading.value),
+                    'timestamp': reading.timestamp})
 
 
 @app.route('/api/sensor/dht11', methods=['GET'])
 def dht11_api():
+    reading = sensor_hub.get('dht11')
+    if reading is None:
+        return jsonify({"success": False, "error": "Aguardando leitura"}), 503
+    if sensor_hub.age('dht11') > MAX_READING_AGE:
+        return jsonify({"success": False, "error": "Leitura desatualizada"}), 503
+    return jsonify({"success": True, **dht11_payload(reading.value),
+                    "timestamp": reading.timestamp})
+
+
+@app.route('/api/stream', methods=['GET'])
+def stream():
+    """
+    Stream SSE com as mudanças de sensores e atuadores.
+
+    Parâmetro opcional: topics (ex: ?topics=dht11,led). Cada evento tem
+    'event' = tópico, 'id' = versão do estado e 'data' = payload JSON.
+    """
+    topics = request.args.get('topics')
+    topics = {t.strip() for t in topics.split(',') if t.strip()} if topics else None
+    sub = live_state.subscribe(topics)
+
+    def format_event(topic, version, data):
+        return f"id: {version}\nevent: {topic}\ndata: {data}\n\n"
+
+    def events():
+        try:
+            yield f"retry: {STREAM_HEARTBEAT * 1000}\n\n"
+            # Estado atual primeiro, depois só mudanças
+            for topic, (version, data) in live_state.events(topics).items():
+                yield format_event(topic, version, data)
+            while True:
+                changes = sub.wait(STREAM_HEARTBEAT)
+                if not changes:
+                    yield ": keep-alive\n\n"
+                    continue
+                for topic, (version, data) in changes.items():
+                    yield format_event(topic, version, data)
+                # Mudanças que chegarem nessa janela saem juntas no próximo envio
+                time.sleep(STREAM_COALESCE)
+        finally:
+            live_state.unsubscribe(sub)
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+
+@app.route('/api/snapshot', methods=['GET'])
+def snapshot():
+    """
+    Estado atual de sensores e atuadores em um único documento.
+
+    O ETag muda junto com a versão do estado; com If-None-Match igual a
+    resposta é 304 sem corpo (nada é serializado). Parâmetro opcional:
+    fields (ex: ?fields=dht11,led).
+    """
+    etag = live_state.etag
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    fields = request.args.get('fields')
+    fields = {f.strip() for f in fields.split(',') if f.strip()} if fields else None
+    unknown = fields - set(SNAPSHOT_FIELDS) if fields else None
+    if unknown:
+        return jsonify({'error': f"Campos desconhecidos: {', '.join(sorted(unknown))}"}), 400
+
+    try:
+        etag, body = live_state.snapshot(fields)
+    except KeyError as e:
+        return jsonify({'error': f'Aguardando leitura: {e.args[0]}'}), 503
+
+    response = Response(body, mimetype='application/json',
+                        headers={'Cache-Control': 'no-cache'})
+    response.set_etag(etag)
+    return response
+
+
+@app.route('/api/sensors/stats', methods=['GET'])
+def sensors_stats():
+    """Contadores de leituras físicas e falhas por sensor"""
+    return jsonify(sensor_hub.stats())
+
+
+@app.route('/api/history/<metric>', methods=['GET'])
+def history_api(metric):
+    """
+    Histórico reduzido de uma métrica.
+
+    Parâmetros: from, to (segundos desde a epoch), max_points e
+    mode ('minmax' ou 'lttb').
+    """
+    if metric not in HISTORY_METRICS:
+        return jsonify({'error': f'Métrica desconhecida: {metric}'}), 404
+
+    # 0 é um instante válido: só o parâmetro ausente usa o padrão
+    end = request.args.get('to', type=float)
+    if end is None:
+        end = time.time()
+    start = request.args.get('from', type=float)
+    if start is None:
+        start = end - HISTORY_DEFAULT_RANGE
+    max_points = request.args.get('max_points', HISTORY_DEFAULT_POINTS, type=int)
+    mode = request.args.get('mode', 'minmax')
+
     try:
-        temp = dht_sensor.temperature
-        humid = dht_sensor.humidity
-        if temp is not None and humid is not None:
-            return jsonify({
-                "success": True,
-                "temperature": temp,
-                "humidity": humid,
-                "unit_temp": "°C",
-                "unit_humid": "%"
-            })
-        else:
-            return jsonify({"success": False, "error": "Leitura inválida"}), 500
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        result = history.query(metric, start, end,
+                               min(max_points, HISTORY_MAX_POINTS), mode)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    result.update({'metric': metric, 'from': start, 'to': end, 'mode': mode})
+    return jsonify(result)
+
+
+@app.route('/api/ssh/sessions', methods=['GET'])
+def ssh_sessions_api():
+    """Sessões SSH abertas: usuário, terminal, IP de origem e login (epoch)"""
+    sessions = ssh_sessions.details()
+    return jsonify({'count': len(sessions), 'sessions': sessions})
+
+
+@app.route('/api/wifi/link', methods=['GET'])
+def wifi_link():
+    """
+    Qualidade do enlace Wi-Fi: último valor, média suavizada e percentis
+    (p10/p50/p90) de sinal, ruído e taxa. Parâmetro opcional: history=N
+    inclui as N amostras mais recentes.
+    """
+    limit = request.args.get('history', type=int)
+    if limit is not None and limit < 1:
+        return jsonify({'error': 'history deve ser >= 1'}), 400
+    result = link_monitor.summary()
+    if limit:
+        result['history'] = link_monitor.history(min(limit, LINK_WINDOW))
+    return jsonify(result)
+
+
+@app.route('/api/wifi/profiles', methods=['GET'])
+def wifi_profiles_api():
+    """Perfis Wi-Fi salvos: nome, SSID, UUID, prioridade e último uso (epoch)"""
+    profiles = wifi_profiles.details()
+    return jsonify({'count': len(profiles), 'profiles': profiles})
+
+
+@app.route('/api/wifi/connect', methods=['POST'])
+def wifi_connect():
+    """
+    Começa a conectar a uma rede e retorna o job sem esperar (202).
+    Corpo JSON: {"ssid": ..., "password": ...} (senha só para redes novas).
+    Acompanhe com GET /api/wifi/connect/<id>.
+    """
+    body = request.get_json(silent=True) or {}
+    ssid = body.get('ssid')
+    if not ssid:
+        return jsonify({'error': 'Campo obrigatório: ssid'}), 400
+    job = wifi_connections.start(ssid, body.get('password') or None)
+    return jsonify(job.to_dict()), 202
+
+
+@app.route('/api/wifi/connect/<int:job_id>', methods=['GET'])
+def wifi_connect_status(job_id):
+    """Fase atual, tempo por fase e resultado de um job de conexão"""
+    job = wifi_connections.job(job_id)
+    if job is None:
+        return jsonify({'error': f'Job desconhecido: {job_id}'}), 404
+    return jsonify(job.to_dict())
+
+
+@app.route('/api/wifi/connect/<int:job_id>', methods=['DELETE'])
+def wifi_connect_cancel(job_id):
+    """Cancela um job de conexão em andamento"""
+    job = wifi_connections.job(job_id)
+    if job is None:
+        return jsonify({'error': f'Job desconhecido: {job_id}'}), 404
+    wifi_connections.cancel(job_id)
+    return jsonify(job.to_dict())
+
+
+@app.route('/api/wifi/survey', methods=['POST'])
+def wifi_survey_start():
+    """
+    Liga o site survey (scans contínuos). Corpo JSON opcional:
+    {"reset": false} continua o survey anterior em vez de zerar.
+    """
+    body = request.get_json(silent=True) or {}
+    wifi_survey.start(reset=body.get('reset', True))
+    return jsonify(wifi_survey.summary())
+
+
+@app.route('/api/wifi/survey', methods=['DELETE'])
+def wifi_survey_stop():
+    """Para o site survey (as estatísticas continuam disponíveis)"""
+    wifi_survey.stop()
+    return jsonify(wifi_survey.summary())
+
+
+@app.route('/api/wifi/survey', methods=['GET'])
+def wifi_survey_results():
+    """
+    Resultado do survey: resumo, congestionamento por canal e sinal
+    (%, min/média/máx/desvio) por BSSID. Parâmetro opcional: limit=N.
+    """
+    limit = request.args.get('limit', type=int)
+    if limit is not None and limit < 1:
+        return jsonify({'error': 'limit deve ser >= 1'}), 400
+    result = wifi_survey.summary()
+    result['channels'] = wifi_survey.channels()
+    result['access_points'] = wifi_survey.rows(limit)
+    return jsonify(result)
+
+
+@app.route('/api/wifi/survey.csv', methods=['GET'])
+def wifi_survey_csv():
+    """Estatísticas por BSSID em CSV (uma linha por BSSID)"""
+    return Response(wifi_survey.to_csv(), mimetype='text/csv', headers={
+        'Content-Disposition': 'attachment; filename=wifi_survey.csv'})
+
+
+@app.route('/api/telemetry/stats', methods=['GET'])
+def telemetry_stats():
+    """Contadores da fila de telemetria e das gravações em lote"""
+    return jsonify(telemetry.stats())
 
 
 # --- Execução principal ---
 if __name__ == '__main__':
     try:
-        ldr_thread = threading.Thread(target=ldr_background_task, daemon=True)
-        ldr_thread.start()
+        telemetry.start()
+        sensor_hub.start()
+        ssh_sessions.start()
+        link_monitor.start()
+        print("[INFO] Hub de sensores e telemetria iniciados.")
         app.run(host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         print("\n[INFO] Interrompido pelo usuário.")
     finally:
-        stop_thread = True
-        lgpio.gpiochip_close(h)
+        ssh_sessions.stop()
+        link_monitor.stop()
+        wifi_survey.stop()
+        survey_scanner.stop()
+        sensor_hub.stop()
+        telemetry.stop()
+        ultrasonic.close()
+        ldr_sensor.close()
+        gpio.gpiochip_close(h)
         print("[INFO] GPIO fechado. Encerrando.")
@@ -0,0 +1,271 @@
+"""
+Consultas de histórico com downsampling feito no servidor.
+
+A cada lote gravado pelo TelemetryWriter, as amostras são agregadas em
+rollups de minuto e de hora (count/sum/min/max) na mesma transação. As
+consultas escolhem a fonte mais grossa que ainda atende à largura de bucket
+pedida, então a quantidade de linhas lidas depende de max_points e não do
+tamanho do intervalo.
+"""
+
+import math
+import time
+
+from sqlalchemy import Integer, cast, func, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.models.sensor_reading import SensorReading
+from app.models.sensor_rollup import SensorRollup
+
+
+MINUTE = 60
+HOUR = 3600
+RESOLUTIONS = (MINUTE, HOUR)
+
+MODE_MINMAX = 'minmax'  # min/max/média por bucket
+MODE_LTTB = 'lttb'  # Largest-Triangle-Three-Buckets sobre a média
+LTTB_OVERSAMPLE = 4  # Buckets intermediários por ponto final no modo LTTB
+
+
+def aggregate_rows(rows, resolutions=RESOLUTIONS):
+    """
+    Agrega um lote de amostras nos buckets de cada resolução.
+
+    Args:
+        rows: Lista de dicts {'metric', 'value', 'timestamp'}
+
+    Retorna:
+        list: Dicts no formato da tabela de rollups
+    """
+    acc = {}
+    for row in rows:
+        value = row['value']
+        for resolution in resolutions:
+            bucket = int(row['timestamp'] // resolution) * resolution
+            key = (row['metric'], resolution, bucket)
+            agg = acc.get(key)
+            if agg is None:
+                acc[key] = [1, value, value, value]
+            else:
+                agg[0] += 1
+                agg[1] += value
+                if value < agg[2]:
+                    agg[2] = value
+                if value > agg[3]:
+                    agg[3] = value
+
+    return [
+        {'metric': metric, 'resolution': resolution, 'bucket': bucket,
+         'count': agg[0], 'sum': agg[1], 'min': agg[2], 'max': agg[3]}
+        for (metric, resolution, bucket), agg in acc.items()
+    ]
+
+
+def lttb(points, threshold):
+    """
+    Downsampling visual Largest-Triangle-Three-Buckets.
+
+    Mantém o primeiro e o último ponto e, em cada bucket intermediário, o
+    ponto que forma o maior triângulo com o ponto escolhido anterior e a
+    média do bucket seguinte. Preserva picos que a média apagaria.
+
+    Args:
+        points: Lista de tuplas (t, valor) ordenada por t
+        threshold: Quantidade de pontos desejada
+
+    Retorna:
+        list: Subconjunto de points com até threshold pontos
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Média do próximo bucket
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_len = avg_end - avg_start
+        avg_t = sum(p[0] for p in points[avg_start:avg_end]) / avg_len
+        avg_v = sum(p[1] for p in points[avg_start:avg_end]) / avg_len
+
+        # Ponto do bucket atual com maior área
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        at, av = points[a]
+        max_area = -1
+        next_a = range_start
+        for j in range(range_start, range_end):
+            t, v = points[j]
+            area = abs((at - avg_t) * (v - av) - (at - t) * (avg_v - av))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        sampled.append(points[next_a])
+        a = next_a
+
+    sampled.append(points[-1])
+    return sampled
+
+
+class HistoryStore:
+    """
+    Mantém os rollups incrementais e responde consultas de histórico.
+
+    Uso:
+        history = HistoryStore(writer.engine)
+        writer.add_batch_listener(history.update_rollups)
+        history.query('humidity', start, end, max_points=500)
+    """
+
+    def __init__(self, engine):
+        """
+        Cria a tabela de rollups (se necessário) e agrega amostras antigas.
+
+        Args:
+            engine: Engine do SQLAlchemy do banco de telemetria
+        """
+        self.engine = engine
+        self.readings = SensorReading.__table__
+        self.rollups = SensorRollup.__table__
+        self.rollups.create(engine, checkfirst=True)
+        self._upsert = self._build_upsert()
+        self._backfill()
+
+    def _build_upsert(self):
+        stmt = sqlite_insert(self.rollups)
+        excluded = stmt.excluded
+        c = self.rollups.c
+        return stmt.on_conflict_do_update(
+            index_elements=[c.metric, c.resolution, c.bucket],
+            set_={
+                'count': c.count + excluded.count,
+                'sum': c.sum + excluded.sum,
+                # min()/max() com 2 argumentos são funções escalares no SQLite
+                'min': func.min(c.min, excluded.min),
+                'max': func.max(c.max, excluded.max),
+            }
+        )
+
+    def update_rollups(self, conn, rows):
+        """
+        Atualiza os rollups com um lote recém-gravado.
+
+        Feito para ser registrado com TelemetryWriter.add_batch_listener:
+        roda na mesma transação do lote, então amostras e rollups ficam
+        sempre consistentes.
+        """
+        aggregated = aggregate_rows(rows)
+        if aggregated:
+            conn.execute(self._upsert, aggregated)
+
+    def _backfill(self):
+        """Gera rollups para amostras gravadas antes da tabela existir."""
+        r = self.readings.c
+        with self.engine.begin() as conn:
+            if conn.execute(select(self.rollups.c.bucket).limit(1)).first():
+                return
+            if not conn.execute(select(r.id).limit(1)).first():
+                return
+            print("[INFO] Gerando rollups do histórico existente...")
+            for resolution in RESOLUTIONS:
+                bucket = cast(r.timestamp / resolution, Integer) * resolution
+                conn.execute(self.rollups.insert().from_select(
+                    ['metric', 'resolution', 'bucket',
+                     'count', 'sum', 'min', 'max'],
+                    select(r.metric, literal(resolution), bucket,
+                           func.count(), func.sum(r.value),
+                           func.min(r.value), func.max(r.value))
+                    .group_by(r.metric, bucket)
+                ))
+
+    @staticmethod
+    def pick_source(bucket_width):
+        """
+        Escolhe a fonte mais grossa que não é maior que o bucket pedido.
+
+        Retorna:
+            int: Resolução do rollup em segundos, ou 0 para amostras brutas
+        """
+        for resolution in sorted(RESOLUTIONS, reverse=True):
+            if bucket_width >= resolution:
+                return resolution
+        return 0
+
+    def _bucketed(self, metric, start, end, width, source):
+        """Agrupa a fonte escolhida em buckets de largura width."""
+        if source:
+            c = self.rollups.c
+            t = c.bucket
+            columns = (func.sum(c.count), func.sum(c.sum),
+                       func.min(c.min), func.max(c.max))
+            # Inclui o bucket do rollup que contém o início do intervalo
+            where = (c.metric == metric, c.resolution == source,
+                     t >= int(start // source) * source, t < end)
+        else:
+            c = self.readings.c
+            t = c.timestamp
+            columns = (func.count(), func.sum(c.value),
+                       func.min(c.value), func.max(c.value))
+            where = (c.metric == metric, t >= start, t < end)
+
+        idx = cast((t - start) / width, Integer).label('idx')
+        stmt = select(idx, *columns).where(*where).group_by(idx).order_by(idx)
+
+        with self.engine.connect() as conn:
+            return [
+                {'t': start + i * width, 'count': count,
+                 'avg': total / count, 'min': vmin, 'max': vmax}
+                for i, count, total, vmin, vmax in conn.execute(stmt)
+            ]
+
+    def query(self, metric, start, end, max_points=500, mode=MODE_MINMAX):
+        """
+        Consulta o histórico de uma métrica já reduzido a max_points.
+
+        Args:
+            metric: Nome da métrica (ex: 'humidity')
+            start, end: Intervalo em segundos desde a epoch
+            max_points: Quantidade máxima de pontos na resposta
+            mode: MODE_MINMAX (min/max/avg por bucket) ou MODE_LTTB
+
+        Retorna:
+            dict: {'source', 'bucket_s', 'points', 'query_ms'}
+
+        Levanta:
+            ValueError: parâmetros inválidos
+        """
+        if not (math.isfinite(start) and math.isfinite(end)):
+            raise ValueError("'from' e 'to' devem ser números finitos")
+        if end <= start:
+            raise ValueError("'to' deve ser maior que 'from'")
+        if max_points < 1:
+            raise ValueError("'max_points' deve ser positivo")
+        if mode not in (MODE_MINMAX, MODE_LTTB):
+            raise ValueError(f"Modo inválido: {mode}")
+
+        began = time.perf_counter()
+        span = end - start
+        if mode == MODE_LTTB:
+            width = span / (max_points * LTTB_OVERSAMPLE)
+        else:
+            width = span / max_points
+        source = self.pick_source(width)
+        buckets = self._bucketed(metric, start, end, width, source)
+
+        if mode == MODE_LTTB:
+            series = [(b['t'] + width / 2, b['avg']) for b in buckets]
+            points = [{'t': t, 'value': v} for t, v in lttb(series, max_points)]
+        else:
+            points = buckets
+
+        return {
+            'source': {0: 'raw', MINUTE: 'minute', HOUR: 'hour'}[source],
+            'bucket_s': width,
+            'points': points,
+            'query_ms': round((time.perf_counter() - began) * 1000, 2),
+        }
@@ -0,0 +1,184 @@
+"""
+Estado ao vivo de sensores e atuadores, versionado e com notificação.
+
+Cada tópico ('dht11', 'led', ...) guarda o último payload já serializado em
+JSON. Uma publicação só conta como mudança se o payload for diferente do
+anterior; nesse caso a versão global é incrementada e os assinantes são
+avisados. Cada assinante guarda apenas o último evento de cada tópico, então
+rajadas de mudanças são coalescidas em um único envio.
+
+O snapshot agregado é montado concatenando os JSONs já serializados de cada
+tópico e fica em cache até a próxima mudança de versão.
+"""
+
+import json
+import os
+import threading
+
+
+class Subscription:
+    """
+    Fila coalescente de um cliente (ex: uma conexão SSE).
+    """
+
+    def __init__(self, topics=None):
+        """
+        Args:
+            topics: Conjunto de tópicos de interesse (None = todos)
+        """
+        self.topics = set(topics) if topics else None
+        self._pending = {}
+        self._cond = threading.Condition()
+
+    def wants(self, topic):
+        """Indica se o tópico passa pelo filtro do cliente."""
+        return self.topics is None or topic in self.topics
+
+    def push(self, topic, event):
+        """Substitui o evento pendente do tópico (coalescência)."""
+        if not self.wants(topic):
+            return
+        with self._cond:
+            self._pending[topic] = event
+            self._cond.notify()
+
+    def wait(self, timeout=None):
+        """
+        Espera por mudanças e retira todas as pendentes.
+
+        Retorna:
+            dict: {tópico: (versão, json)}; vazio se estourou o timeout
+        """
+        with self._cond:
+            if not self._pending:
+                self._cond.wait(timeout)
+            pending, self._pending = self._pending, {}
+            return pending
+
+
+class LiveState:
+    """
+    Último estado conhecido de cada tópico, com contador de versão.
+
+    Uso:
+        state = LiveState()
+        state.publish('led', {'status': 'on'})
+        sub = state.subscribe({'led'})
+        changes = sub.wait(15)
+    """
+
+    def __init__(self):
+        """Inicializa sem tópicos publicados."""
+        self.version = 0
+        # Distingue versões de execuções diferentes (o contador volta a 0)
+        self.instance = os.urandom(4).hex()
+        self._topics = {}  # tópico -> (payload, timestamp, versão, json)
+        self._subscribers = set()
+        self._snapshots = {}  # tópicos projetados -> corpo JSON
+        self._lock = threading.Lock()
+
+    def publish(self, topic, payload, timestamp=None):
+        """
+        Publica o estado atual de um tópico.
+
+        Args:
+            topic: Nome do tópico
+            payload: dict serializável em JSON (sem o timestamp)
+            timestamp: Momento da leitura; acompanha o evento mas não conta
+                       como mudança
+
+        Retorna:
+            bool: True se o payload mudou (versão incrementada)
+        """
+        with self._lock:
+            current = self._topics.get(topic)
+            if current is not None and current[0] == payload:
+                return False
+
+            self.version += 1
+            data = dict(payload)
+            if timestamp is not None:
+                data['timestamp'] = timestamp
+            encoded = json.dumps(data)
+            self._topics[topic] = (payload, timestamp, self.version, encoded)
+            self._snapshots.clear()
+            event = (self.version, encoded)
+            subscribers = list(self._subscribers)
+
+        for sub in subscribers:
+            sub.push(topic, event)
+        return True
+
+    def get(self, topic):
+        """
+        Retorna o último payload de um tópico.
+
+        Retorna:
+            tuple: (payload, timestamp) ou None se nunca foi publicado
+        """
+        current = self._topics.get(topic)
+        if current is None:
+            return None
+        return current[0], current[1]
+
+    def events(self, topics=None):
+        """
+        Estado atual como eventos já serializados.
+
+        Retorna:
+            dict: {tópico: (versão, json)}
+        """
+        with self._lock:
+            return {
+                topic: (version, encoded)
+                for topic, (_, _, version, encoded) in self._topics.items()
+                if topics is None or topic in topics
+            }
+
+    @property
+    def etag(self):
+        """ETag (sem aspas) do estado atual; muda a cada publicação que altera algo."""
+        return f'{self.instance}-{self.version}'
+
+    def snapshot(self, topics=None):
+        """
+        Estado atual de todos os tópicos em um único documento JSON.
+
+        Args:
+            topics: Projeção opcional (iterável de nomes de tópicos)
+
+        Retorna:
+            tuple: (etag sem aspas, corpo JSON em bytes)
+
+        Levanta:
+            KeyError: tópico pedido nunca foi publicado
+        """
+        key = tuple(sorted(set(topics))) if topics else None
+        with self._lock:
+            body = self._snapshots.get(key)
+            if body is None:
+                names = key if key is not None else sorted(self._topics)
+                missing = [t for t in names if t not in self._topics]
+                if missing:
+                    raise KeyError(', '.join(missing))
+                parts = [f'"version": {self.version}']
+                parts += [f'{json.dumps(t)}: {self._topics[t][3]}' for t in names]
+                body = ('{' + ', '.join(parts) + '}').encode()
+                self._snapshots[key] = body
+            return self.etag, body
+
+    def subscribe(self, topics=None):
+        """Cria uma assinatura (opcionalmente filtrada por tópicos)."""
+        sub = Subscription(topics)
+        with self._lock:
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """Remove uma assinatura."""
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
@@ -1,18 +1,26 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from app import db
 
 class SensorReading(db.Model):
+    """
+    Amostra de série temporal: uma métrica (ex: 'temperature') por linha.
+    O timestamp é guardado em segundos desde a epoch (REAL), que ocupa menos
+    espaço que texto ISO e permite consultas por faixa direto no índice.
+    """
+    __table_args__ = (
+        db.Index('ix_sensor_reading_metric_ts', 'metric', 'timestamp'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
-    temperature = db.Column(db.Float, nullable=False)
-    humidity = db.Column(db.Float, nullable=False)
-    pressure = db.Column(db.Float, nullable=False)
-    timestamp = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    metric = db.Column(db.String(32), nullable=False)
+    value = db.Column(db.Float, nullable=False)
+    timestamp = db.Column(db.Float, nullable=False)
 
     def to_dict(self):
         return {
             'id': self.id,
-            'temperature': self.temperature,
-            'humidity': self.humidity,
-            'pressure': self.pressure,
-            'timestamp': self.timestamp.isoformat()
-        }
\ No newline at end of file
+            'metric': self.metric,
+            'value': self.value,
+            'timestamp': datetime.fromtimestamp(
+                self.timestamp, timezone.utc).isoformat()
+        }
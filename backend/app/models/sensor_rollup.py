@@ -0,0 +1,28 @@
+from app import db
+
+class SensorRollup(db.Model):
+    """
+    Agregado de uma métrica em um intervalo fixo (bucket).
+
+    resolution é a largura do bucket em segundos (60 = minuto, 3600 = hora)
+    e bucket é o início do intervalo em segundos desde a epoch. Os campos
+    count/sum/min/max permitem combinar buckets sem voltar às amostras.
+    """
+    metric = db.Column(db.String(32), primary_key=True)
+    resolution = db.Column(db.Integer, primary_key=True)
+    bucket = db.Column(db.Integer, primary_key=True)
+    count = db.Column(db.Integer, nullable=False)
+    sum = db.Column(db.Float, nullable=False)
+    min = db.Column(db.Float, nullable=False)
+    max = db.Column(db.Float, nullable=False)
+
+    def to_dict(self):
+        return {
+            'metric': self.metric,
+            'resolution': self.resolution,
+            'bucket': self.bucket,
+            'count': self.count,
+            'avg': self.sum / self.count,
+            'min': self.min,
+            'max': self.max
+        }
@@ -0,0 +1,213 @@
+"""
+Gravação de telemetria em SQLite com commits em lote.
+
+As amostras entram em uma fila em memória (O(1), sem I/O) e uma thread
+dedicada grava tudo em uma única transação por lote. Isso mantém o disco
+fora do caminho das requisições e da amostragem dos sensores, e reduz a
+quantidade de escritas no cartão SD: o banco usa WAL com synchronous=NORMAL,
+então cada lote custa um append no WAL em vez de reescrever páginas do banco
+a cada amostra.
+"""
+
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import create_engine, event
+
+from app.models.sensor_reading import SensorReading
+
+
+# Políticas quando a fila está cheia
+DROP_OLDEST = 'drop_oldest'  # Descarta a amostra mais antiga (padrão)
+DROP_NEWEST = 'drop_newest'  # Descarta a amostra que está chegando
+BLOCK = 'block'  # Bloqueia o produtor até haver espaço (com timeout)
+
+
+def enable_sqlite_wal(engine, autocheckpoint=1000):
+    """
+    Configura cada conexão SQLite do engine para WAL.
+
+    Args:
+        engine: Engine do SQLAlchemy
+        autocheckpoint: Páginas no WAL antes de um checkpoint automático.
+                        Valores maiores agrupam mais escritas no banco.
+    """
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA wal_autocheckpoint={int(autocheckpoint)}')
+        cursor.close()
+
+
+class TelemetryWriter:
+    """
+    Fila limitada de amostras + thread que grava em lote no SQLite.
+
+    Uso:
+        writer = TelemetryWriter('sqlite:///sensor_data.db')
+        writer.start()
+        writer.submit('temperature', 24.0)
+        writer.stop()  # grava o que restou na fila
+    """
+
+    def __init__(self, db_url, batch_size=500, flush_interval=5.0,
+                 max_queue=10000, policy=DROP_OLDEST, block_timeout=1.0):
+        """
+        Args:
+            db_url: URL do banco (ex: 'sqlite:////home/pi/sensor_data.db')
+            batch_size: Grava assim que a fila atingir este tamanho
+            flush_interval: Tempo máximo (s) que uma amostra espera na fila
+            max_queue: Capacidade máxima da fila em memória
+            policy: DROP_OLDEST, DROP_NEWEST ou BLOCK
+            block_timeout: Espera máxima do produtor na política BLOCK
+        """
+        if policy not in (DROP_OLDEST, DROP_NEWEST, BLOCK):
+            raise ValueError(f"Política inválida: {policy}")
+
+        self.engine = create_engine(db_url)
+        if self.engine.dialect.name == 'sqlite':
+            enable_sqlite_wal(self.engine)
+        self.table = SensorReading.__table__
+        self.table.create(self.engine, checkfirst=True)
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread = None
+        self._batch_listeners = []
+
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.write_errors = 0
+        self.last_batch_ms = 0.0
+
+    def add_batch_listener(self, callback):
+        """
+        Registra uma função chamada dentro da transação de cada lote.
+
+        Args:
+            callback: callback(connection, rows), onde rows é a lista de
+                      dicts {'metric', 'value', 'timestamp'} do lote
+        """
+        self._batch_listeners.append(callback)
+
+    def start(self):
+        """Inicia a thread de gravação."""
+        if self._thread:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._writer_loop, name='telemetry-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """Grava o que resta na fila e encerra a thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def submit(self, metric, value, timestamp=None):
+        """
+        Enfileira uma amostra sem fazer I/O.
+
+        Args:
+            metric: Nome da métrica (ex: 'humidity')
+            value: Valor numérico
+            timestamp: Segundos desde a epoch (padrão: agora)
+
+        Retorna:
+            bool: False se a amostra foi descartada pela política da fila
+        """
+        row = {
+            'metric': metric,
+            'value': float(value),
+            'timestamp': timestamp if timestamp is not None else time.time()
+        }
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                if self.policy == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.policy == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif not self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_queue,
+                        self.block_timeout):
+                    self.dropped += 1
+                    return False
+
+            self._queue.append(row)
+            self.submitted += 1
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def stats(self):
+        """Contadores da fila e das gravações."""
+        return {
+            'queued': len(self._queue),
+            'submitted': self.submitted,
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'write_errors': self.write_errors,
+            'last_batch_ms': round(self.last_batch_ms, 2),
+            'policy': self.policy,
+        }
+
+    def _take_batch(self):
+        """Espera até ter um lote (ou estourar o intervalo) e o retira da fila."""
+        with self._cond:
+            deadline = time.monotonic() + self.flush_interval
+            while (not self._stopping
+                   and len(self._queue) < self.batch_size):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            count = min(len(self._queue), self.batch_size)
+            batch = [self._queue.popleft() for _ in range(count)]
+            # Libera produtores bloqueados (política BLOCK)
+            self._cond.notify_all()
+            return batch
+
+    def _write_batch(self, batch):
+        start = time.perf_counter()
+        try:
+            # Uma transação por lote (executemany)
+            with self.engine.begin() as conn:
+                conn.execute(self.table.insert(), batch)
+                for listener in self._batch_listeners:
+                    listener(conn, batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.write_errors += 1
+            self.dropped += len(batch)
+            print(f"[ERRO] Falha ao gravar telemetria: {e}")
+        self.last_batch_ms = (time.perf_counter() - start) * 1000
+
+    def _writer_loop(self):
+        while True:
+            batch = self._take_batch()
+            if batch:
+                self._write_batch(batch)
+            with self._cond:
+                if self._stopping and not self._queue:
+                    break
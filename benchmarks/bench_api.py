@@ -0,0 +1,157 @@
+# benchmarks/bench_api.py
+"""
+Benchmark das rotas Flask do backend com hardware simulado.
+
+Sobe o backend/app.py com o HAL simulado e um banco temporário, inicia o hub
+de sensores, serve o app em um servidor WSGI local com threads e dispara
+requisições HTTP de vários clientes concorrentes. Para cada rota e nível de
+concorrência mede latência (p50/p95/p99) e vazão.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_api [--requests 400] [--clients 1,8]
+"""
+
+import http.client
+import importlib.util
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from benchmarks.common import BACKEND_DIR, add_backend_path, latency_stats, run_cli
+from libs.hal import SIM, create_hal, set_hal
+
+
+# Simulação estável: sem falhas do DHT e seed fixo
+SIM_CONFIG = {'seed': 1, 'dht11': {'fail_rate': 0.0}}
+
+ROUTES = (
+    ('led_status', '/api/led/status', None),
+    ('ldr', '/api/ldr', None),
+    ('dht11', '/api/sensor/dht11', None),
+    ('snapshot', '/api/snapshot', None),
+    ('snapshot_304', '/api/snapshot', 'etag'),
+    ('history', '/api/history/humidity', None),
+)
+
+
+def load_backend(db_path, sim_config=SIM_CONFIG):
+    """
+    Importa backend/app.py com o HAL simulado.
+
+    Retorna:
+        module: Módulo do backend (app, sensor_hub, live_state, ...)
+    """
+    os.environ['HARVEST_DB'] = db_path
+    set_hal(create_hal(SIM, sim_config))
+    add_backend_path()
+    spec = importlib.util.spec_from_file_location(
+        'harvest_backend', os.path.join(BACKEND_DIR, 'app.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _wait_readings(backend, timeout=15):
+    """Espera todos os tópicos do snapshot terem uma leitura."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            backend.live_state.snapshot(backend.SNAPSHOT_FIELDS)
+            return
+        except KeyError:
+            time.sleep(0.1)
+    raise TimeoutError("Sensores simulados não publicaram leituras")
+
+
+def _client(port, path, headers, count, samples, status):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    for _ in range(count):
+        start = time.perf_counter()
+        conn.request('GET', path, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        samples.append(time.perf_counter() - start)
+        status[response.status] = status.get(response.status, 0) + 1
+    conn.close()
+
+
+def _load(port, path, headers, requests, clients):
+    samples = []
+    status = {}
+    per_client = max(requests // clients, 1)
+    threads = [threading.Thread(target=_client,
+                                args=(port, path, headers, per_client,
+                                      samples, status))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    result = latency_stats(samples)
+    result['req_per_s'] = round(len(samples) / elapsed)
+    result['status'] = {str(code): n for code, n in sorted(status.items())}
+    return result
+
+
+def run(requests=400, clients=(1, 8)):
+    """
+    Retorna:
+        dict: {rota: {'c<clientes>': estatísticas}}
+    """
+    from werkzeug.serving import make_server
+
+    # Log por requisição do servidor de desenvolvimento distorce a medida
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = load_backend(os.path.join(tmpdir, 'bench.db'))
+        backend.sensor_hub.start()
+        server = make_server('127.0.0.1', 0, backend.app, threaded=True)
+        server_thread = threading.Thread(target=server.serve_forever,
+                                         daemon=True)
+        server_thread.start()
+        try:
+            _wait_readings(backend)
+            for name, path, mode in ROUTES:
+                headers = {'Accept': 'application/json'}
+                if mode == 'etag':
+                    # Estado congelado: o ETag continua válido durante a carga
+                    backend.sensor_hub.stop()
+                    headers['If-None-Match'] = f'"{backend.live_state.etag}"'
+                results[name] = {
+                    f'c{n}': _load(server.port, path, headers, requests, n)
+                    for n in clients
+                }
+        finally:
+            server.shutdown()
+            backend.sensor_hub.stop()
+            backend.telemetry.engine.dispose()
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--requests', type=int, default=400,
+                        help="Requisições por rota e nível de concorrência")
+    parser.add_argument('--clients', default='1,8',
+                        type=lambda s: tuple(int(c) for c in s.split(',')),
+                        help="Níveis de concorrência separados por vírgula")
+
+
+def report(results, args):
+    print(f"{'rota':<14} {'clientes':>8} {'req/s':>7} {'p50 ms':>8} "
+          f"{'p95 ms':>8} {'p99 ms':>8}  status")
+    for name, levels in results.items():
+        for level, r in levels.items():
+            print(f"{name:<14} {level[1:]:>8} {r['req_per_s']:>7} "
+                  f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8}  "
+                  f"{r['status']}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
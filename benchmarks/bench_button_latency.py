@@ -0,0 +1,170 @@
+# benchmarks/bench_button_latency.py
+"""
+Benchmark da latência botão -> pixel com hardware simulado.
+
+Reproduz o laço do main.py na tela WIFI_LIST (ButtonManager com alertas de
+borda, DisplayPresenter com SimI2C em tempo real) em dois modos:
+- polling: redesenha a tela inteira com pausa de 50 ms entre quadros
+- event: RenderScheduler, quadro só quando um botão chega (callback
+  enfileirado com post e executado na thread do laço)
+
+A cada pressionamento simulado do botão RIGHT mede:
+- input_ms: pressionamento -> callback do botão
+- total_ms: pressionamento -> fim do envio do primeiro quadro que já
+  mostra a nova seleção
+e, sem nenhum botão, a CPU do processo por segundo ocioso (idle_cpu_ms_per_s).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_button_latency [--presses 20] [--i2c-hz 100000]
+"""
+
+import threading
+import time
+
+from PIL import Image, ImageDraw
+
+from benchmarks.common import latency_stats, load_font, run_cli
+from libs.display.display_utils import draw_wifi_list
+from libs.display.presenter import DisplayPresenter
+from libs.display.scheduler import RenderScheduler
+from libs.hal.sim import SimHal
+from libs.input_gpio.buttons import ButtonManager
+
+
+SSIDS = [f'Rede-{i:02d}' for i in range(30)]
+LOOP_SLEEP = 0.05  # Pausa do laço do main.py
+PRESS_DURATION = 0.1
+PRESS_GAP = 0.4  # Maior que o debounce de 200 ms
+IDLE_TIME = 1.0
+MODES = ('polling', 'event')
+
+
+class _WifiListLoop:
+    """Laço principal do main.py reduzido à tela WIFI_LIST."""
+
+    def __init__(self, disp, font, mode):
+        self.disp = disp
+        self.mode = mode
+        self.scheduler = RenderScheduler()
+        self.presenter = DisplayPresenter(disp)
+        self.font = font
+        self.image = Image.new('1', (disp.width, disp.height))
+        self.draw = ImageDraw.Draw(self.image)
+        self.selected = 0
+        self.callback_ns = []
+        self.frames = []  # (seleção desenhada, fim do envio em ns)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def on_right(self):
+        self.callback_ns.append(time.monotonic_ns())
+        if self.mode == 'event':
+            self.scheduler.post(self._next)
+        else:
+            self._next()
+
+    def _next(self):
+        self.selected = (self.selected + 1) % len(SSIDS)
+
+    def _render(self):
+        width, height = self.disp.width, self.disp.height
+        selected = self.selected
+        draw_wifi_list(self.draw, width, height, self.font, SSIDS, selected)
+        self.draw.rectangle((0, height - 9, width, height), outline=0, fill=0)
+        self.draw.text((0, height - 8), "L/R:Nav SEL:Ok MODE:Back",
+                       font=self.font, fill=255)
+        self.presenter.present(self.image)
+        self.frames.append((selected, time.monotonic_ns()))
+
+    def _loop(self):
+        if self.mode == 'event':
+            for _ in self.scheduler.frames():
+                if self._stop.is_set():
+                    break
+                self._render()
+            return
+        while not self._stop.is_set():
+            self._render()
+            time.sleep(LOOP_SLEEP)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.scheduler.request_frame()
+        self._thread.join()
+
+
+def _run_mode(mode, presses, i2c_hz):
+    hal = SimHal({'seed': 1, 'i2c': {'frequency': i2c_hz}})
+    disp = hal.display(128, 64)
+    buttons = ButtonManager(gpio=hal.gpio)
+    loop = _WifiListLoop(disp, load_font(), mode)
+    buttons.set_callbacks(on_right=loop.on_right)
+    loop.start()
+    time.sleep(0.3)
+
+    cpu_start = time.process_time()
+    time.sleep(IDLE_TIME)
+    idle_cpu = (time.process_time() - cpu_start) / IDLE_TIME
+
+    input_samples = []
+    total_samples = []
+    for _ in range(presses):
+        expected = (loop.selected + 1) % len(SSIDS)
+        callbacks_before = len(loop.callback_ns)
+        frames_before = len(loop.frames)
+        pressed_ns = time.monotonic_ns()
+        hal.gpio.press(ButtonManager.PIN_RIGHT, PRESS_DURATION)
+        time.sleep(PRESS_GAP)
+
+        if len(loop.callback_ns) > callbacks_before:
+            input_samples.append(
+                (loop.callback_ns[callbacks_before] - pressed_ns) / 1e9)
+        for selected, shown_ns in loop.frames[frames_before:]:
+            if selected == expected and shown_ns > pressed_ns:
+                total_samples.append((shown_ns - pressed_ns) / 1e9)
+                break
+
+    loop.stop()
+    buttons.cleanup()
+
+    return {
+        'input_ms': latency_stats(input_samples),
+        'total_ms': latency_stats(total_samples),
+        'idle_cpu_ms_per_s': round(idle_cpu * 1000, 2),
+        'frames': len(loop.frames),
+    }
+
+
+def run(presses=20, i2c_hz=100000):
+    """
+    Retorna:
+        dict: {modo: {'input_ms', 'total_ms', 'idle_cpu_ms_per_s', 'frames'}}
+    """
+    results = {mode: _run_mode(mode, presses, i2c_hz) for mode in MODES}
+    results['i2c_hz'] = i2c_hz
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--presses', type=int, default=20)
+    parser.add_argument('--i2c-hz', type=int, default=100000)
+
+
+def report(results, args):
+    print(f"I2C {results['i2c_hz'] // 1000} kHz")
+    print(f"{'modo':<8} {'etapa':<10} {'n':>4} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'máx ms':>8}")
+    for mode in MODES:
+        for name in ('input_ms', 'total_ms'):
+            r = results[mode][name]
+            print(f"{mode:<8} {name:<10} {r['n']:>4} {r.get('p50_ms', '-'):>8} "
+                  f"{r.get('p95_ms', '-'):>8} {r.get('max_ms', '-'):>8}")
+        print(f"{mode:<8} CPU ociosa {results[mode]['idle_cpu_ms_per_s']} ms/s, "
+              f"{results[mode]['frames']} quadros")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
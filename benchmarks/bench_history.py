@@ -0,0 +1,115 @@
+# benchmarks/bench_history.py
+"""
+Benchmark das consultas de histórico (rollups x amostras brutas).
+
+Gera uma série sintética de vários dias em um banco temporário, gera os
+rollups e mede o tempo de consulta para intervalos de 1 hora até o período
+inteiro, com a fonte automática (rollups) e forçando amostras brutas.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_history [--days 30] [--period 10]
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.common import run_cli
+
+BACKEND_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from app.history import HistoryStore  # noqa: E402
+from app.telemetry import TelemetryWriter  # noqa: E402
+
+
+METRIC = 'humidity'
+RANGES = (('1h', 3600), ('1d', 86400), ('7d', 7 * 86400), ('30d', 30 * 86400))
+
+
+def _populate(writer, days, period, end):
+    """Insere a série sintética direto, em lotes grandes."""
+    start = end - days * 86400
+    rows = []
+    t = start
+    while t < end:
+        value = 50 + 20 * math.sin(t / 86400 * 2 * math.pi) + random.gauss(0, 1)
+        rows.append({'metric': METRIC, 'value': value, 'timestamp': t})
+        t += period
+    with writer.engine.begin() as conn:
+        for i in range(0, len(rows), 10000):
+            conn.execute(writer.table.insert(), rows[i:i + 10000])
+    return len(rows)
+
+
+def _time_query(history, start, end, max_points, repeat, force_raw=False):
+    pick_source = history.pick_source
+    if force_raw:
+        history.pick_source = lambda width: 0
+    try:
+        best = float('inf')
+        for _ in range(repeat):
+            began = time.perf_counter()
+            result = history.query(METRIC, start, end, max_points)
+            best = min(best, time.perf_counter() - began)
+    finally:
+        history.pick_source = pick_source
+    return round(best * 1000, 2), result['source'], len(result['points'])
+
+
+def run(days=30, period=10, max_points=500, repeat=3):
+    """
+    Retorna:
+        dict: {intervalo: {'rollup_ms', 'source', 'points', 'raw_ms'}}
+    """
+    end = time.time()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        writer = TelemetryWriter(f"sqlite:///{os.path.join(tmpdir, 'h.db')}")
+        rows = _populate(writer, days, period, end)
+        began = time.perf_counter()
+        history = HistoryStore(writer.engine)
+        results['_setup'] = {
+            'rows': rows,
+            'backfill_s': round(time.perf_counter() - began, 2),
+        }
+
+        for label, span in RANGES:
+            if span > days * 86400:
+                continue
+            start = end - span
+            rollup_ms, source, points = _time_query(
+                history, start, end, max_points, repeat)
+            raw_ms, _, _ = _time_query(
+                history, start, end, max_points, repeat, force_raw=True)
+            results[label] = {'rollup_ms': rollup_ms, 'source': source,
+                              'points': points, 'raw_ms': raw_ms}
+        writer.engine.dispose()
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--period', type=float, default=10,
+                        help="Segundos entre amostras sintéticas")
+    parser.add_argument('--max-points', type=int, default=500)
+
+
+def report(results, args):
+    setup = results['_setup']
+    print(f"{setup['rows']} amostras, rollups gerados em {setup['backfill_s']} s")
+    print(f"{'intervalo':<10} {'fonte':<8} {'pontos':>7} "
+          f"{'rollup ms':>10} {'bruto ms':>10}")
+    for label, r in results.items():
+        if label == '_setup':
+            continue
+        print(f"{label:<10} {r['source']:<8} {r['points']:>7} "
+              f"{r['rollup_ms']:>10} {r['raw_ms']:>10}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
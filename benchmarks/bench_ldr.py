@@ -0,0 +1,118 @@
+# benchmarks/bench_ldr.py
+"""
+Benchmark da leitura do LDR: loop de contagem antigo x alerta de borda.
+
+Roda sobre o GPIO simulado do HAL (libs/hal/sim.py), com e sem carga de CPU
+concorrente, e mede:
+- CPU consumida por leitura pela thread que faz a leitura (thread_time)
+- valor médio e jitter (desvio padrão relativo) para um tempo de carga fixo
+
+O valor antigo é uma contagem de iterações e o novo é em microssegundos;
+compare o jitter e a variação da média entre os cenários 'idle' e 'cpu_load'.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_ldr [--reads 30] [--charge-us 20000]
+"""
+
+import statistics
+import threading
+import time
+
+from benchmarks.common import run_cli
+from libs.hal.sim import SimGpio
+from libs.sensors.ldr import LdrSensor
+
+
+LDR_PIN = 21
+HANDLE = 0
+
+
+def legacy_read_ldr(gpio, discharge_time):
+    """Implementação original de backend/app.py (contagem de iterações)."""
+    gpio.gpio_claim_output(HANDLE, LDR_PIN)
+    gpio.gpio_write(HANDLE, LDR_PIN, 0)
+    time.sleep(discharge_time)
+    gpio.gpio_claim_input(HANDLE, LDR_PIN)
+    count = 0
+    while gpio.gpio_read(HANDLE, LDR_PIN) == 0 and count < 100000:
+        count += 1
+    return count
+
+
+def _busy_worker(stop):
+    """Carga de CPU concorrente (disputa o GIL, como Flask + display)."""
+    x = 0
+    while not stop.is_set():
+        x += 1
+
+
+def _measure(read_fn, reads, load_threads):
+    stop = threading.Event()
+    workers = [threading.Thread(target=_busy_worker, args=(stop,), daemon=True)
+               for _ in range(load_threads)]
+    for w in workers:
+        w.start()
+
+    values = []
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    for _ in range(reads):
+        values.append(read_fn())
+    wall = time.perf_counter() - wall_start
+    cpu = time.thread_time() - cpu_start
+
+    stop.set()
+    for w in workers:
+        w.join()
+
+    mean = statistics.mean(values)
+    return {
+        'mean': round(mean, 1),
+        'jitter_pct': round(statistics.pstdev(values) / mean * 100, 2),
+        'cpu_ms_per_read': round(cpu / reads * 1000, 3),
+        'wall_ms_per_read': round(wall / reads * 1000, 3),
+    }
+
+
+def run(reads=30, charge_us=20000, discharge_time=0.01):
+    """
+    Executa o benchmark e retorna os resultados.
+
+    Retorna:
+        dict: {cenário: {implementação: métricas}}
+    """
+    gpio = SimGpio(rc_pins={LDR_PIN: {'charge_us': charge_us}})
+    sensor = LdrSensor(HANDLE, LDR_PIN, discharge_time=discharge_time,
+                       gpio=gpio)
+
+    results = {}
+    for scenario, load_threads in (('idle', 0), ('cpu_load', 2)):
+        results[scenario] = {
+            'legacy_spin': _measure(
+                lambda: legacy_read_ldr(gpio, discharge_time),
+                reads, load_threads),
+            'edge_alert': _measure(
+                lambda: sensor.read().charge_us, reads, load_threads),
+        }
+    sensor.close()
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--reads', type=int, default=30)
+    parser.add_argument('--charge-us', type=int, default=20000)
+
+
+def report(results, args):
+    print(f"LDR: tempo de carga simulado = {args.charge_us} us")
+    print(f"{'cenário':<10} {'impl':<12} {'média':>10} {'jitter%':>8} "
+          f"{'cpu ms':>8} {'wall ms':>8}")
+    for scenario, impls in results.items():
+        for impl, m in impls.items():
+            print(f"{scenario:<10} {impl:<12} {m['mean']:>10} "
+                  f"{m['jitter_pct']:>8} {m['cpu_ms_per_read']:>8} "
+                  f"{m['wall_ms_per_read']:>8}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
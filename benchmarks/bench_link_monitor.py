@@ -0,0 +1,154 @@
+# benchmarks/bench_link_monitor.py
+"""
+Benchmark do monitor de enlace Wi-Fi (utils/link_monitor.py).
+
+Mede, com um /proc/net/wireless de exemplo (o ioctl da taxa falha rápido
+sem wlan0, como numa interface sem suporte):
+- sample_us: uma amostra completa (leitura + buffers + média suavizada)
+- cpu_ms_per_s: CPU do monitor a 1 Hz, medida com a thread rodando a
+  --rate amostras/s e normalizada para 1 amostra/s
+- summary_us / history_us: leituras da API com a janela cheia (300)
+- bytes_per_sample: memória da janela nos buffers circulares (array) x
+  uma deque de tuplas (timestamp, LinkSample)
+- shell: o antigo `iw dev wlan0 link | awk` por leitura, com CPU dos filhos
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_link_monitor [--samples 2000] [--rate 200]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+
+from benchmarks.common import cpu_time, run_cli
+from utils.link_monitor import LinkMonitor, LinkSample, read_link
+
+
+WINDOW = 300
+
+WIRELESS_TEMPLATE = """\
+Inter-| sta-|   Quality        |   Discarded packets               | Missed | WE
+ face | tus | link level noise |  nwid  crypt   frag  retry   misc | beacon | 22
+ wlan0: 0000   {quality}.  {level}.  -92.        0      0      0      0     17        0
+"""
+
+
+def _us(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return round((time.perf_counter() - start) / repeat * 1e6, 2)
+
+
+def _memory(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del obj
+    return round(used / WINDOW, 1)
+
+
+def _ring_window():
+    monitor = LinkMonitor(size=WINDOW, read=lambda: LinkSample(-55, -92, 72.2))
+    for _ in range(WINDOW):
+        monitor.sample()
+    return monitor
+
+
+def _deque_window():
+    window = deque(maxlen=WINDOW)
+    for i in range(WINDOW):
+        window.append((time.time(), LinkSample(-55 - i % 7, -92 - i % 3,
+                                               72.2 + i % 2)))
+    return window
+
+
+def run(samples=2000, rate=200.0, shell_calls=20):
+    """
+    Retorna:
+        dict: {'monitor': métricas, 'memory': métricas, 'shell': métricas}
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'wireless')
+        with open(path, 'w') as f:
+            f.write(WIRELESS_TEMPLATE.format(quality=54, level=-56))
+
+        rng = random.Random(1)
+
+        def read():
+            if rng.random() < 0.1:  # Atualiza o arquivo como o driver faria
+                with open(path, 'w') as f:
+                    f.write(WIRELESS_TEMPLATE.format(
+                        quality=rng.randint(30, 70), level=rng.randint(-80, -40)))
+            return read_link('wlan0', path)
+
+        monitor = LinkMonitor(size=WINDOW, read=read)
+        sample_us = _us(monitor.sample, samples)
+        summary_us = _us(monitor.summary, 200)
+        history_us = _us(monitor.history, 200)
+
+        threaded = LinkMonitor(size=WINDOW, rate_hz=rate,
+                               read=lambda: read_link('wlan0', path))
+        cpu_start = cpu_time()
+        start = time.perf_counter()
+        threaded.start()
+        time.sleep(1.0)
+        threaded.stop()
+        elapsed = time.perf_counter() - start
+        cpu = cpu_time() - cpu_start
+        per_sample = cpu / max(threaded.samples, 1)
+
+    results = {
+        'monitor': {
+            'sample_us': sample_us,
+            'summary_us': summary_us,
+            'history_us': history_us,
+            'threaded_samples_per_s': round(threaded.samples / elapsed, 1),
+            'cpu_ms_per_s': round(per_sample * 1000, 4),  # a 1 Hz
+        },
+        'memory': {
+            'ring_bytes_per_sample': _memory(_ring_window),
+            'deque_bytes_per_sample': _memory(_deque_window),
+        },
+    }
+
+    cpu_start = cpu_time(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    for _ in range(shell_calls):
+        subprocess.run("iw dev wlan0 link | awk '/signal/ {print $2 \" dBm\"}'",
+                       shell=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)
+    results['shell'] = {
+        'call_us': round((time.perf_counter() - start) / shell_calls * 1e6, 1),
+        'cpu_ms_per_s': round(
+            (cpu_time(resource.RUSAGE_CHILDREN) - cpu_start) / shell_calls * 1000, 3),
+    }
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('--rate', type=float, default=200.0)
+
+
+def report(results, args):
+    m = results['monitor']
+    print(f"amostra: {m['sample_us']} us  summary: {m['summary_us']} us  "
+          f"history: {m['history_us']} us")
+    print(f"CPU a 1 Hz: monitor {m['cpu_ms_per_s']} ms/s  x  "
+          f"shell {results['shell']['cpu_ms_per_s']} ms/s "
+          f"({results['shell']['call_us']} us por chamada)")
+    mem = results['memory']
+    print(f"memória por amostra: ring {mem['ring_bytes_per_sample']} B  x  "
+          f"deque {mem['deque_bytes_per_sample']} B")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,131 @@
+# benchmarks/bench_nm_dbus.py
+"""
+Benchmark das operações de Wi-Fi: cliente D-Bus persistente x nmcli.
+
+O lado D-Bus roda contra o NetworkManager simulado (utils/nm_standin.py)
+num dbus-daemon privado, com atrasos de scan/ativação zerados: o tempo
+medido é só o do cliente + IPC. Operações, como chamadas pelo main.py:
+- ssids: lista de redes do cache (scan_wifi_networks sem o rescan)
+- scan: RequestScan + espera do sinal LastScan + lista
+- known: conexões salvas, lidas do NetworkManager a cada vez
+- known_cached: SSID no registro de perfis (get_known_wifi_ssids, relido
+  só após um sinal de mudança)
+- known_reload: sinal de mudança + próxima consulta (releitura)
+- connected: estado + SSID ativo (is_connected_to_network)
+- activate: ativar conexão salva até o sinal de ACTIVATED
+
+O lado nmcli só é medido se o nmcli existir; sempre é medido o custo de
+criar um processo (/bin/true), o piso de qualquer chamada ao nmcli. O
+scan antigo ainda dormia 2 s fixos.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_nm_dbus [--repeat 200]
+"""
+
+import shutil
+import subprocess
+import time
+
+from benchmarks.common import latency_stats, run_cli
+from utils.nm_dbus import NMClient
+from utils.nm_standin import PrivateBus, StandInNetworkManager
+from utils.wifi_profiles import ProfileRegistry
+from utils.wifi_utils import dbus_profiles
+
+
+NMCLI_COMMANDS = {
+    'ssids': ['nmcli', '-t', '-f', 'SSID', 'device', 'wifi', 'list'],
+    'known': ['nmcli', '-t', '-f', 'NAME', 'connection', 'show'],
+    'connected': ['nmcli', '-t', '-f', 'STATE', 'general'],
+}
+
+
+def _time(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return latency_stats(samples)
+
+
+def _bench_dbus(repeat):
+    bus = PrivateBus()
+    standin = StandInNetworkManager(bus.address, {
+        'scan_delay': 0.0, 'connect_delay': 0.0}).start()
+    try:
+        start = time.perf_counter()
+        nm = NMClient('wlan0', bus=bus.address)
+        init_ms = round((time.perf_counter() - start) * 1000, 3)
+
+        def scan():
+            nm.request_scan()
+            return nm.ssids()
+
+        registry = ProfileRegistry(nm_client=lambda: nm,
+                                   load=lambda: dbus_profiles(nm), watch_dir=None)
+
+        def reload():
+            registry.invalidate()
+            return 'Casa' in registry
+
+        results = {
+            'init_ms': init_ms,
+            'ssids': _time(nm.ssids, repeat),
+            'scan': _time(scan, repeat // 4 or 1),
+            'known': _time(nm.connections, repeat),
+            'known_cached': _time(lambda: 'Casa' in registry, repeat),
+            'known_reload': _time(reload, repeat),
+            'connected': _time(lambda: nm.connected() and nm.active_ssid(), repeat),
+            'activate': _time(lambda: nm.activate('Casa'), repeat // 4 or 1),
+        }
+        results['dbus_calls'] = nm.calls
+        results['signals'] = nm.signals
+        nm.close()
+    finally:
+        standin.stop()
+        bus.close()
+    return results
+
+
+def _bench_processes(repeat):
+    results = {'spawn': _time(lambda: subprocess.run(['true']), repeat)}
+    if shutil.which('nmcli'):
+        for name, command in NMCLI_COMMANDS.items():
+            results[name] = _time(lambda: subprocess.run(
+                command, capture_output=True), max(repeat // 10, 1))
+    return results
+
+
+def run(repeat=200):
+    """
+    Retorna:
+        dict: {'dbus': métricas, 'process': métricas}
+    """
+    return {
+        'dbus': _bench_dbus(repeat),
+        'process': _bench_processes(min(repeat, 50)),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--repeat', type=int, default=200)
+
+
+def report(results, args):
+    dbus = results['dbus']
+    print(f"D-Bus: conexão inicial {dbus['init_ms']} ms")
+    print(f"{'operação':<12} {'p50 ms':>8} {'p95 ms':>8} {'máx ms':>8}")
+    for name in ('ssids', 'scan', 'known', 'known_cached', 'known_reload',
+                 'connected', 'activate'):
+        lat = dbus[name]
+        print(f"{name:<12} {lat['p50_ms']:>8} {lat['p95_ms']:>8} {lat['max_ms']:>8}")
+    for name, lat in results['process'].items():
+        label = 'processo' if name == 'spawn' else f"nmcli {name}"
+        print(f"{label:<12} {lat['p50_ms']:>8} {lat['p95_ms']:>8} {lat['max_ms']:>8}")
+    if 'ssids' not in results['process']:
+        print("(nmcli não encontrado: só o custo de criar um processo)")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
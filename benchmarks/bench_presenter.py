@@ -0,0 +1,121 @@
+# benchmarks/bench_presenter.py
+"""
+Benchmark do envio de quadros ao SSD1306: show() completo x DisplayPresenter.
+
+Simula o laço de 20 quadros/s do main.py em telas com diferentes taxas de
+mudança e mede, por segundo simulado:
+- bytes no barramento I2C e ocupação do barramento a 100 kHz
+- CPU gasta em conversão + envio (desenho da tela fica fora da medida)
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_presenter [--frames 200]
+"""
+
+import time
+
+from PIL import Image, ImageDraw
+
+from benchmarks.common import load_font, run_cli
+from libs.display.display_utils import draw_info_screen, draw_wifi_list
+from libs.display.presenter import DisplayPresenter
+from libs.display.virtual_keyboard_display import draw_virtual_keyboard
+from libs.hal.sim import SimHal
+from libs.input_gpio.virtual_keyboard import VirtualKeyboard
+
+
+FPS = 20  # Laço do main.py: sleep de 50 ms
+WIDTH = 128
+HEIGHT = 64
+SSIDS = [f'Rede-{i:02d}' for i in range(12)]
+
+
+def _scenarios(draw, font):
+    """Telas do main.py com a frequência típica de mudança (em quadros)."""
+    keyboard = VirtualKeyboard()
+
+    def show_url(i):
+        draw.rectangle((0, 0, WIDTH, HEIGHT), outline=0, fill=0)
+        draw.text((0, 20), "http://192.168.0.42:8080", font=font, fill=255)
+        draw.text((0, HEIGHT - 8), "MODE: Voltar", font=font, fill=255)
+
+    def info(i):
+        # Usuários SSH mudam a cada 2 s, o resto é estático
+        draw_info_screen(draw, WIDTH, HEIGHT, font, host='harvest-bloom',
+                         ip='192.168.0.42', wifi_status='Conectado',
+                         wifi_signal='-52 dBm', ssh_status='Ativo',
+                         ssh_users=str(i // 40 % 3), ssid='Lab-Embarcados')
+
+    def wifi_list(i):
+        # Navegação: um botão a cada 0,5 s
+        draw_wifi_list(draw, WIDTH, HEIGHT, font, SSIDS, i // 10 % len(SSIDS))
+
+    def vkeyboard(i):
+        keyboard.cursor_pos = i // 5 % len(keyboard.get_current_layout())
+        draw_virtual_keyboard(draw, WIDTH, HEIGHT, font, keyboard, 'Lab')
+
+    return {'show_url': show_url, 'info': info, 'wifi_list': wifi_list,
+            'keyboard': vkeyboard}
+
+
+def _run_scenario(render, image, frames, use_presenter):
+    hal = SimHal({'i2c': {'realtime': False}})
+    disp = hal.display(WIDTH, HEIGHT)
+    i2c = hal.i2c()
+    presenter = DisplayPresenter(disp)
+
+    cpu = 0.0
+    for i in range(frames):
+        render(i)
+        start = time.thread_time()
+        if use_presenter:
+            presenter.present(image)
+        else:
+            disp.image(image)
+            disp.show()
+        cpu += time.thread_time() - start
+
+    seconds = frames / FPS
+    result = {
+        'bus_bytes_per_s': round(i2c.bytes_written / seconds),
+        'bus_busy_pct': round(i2c.bus_time / seconds * 100, 2),
+        'cpu_ms_per_s': round(cpu * 1000 / seconds, 2),
+    }
+    if use_presenter:
+        stats = presenter.stats()
+        result['skipped_pct'] = round(stats['skipped'] / frames * 100, 1)
+        result['partial_updates'] = stats['partial_updates']
+    return result
+
+
+def run(frames=200):
+    """
+    Retorna:
+        dict: {tela: {'full_show': métricas, 'presenter': métricas}}
+    """
+    image = Image.new('1', (WIDTH, HEIGHT))
+    draw = ImageDraw.Draw(image)
+    results = {}
+    for name, render in _scenarios(draw, load_font()).items():
+        results[name] = {
+            'full_show': _run_scenario(render, image, frames, False),
+            'presenter': _run_scenario(render, image, frames, True),
+        }
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--frames', type=int, default=200)
+
+
+def report(results, args):
+    print(f"{'tela':<10} {'modo':<10} {'bytes/s':>8} {'I2C %':>7} "
+          f"{'cpu ms/s':>9} {'descartados %':>14}")
+    for name, modes in results.items():
+        for mode, r in modes.items():
+            print(f"{name:<10} {mode:<10} {r['bus_bytes_per_s']:>8} "
+                  f"{r['bus_busy_pct']:>7} {r['cpu_ms_per_s']:>9} "
+                  f"{r.get('skipped_pct', '-'):>14}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,145 @@
+# benchmarks/bench_render.py
+"""
+Benchmark de renderização das telas do OLED e da conversão para o SSD1306.
+
+Mede, por quadro:
+- draw_info_screen, draw_wifi_list e draw_virtual_keyboard (PIL ImageDraw)
+- as mesmas telas nos widgets de modo retido (screens.py): atualização do
+  estado + Screen.render, que só redesenha o que mudou
+- uma linha de texto: draw.text (TrueType a cada chamada) x textcache
+  (máscara já rasterizada), e a taxa de acerto do cache nas telas
+- conversão da imagem PIL para o buffer em páginas do SSD1306: laço do
+  driver da Adafruit (via SimSSD1306) x pagebuffer.load_image
+- tempo de barramento do show() a 100 kHz e 400 kHz (calculado)
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_render [--frames 300]
+"""
+
+import time
+
+from PIL import Image, ImageDraw
+
+from benchmarks.common import latency_stats, load_font, run_cli
+from libs.display.display_utils import draw_info_screen, draw_wifi_list
+from libs.display.pagebuffer import load_image
+from libs.display.screens import InfoScreen, KeyboardScreen, WifiListScreen
+from libs.display.textcache import TextCache, text_cache
+from libs.display.virtual_keyboard_display import draw_virtual_keyboard
+from libs.hal.sim import SimI2C, SimSSD1306
+from libs.input_gpio.virtual_keyboard import VirtualKeyboard
+
+
+WIDTH = 128
+HEIGHT = 64
+
+INFO = {
+    'host': 'harvest-bloom', 'ip': '192.168.0.42', 'wifi_status': 'Conectado',
+    'wifi_signal': '-52 dBm', 'ssh_status': 'Ativo', 'ssh_users': '2',
+    'ssid': 'Lab-Embarcados',
+}
+SSIDS = [f'Rede-{i:02d}-{"x" * (i % 7)}' for i in range(12)]
+FOOTER = "L/R:Nav SEL:Ok MODE:Back"
+
+
+def _time_frames(render, frames):
+    samples = []
+    for i in range(frames):
+        start = time.perf_counter()
+        render(i)
+        samples.append(time.perf_counter() - start)
+    return latency_stats(samples)
+
+
+def run(frames=300):
+    """
+    Retorna:
+        dict: {tela ou etapa: estatísticas em ms}
+    """
+    font = load_font()
+    image = Image.new('1', (WIDTH, HEIGHT))
+    draw = ImageDraw.Draw(image)
+
+    keyboard = VirtualKeyboard()
+    keyboard.password = 'senha123'
+
+    def info(i):
+        draw_info_screen(draw, WIDTH, HEIGHT, font, **INFO)
+
+    def wifi_list(i):
+        draw_wifi_list(draw, WIDTH, HEIGHT, font, SSIDS, i % len(SSIDS))
+
+    def vkeyboard(i):
+        keyboard.cursor_pos = i % len(keyboard.get_current_layout())
+        draw_virtual_keyboard(draw, WIDTH, HEIGHT, font, keyboard, INFO['ssid'])
+
+    text_cache.clear()
+    results = {
+        'draw_info_screen': _time_frames(info, frames),
+        'draw_wifi_list': _time_frames(wifi_list, frames),
+        'draw_virtual_keyboard': _time_frames(vkeyboard, frames),
+    }
+    results['text_cache'] = text_cache.stats()
+
+    info_screen = InfoScreen(WIDTH, HEIGHT, font)
+    list_screen = WifiListScreen(WIDTH, HEIGHT, font, FOOTER)
+    keyboard_screen = KeyboardScreen(WIDTH, HEIGHT, font)
+    info_args = {k: v for k, v in INFO.items() if k != 'wifi_status'}
+
+    def info_widgets(i):
+        info_screen.update(**info_args)
+        info_screen.render(draw)
+
+    def wifi_list_widgets(i):
+        list_screen.update(SSIDS, i % len(SSIDS))
+        list_screen.render(draw)
+
+    def keyboard_widgets(i):
+        keyboard.cursor_pos = i % len(keyboard.get_current_layout())
+        keyboard_screen.update(keyboard, INFO['ssid'])
+        keyboard_screen.render(draw)
+
+    results['screen_info'] = _time_frames(info_widgets, frames)
+    results['screen_wifi_list'] = _time_frames(wifi_list_widgets, frames)
+    results['screen_keyboard'] = _time_frames(keyboard_widgets, frames)
+
+    cache = TextCache()
+    results['draw_text_truetype'] = _time_frames(
+        lambda i: draw.text((0, HEIGHT - 8), FOOTER, font=font, fill=255), frames)
+    results['draw_text_cached'] = _time_frames(
+        lambda i: cache.draw_text(draw, (0, HEIGHT - 8), FOOTER, font), frames)
+
+    i2c = SimI2C(realtime=False)
+    disp = SimSSD1306(WIDTH, HEIGHT, i2c)
+    results['pil_to_ssd1306'] = _time_frames(lambda i: disp.image(image), frames)
+    results['pil_to_ssd1306_fast'] = _time_frames(
+        lambda i: load_image(disp, image), frames)
+
+    # show(): 6 comandos de 2 bytes + framebuffer com control byte
+    transfers = [2] * 6 + [len(disp.buffer)]
+    for hz in (100000, 400000):
+        bus = SimI2C(frequency=hz, realtime=False)
+        results[f'show_bus_{hz // 1000}khz'] = {
+            'bytes': sum(transfers),
+            'ms': round(sum(bus.transfer_time(n) for n in transfers) * 1000, 3),
+        }
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--frames', type=int, default=300)
+
+
+def report(results, args):
+    print(f"{'etapa':<24} {'média ms':>9} {'p95 ms':>8} {'máx ms':>8}")
+    for name, r in results.items():
+        if 'mean_ms' in r:
+            print(f"{name:<24} {r['mean_ms']:>9} {r['p95_ms']:>8} {r['max_ms']:>8}")
+        elif 'hit_rate' in r:
+            print(f"{name:<24} acertos {r['hit_rate']:.1%} ({r['entries']} linhas)")
+        else:
+            print(f"{name:<24} {r['ms']:>9} ({r['bytes']} bytes no barramento)")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,136 @@
+# benchmarks/bench_screens.py
+"""
+Benchmark de quadros por segundo e bytes I2C por quadro de cada tela do menu.
+
+Usa o display sem hardware do HAL simulado (FramebufferDisplay): as telas
+de screens.py são desenhadas e enviadas pelo DisplayPresenter, e o
+emulador do SSD1306 decodifica o que passou pelo barramento. Cada tela
+recebe uma mudança por quadro (navegação, digitação, valor novo); a tela
+da URL fica parada.
+
+Para cada tela:
+- wire_bytes_per_frame: bytes no fio (endereço + control + conteúdo)
+- partial_writes/full_writes: escritas de janela x tela inteira
+- cpu_ms: desenho + conversão + envio (sem esperar o barramento)
+- bus_ms: tempo de barramento por quadro no clock escolhido
+- max_fps: limite de quadros/s somando CPU e barramento
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_screens [--frames 200] [--i2c-hz 100000]
+"""
+
+import time
+
+from PIL import Image, ImageDraw
+
+from benchmarks.common import load_font, run_cli
+from libs.display.presenter import DisplayPresenter
+from libs.display.screens import (
+    InfoScreen, KeyboardScreen, MessageScreen, WifiListScreen
+)
+from libs.hal.sim import SimHal
+from libs.input_gpio.virtual_keyboard import VirtualKeyboard
+
+
+WIDTH = 128
+HEIGHT = 64
+SSIDS = [f'Rede-{i:02d}' for i in range(12)]
+
+
+def _states(font):
+    """Tela de cada estado do menu e a mudança aplicada a cada quadro."""
+    info = InfoScreen(WIDTH, HEIGHT, font)
+    wifi_list = WifiListScreen(WIDTH, HEIGHT, font, "L/R:Nav SEL:Ok MODE:Back")
+    keyboard_screen = KeyboardScreen(WIDTH, HEIGHT, font)
+    connecting = MessageScreen(WIDTH, HEIGHT, font, [(15, 20), (5, 35)])
+    url = MessageScreen(WIDTH, HEIGHT, font, [(0, 20)], footer="MODE: Voltar")
+    keyboard = VirtualKeyboard()
+
+    def info_step(i):
+        info.update(host='harvest-bloom', ip='192.168.0.42',
+                    wifi_signal=f'-{40 + i % 30} dBm', ssh_status='Ativo',
+                    ssh_users=str(i // 10 % 3), ssid='Lab-Embarcados')
+
+    def keyboard_step(i):
+        if i % 4 == 3:
+            keyboard.select_char()
+        else:
+            keyboard.move_right()
+        keyboard_screen.update(keyboard, 'Lab-Embarcados')
+
+    dots = ('.', '..', '...')
+    return {
+        'MAIN_CONNECTED': (info, info_step),
+        'WIFI_LIST': (wifi_list,
+                      lambda i: wifi_list.update(SSIDS, i % len(SSIDS))),
+        'PASSWORD_ENTRY': (keyboard_screen, keyboard_step),
+        'CONNECTING': (connecting, lambda i: connecting.set_lines(
+            f"Conectando{dots[i % 3]}", 'Lab-Embarcados')),
+        'SHOW_URL': (url, lambda i: url.set_lines("http://192.168.0.42:8080")),
+    }
+
+
+def _run_state(screen, step, frames, i2c_hz):
+    hal = SimHal({'i2c': {'frequency': i2c_hz, 'realtime': False}})
+    disp = hal.display(WIDTH, HEIGHT)
+    emulator = disp.emulator
+    presenter = DisplayPresenter(disp)
+    image = Image.new('1', (WIDTH, HEIGHT))
+    draw = ImageDraw.Draw(image)
+    i2c = hal.i2c()
+
+    screen.invalidate()
+    presenter.present(image, screen.render(draw))  # Quadro inicial completo
+    base = emulator.stats()
+    bus_start = i2c.bus_time
+
+    cpu = 0.0
+    for i in range(frames):
+        start = time.perf_counter()
+        step(i)
+        presenter.present(image, screen.render(draw))
+        cpu += time.perf_counter() - start
+
+    stats = emulator.stats()
+    bus = i2c.bus_time - bus_start
+    cpu_ms = cpu * 1000 / frames
+    bus_ms = bus * 1000 / frames
+    return {
+        'frames': frames,
+        'wire_bytes_per_frame': round(
+            (stats['wire_bytes'] - base['wire_bytes']) / frames, 1),
+        'partial_writes': stats['partial_writes'] - base['partial_writes'],
+        'full_writes': stats['full_writes'] - base['full_writes'],
+        'cpu_ms': round(cpu_ms, 3),
+        'bus_ms': round(bus_ms, 3),
+        'max_fps': round(1000 / (cpu_ms + bus_ms), 1),
+    }
+
+
+def run(frames=200, i2c_hz=100000):
+    """
+    Retorna:
+        dict: {estado do menu: métricas}
+    """
+    results = {}
+    for state, (screen, step) in _states(load_font()).items():
+        results[state] = _run_state(screen, step, frames, i2c_hz)
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--i2c-hz', type=int, default=100000)
+
+
+def report(results, args):
+    print(f"{'estado':<16} {'bytes/quadro':>12} {'parciais':>9} {'cpu ms':>8} "
+          f"{'I2C ms':>8} {'fps máx':>8}")
+    for state, r in results.items():
+        print(f"{state:<16} {r['wire_bytes_per_frame']:>12} "
+              f"{r['partial_writes']:>9} {r['cpu_ms']:>8} {r['bus_ms']:>8} "
+              f"{r['max_fps']:>8}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,125 @@
+# benchmarks/bench_ssh_sessions.py
+"""
+Benchmark da detecção de logins SSH: `who | grep` periódico x inotify.
+
+Usa um utmp temporário onde são gravados logins (registros pts/N) e
+logouts (registro zerado, como faz o sshd):
+- inotify: SessionTracker observando o arquivo; mede o tempo entre a
+  gravação e a chegada do on_change, e a CPU do processo parado
+- who_poll: custo de uma chamada do antigo `who | grep -c 'pts/'` (CPU
+  incluindo os processos filhos) e o que isso dá no intervalo de 2 s do
+  main.py; a latência de detecção do polling é em média metade do
+  intervalo (até o intervalo inteiro), não medida aqui
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_ssh_sessions [--logins 50] [--idle 2]
+"""
+
+import os
+import resource
+import socket
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+
+from benchmarks.common import cpu_time, latency_stats, run_cli
+from utils.ssh_sessions import SessionTracker
+from utils.utmp import USER_PROCESS, _RECORD
+
+
+POLL_INTERVAL = 2.0  # Intervalo de atualização do main.py antigo
+
+
+def _record(user, line, ip, login_time):
+    addr = struct.unpack('<i', socket.inet_aton(ip))[0]
+    return _RECORD.pack(USER_PROCESS, 1000, line.encode(), line[-4:].encode(),
+                        user.encode(), ip.encode(), 0, 0, 0, login_time, 0,
+                        addr, 0, 0, 0)
+
+
+def _bench_inotify(logins, idle):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'utmp')
+        open(path, 'wb').close()
+
+        changed = threading.Event()
+        tracker = SessionTracker(path, on_change=lambda s: changed.set())
+        tracker.start()
+        time.sleep(0.1)
+
+        latencies = []
+        with open(path, 'r+b') as f:
+            for i in range(logins):
+                # Login e logout no mesmo slot, como o utmp de verdade
+                for data in (_record('pi', f'pts/{i % 8}', '192.168.0.10',
+                                     int(time.time())),
+                             bytes(_RECORD.size)):
+                    changed.clear()
+                    start = time.perf_counter()
+                    f.seek(0)
+                    f.write(data)
+                    f.flush()
+                    changed.wait(1.0)
+                    latencies.append(time.perf_counter() - start)
+
+        cpu_start = cpu_time()
+        time.sleep(idle)
+        idle_cpu = cpu_time() - cpu_start
+        mode = tracker.mode
+        tracker.stop()
+
+    return {
+        'mode': mode,
+        'latency': latency_stats(latencies),
+        'idle_cpu_ms_per_s': round(idle_cpu * 1000 / idle, 3),
+    }
+
+
+def _bench_who(calls):
+    cpu_start = cpu_time(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    for _ in range(calls):
+        subprocess.run("who | grep -c 'pts/' || echo 0", shell=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    wall = (time.perf_counter() - start) / calls
+    cpu = (cpu_time(resource.RUSAGE_CHILDREN) - cpu_start) / calls
+    return {
+        'call_ms': round(wall * 1000, 3),
+        'cpu_ms_per_call': round(cpu * 1000, 3),
+        'idle_cpu_ms_per_s': round(cpu * 1000 / POLL_INTERVAL, 3),
+        'expected_latency_ms': round(POLL_INTERVAL * 1000 / 2, 1),
+    }
+
+
+def run(logins=50, idle=2.0):
+    """
+    Retorna:
+        dict: {'inotify': métricas, 'who_poll': métricas}
+    """
+    return {
+        'inotify': _bench_inotify(logins, idle),
+        'who_poll': _bench_who(min(logins, 20)),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--logins', type=int, default=50)
+    parser.add_argument('--idle', type=float, default=2.0)
+
+
+def report(results, args):
+    inotify = results['inotify']
+    lat = inotify['latency']
+    print(f"inotify ({inotify['mode']}): detecção p50 {lat['p50_ms']} ms, "
+          f"p95 {lat['p95_ms']} ms, máx {lat['max_ms']} ms; "
+          f"CPU parado {inotify['idle_cpu_ms_per_s']} ms/s")
+    who = results['who_poll']
+    print(f"who_poll: {who['call_ms']} ms e {who['cpu_ms_per_call']} ms de CPU "
+          f"por chamada = {who['idle_cpu_ms_per_s']} ms/s a cada "
+          f"{POLL_INTERVAL:g} s; detecção média ~{who['expected_latency_ms']} ms")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,105 @@
+# benchmarks/bench_system_collector.py
+"""
+Benchmark do tempo que a interface fica parada lendo as informações do sistema.
+
+Simula uma sonda travando (ssh_status demora --stall s, como um systemctl
+preso) e um laço de interface a 50 quadros/s que precisa das informações a
+cada quadro. Compara:
+- sync: provider.read() na thread da interface (o main.py antes do coletor)
+- collector: SystemInfoCollector em segundo plano, a interface só lê o
+  snapshot publicado
+
+Os TTLs são reduzidos para 0,1 s para o efeito aparecer em poucos segundos.
+
+Métricas por modo:
+- ui_read: tempo da interface obtendo as informações, por quadro
+- frames: quadros desenhados no período (50/s se nada trava)
+- snapshots / timeouts / probes (só collector): publicações, sondas
+  abandonadas e latência de cada sonda
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_system_collector [--duration 2] [--stall 0.5]
+"""
+
+import time
+
+from benchmarks.common import latency_stats, run_cli
+from utils.system_collector import SystemInfoCollector
+from utils.system_info import SystemInfoProvider
+
+
+FRAME_INTERVAL = 0.02
+TTL = 0.1
+
+
+def _provider(stall):
+    provider = SystemInfoProvider(ttls=dict.fromkeys(
+        ('host', 'ip', 'ssid', 'signal', 'ssh_status', 'ssh_users'), TTL))
+    probe = provider.probes['ssh_status']
+
+    def stuck():
+        time.sleep(stall)
+        return probe()
+
+    provider.probes['ssh_status'] = stuck
+    return provider
+
+
+def _ui_loop(read_info, duration):
+    samples = []
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        read_info()
+        samples.append(time.perf_counter() - start)
+        time.sleep(FRAME_INTERVAL)
+    return {'ui_read': latency_stats(samples), 'frames': len(samples)}
+
+
+def run(duration=2.0, stall=0.5):
+    """
+    Retorna:
+        dict: {'sync': métricas, 'collector': métricas}
+    """
+    results = {'sync': _ui_loop(_provider(stall).read, duration)}
+
+    collector = SystemInfoCollector(_provider(stall),
+                                    timeouts={'ssh_status': 0.05})
+    collector.start()
+    try:
+        results['collector'] = _ui_loop(lambda: collector.snapshot.info,
+                                        duration)
+    finally:
+        collector.stop()
+    stats = collector.stats()
+    results['collector']['snapshots'] = stats['published']
+    results['collector']['timeouts'] = sum(
+        p['timeouts'] for p in stats['probes'].values())
+    results['collector']['probes'] = {
+        name: p['latency'] for name, p in stats['probes'].items()}
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--duration', type=float, default=2.0)
+    parser.add_argument('--stall', type=float, default=0.5)
+
+
+def report(results, args):
+    print(f"{'modo':<10} {'quadros':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'máx ms':>8}")
+    for mode, r in results.items():
+        ui = r['ui_read']
+        print(f"{mode:<10} {r['frames']:>8} {ui['p50_ms']:>8} "
+              f"{ui['p95_ms']:>8} {ui['max_ms']:>8}")
+    collector = results['collector']
+    print(f"snapshots: {collector['snapshots']}  "
+          f"timeouts: {collector['timeouts']}")
+    for name, lat in collector['probes'].items():
+        if lat['n']:
+            print(f"  {name:<11} n={lat['n']:<4} p50 {lat['p50_ms']} ms  "
+                  f"máx {lat['max_ms']} ms")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,142 @@
+# benchmarks/bench_system_info.py
+"""
+Benchmark da coleta de informações do sistema: shell x leitura direta.
+
+Compara, por atualização da tela principal (UPDATE_INTERVAL = 2 s):
+- shell: o get_system_info antigo do main.py, com um /bin/sh por comando
+  (hostname, hostname -I | awk, iwgetid, iw | awk, systemctl, who | grep)
+- native: SystemInfoProvider com os TTLs padrão, relógio avançando 2 s
+  por atualização como no laço real
+- native_no_cache: SystemInfoProvider rodando todas as sondas sempre
+
+Mede latência (parede) e CPU por atualização, somando a CPU dos processos
+filhos (os shells).
+
+Sem Wi-Fi/systemd (ex: container) os comandos falham rápido, mas o custo de
+criar os shells é o mesmo.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_system_info [--refreshes 50]
+"""
+
+import resource
+import subprocess
+import time
+
+from benchmarks.common import cpu_time, latency_stats, run_cli
+from utils.system_info import SystemInfoProvider
+
+
+UPDATE_INTERVAL = 2.0
+# CPU do processo + filhos já encerrados (as sondas antigas criam processos)
+CPU_TARGETS = (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)
+
+
+def _shell(command):
+    return subprocess.check_output(command, shell=True, text=True,
+                                   stderr=subprocess.DEVNULL).strip()
+
+
+def legacy_system_info():
+    """get_system_info do main.py antes do SystemInfoProvider."""
+    info = {}
+    try:
+        info['host'] = _shell("hostname")
+    except Exception:
+        info['host'] = "N/A"
+    try:
+        info['ip'] = _shell("hostname -I | awk '{print $1}'")
+    except Exception:
+        info['ip'] = "N/A"
+    try:
+        ssid = _shell("iwgetid -r")
+        is_connected = True
+    except Exception:
+        ssid, is_connected = "", False
+    info['wifi_connected'] = is_connected
+    info['ssid'] = ssid if is_connected else "Desconectado"
+    if is_connected:
+        try:
+            output = _shell("iw dev wlan0 link | awk '/signal/ {print $2 \" dBm\"}'")
+            info['wifi_signal'] = output if output else "N/A"
+        except Exception:
+            info['wifi_signal'] = "N/A"
+        info['wifi_status'] = "Conectado"
+    else:
+        info['wifi_signal'] = "N/A"
+        info['wifi_status'] = "Desconectado"
+    try:
+        ssh_result = _shell("systemctl is-active ssh")
+        info['ssh_status'] = "Ativo" if ssh_result == "active" else "Inativo"
+    except Exception:
+        info['ssh_status'] = "Inativo"
+    try:
+        info['ssh_users_raw'] = int(_shell("who | grep -c 'pts/' || echo 0"))
+    except Exception:
+        info['ssh_users_raw'] = 0
+    return info
+
+
+class _SteppedClock:
+    """Relógio que avança UPDATE_INTERVAL a cada atualização."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _measure(refresh, refreshes):
+    wall = []
+    cpu = []
+    for _ in range(refreshes):
+        cpu_start = cpu_time(*CPU_TARGETS)
+        start = time.perf_counter()
+        refresh()
+        wall.append(time.perf_counter() - start)
+        cpu.append(cpu_time(*CPU_TARGETS) - cpu_start)
+    return {
+        'latency': latency_stats(wall),
+        'cpu_ms_per_refresh': round(sum(cpu) / refreshes * 1000, 3),
+    }
+
+
+def run(refreshes=50):
+    """
+    Retorna:
+        dict: {modo: {'latency', 'cpu_ms_per_refresh', ...}}
+    """
+    results = {'shell': _measure(legacy_system_info, refreshes)}
+
+    clock = _SteppedClock()
+    provider = SystemInfoProvider(clock=clock)
+
+    def native():
+        provider.read()
+        clock.now += UPDATE_INTERVAL
+
+    results['native'] = _measure(native, refreshes)
+    results['native']['probe_calls'] = dict(provider.probe_calls)
+
+    uncached = SystemInfoProvider(ttls=dict.fromkeys(provider.ttls, 0))
+    results['native_no_cache'] = _measure(uncached.read, refreshes)
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--refreshes', type=int, default=50)
+
+
+def report(results, args):
+    print(f"{'modo':<16} {'p50 ms':>8} {'p95 ms':>8} {'máx ms':>8} "
+          f"{'cpu ms':>8}")
+    for mode, r in results.items():
+        lat = r['latency']
+        print(f"{mode:<16} {lat['p50_ms']:>8} {lat['p95_ms']:>8} "
+              f"{lat['max_ms']:>8} {r['cpu_ms_per_refresh']:>8}")
+    print(f"chamadas de sonda (native): {results['native']['probe_calls']}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
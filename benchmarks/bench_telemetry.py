@@ -0,0 +1,150 @@
+# benchmarks/bench_telemetry.py
+"""
+Benchmark de gravação de telemetria no SQLite.
+
+Compara o commit por amostra (journal padrão) com o TelemetryWriter
+(WAL + um commit por lote) e mede:
+- amostras gravadas por segundo
+- bytes escritos em disco por amostra (wchar de /proc/self/io), que é a
+  medida de amplificação de escrita relevante para o cartão SD
+- quantidade de commits
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_telemetry [--rows 20000]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.common import run_cli
+
+BACKEND_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend')
+sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import create_engine  # noqa: E402
+
+from app.models.sensor_reading import SensorReading  # noqa: E402
+from app.telemetry import TelemetryWriter  # noqa: E402
+
+
+METRICS = ('temperature', 'humidity', 'light', 'distance')
+
+
+def _bytes_written():
+    """Bytes passados para write() pelo processo (None fora do Linux)."""
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _db_url(tmpdir, name):
+    return f"sqlite:///{os.path.join(tmpdir, name)}"
+
+
+def bench_per_row_commit(tmpdir, rows):
+    """Uma transação por amostra, como um db.session.commit() por leitura."""
+    engine = create_engine(_db_url(tmpdir, 'per_row.db'))
+    table = SensorReading.__table__
+    table.create(engine, checkfirst=True)
+    insert = table.insert()
+
+    written_before = _bytes_written()
+    start = time.perf_counter()
+    for i in range(rows):
+        with engine.begin() as conn:
+            conn.execute(insert, {'metric': METRICS[i % len(METRICS)],
+                                  'value': float(i), 'timestamp': time.time()})
+    elapsed = time.perf_counter() - start
+    written_after = _bytes_written()
+    engine.dispose()
+
+    return _result(rows, elapsed, written_before, written_after, rows)
+
+
+def bench_writer(tmpdir, rows, batch_size, producers=4):
+    """TelemetryWriter com vários produtores simulando sensores."""
+    writer = TelemetryWriter(
+        _db_url(tmpdir, f'batch_{batch_size}.db'),
+        batch_size=batch_size, flush_interval=0.5, max_queue=rows)
+
+    per_producer = rows // producers
+
+    def produce(metric):
+        for i in range(per_producer):
+            writer.submit(metric, float(i))
+
+    written_before = _bytes_written()
+    start = time.perf_counter()
+    writer.start()
+    threads = [threading.Thread(target=produce, args=(METRICS[p % len(METRICS)],))
+               for p in range(producers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    submit_elapsed = time.perf_counter() - start
+    writer.stop(timeout=60)
+    elapsed = time.perf_counter() - start
+    written_after = _bytes_written()
+    writer.engine.dispose()
+
+    result = _result(writer.written, elapsed, written_before, written_after,
+                     writer.batches)
+    result['submit_us_per_row'] = round(submit_elapsed / (per_producer * producers) * 1e6, 2)
+    result['dropped'] = writer.dropped
+    return result
+
+
+def _result(rows, elapsed, written_before, written_after, commits):
+    result = {
+        'rows': rows,
+        'rows_per_s': round(rows / elapsed),
+        'commits': commits,
+    }
+    if written_before is not None and written_after is not None:
+        result['bytes_per_row'] = round((written_after - written_before) / rows, 1)
+    return result
+
+
+def run(rows=20000, per_row_rows=2000):
+    """
+    Executa o benchmark em um diretório temporário.
+
+    Args:
+        rows: Amostras para os cenários em lote
+        per_row_rows: Amostras para o cenário de commit por amostra
+                      (bem mais lento, por isso menor)
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results['per_row_commit'] = bench_per_row_commit(tmpdir, per_row_rows)
+        for batch_size in (50, 500):
+            results[f'wal_batch_{batch_size}'] = bench_writer(
+                tmpdir, rows, batch_size)
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--per-row-rows', type=int, default=2000)
+
+
+def report(results, args):
+    print(f"{'cenário':<16} {'amostras':>9} {'amostras/s':>11} "
+          f"{'commits':>8} {'bytes/amostra':>14}")
+    for name, r in results.items():
+        print(f"{name:<16} {r['rows']:>9} {r['rows_per_s']:>11} "
+              f"{r['commits']:>8} {r.get('bytes_per_row', '-'):>14}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,102 @@
+# benchmarks/bench_wifi_connect.py
+"""
+Benchmark das conexões Wi-Fi em segundo plano (utils/wifi_connect.py).
+
+Roda contra o NetworkManager simulado (utils/nm_standin.py) com uma
+ativação de --connect-delay segundos. Mede quanto tempo a thread que pede
+a conexão (laço do OLED, worker do Flask) fica presa:
+- blocking: o caminho antigo, NMClient.activate até o fim da ativação
+- start: ConnectionManager.start (o job segue em outra thread)
+e também:
+- total: do start até o job terminar (verified)
+- cancel: do cancel() até o job terminar (cancelled)
+- phases: tempo médio em cada fase (o simulado divide a ativação em
+  quartos: associating, authenticating, dhcp)
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_wifi_connect [--repeat 5] [--connect-delay 1.0]
+"""
+
+import time
+
+from benchmarks.common import latency_stats, run_cli
+from utils.nm_dbus import NMClient
+from utils.nm_standin import PrivateBus, StandInNetworkManager
+from utils.wifi_connect import ConnectionManager
+from utils.wifi_profiles import ProfileRegistry
+from utils.wifi_utils import dbus_profiles
+
+
+def run(repeat=5, connect_delay=1.0):
+    """
+    Retorna:
+        dict: latências de blocking, start, total e cancel, e phases
+              {fase: segundos médios}
+    """
+    bus = PrivateBus()
+    standin = StandInNetworkManager(bus.address, {
+        'connect_delay': connect_delay}).start()
+    nm = NMClient('wlan0', bus=bus.address)
+    timeout = connect_delay + 5
+    try:
+        blocking = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            ok, message = nm.activate('Casa', timeout=timeout)
+            blocking.append(time.perf_counter() - start)
+            assert ok, message
+
+        profiles = ProfileRegistry(nm_client=lambda: nm,
+                                   load=lambda: dbus_profiles(nm), watch_dir=None)
+        manager = ConnectionManager(nm_client=lambda: nm, timeout=timeout,
+                                    profiles=profiles)
+        starts, totals, phases = [], [], {}
+        for _ in range(repeat):
+            start = time.perf_counter()
+            job = manager.start('Casa')
+            starts.append(time.perf_counter() - start)
+            job.wait(timeout)
+            totals.append(time.perf_counter() - start)
+            assert job.success, job.message
+            for phase, seconds in job.phase_times():
+                phases.setdefault(phase, []).append(seconds)
+
+        cancels = []
+        for _ in range(repeat):
+            job = manager.start('Casa')
+            time.sleep(connect_delay / 2)
+            start = time.perf_counter()
+            manager.cancel()
+            job.wait(timeout)
+            cancels.append(time.perf_counter() - start)
+            assert job.phase == 'cancelled', job.phase
+    finally:
+        nm.close()
+        standin.stop()
+        bus.close()
+
+    return {
+        'blocking': latency_stats(blocking),
+        'start': latency_stats(starts),
+        'total': latency_stats(totals),
+        'cancel': latency_stats(cancels),
+        'phases': {phase: round(sum(v) / len(v), 3) for phase, v in phases.items()},
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--connect-delay', type=float, default=1.0)
+
+
+def report(results, args):
+    print(f"{'chamada':<10} {'p50 ms':>9} {'p95 ms':>9} {'máx ms':>9}")
+    for name in ('blocking', 'start', 'total', 'cancel'):
+        lat = results[name]
+        print(f"{name:<10} {lat['p50_ms']:>9} {lat['p95_ms']:>9} {lat['max_ms']:>9}")
+    print("tempo médio por fase (s): " + ", ".join(
+        f"{phase} {seconds}" for phase, seconds in results['phases'].items()))
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
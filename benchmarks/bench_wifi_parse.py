@@ -0,0 +1,107 @@
+# benchmarks/bench_wifi_parse.py
+"""
+Benchmark do parsing da saída do nmcli (utils/wifi_utils.py).
+
+Gera saídas sintéticas de 'nmcli -t -f SSID device wifi list' (com SSIDs
+repetidos de vários APs e linhas vazias de redes ocultas) e de
+'nmcli -t -f NAME,UUID,TYPE,AUTOCONNECT-PRIORITY,TIMESTAMP connection
+show', além da saída com os registros
+completos do scanner ('-f SSID,BSSID,SIGNAL,CHAN,SECURITY'), e mede o tempo de parsing por chamada.
+O tempo do processo nmcli em si não entra na medida.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_wifi_parse [--repeat 2000]
+"""
+
+import random
+import time
+import uuid
+
+from benchmarks.common import run_cli
+from utils.wifi_utils import (
+    parse_profiles, parse_scan_records, parse_ssid_list
+)
+
+
+SIZES = (10, 50, 200)
+
+
+def make_scan_output(networks, seed=0):
+    """Saída do scan com ~1/3 de SSIDs repetidos e algumas redes ocultas."""
+    rng = random.Random(seed)
+    names = [f'Rede_{i:03d}' for i in range(networks)]
+    lines = []
+    for name in names:
+        lines.append(name)
+        if rng.random() < 0.33:
+            lines.append(name)  # mesmo SSID em outro AP/banda
+        if rng.random() < 0.1:
+            lines.append('')  # rede oculta
+    return '\n'.join(lines) + '\n'
+
+
+def make_records_output(networks, seed=0):
+    """Mesma saída do scan, com BSSID (':' escapado), sinal, canal e segurança."""
+    rng = random.Random(seed)
+    lines = []
+    for i, ssid in enumerate(make_scan_output(networks, seed).splitlines()):
+        bssid = '\\:'.join(f'{b:02X}' for b in (2, 0, 0, i >> 8, i & 0xFF, 1))
+        security = rng.choice(('WPA2', 'WPA1 WPA2', 'WPA3', '--'))
+        lines.append(f'{ssid}:{bssid}:{rng.randint(10, 99)}:'
+                     f'{rng.choice((1, 6, 11, 36, 149))}:{security}')
+    return '\n'.join(lines) + '\n'
+
+
+def make_connections_output(count):
+    lines = [f'Rede_{i:03d}:{uuid.UUID(int=i)}:802-11-wireless:0:{1700000000 + i}'
+             for i in range(count)]
+    lines += [f'lo:{uuid.UUID(int=count)}:loopback:-999:0',
+              f'Wired connection 1:{uuid.UUID(int=count + 1)}:802-3-ethernet:-999:0']
+    return '\n'.join(lines) + '\n'
+
+
+def _time_call(fn, arg, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return round((time.perf_counter() - start) / repeat * 1e6, 2)
+
+
+def run(repeat=2000):
+    """
+    Retorna:
+        dict: {'scan_<n>': {'lines', 'us_per_call'}, 'records_<n>': ...,
+               'connections_<n>': ...}
+    """
+    results = {}
+    for size in SIZES:
+        scan = make_scan_output(size)
+        results[f'scan_{size}'] = {
+            'lines': scan.count('\n'),
+            'us_per_call': _time_call(parse_ssid_list, scan, repeat),
+        }
+        records = make_records_output(size)
+        results[f'records_{size}'] = {
+            'lines': records.count('\n'),
+            'us_per_call': _time_call(parse_scan_records, records, repeat),
+        }
+        conns = make_connections_output(size)
+        results[f'connections_{size}'] = {
+            'lines': conns.count('\n'),
+            'us_per_call': _time_call(parse_profiles, conns, repeat),
+        }
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument('--repeat', type=int, default=2000)
+
+
+def report(results, args):
+    print(f"{'saída':<18} {'linhas':>7} {'us/chamada':>11}")
+    for name, r in results.items():
+        print(f"{name:<18} {r['lines']:>7} {r['us_per_call']:>11}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,96 @@
+# benchmarks/bench_wifi_scanner.py
+"""
+Benchmark do scanner Wi-Fi em segundo plano (utils/wifi_scanner.py).
+
+Roda contra o NetworkManager simulado (utils/nm_standin.py) com um atraso
+de scan parecido com o de um driver real (--scan-delay). Mede o tempo
+entre apertar SELECT e ter a lista de redes:
+- blocking: o caminho antigo, scan completo na thread dos botões
+- cached: abrir a lista pelo cache do scanner (o scan roda em paralelo)
+- first_update_ms: do pedido de scan até a primeira atualização do cache
+  (sinais do NetworkManager) e scan_ms até o fim do scan completo
+
+O scan antigo via nmcli ainda dormia 2 s fixos além do próprio scan.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_wifi_scanner [--repeat 10] [--scan-delay 1.0]
+"""
+
+import threading
+import time
+
+from benchmarks.common import latency_stats, run_cli
+from utils.nm_dbus import NMClient
+from utils.nm_standin import PrivateBus, StandInNetworkManager
+from utils.wifi_scanner import WifiScanner
+from utils.wifi_utils import access_point_record
+
+
+def run(repeat=10, scan_delay=1.0):
+    """
+    Retorna:
+        dict: {'blocking': latência, 'cached': latência,
+               'first_update_ms': latência, 'scan_ms': latência}
+    """
+    bus = PrivateBus()
+    standin = StandInNetworkManager(bus.address, {
+        'scan_delay': scan_delay}).start()
+    nm = NMClient('wlan0', bus=bus.address)
+    try:
+        def blocking_scan():
+            nm.request_scan(timeout=scan_delay + 5)
+            return [access_point_record(ap) for ap in nm.access_points()]
+
+        updated = threading.Event()
+        scanner = WifiScanner(on_update=updated.set, scan=blocking_scan,
+                              nm_client=lambda: nm).start()
+
+        blocking = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            blocking_scan()
+            blocking.append(time.perf_counter() - start)
+
+        cached, first_update, scans = [], [], []
+        for _ in range(repeat):
+            count = scanner.scans
+            start = time.perf_counter()
+            ssids = scanner.ssids()
+            cached.append(time.perf_counter() - start)
+            assert ssids or count == 0
+
+            updated.clear()
+            scanner.request()
+            updated.wait(scan_delay + 5)
+            first_update.append(time.perf_counter() - start)
+            while scanner.scans == count:
+                time.sleep(0.001)
+            scans.append(time.perf_counter() - start)
+        scanner.stop()
+    finally:
+        nm.close()
+        standin.stop()
+        bus.close()
+
+    return {
+        'blocking': latency_stats(blocking),
+        'cached': latency_stats(cached),
+        'first_update_ms': latency_stats(first_update),
+        'scan_ms': latency_stats(scans),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--scan-delay', type=float, default=1.0)
+
+
+def report(results, args):
+    print(f"{'lista de redes':<16} {'p50 ms':>9} {'p95 ms':>9} {'máx ms':>9}")
+    for name in ('blocking', 'cached', 'first_update_ms', 'scan_ms'):
+        lat = results[name]
+        print(f"{name:<16} {lat['p50_ms']:>9} {lat['p95_ms']:>9} {lat['max_ms']:>9}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
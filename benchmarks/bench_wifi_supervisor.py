@@ -0,0 +1,124 @@
+# benchmarks/bench_wifi_supervisor.py
+"""
+Benchmark da reconexão automática (utils/wifi_supervisor.py).
+
+Roda contra o NetworkManager simulado (utils/nm_standin.py) com três redes
+salvas e derruba o enlace repetidas vezes. Sem carência (--grace 0), mede:
+- detect: da queda até o supervisor saber dela (sinal de estado, sem polling)
+- same_network: tempo até reconectar quando a mesma rede continua no ar
+- failover: tempo até reconectar quando a rede some e é preciso trocar
+E, das quedas registradas pelo próprio supervisor, as tentativas médias.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_wifi_supervisor [--repeat 5] [--connect-delay 0.5]
+"""
+
+import threading
+import time
+
+from benchmarks.common import latency_stats, run_cli
+from utils.nm_dbus import NMClient
+from utils.nm_standin import PrivateBus, StandInNetworkManager
+from utils.wifi_connect import ConnectionManager
+from utils.wifi_profiles import ProfileRegistry
+from utils.wifi_scanner import WifiScanner
+from utils.wifi_supervisor import ReconnectSupervisor
+from utils.wifi_utils import access_point_record, dbus_profiles
+
+KNOWN = ['Casa', 'Lab-Embarcados', 'Vizinho-5G']
+
+
+def run(repeat=5, connect_delay=0.5, grace=0.0, backoff_base=0.2):
+    """
+    Retorna:
+        dict: latências de detect, same_network e failover, e attempts
+              {cenário: tentativas médias}
+    """
+    bus = PrivateBus()
+    standin = StandInNetworkManager(bus.address, {
+        'connected': 'Casa', 'known': KNOWN, 'connect_delay': connect_delay,
+        'scan_delay': 0.1}).start()
+    nm = NMClient('wlan0', bus=bus.address)
+    timeout = connect_delay + 5
+
+    def scan():
+        nm.request_scan(timeout=timeout)
+        return [access_point_record(ap) for ap in nm.access_points()]
+
+    events = []  # (connected, instante)
+    changed = threading.Condition()
+
+    def on_change(connected):
+        with changed:
+            events.append((connected, time.monotonic()))
+            changed.notify_all()
+
+    def wait_event(connected):
+        with changed:
+            changed.wait_for(lambda: events and events[-1][0] == connected,
+                             timeout * 4)
+            return events[-1]
+
+    scanner = WifiScanner(scan=scan, nm_client=lambda: nm).start()
+    profiles = ProfileRegistry(nm_client=lambda: nm,
+                               load=lambda: dbus_profiles(nm), watch_dir=None)
+    connections = ConnectionManager(nm_client=lambda: nm, timeout=timeout,
+                                    profiles=profiles)
+    supervisor = ReconnectSupervisor(connections, profiles,
+                                     networks=scanner.networks,
+                                     request_scan=scanner.request,
+                                     nm_client=lambda: nm, grace=grace,
+                                     backoff_base=backoff_base,
+                                     on_change=on_change)
+    try:
+        scanner.request()
+        supervisor.start()
+        results = {'detect': [], 'same_network': [], 'failover': []}
+        attempts = {'same_network': [], 'failover': []}
+        for scenario in ('same_network', 'failover'):
+            for _ in range(repeat):
+                lost = nm.active_ssid()
+                standin.drop_link(remove_network=scenario == 'failover')
+                _, down_at = wait_event(False)
+                connected, up_at = wait_event(True)
+                assert connected, "Não reconectou"
+                results['detect'].append(down_at - standin.dropped_at)
+                results[scenario].append(up_at - standin.dropped_at)
+                outage = supervisor.stats()['outages'][-1]
+                attempts[scenario].append(outage['attempts'])
+                if scenario == 'failover':
+                    assert outage['ssid'] != lost, outage
+                    standin.restore_networks()
+        stats = supervisor.stats()
+    finally:
+        supervisor.stop()
+        scanner.stop()
+        nm.close()
+        standin.stop()
+        bus.close()
+
+    output = {name: latency_stats(values) for name, values in results.items()}
+    output['attempts'] = {name: round(sum(v) / len(v), 2)
+                          for name, v in attempts.items()}
+    output['reconnects'] = stats['reconnects']
+    return output
+
+
+def add_arguments(parser):
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--connect-delay', type=float, default=0.5)
+    parser.add_argument('--grace', type=float, default=0.0)
+    parser.add_argument('--backoff-base', type=float, default=0.2)
+
+
+def report(results, args):
+    print(f"{'queda':<14} {'p50 ms':>9} {'p95 ms':>9} {'máx ms':>9}")
+    for name in ('detect', 'same_network', 'failover'):
+        lat = results[name]
+        print(f"{name:<14} {lat['p50_ms']:>9} {lat['p95_ms']:>9} {lat['max_ms']:>9}")
+    print("tentativas médias: " + ", ".join(
+        f"{name} {n}" for name, n in results['attempts'].items()))
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
@@ -0,0 +1,158 @@
+# benchmarks/bench_wifi_survey.py
+"""
+Benchmark do site survey Wi-Fi (utils/wifi_survey.py).
+
+Alimenta o survey com scans sintéticos (--aps BSSIDs distintos, mais que
+a capacidade da tabela, para exercitar a troca de vagas) por um WifiScanner
+real com scan instantâneo, e mede:
+- ingest_us_per_record: acumular um AP de um scan (Welford + canal)
+- scan_cpu_us: CPU da thread de scan por scan acumulado (scan + survey)
+- growth_bytes: memória alocada pelo survey entre o fim do aquecimento
+  (warmup scans) e o último scan; deve ficar perto de zero (arrays de
+  tamanho fixo)
+- rows / channels / csv: leituras do OLED e da API com a tabela cheia
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_wifi_survey [--scans 2000] [--aps 300]
+"""
+
+import random
+import threading
+import time
+import tracemalloc
+
+from benchmarks.common import latency_stats, run_cli
+from utils.wifi_scanner import WifiScanner
+from utils.wifi_survey import MAX_BSSIDS, BssidStats, SiteSurvey
+from utils.wifi_utils import ScanRecord
+
+CHANNELS = (1, 6, 11, 36, 40, 44, 149)
+PER_SCAN = 40  # APs por scan
+
+
+def synthetic_aps(count, rng):
+    return [(f"Rede-{i % (count // 2 or 1)}", f"02:00:00:00:{i // 256:02X}:{i % 256:02X}",
+             rng.choice(CHANNELS), rng.randint(20, 90)) for i in range(count)]
+
+
+def synthetic_scan(aps, rng):
+    now = time.monotonic()
+    return [ScanRecord(ssid, bssid, max(0, min(100, base + rng.randint(-8, 8))),
+                       channel, 'WPA2', now)
+            for ssid, bssid, channel, base in rng.sample(aps, min(PER_SCAN, len(aps)))]
+
+
+def survey_run(batches, scans, warmup, trace=False):
+    """
+    Roda um survey até scans scans.
+
+    Retorna:
+        tuple: (SiteSurvey parado, CPU da thread de scan após o aquecimento
+               em segundos ou bytes alocados pelo survey nesse trecho)
+    """
+    done = threading.Event()
+    marks = {}
+    counter = iter(range(1, scans + 1))
+
+    def scan():
+        return batches[next(counter, 0) % len(batches)]
+
+    def mark():
+        if trace:
+            return tracemalloc.take_snapshot()
+        return time.thread_time()
+
+    def on_update():
+        if survey.scans == warmup:
+            marks['warm'] = mark()
+        elif survey.scans >= scans:
+            marks['end'] = mark()
+            survey.stop()
+            done.set()
+
+    scanner = WifiScanner(scan=scan, nm_client=None)
+    survey = SiteSurvey(scanner, interval=0, on_update=on_update)
+    if trace:
+        tracemalloc.start()
+    try:
+        survey.start()
+        done.wait(60)
+    finally:
+        scanner.stop()
+        if trace:
+            tracemalloc.stop()
+    assert 'end' in marks, "Survey não terminou"
+
+    if not trace:
+        return survey, marks['end'] - marks['warm']
+    growth = sum(stat.size_diff for stat in
+                 marks['end'].compare_to(marks['warm'], 'filename')
+                 if stat.traceback[0].filename.endswith('wifi_survey.py'))
+    return survey, growth
+
+
+def run(scans=2000, aps=300, warmup=200, seed=1):
+    """
+    Retorna:
+        dict: ingest_us_per_record, scan_cpu_us, growth_bytes, bssids,
+              evictions e latências de rows, channels e csv
+    """
+    warmup = min(warmup, scans // 2)
+    rng = random.Random(seed)
+    pool = synthetic_aps(aps, rng)
+    batches = [synthetic_scan(pool, rng) for _ in range(50)]
+
+    # Custo do acúmulo isolado
+    stats = BssidStats()
+    records = [r for batch in batches for r in batch]
+    start = time.perf_counter()
+    for record in records:
+        stats.add(record, 0.0)
+    ingest_us = (time.perf_counter() - start) / len(records) * 1e6
+
+    # Survey completo, na thread do scanner: uma rodada mede a CPU e
+    # outra (com tracemalloc, que pesa na CPU) a memória
+    survey, cpu = survey_run(batches, scans, warmup)
+    _, growth = survey_run(batches, scans, warmup, trace=True)
+
+    timings = {'rows': [], 'channels': [], 'csv': []}
+    for _ in range(20):
+        for name, func in (('rows', survey.rows), ('channels', survey.channels),
+                           ('csv', survey.to_csv)):
+            start = time.perf_counter()
+            func()
+            timings[name].append(time.perf_counter() - start)
+
+    summary = survey.summary()
+    return {
+        'ingest_us_per_record': round(ingest_us, 3),
+        'scan_cpu_us': round(cpu / (scans - warmup) * 1e6, 1),
+        'growth_bytes': growth,
+        'bssids': summary['bssids'],
+        'capacity': MAX_BSSIDS,
+        'evictions': summary['evictions'],
+        'rows': latency_stats(timings['rows']),
+        'channels': latency_stats(timings['channels']),
+        'csv': latency_stats(timings['csv']),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--scans', type=int, default=2000)
+    parser.add_argument('--aps', type=int, default=300)
+
+
+def report(results, args):
+    print(f"acúmulo: {results['ingest_us_per_record']} us/AP, "
+          f"{results['scan_cpu_us']} us de CPU por scan")
+    print(f"memória após o aquecimento: {results['growth_bytes']:+} bytes "
+          f"({results['bssids']}/{results['capacity']} BSSIDs, "
+          f"{results['evictions']} trocas de vaga)")
+    print(f"{'leitura':<10} {'p50 ms':>9} {'p95 ms':>9} {'máx ms':>9}")
+    for name in ('rows', 'channels', 'csv'):
+        lat = results[name]
+        print(f"{name:<10} {lat['p50_ms']:>9} {lat['p95_ms']:>9} {lat['max_ms']:>9}")
+
+
+if __name__ == '__main__':
+    run_cli(__doc__, run, report, add_arguments)
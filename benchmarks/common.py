@@ -0,0 +1,98 @@
+# benchmarks/common.py
+"""
+Utilitários compartilhados pelos benchmarks.
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+
+from utils.stats import percentile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+FONT_PATH = os.path.join(ROOT_DIR, 'fonts', 'LSANS.ttf')
+
+
+def latency_stats(samples_s):
+    """
+    Resume uma lista de durações (segundos) em milissegundos.
+
+    Retorna:
+        dict: {'n', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}
+    """
+    values = sorted(samples_s)
+    if not values:
+        return {'n': 0}
+    return {
+        'n': len(values),
+        'mean_ms': round(statistics.mean(values) * 1000, 3),
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'p99_ms': round(percentile(values, 99) * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3),
+    }
+
+
+def cpu_time(*who):
+    """
+    CPU (usuário + sistema, em s) somada dos alvos de getrusage.
+
+    Args:
+        who: resource.RUSAGE_SELF (padrão), RUSAGE_CHILDREN (filhos já
+             encerrados) ou os dois
+    """
+    total = 0.0
+    for target in who or (resource.RUSAGE_SELF,):
+        usage = resource.getrusage(target)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+def run_cli(doc, run, report, add_arguments=None):
+    """
+    Linha de comando comum dos benchmarks.
+
+    Os argumentos do script (mesmos nomes dos parâmetros de run) são
+    repassados a run(); os resultados vão para report() e, com --json,
+    para um arquivo.
+
+    Args:
+        doc: __doc__ do script (a segunda linha vira a descrição)
+        run: Função do benchmark
+        report: Função (results, args) que imprime o resumo
+        add_arguments: Função (parser) que declara os argumentos do script
+    """
+    parser = argparse.ArgumentParser(description=doc.splitlines()[1])
+    if add_arguments is not None:
+        add_arguments(parser)
+    parser.add_argument('--json', help="Salva os resultados neste arquivo")
+    args = parser.parse_args()
+
+    options = vars(args).copy()
+    output = options.pop('json')
+    results = run(**options)
+    report(results, args)
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+def load_font(size=9):
+    """Mesma fonte usada pelo main.py."""
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype(FONT_PATH, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def add_backend_path():
+    """Permite importar os módulos do backend (app.history, ...)."""
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
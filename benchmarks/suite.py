@@ -0,0 +1,199 @@
+# benchmarks/suite.py
+"""
+Executa todos os benchmarks e grava os resultados em JSON.
+
+Roda sem Raspberry Pi (HAL simulado). Cada execução gera
+benchmarks/results/<data>-<commit>.json com os resultados e metadados
+(commit, Python, plataforma), e --compare mostra a variação de cada métrica
+em relação a um arquivo anterior, marcando regressões acima do limite.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.suite [--quick] [--only api,render]
+    python -m benchmarks.suite --compare benchmarks/results/<base>.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks.common import ROOT_DIR
+
+
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'results')
+
+# nome -> (módulo, parâmetros completos, parâmetros do modo --quick)
+BENCHMARKS = {
+    'api': ('benchmarks.bench_api', {}, {'requests': 100}),
+    'render': ('benchmarks.bench_render', {}, {'frames': 50}),
+    'presenter': ('benchmarks.bench_presenter', {}, {'frames': 60}),
+    'screens': ('benchmarks.bench_screens', {}, {'frames': 50}),
+    'wifi_parse': ('benchmarks.bench_wifi_parse', {}, {'repeat': 200}),
+    'system_info': ('benchmarks.bench_system_info', {}, {'refreshes': 10}),
+    'system_collector': ('benchmarks.bench_system_collector', {},
+                         {'duration': 0.5}),
+    'ssh_sessions': ('benchmarks.bench_ssh_sessions', {},
+                     {'logins': 10, 'idle': 0.5}),
+    'link_monitor': ('benchmarks.bench_link_monitor', {},
+                     {'samples': 500, 'rate': 100}),
+    'nm_dbus': ('benchmarks.bench_nm_dbus', {}, {'repeat': 40}),
+    'wifi_scanner': ('benchmarks.bench_wifi_scanner', {},
+                     {'repeat': 3, 'scan_delay': 0.3}),
+    'wifi_connect': ('benchmarks.bench_wifi_connect', {},
+                     {'repeat': 2, 'connect_delay': 0.3}),
+    'wifi_supervisor': ('benchmarks.bench_wifi_supervisor', {},
+                        {'repeat': 2, 'connect_delay': 0.2}),
+    'wifi_survey': ('benchmarks.bench_wifi_survey', {},
+                    {'scans': 300}),
+    'button_latency': ('benchmarks.bench_button_latency', {}, {'presses': 5}),
+    'ldr': ('benchmarks.bench_ldr', {}, {'reads': 10}),
+    'telemetry': ('benchmarks.bench_telemetry', {},
+                  {'rows': 5000, 'per_row_rows': 500}),
+    'history': ('benchmarks.bench_history', {}, {'days': 7, 'period': 30}),
+}
+
+# Direção de cada métrica pelo nome da chave final
+HIGHER_IS_BETTER = ('per_s', 'fps')
+LOWER_IS_BETTER = ('_ms', 'ms', 'us_per_call', 'us_per_row', 'jitter_pct',
+                   'bytes_per_row', 'backfill_s', 'ms_per_s', 'bytes_per_s',
+                   'busy_pct', 'bytes_per_frame', 'ms_per_refresh', '_us',
+                   'bytes_per_sample', 'us_per_record', 'growth_bytes')
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+            text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_suite(names=None, quick=False):
+    """
+    Executa os benchmarks pedidos.
+
+    Retorna:
+        dict: {'meta': {...}, 'results': {nome: resultado}}
+    """
+    results = {}
+    durations = {}
+    for name, (module_name, params, quick_params) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        print(f"[INFO] Executando {name}...", flush=True)
+        module = importlib.import_module(module_name)
+        start = time.perf_counter()
+        results[name] = module.run(**(quick_params if quick else params))
+        durations[name] = round(time.perf_counter() - start, 1)
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'quick': quick,
+            'duration_s': durations,
+        },
+        'results': results,
+    }
+
+
+def flatten(results, prefix=''):
+    """Achata o dict de resultados em {'a.b.c': número}."""
+    flat = {}
+    for key, value in results.items():
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + '.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def _direction(path):
+    key = path.rsplit('.', 1)[-1]
+    # Menor primeiro: 'cpu_ms_per_s' também termina em 'per_s'
+    if any(key.endswith(s) for s in LOWER_IS_BETTER):
+        return -1
+    if any(key.endswith(s) for s in HIGHER_IS_BETTER):
+        return 1
+    return 0
+
+
+def compare(base, current, threshold=10.0):
+    """
+    Compara dois resultados da suíte.
+
+    Args:
+        threshold: Variação percentual a partir da qual uma piora é regressão
+
+    Retorna:
+        list: Tuplas (métrica, base, atual, variação %, regressão)
+    """
+    base_flat = flatten(base['results'])
+    current_flat = flatten(current['results'])
+    rows = []
+    for path, value in current_flat.items():
+        direction = _direction(path)
+        old = base_flat.get(path)
+        if not direction or old is None or old == 0:
+            continue
+        change = (value - old) / abs(old) * 100
+        rows.append((path, old, value, round(change, 1),
+                     -change * direction > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--only', help="Benchmarks separados por vírgula "
+                        f"({', '.join(BENCHMARKS)})")
+    parser.add_argument('--quick', action='store_true',
+                        help="Parâmetros reduzidos (verificação rápida)")
+    parser.add_argument('--out', help="Arquivo de saída (padrão: "
+                        "benchmarks/results/<data>-<commit>.json)")
+    parser.add_argument('--compare', help="Resultado anterior para comparar")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="Piora percentual considerada regressão")
+    args = parser.parse_args()
+
+    names = set(args.only.split(',')) if args.only else None
+    unknown = (names or set()) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Benchmarks desconhecidos: {', '.join(sorted(unknown))}")
+
+    suite = run_suite(names, quick=args.quick)
+
+    out = args.out
+    if not out:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        out = os.path.join(RESULTS_DIR, f"{stamp}-{suite['meta']['commit']}.json")
+    with open(out, 'w') as f:
+        json.dump(suite, f, indent=2)
+    print(f"[INFO] Resultados salvos em {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+        rows = compare(base, suite, args.threshold)
+        regressions = [r for r in rows if r[4]]
+        print(f"\nComparação com {base['meta']['commit']} "
+              f"({len(regressions)} regressões > {args.threshold}%)")
+        print(f"{'métrica':<52} {'base':>10} {'atual':>10} {'var %':>7}")
+        for path, old, value, change, regression in rows:
+            flag = '  <-- regressão' if regression else ''
+            print(f"{path:<52} {old:>10} {value:>10} {change:>7}{flag}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@ import { useEffect, useState } from "react";
 import { Card } from "@/components/ui/card";
 import { Thermometer, Droplets, AlertCircle } from "lucide-react";
 import { setHumidity } from "@/lib/ambientStore";
+import { subscribeStream } from "@/lib/api";
 
 type DHT11State = {
   temperature: number | null;
@@ -12,47 +13,31 @@ type DHT11State = {
   error?: string;
 };
 
-const API_BASE_URL = window.location.origin.replace(/:8080$/, ':5000') + '/api';
-
 export const DHT11Monitor = () => {
   const [sensor, setSensor] = useState<DHT11State | null>(null);
   const [loading, setLoading] = useState(true);
   const [lastUpdate, setLastUpdate] = useState<Date | null>(null);
 
   useEffect(() => {
-    const fetchSensor = async () => {
-      try {
-        const res = await fetch(`${API_BASE_URL}/sensor/dht11`, { 
-          cache: "no-store",
-          headers: {
-            'Accept': 'application/json',
-          }
-        });
-        
-        if (!res.ok) {
-          throw new Error(`HTTP error! status: ${res.status}`);
-        }
-        
-        const data = await res.json();
-        setSensor(data);
-        setLastUpdate(new Date());
-        setHumidity(data.humidity);
-      } catch (error) {
-        console.error("Erro ao buscar dados do DHT11:", error);
-        setSensor({ 
-          success: false, 
-          temperature: null, 
-          humidity: null, 
-          error: "Falha na conexão com o sensor" 
-        });
-      } finally {
+    // Atualizações chegam pelo stream SSE, sem polling
+    return subscribeStream("dht11", (data) => {
+      setSensor({ success: true, ...data });
+      setLastUpdate(new Date());
+      setHumidity(data.humidity);
+      setLoading(false);
+    }, (error) => {
+      // Sem conexão: sai do carregamento e mostra o erro (a última
+      // leitura volta a aparecer quando o stream reconectar)
+      if (error) {
+        setSensor((prev) => ({
+          temperature: prev?.temperature ?? null,
+          humidity: prev?.humidity ?? null,
+          success: false,
+          error,
+        }));
         setLoading(false);
       }
-    };
-
-    fetchSensor();
-    const interval = setInterval(fetchSensor, 3000);
-    return () => clearInterval(interval);
+    });
   }, []);
 
   const getTemperatureColor = (temp: number | null) => {
@@ -1,8 +1,7 @@
 import { useEffect, useState } from "react";
 import { Card } from "@/components/ui/card";
 import { Lightbulb, AlertCircle } from "lucide-react";
-
-const API_BASE_URL = window.location.origin.replace(/:8080$/, ':5000') + '/api';
+import { subscribeStream } from "@/lib/api";
 
 interface LDRStatus {
   color: string;
@@ -10,22 +9,22 @@ interface LDRStatus {
   intensity: "forte" | "media" | "fraca" | "escura";
 }
 
-function getLDRStatus(valor: number): LDRStatus {
-  if (valor < 50000) {
+function getLDRStatus(luz: number): LDRStatus {
+  if (luz >= 66) {
     return { 
       color: "#FFD700", 
       text: "Iluminação Forte", 
       intensity: "forte" 
     };
   }
-  if (valor < 90000) {
+  if (luz >= 33) {
     return { 
       color: "#FFA500", 
       text: "Iluminação Média", 
       intensity: "media" 
     };
   }
-  if (valor < 120000) {
+  if (luz >= 10) {
     return { 
       color: "#B197FC", 
       text: "Iluminação Fraca", 
@@ -45,36 +44,17 @@ export const SensorMonitor = () => {
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    const fetchLDR = async () => {
-      try {
-        const res = await fetch(`${API_BASE_URL}/ldr`, {
-          headers: {
-            'Accept': 'application/json',
-          }
-        });
-        
-        if (!res.ok) {
-          throw new Error(`HTTP error! status: ${res.status}`);
-        }
-        
-        const data = await res.json();
-        
-        if (data.ldr !== null && data.ldr !== undefined) {
-          setLdrValue(data.ldr);
-          setLastUpdate(new Date());
-          setError(null);
-        } else if (data.status === 'aguardando leitura') {
-          setError("Aguardando primeira leitura...");
-        }
-      } catch (err) {
-        console.error("Erro ao buscar dados do LDR:", err);
-        setError("Falha na conexão com o sensor");
+    setError("Aguardando primeira leitura...");
+    // Atualizações chegam pelo stream SSE, sem polling
+    return subscribeStream("ldr", (data) => {
+      if (data.light_pct !== null && data.light_pct !== undefined) {
+        setLdrValue(data.light_pct);
+        setLastUpdate(new Date());
+        setError(null);
       }
-    };
-
-    fetchLDR();
-    const interval = setInterval(fetchLDR, 1000);
-    return () => clearInterval(interval);
+    }, (streamError) => {
+      if (streamError) setError(streamError);
+    });
   }, []);
 
   const status = ldrValue !== null 
@@ -83,7 +63,7 @@ export const SensorMonitor = () => {
 
   // Calcula a porcentagem da barra (invertida: menos luz = mais à direita)
   const barFill = ldrValue !== null 
-    ? Math.min(Math.max((ldrValue / 150000) * 100, 1), 100) 
+    ? Math.min(Math.max(100 - ldrValue, 1), 100) 
     : 0;
 
   return (
@@ -154,7 +134,7 @@ export const SensorMonitor = () => {
             <div className="flex items-center justify-between">
               <span className="text-sm text-muted-foreground">Valor do sensor:</span>
               <span className="text-xl font-mono font-bold" style={{ color: status.color }}>
-                {ldrValue !== null ? ldrValue.toLocaleString() : "--"}
+                {ldrValue !== null ? `${ldrValue.toFixed(1)}%` : "--"}
               </span>
             </div>
           </div>
@@ -3,7 +3,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from "recharts";
 import { Ruler, Activity } from "lucide-react";
 import { Button } from "@/components/ui/button";
-import { getUltrasonicCurrent, UltrasonicReading } from "@/lib/api";
+import { subscribeStream } from "@/lib/api";
 
 type Reading = {
   timestamp: number;
@@ -46,27 +46,18 @@ export const UltrasonicMonitor = () => {
       });
     };
 
-    const fetchOnce = async () => {
-      try {
-        const res: UltrasonicReading = await getUltrasonicCurrent();
-        if (!mounted.current) return;
-        addReading(Number(res.distance_cm));
-        setError(null);
-      } catch (err) {
-        console.error('Ultrasonic fetch error', err);
-        if (!mounted.current) return;
-        setError('Falha ao obter distância');
-      }
-    };
-
-    // initial fetch
-    fetchOnce();
-    // poll every 1.5s
-    const interval = setInterval(fetchOnce, 1500);
+    // Atualizações chegam pelo stream SSE, sem polling
+    const unsubscribe = subscribeStream('ultrasonic', (data) => {
+      if (!mounted.current) return;
+      addReading(Number(data.distance_cm));
+      setError(null);
+    }, (streamError) => {
+      if (mounted.current) setError(streamError);
+    });
 
     return () => {
       mounted.current = false;
-      clearInterval(interval);
+      unsubscribe();
     };
   }, []);
 
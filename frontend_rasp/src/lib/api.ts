@@ -5,6 +5,9 @@ const API_BASE_URL = window.location.origin.replace(/:8080$/, ':5000') + '/api';
 // Tipos de resposta da API
 export interface LDRResponse {
   ldr: number | null;
+  charge_us?: number;
+  light_pct?: number;
+  timestamp?: number;
   status?: string;
 }
 
@@ -23,6 +26,12 @@ export interface LEDStatus {
 
 export interface UltrasonicReading {
   distance_cm: number;
+  quality?: 'ok' | 'degraded';
+  timestamp?: number;
+}
+
+export interface PumpStatus {
+  status: 'on' | 'off';
 }
 
 // Funções auxiliares para fazer requisições
@@ -70,8 +79,114 @@ export const api = {
     if (!response.ok) throw new Error("Erro ao buscar distância");
     return response.json();
   },
+
+  // Snapshot agregado; o navegador revalida com If-None-Match e o servidor
+  // responde 304 quando nada mudou
+  getSnapshot: async (fields?: StreamTopic[]): Promise<Snapshot> => {
+    const query = fields?.length ? `?fields=${fields.join(",")}` : "";
+    const response = await fetch(`${API_BASE_URL}/snapshot${query}`);
+    if (!response.ok) throw new Error("Erro ao buscar snapshot");
+    return response.json();
+  },
 };
 
+// Stream SSE (/api/stream): uma única conexão compartilhada por todos os
+// componentes, filtrada pelos tópicos que estão em uso
+export type StreamTopic = 'dht11' | 'ldr' | 'ultrasonic' | 'led' | 'pump';
+
+export interface StreamPayloads {
+  dht11: Omit<DHT11Response, 'success'> & { timestamp?: number };
+  ldr: LDRResponse;
+  ultrasonic: UltrasonicReading;
+  led: LEDStatus;
+  pump: PumpStatus;
+}
+
+export type Snapshot = Partial<StreamPayloads> & { version: number };
+
+type StreamListener = (data: unknown) => void;
+// Estado da conexão: mensagem de erro, ou null quando conectado
+export type StreamStatusListener = (error: string | null) => void;
+
+const STREAM_ERROR = "Sem conexão com o servidor";
+
+const streamListeners = new Map<StreamTopic, Set<StreamListener>>();
+const statusListeners = new Set<StreamStatusListener>();
+let streamError: string | null = null;
+let eventSource: EventSource | null = null;
+let connectedTopics = "";
+let syncScheduled = false;
+
+// Reabre a conexão só quando o conjunto de tópicos muda
+function syncStream() {
+  syncScheduled = false;
+  const topics = [...streamListeners.keys()].sort();
+  const key = topics.join(",");
+  if (key === connectedTopics) return;
+
+  eventSource?.close();
+  eventSource = null;
+  connectedTopics = key;
+  if (!topics.length) return;
+
+  const source = new EventSource(`${API_BASE_URL}/stream?topics=${key}`);
+  topics.forEach((topic) => {
+    source.addEventListener(topic, (event) => {
+      let data: unknown;
+      try {
+        data = JSON.parse((event as MessageEvent).data);
+      } catch (err) {
+        // Um evento malformado não derruba os listeners
+        console.error(`Evento '${topic}' inválido no stream:`, err);
+        return;
+      }
+      streamListeners.get(topic)?.forEach((listener) => listener(data));
+    });
+  });
+  // O EventSource reconecta sozinho; os componentes só são avisados
+  source.onopen = () => setStreamError(null);
+  source.onerror = () => setStreamError(STREAM_ERROR);
+  eventSource = source;
+}
+
+function setStreamError(error: string | null) {
+  if (error === streamError) return;
+  streamError = error;
+  statusListeners.forEach((listener) => listener(error));
+}
+
+// Agrupa vários subscribe/unsubscribe do mesmo render em uma só reconexão
+function scheduleSync() {
+  if (syncScheduled) return;
+  syncScheduled = true;
+  queueMicrotask(syncStream);
+}
+
+// onStatus recebe o erro da conexão (ou null quando ela volta); se a
+// conexão já está com erro, é chamado na hora
+export function subscribeStream<T extends StreamTopic>(
+  topic: T,
+  callback: (data: StreamPayloads[T]) => void,
+  onStatus?: StreamStatusListener
+): () => void {
+  const listener = callback as StreamListener;
+  if (!streamListeners.has(topic)) streamListeners.set(topic, new Set());
+  streamListeners.get(topic)!.add(listener);
+  if (onStatus) {
+    statusListeners.add(onStatus);
+    if (streamError) onStatus(streamError);
+  }
+  scheduleSync();
+
+  return () => {
+    const listeners = streamListeners.get(topic);
+    listeners?.delete(listener);
+    if (listeners && !listeners.size) streamListeners.delete(topic);
+    if (onStatus) statusListeners.delete(onStatus);
+    scheduleSync();
+  };
+}
+
 // Exporta também as funções individuais para compatibilidade
 export const turnLedOn = api.turnLedOn;
 export const turnLedOff = api.turnLedOff;
@@ -6,6 +6,8 @@ Centraliza toda a lógica visual para manter a main limpa.
 
 from PIL import ImageDraw, ImageFont
 
+from .textcache import draw_text
+
 
 def clear_display(draw, width, height):
     """Limpa o display (desenha retângulo preto)."""
@@ -37,27 +39,27 @@ def draw_info_screen(draw, width, height, font, host="", ip="", wifi_status="",
     line_height = 9
 
     # Host
-    draw.text((0, y_pos), f"Host: {host[:12]}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"Host: {host[:12]}", font, fill=255)
     y_pos += line_height
 
     # IP
-    draw.text((0, y_pos), f"IP: {ip[:15]}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"IP: {ip[:15]}", font, fill=255)
     y_pos += line_height
 
     # Sinal Wi-Fi (novo campo da Fase 1)
-    draw.text((0, y_pos), f"Sinal: {wifi_signal[:12]}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"Sinal: {wifi_signal[:12]}", font, fill=255)
     y_pos += line_height
 
     # SSH
-    draw.text((0, y_pos), f"SSH: {ssh_status}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"SSH: {ssh_status}", font, fill=255)
     y_pos += line_height
 
     # Usuários SSH
-    draw.text((0, y_pos), f"Users: {ssh_users}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"Users: {ssh_users}", font, fill=255)
     y_pos += line_height
 
     # SSID
-    draw.text((0, y_pos), f"SSID: {ssid[:14]}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"SSID: {ssid[:14]}", font, fill=255)
 
 
 def draw_wifi_list(draw, width, height, font, wifi_list, selected_index):
@@ -86,7 +88,7 @@ def draw_wifi_list(draw, width, height, font, wifi_list, selected_index):
         scroll_start = max(0, len(wifi_list) - items_per_page)
 
     # Título
-    draw.text((0, 2), "Redes WiFi:", font=font, fill=255)
+    draw_text(draw, (0, 2), "Redes WiFi:", font, fill=255)
 
     y_pos = 14
     line_height = 10
@@ -102,18 +104,18 @@ def draw_wifi_list(draw, width, height, font, wifi_list, selected_index):
                 (0, y_pos - 1, width - 1, y_pos + 8),
                 outline=255, fill=255
             )
-            draw.text((2, y_pos), ssid, font=font, fill=0)  # Texto preto
+            draw_text(draw, (2, y_pos), ssid, font, fill=0)  # Texto preto
         else:
-            draw.text((2, y_pos), ssid, font=font, fill=255)  # Texto branco
+            draw_text(draw, (2, y_pos), ssid, font, fill=255)  # Texto branco
 
         y_pos += line_height
 
     # Indicators de scroll
     if scroll_start > 0:
-        draw.text((width - 6, 14), "^", font=font, fill=255)
+        draw_text(draw, (width - 6, 14), "^", font, fill=255)
 
     if scroll_end < len(wifi_list):
-        draw.text((width - 6, height - 10), "v", font=font, fill=255)
+        draw_text(draw, (width - 6, height - 10), "v", font, fill=255)
 
 
 def draw_password_entry(draw, width, height, font, ssid, password, show_instructions=True):
@@ -131,17 +133,17 @@ def draw_password_entry(draw, width, height, font, ssid, password, show_instruct
     clear_display(draw, width, height)
 
     # Cabeçalho
-    draw.text((0, 2), "Conexao WiFi", font=font, fill=255)
-    draw.text((0, 14), f"SSID: {ssid[:18]}", font=font, fill=255)
+    draw_text(draw, (0, 2), "Conexao WiFi", font, fill=255)
+    draw_text(draw, (0, 14), f"SSID: {ssid[:18]}", font, fill=255)
 
     # Campo de senha
-    draw.text((0, 28), "Senha:", font=font, fill=255)
+    draw_text(draw, (0, 28), "Senha:", font, fill=255)
     password_display = "*" * len(password)
-    draw.text((50, 28), password_display[:15], font=font, fill=255)
+    draw_text(draw, (50, 28), password_display[:15], font, fill=255)
 
     if show_instructions:
-        draw.text((0, 45), "ENTER: OK  BKSP: Apaga", font=font, fill=255)
-        draw.text((0, 55), "ESC: Cancelar", font=font, fill=255)
+        draw_text(draw, (0, 45), "ENTER: OK  BKSP: Apaga", font, fill=255)
+        draw_text(draw, (0, 55), "ESC: Cancelar", font, fill=255)
 
 
 def draw_connecting_screen(draw, width, height, font, ssid):
@@ -156,8 +158,8 @@ def draw_connecting_screen(draw, width, height, font, ssid):
     """
     clear_display(draw, width, height)
 
-    draw.text((15, 15), "Conectando...", font=font, fill=255)
-    draw.text((10, 35), ssid[:20], font=font, fill=255)
+    draw_text(draw, (15, 15), "Conectando...", font, fill=255)
+    draw_text(draw, (10, 35), ssid[:20], font, fill=255)
 
 
 def draw_status_screen(draw, width, height, font, success, message=""):
@@ -174,10 +176,10 @@ def draw_status_screen(draw, width, height, font, success, message=""):
     clear_display(draw, width, height)
 
     if success:
-        draw.text((20, 25), "Conectado!", font=font, fill=255)
-        draw.text((0, 45), "Voltando ao menu...", font=font, fill=255)
+        draw_text(draw, (20, 25), "Conectado!", font, fill=255)
+        draw_text(draw, (0, 45), "Voltando ao menu...", font, fill=255)
     else:
-        draw.text((10, 15), "ERRO!", font=font, fill=255)
-        draw.text((0, 30), "Falha na conexao", font=font, fill=255)
+        draw_text(draw, (10, 15), "ERRO!", font, fill=255)
+        draw_text(draw, (0, 30), "Falha na conexao", font, fill=255)
         if message:
-            draw.text((0, 42), message[:20], font=font, fill=255)
+            draw_text(draw, (0, 42), message[:20], font, fill=255)
@@ -0,0 +1,58 @@
+# libs/display/pagebuffer.py
+"""
+Conversão rápida de imagem PIL modo '1' para o buffer em páginas do SSD1306.
+
+O SSD1306 organiza a memória em páginas de 8 linhas: cada byte é uma coluna
+de 8 pixels, com o bit 0 na linha de cima. O disp.image() da Adafruit monta
+esse buffer lendo pixel a pixel em Python. Aqui todo o trabalho é feito em C
+pelo PIL e pelos métodos de bytes:
+1. transpose() troca linhas por colunas, então cada linha da imagem
+   transposta empacota 8 pixels verticais por byte (bit 7 = linha de cima)
+2. translate() inverte a ordem dos bits de cada byte com uma tabela de 256
+   entradas (bit 0 = linha de cima)
+3. fatiamento com passo (raw[page::pages]) reordena de coluna-página para
+   página-coluna
+"""
+
+from PIL import Image
+
+
+# Tabela de inversão de bits: _REVERSE[b] = b com os 8 bits espelhados
+_REVERSE = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+
+
+def image_to_pages(image, out=None):
+    """
+    Converte uma imagem modo '1' para o layout de páginas do SSD1306.
+
+    Args:
+        image: Imagem PIL modo '1' com altura múltipla de 8
+        out: Buffer gravável com width * height / 8 bytes (ex: disp.buf).
+             Se None, um bytearray novo é criado.
+
+    Retorna:
+        O buffer preenchido (out ou o bytearray novo)
+    """
+    width, height = image.size
+    pages = height // 8
+    raw = image.transpose(Image.Transpose.TRANSPOSE).tobytes().translate(_REVERSE)
+    if out is None:
+        out = bytearray(width * pages)
+    for page in range(pages):
+        out[page * width:(page + 1) * width] = raw[page::pages]
+    return out
+
+
+def load_image(disp, image):
+    """
+    Substituto de disp.image(image): grava direto no buffer do driver.
+
+    Levanta:
+        ValueError: modo ou tamanho incompatível (mesmas regras da Adafruit)
+    """
+    if image.mode != '1':
+        raise ValueError("Image must be in mode 1.")
+    if image.size != (disp.width, disp.height):
+        raise ValueError(
+            f"Image must be same dimensions as display ({disp.width}x{disp.height}).")
+    image_to_pages(image, disp.buf)
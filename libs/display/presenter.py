@@ -0,0 +1,218 @@
+# libs/display/presenter.py
+"""
+Envio de quadros para o SSD1306 só com o que mudou.
+
+O laço principal desenha a tela inteira a cada quadro, mas na maior parte do
+tempo o conteúdo é igual ao anterior. O DisplayPresenter compara cada quadro
+com o último enviado e:
+- descarta quadros idênticos sem converter nem tocar no I2C
+- converte a imagem com load_image (sem laço por pixel em Python)
+- envia só as páginas (faixas de 8 linhas) que mudaram, limitadas às colunas
+  alteradas, usando a janela de endereçamento do SSD1306 (0x21/0x22)
+
+Se quem desenhou sabe o que mudou (Screen.render dos widgets), as regiões
+podem ser passadas em present(); a comparação fica restrita às páginas
+dessas regiões e uma lista vazia descarta o quadro direto.
+
+Displays sem hardware (FramebufferDisplay do HAL simulado) são avisados do
+fim de cada quadro enviado por disp.frame_done(), para gravar o quadro.
+
+O modo de endereçamento horizontal configurado pelo driver da Adafruit é
+mantido, então disp.show() continua funcionando normalmente.
+"""
+
+import time
+
+from .pagebuffer import load_image
+
+
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+CONTROL_CMD_STREAM = 0x00  # Vários comandos em uma única transação
+CONTROL_DATA = 0x40
+
+# Overhead em bytes no barramento de uma janela parcial:
+# transação de comandos (endereço + controle + 6 bytes) e de dados
+# (endereço + controle)
+WINDOW_OVERHEAD = 8 + 2
+
+
+class DisplayPresenter:
+    """
+    Apresenta imagens PIL no display enviando apenas as regiões alteradas.
+
+    Uso:
+        presenter = DisplayPresenter(disp)
+        presenter.present(image)  # no lugar de disp.image(image); disp.show()
+    """
+
+    def __init__(self, disp):
+        """
+        Args:
+            disp: Display SSD1306 (adafruit_ssd1306.SSD1306_I2C ou o simulado
+                  do HAL), com buffer/buf/i2c_device
+        """
+        self.disp = disp
+        self.width = disp.width
+        self.pages = disp.height // 8
+        self._last_image = None  # bytes da última imagem PIL apresentada
+        self._sent = None  # cópia do buffer de páginas que está no display
+        self._frame_done = getattr(disp, 'frame_done', None)
+
+        self.frames = 0
+        self.skipped = 0
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.windows_sent = 0
+        self.bytes_sent = 0
+        self.cpu_time = 0.0
+
+    def invalidate(self):
+        """Força atualização completa no próximo quadro (ex: após erro no I2C)."""
+        self._last_image = None
+        self._sent = None
+
+    def present(self, image, regions=None):
+        """
+        Envia um quadro ao display, se mudou.
+
+        Args:
+            image: Imagem PIL modo '1' do tamanho do display
+            regions: Regiões (x0, y0, x1, y1) alteradas desde o último
+                     quadro, ou None para comparar a imagem inteira
+
+        Retorna:
+            int: Bytes de dados enviados (0 se o quadro foi descartado)
+        """
+        start = time.thread_time()
+        self.frames += 1
+        try:
+            if regions is not None and self._sent is not None:
+                if not regions:
+                    self.skipped += 1
+                    return 0
+                raw = None  # Não compara a imagem inteira
+            else:
+                raw = image.tobytes()
+                if raw == self._last_image:
+                    self.skipped += 1
+                    return 0
+
+            load_image(self.disp, image)
+            try:
+                if self._sent is None:
+                    sent = self._send_full()
+                else:
+                    sent = self._send_dirty(regions)
+            except OSError:
+                self.invalidate()
+                raise
+
+            self._last_image = raw
+            self._sent = bytes(self.disp.buf)
+            if sent and self._frame_done:
+                self._frame_done()
+            return sent
+        finally:
+            self.cpu_time += time.thread_time() - start
+
+    def _send_full(self):
+        self.disp.show()
+        self.full_updates += 1
+        nbytes = len(self.disp.buffer) - 1
+        self.bytes_sent += nbytes
+        return nbytes
+
+    def dirty_windows(self, old, new, regions=None):
+        """
+        Calcula as janelas a enviar entre dois buffers de páginas.
+
+        Se regions for dado, só as páginas cobertas por ele são comparadas.
+
+        Cada página alterada vira uma janela (página, página, coluna inicial,
+        coluna final); páginas vizinhas são unidas quando a janela única custa
+        menos bytes no barramento que as separadas.
+
+        Retorna:
+            list: Tuplas (página_ini, página_fim, coluna_ini, coluna_fim)
+        """
+        width = self.width
+        windows = []
+        for page in self._pages_to_check(regions):
+            base = page * width
+            if old[base:base + width] == new[base:base + width]:
+                continue
+            first = 0
+            while old[base + first] == new[base + first]:
+                first += 1
+            last = width - 1
+            while old[base + last] == new[base + last]:
+                last -= 1
+            windows.append([page, page, first, last])
+
+        merged = []
+        for window in windows:
+            if merged and merged[-1][1] == window[0] - 1:
+                prev = merged[-1]
+                separate = (_window_cost(*prev) + _window_cost(*window))
+                union = [prev[0], window[1], min(prev[2], window[2]),
+                         max(prev[3], window[3])]
+                if _window_cost(*union) <= separate:
+                    merged[-1] = union
+                    continue
+            merged.append(window)
+        return [tuple(w) for w in merged]
+
+    def _pages_to_check(self, regions):
+        if regions is None:
+            return range(self.pages)
+        pages = set()
+        for _, y0, _, y1 in regions:
+            first = max(0, y0) // 8
+            last = min(self.pages * 8 - 1, y1) // 8
+            pages.update(range(first, last + 1))
+        return sorted(pages)
+
+    def _send_dirty(self, regions=None):
+        buf = self.disp.buf
+        windows = self.dirty_windows(self._sent, buf, regions)
+        if not windows:
+            self.skipped += 1
+            return 0
+
+        device = self.disp.i2c_device
+        width = self.width
+        nbytes = 0
+        for page_start, page_end, col_start, col_end in windows:
+            data = bytearray([CONTROL_DATA])
+            for page in range(page_start, page_end + 1):
+                base = page * width
+                data += buf[base + col_start:base + col_end + 1]
+            with device:
+                device.write(bytes((CONTROL_CMD_STREAM,
+                                    SET_COL_ADDR, col_start, col_end,
+                                    SET_PAGE_ADDR, page_start, page_end)))
+                device.write(data)
+            nbytes += len(data) - 1
+
+        self.partial_updates += 1
+        self.windows_sent += len(windows)
+        self.bytes_sent += nbytes
+        return nbytes
+
+    def stats(self):
+        """Contadores acumulados desde a criação."""
+        return {
+            'frames': self.frames,
+            'skipped': self.skipped,
+            'full_updates': self.full_updates,
+            'partial_updates': self.partial_updates,
+            'windows_sent': self.windows_sent,
+            'bytes_sent': self.bytes_sent,
+            'cpu_ms': round(self.cpu_time * 1000, 2),
+        }
+
+
+def _window_cost(page_start, page_end, col_start, col_end):
+    """Bytes no barramento para enviar uma janela."""
+    return WINDOW_OVERHEAD + (page_end - page_start + 1) * (col_end - col_start + 1)
@@ -0,0 +1,154 @@
+# libs/display/scheduler.py
+"""
+Agendador de quadros orientado a eventos para o laço do OLED.
+
+Substitui o "desenha tudo e dorme 50 ms": o laço principal só acorda quando
+algo muda (botão, nova leitura do sistema, resultado de scan, timer), junta
+várias mudanças em um único quadro e respeita um limite de quadros/s.
+
+Eventos vindos de outras threads (callbacks dos botões) são enfileirados com
+post() e executados na thread do laço, antes do próximo quadro, então o
+estado do menu só é alterado por uma thread.
+
+Uso:
+    scheduler = RenderScheduler(max_fps=30)
+    buttons.set_callbacks(on_left=lambda: scheduler.post(on_left))
+
+    for _ in scheduler.frames():
+        ...  # atualiza estado e desenha
+        scheduler.wake_in(2)  # próximo refresh periódico
+"""
+
+import threading
+import time
+from collections import deque
+
+from utils.stats import latency_summary
+
+
+HISTORY = 256  # Quadros guardados para as estatísticas de tempo
+
+
+class RenderScheduler:
+    """
+    Decide quando o próximo quadro deve ser desenhado.
+
+    Um quadro acontece quando há eventos enfileirados (post), um pedido
+    explícito (request_frame) ou um timer vencido (wake_in), nunca mais que
+    max_fps vezes por segundo. Sem nada disso a thread fica bloqueada.
+    """
+
+    def __init__(self, max_fps=30):
+        """
+        Args:
+            max_fps: Limite de quadros por segundo
+        """
+        self.min_interval = 1.0 / max_fps
+        self._cond = threading.Condition()
+        self._events = deque()
+        self._frame_requested = True  # Primeiro quadro sai imediatamente
+        self._deadline = None  # Instante (monotonic) do próximo timer
+        self._changed_at = None  # Primeira mudança ainda não desenhada
+        self._last_frame = 0.0
+
+        self.frames_drawn = 0
+        self.events_run = 0
+        self.coalesced = 0  # Eventos que compartilharam quadro com outro
+        self.timer_wakeups = 0
+        self._frame_times = deque(maxlen=HISTORY)
+        self._latencies = deque(maxlen=HISTORY)
+
+    # --- Chamados de qualquer thread ---
+
+    def post(self, func, *args):
+        """Enfileira func(*args) para rodar na thread do laço e pede quadro."""
+        with self._cond:
+            self._events.append((func, args))
+            self._mark_changed()
+            self._cond.notify()
+
+    def request_frame(self):
+        """Pede um quadro (ex: o estado mudou fora de um evento)."""
+        with self._cond:
+            self._frame_requested = True
+            self._mark_changed()
+            self._cond.notify()
+
+    def wake_in(self, delay):
+        """Garante um quadro daqui a delay s (mantém o timer mais próximo)."""
+        deadline = time.monotonic() + max(0.0, delay)
+        with self._cond:
+            if self._deadline is None or deadline < self._deadline:
+                self._deadline = deadline
+                self._cond.notify()
+
+    def _mark_changed(self):
+        if self._changed_at is None:
+            self._changed_at = time.monotonic()
+
+    # --- Thread do laço ---
+
+    def wait(self):
+        """
+        Bloqueia até o próximo quadro e executa os eventos enfileirados.
+
+        Retorna:
+            float: Instante (monotonic) da primeira mudança do quadro
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                timer_due = self._deadline is not None and now >= self._deadline
+                if self._events or self._frame_requested or timer_due:
+                    earliest = self._last_frame + self.min_interval
+                    if now >= earliest:
+                        break
+                    # Limite de fps: espera e junta o que chegar nesse meio tempo
+                    self._cond.wait(earliest - now)
+                    continue
+                timeout = None if self._deadline is None else self._deadline - now
+                self._cond.wait(timeout)
+
+            if timer_due:
+                self._deadline = None
+                self.timer_wakeups += 1
+            events = list(self._events)
+            self._events.clear()
+            self._frame_requested = False
+            changed_at = self._changed_at if self._changed_at is not None else now
+            self._changed_at = None
+            self._last_frame = now
+
+        for func, args in events:
+            func(*args)
+        self.events_run += len(events)
+        self.coalesced += max(0, len(events) - 1)
+        return changed_at
+
+    def frames(self):
+        """
+        Gerador para o laço principal: cada iteração é um quadro.
+
+        O tempo entre o início da iteração e o pedido da próxima é registrado
+        como tempo do quadro, e o tempo desde a primeira mudança até o fim
+        do quadro como latência.
+        """
+        while True:
+            changed_at = self.wait()
+            start = time.monotonic()
+            yield
+            end = time.monotonic()
+            self.frames_drawn += 1
+            self._frame_times.append(end - start)
+            self._latencies.append(end - changed_at)
+
+    def stats(self):
+        """Contadores e tempos dos últimos quadros."""
+        return {
+            'frames': self.frames_drawn,
+            'events': self.events_run,
+            'coalesced': self.coalesced,
+            'timer_wakeups': self.timer_wakeups,
+            'frame_time': latency_summary(list(self._frame_times)),
+            'latency': latency_summary(list(self._latencies)),
+        }
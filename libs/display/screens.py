@@ -0,0 +1,223 @@
+# libs/display/screens.py
+"""
+Telas do OLED montadas sobre os widgets de modo retido (widgets.py).
+
+Cada tela cria seus widgets uma vez e expõe um método de atualização que
+só altera (e marca como sujos) os widgets cujo conteúdo mudou. O layout é o
+mesmo das funções de display_utils e virtual_keyboard_display.
+"""
+
+from .widgets import Group, Label, Screen
+
+
+FOOTER_HEIGHT = 9
+
+
+def footer_label(width, height, font, text):
+    """Rodapé com fundo preto sobre o conteúdo da tela."""
+    return Label((0, height - 8), text, font,
+                 box=(0, height - FOOTER_HEIGHT, width, height), opaque=True)
+
+
+class InfoScreen(Screen):
+    """Tela principal com informações do sistema (Wi-Fi conectado)."""
+
+    LINE_HEIGHT = 9
+    SIGNAL_LOW_X = 84
+
+    def __init__(self, width, height, font, footer="SELECT: Trocar Rede"):
+        super().__init__(width, height)
+        fields = ('host', 'ip', 'wifi_signal', 'ssh_status', 'ssh_users', 'ssid')
+        self.lines = {}
+        for i, name in enumerate(fields):
+            self.lines[name] = self.add(
+                Label((0, 2 + i * self.LINE_HEIGHT), "", font))
+        # Pior sinal recente (p10 da janela do LinkMonitor), à direita do sinal
+        self.signal_low = self.add(
+            Label((self.SIGNAL_LOW_X, 2 + 2 * self.LINE_HEIGHT), "", font))
+        self.footer = self.add(footer_label(width, height, font, footer))
+
+    def update(self, host="", ip="", wifi_signal="", ssh_status="",
+               ssh_users="", ssid="", signal_low=""):
+        """Atualiza os valores exibidos (mesmos cortes de draw_info_screen)."""
+        self.lines['host'].set_text(f"Host: {host[:12]}")
+        self.lines['ip'].set_text(f"IP: {ip[:15]}")
+        self.lines['wifi_signal'].set_text(f"Sinal: {wifi_signal[:12]}")
+        self.signal_low.set_text(f"p10 {signal_low}" if signal_low else "")
+        self.lines['ssh_status'].set_text(f"SSH: {ssh_status}")
+        self.lines['ssh_users'].set_text(f"Users: {ssh_users}")
+        self.lines['ssid'].set_text(f"SSID: {ssid[:14]}")
+
+
+class ListView(Group):
+    """
+    Lista com rolagem, linha selecionada em destaque e indicadores ^/v.
+
+    Mantém a seleção no meio da página, como draw_wifi_list.
+    """
+
+    ITEMS_PER_PAGE = 5
+    LINE_HEIGHT = 10
+    MAX_CHARS = 20
+
+    def __init__(self, width, height, font, top=14):
+        super().__init__()
+        self.rows = []
+        for i in range(self.ITEMS_PER_PAGE):
+            y = top + i * self.LINE_HEIGHT
+            self.rows.append(self.add(
+                Label((2, y), "", font, box=(0, y - 1, width - 1, y + 8))))
+        self.scroll_up = self.add(Label((width - 6, top), "", font))
+        self.scroll_down = self.add(Label((width - 6, height - 10), "", font))
+
+    def set_items(self, items, selected_index):
+        """Atualiza itens e seleção; só as linhas alteradas ficam sujas."""
+        scroll_start = max(0, selected_index - 2)
+        scroll_end = min(len(items), scroll_start + self.ITEMS_PER_PAGE)
+        if selected_index >= len(items) - 2:
+            scroll_start = max(0, len(items) - self.ITEMS_PER_PAGE)
+
+        for row, i in zip(self.rows, range(scroll_start, scroll_start + len(self.rows))):
+            if i < scroll_end:
+                row.set(text=items[i][:self.MAX_CHARS],
+                        inverted=(i == selected_index))
+            else:
+                row.set(text="", inverted=False)
+
+        self.scroll_up.set_text("^" if scroll_start > 0 else "")
+        self.scroll_down.set_text("v" if scroll_end < len(items) else "")
+
+
+class WifiListScreen(Screen):
+    """Lista de redes Wi-Fi com rodapé; mensagem própria se vazia."""
+
+    def __init__(self, width, height, font, footer,
+                 empty_footer="Escaneando..."):
+        super().__init__(width, height)
+        self.footer_text = footer
+        self.empty_footer = empty_footer
+        self.title = self.add(Label((0, 2), "", font))
+        self.list = self.add(ListView(width, height, font))
+        self.empty = [self.add(Label((10, 20), "", font)),
+                      self.add(Label((10, 30), "", font))]
+        self.footer = self.add(footer_label(width, height, font, footer))
+
+    def update(self, items, selected_index, scanning=False, footer=None):
+        """footer substitui o rodapé padrão (ex: status da reconexão)."""
+        if items:
+            self.title.set_text("Redes WiFi..." if scanning else "Redes WiFi:")
+            self.list.set_items(items, selected_index)
+            self.empty[0].set_text("")
+            self.empty[1].set_text("")
+            self.footer.set_text(footer or self.footer_text)
+        else:
+            self.title.set_text("")
+            self.list.set_items([], 0)
+            self.empty[0].set_text("Buscando redes" if scanning else "Nenhuma rede")
+            self.empty[1].set_text("" if scanning else "encontrada")
+            self.footer.set_text(footer or self.empty_footer)
+
+
+class SurveyScreen(Screen):
+    """Site survey: resumo no título e lista de BSSIDs ou de canais."""
+
+    def __init__(self, width, height, font, footer="SEL:AP/Canal MODE:Sai"):
+        super().__init__(width, height)
+        self.title = self.add(Label((0, 2), "", font))
+        self.list = self.add(ListView(width, height, font))
+        self.empty = self.add(Label((10, 25), "", font))
+        self.footer = self.add(footer_label(width, height, font, footer))
+
+    def update(self, summary, items, selected_index, view='aps'):
+        """
+        Args:
+            summary: SiteSurvey.summary()
+            items: Linhas já formatadas da visão atual
+            view: 'aps' ou 'channels' (só muda o título)
+        """
+        if view == 'channels':
+            self.title.set_text(f"Canais {summary['scans']} scans")
+        else:
+            self.title.set_text(f"Survey {summary['bssids']} APs "
+                                f"{summary['scans']} sc")
+        self.list.set_items(items, selected_index)
+        self.empty.set_text("" if items else "Escaneando...")
+
+
+class KeyboardScreen(Screen):
+    """Teclado virtual: SSID, senha, faixa de teclas e rodapé."""
+
+    VISIBLE_KEYS = 7
+    KEY_WIDTH = 16
+
+    def __init__(self, width, height, font):
+        super().__init__(width, height)
+        self.font = font
+        self.ssid = self.add(Label((0, 0), "", font))
+        self.password = self.add(Label((0, 0), "", font))
+        self.keys = [self.add(Label((0, 0), "", font))
+                     for _ in range(self.VISIBLE_KEYS)]
+        self.more_left = self.add(Label((0, 0), "", font))
+        self.more_right = self.add(Label((width - 8, 0), "", font))
+        self.mode = self.add(Label((0, height - 10), "", font))
+        self.help = self.add(Label((60, height - 10), "L/R:Nav SEL:OK", font))
+
+    def update(self, keyboard, ssid=""):
+        """Sincroniza com o VirtualKeyboard (mesmo layout do teclado)."""
+        y_pos = 0
+        self.ssid.set_text(f"SSID: {ssid[:12]}" if ssid else "")
+        if ssid:
+            y_pos += 10
+
+        self.password.set(text=f"Pwd: {keyboard.password[-14:]}", xy=(0, y_pos))
+        y_pos += 12
+
+        layout = keyboard.get_current_layout()
+        start_idx = max(0, keyboard.cursor_pos - 3)
+        end_idx = min(len(layout), start_idx + self.VISIBLE_KEYS)
+        if end_idx - start_idx < self.VISIBLE_KEYS and end_idx == len(layout):
+            start_idx = max(0, end_idx - self.VISIBLE_KEYS)
+
+        for n, key in enumerate(self.keys):
+            i = start_idx + n
+            x_pos = n * self.KEY_WIDTH
+            box = (x_pos, y_pos - 1, x_pos + self.KEY_WIDTH - 2, y_pos + 11)
+            if i < end_idx:
+                key.set(text=layout[i][:3], xy=(x_pos + 2, y_pos),
+                        inverted=(i == keyboard.cursor_pos), box=box)
+            else:
+                key.set(text="", inverted=False, box=box)
+        y_pos += 14
+
+        self.more_left.set(text="<" if keyboard.cursor_pos > 3 else "",
+                           xy=(0, y_pos))
+        self.more_right.set(
+            text=">" if keyboard.cursor_pos < len(layout) - 4 else "",
+            xy=(self.more_right.xy[0], y_pos))
+        self.mode.set_text(f"Mode:{keyboard.get_mode_name()}")
+
+
+class MessageScreen(Screen):
+    """
+    Linhas de texto em posições fixas, com rodapé opcional.
+
+    Usada nas telas de apresentação, "Conectando...", resultado da conexão
+    e URL do painel web.
+    """
+
+    def __init__(self, width, height, font, positions, footer=None):
+        """
+        Args:
+            positions: Lista de (x, y) de cada linha
+            footer: Texto do rodapé (None = sem rodapé)
+        """
+        super().__init__(width, height)
+        self.lines = [self.add(Label(xy, "", font)) for xy in positions]
+        self.footer = None
+        if footer is not None:
+            self.footer = self.add(footer_label(width, height, font, footer))
+
+    def set_lines(self, *texts):
+        """Define o texto de cada linha (linhas a mais ficam vazias)."""
+        for i, line in enumerate(self.lines):
+            line.set_text(texts[i] if i < len(texts) else "")
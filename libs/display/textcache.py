@@ -0,0 +1,108 @@
+# libs/display/textcache.py
+"""
+Cache de linhas de texto já rasterizadas para o display SSD1306.
+
+As telas são redesenhadas a cada quadro e quase todo o texto se repete
+("Host:", "SELECT: Trocar Rede", as teclas do teclado virtual...). Em vez de
+rasterizar a fonte TrueType de novo a cada draw.text, cada linha é
+rasterizada uma única vez numa máscara de 1 bit e depois só copiada para a
+imagem com draw.bitmap.
+
+O cache é LRU, limitado em número de linhas, e conta acertos e faltas para
+acompanhar a taxa de acerto.
+"""
+
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw
+
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+class TextCache:
+    """
+    Cache LRU de máscaras de texto indexado por (texto, fonte, cor).
+
+    Uso:
+        cache = TextCache()
+        cache.draw_text(draw, (0, 2), "Host:", font)  # no lugar de draw.text
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            max_entries: Número máximo de linhas guardadas
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # chave -> (deslocamento, máscara) ou None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _render(self, text, font):
+        """Rasteriza a linha numa máscara do tamanho exato do texto."""
+        # mode='1': mesma rasterização sem antialiasing do draw.text em
+        # imagens modo '1' (a caixa pode diferir da do modo 'L')
+        left, top, right, bottom = font.getbbox(text, mode='1')
+        if right <= left or bottom <= top:
+            return None  # Texto vazio ou só espaços: nada a desenhar
+        mask = Image.new('1', (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=1)
+        return (left, top), mask
+
+    def get(self, text, font, fill=255):
+        """
+        Retorna a máscara da linha, rasterizando na primeira vez.
+
+        Retorna:
+            tuple: ((dx, dy), máscara modo '1') ou None se não há pixels
+        """
+        key = (text, font, fill)
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            entry = self._render(text, font)
+            self._entries[key] = entry
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return entry
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def draw_text(self, draw, xy, text, font, fill=255):
+        """Equivalente a draw.text(xy, text, font=font, fill=fill)."""
+        entry = self.get(text, font, fill)
+        if entry is None:
+            return
+        (dx, dy), mask = entry
+        draw.bitmap((xy[0] + dx, xy[1] + dy), mask, fill=fill)
+
+    def clear(self):
+        """Descarta as linhas guardadas (os contadores são mantidos)."""
+        self._entries.clear()
+
+    def stats(self):
+        """Contadores acumulados desde a criação."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Cache compartilhado pelas funções de desenho das telas
+text_cache = TextCache()
+
+
+def draw_text(draw, xy, text, font, fill=255):
+    """Desenha texto usando o cache compartilhado."""
+    text_cache.draw_text(draw, xy, text, font, fill)
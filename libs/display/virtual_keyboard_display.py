@@ -3,6 +3,8 @@
 Funções de renderização do teclado virtual no display SSD1306.
 """
 
+from .textcache import draw_text
+
 
 def draw_virtual_keyboard(draw, width, height, font, keyboard, ssid=""):
     """
@@ -26,13 +28,13 @@ def draw_virtual_keyboard(draw, width, height, font, keyboard, ssid=""):
     # Linha 1: SSID (se fornecido)
     y_pos = 0
     if ssid:
-        draw.text((0, y_pos), f"SSID: {ssid[:12]}", font=font, fill=255)
+        draw_text(draw, (0, y_pos), f"SSID: {ssid[:12]}", font, fill=255)
         y_pos += 10
 
     # Linha 2: Senha digitada (sem máscara para facilitar testes)
     senha_display = keyboard.password[-14:] if len(
         keyboard.password) > 14 else keyboard.password
-    draw.text((0, y_pos), f"Pwd: {senha_display}", font=font, fill=255)
+    draw_text(draw, (0, y_pos), f"Pwd: {senha_display}", font, fill=255)
     y_pos += 12
 
     # Grid de caracteres (apenas primeira linha visível + cursor)
@@ -61,9 +63,9 @@ def draw_virtual_keyboard(draw, width, height, font, keyboard, ssid=""):
                 (x_pos, y_pos - 1, x_pos + char_width - 2, y_pos + 11),
                 outline=255, fill=255
             )
-            draw.text((x_pos + 2, y_pos), char[:3], font=font, fill=0)
+            draw_text(draw, (x_pos + 2, y_pos), char[:3], font, fill=0)
         else:
-            draw.text((x_pos + 2, y_pos), char[:3], font=font, fill=255)
+            draw_text(draw, (x_pos + 2, y_pos), char[:3], font, fill=255)
 
         x_pos += char_width
 
@@ -71,16 +73,16 @@ def draw_virtual_keyboard(draw, width, height, font, keyboard, ssid=""):
 
     # Indicadores de mais caracteres
     if keyboard.cursor_pos > 3:
-        draw.text((0, y_pos), "<", font=font, fill=255)
+        draw_text(draw, (0, y_pos), "<", font, fill=255)
     if keyboard.cursor_pos < len(layout) - 4:
-        draw.text((width - 8, y_pos), ">", font=font, fill=255)
+        draw_text(draw, (width - 8, y_pos), ">", font, fill=255)
 
     y_pos += 10
 
     # Footer: Modo e instruções
     mode_name = keyboard.get_mode_name()
-    draw.text((0, height - 10), f"Mode:{mode_name}", font=font, fill=255)
-    draw.text((60, height - 10), "L/R:Nav SEL:OK", font=font, fill=255)
+    draw_text(draw, (0, height - 10), f"Mode:{mode_name}", font, fill=255)
+    draw_text(draw, (60, height - 10), "L/R:Nav SEL:OK", font, fill=255)
 
 
 def draw_virtual_keyboard_compact(draw, width, height, font, keyboard, ssid=""):
@@ -99,11 +101,11 @@ def draw_virtual_keyboard_compact(draw, width, height, font, keyboard, ssid=""):
     # Senha
     y_pos = 0
     if ssid:
-        draw.text((0, y_pos), ssid[:16], font=font, fill=255)
+        draw_text(draw, (0, y_pos), ssid[:16], font, fill=255)
         y_pos += 9
 
     senha_display = keyboard.password[-16:]
-    draw.text((0, y_pos), senha_display, font=font, fill=255)
+    draw_text(draw, (0, y_pos), senha_display, font, fill=255)
     y_pos += 11
 
     # Grid 3x3 centralizado no cursor
@@ -131,19 +133,19 @@ def draw_virtual_keyboard_compact(draw, width, height, font, keyboard, ssid=""):
                     (x_pos - 2, y_pos - 1, x_pos + 16, y_pos + 9),
                     outline=255, fill=255
                 )
-                draw.text((x_pos, y_pos), char[:3], font=font, fill=0)
+                draw_text(draw, (x_pos, y_pos), char[:3], font, fill=0)
             else:
                 draw.rectangle(
                     (x_pos - 2, y_pos - 1, x_pos + 16, y_pos + 9),
                     outline=255, fill=0
                 )
-                draw.text((x_pos, y_pos), char[:3], font=font, fill=255)
+                draw_text(draw, (x_pos, y_pos), char[:3], font, fill=255)
 
             x_pos += 20
 
         y_pos += 11
 
     # Footer
-    draw.text((0, height - 9),
-              f"{keyboard.get_mode_name()}", font=font, fill=255)
-    draw.text((40, height - 9), "MODE:Switch", font=font, fill=255)
+    draw_text(draw, (0, height - 9),
+              f"{keyboard.get_mode_name()}", font, fill=255)
+    draw_text(draw, (40, height - 9), "MODE:Switch", font, fill=255)
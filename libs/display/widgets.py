@@ -0,0 +1,233 @@
+# libs/display/widgets.py
+"""
+Camada de UI em modo retido para o display SSD1306.
+
+Em vez de limpar a imagem e redesenhar tudo a cada quadro, cada tela é uma
+árvore de widgets que guardam o próprio estado. Um widget só fica "sujo"
+quando algo que ele mostra muda, e a Screen redesenha apenas:
+- os widgets sujos
+- os widgets que se sobrepõem a eles (a ordem de desenho é preservada,
+  então o resultado é idêntico a redesenhar a tela inteira)
+
+Screen.render() devolve as regiões alteradas, que podem ser repassadas ao
+DisplayPresenter para limitar a comparação às páginas afetadas.
+
+Coordenadas de bounds e regiões seguem o PIL (x0, y0, x1, y1) inclusivas.
+"""
+
+from .textcache import text_cache
+
+
+def _union(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _intersects(a, b):
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class Widget:
+    """
+    Base dos widgets: sabe a área que ocupa e se precisa ser redesenhado.
+
+    Subclasses implementam bounds() e paint(draw).
+    """
+
+    def __init__(self):
+        self.dirty = True
+        self.painted = None  # bounds do último desenho (None = nada na tela)
+
+    def invalidate(self):
+        self.dirty = True
+
+    def bounds(self):
+        """Área ocupada pelo conteúdo atual, ou None se não desenha nada."""
+        raise NotImplementedError
+
+    def paint(self, draw):
+        """Desenha o widget (a Screen já limpou a área)."""
+        raise NotImplementedError
+
+
+class Label(Widget):
+    """
+    Uma linha de texto, opcionalmente com caixa de fundo.
+
+    - inverted: caixa preenchida e texto preto (linha selecionada)
+    - opaque: caixa preta por baixo do texto (ex: rodapé sobre a lista)
+    A caixa só é desenhada quando inverted ou opaque.
+    """
+
+    def __init__(self, xy, text, font, box=None, inverted=False, opaque=False):
+        """
+        Args:
+            xy: Posição do texto (x, y)
+            text: Texto inicial
+            font: Fonte PIL
+            box: Retângulo de fundo (x0, y0, x1, y1), opcional
+            inverted: Fundo branco com texto preto
+            opaque: Fundo preto (cobre o que estiver por baixo)
+        """
+        super().__init__()
+        self.xy = xy
+        self.text = text
+        self.font = font
+        self.box = box
+        self.inverted = inverted
+        self.opaque = opaque
+        self._bounds = None  # Calculado sob demanda a cada mudança
+
+    def set(self, text=None, xy=None, inverted=None, box=None):
+        """Atualiza o conteúdo; só marca sujo se algo mudou."""
+        if text is not None and text != self.text:
+            self.text = text
+            self.dirty = True
+        if xy is not None and xy != self.xy:
+            self.xy = xy
+            self.dirty = True
+        if inverted is not None and inverted != self.inverted:
+            self.inverted = inverted
+            self.dirty = True
+        if box is not None and box != self.box:
+            self.box = box
+            self.dirty = True
+        if self.dirty:
+            self._bounds = None
+
+    def set_text(self, text):
+        self.set(text=text)
+
+    def _fill(self):
+        return 0 if self.inverted else 255
+
+    def _has_box(self):
+        return self.box is not None and (self.inverted or self.opaque)
+
+    def bounds(self):
+        if self._bounds is None:
+            area = self.box if self._has_box() else None
+            entry = text_cache.get(self.text, self.font, self._fill())
+            if entry is not None:
+                (dx, dy), mask = entry
+                x, y = self.xy[0] + dx, self.xy[1] + dy
+                area = _union(area, (x, y, x + mask.width - 1, y + mask.height - 1))
+            self._bounds = (area,)
+        return self._bounds[0]
+
+    def paint(self, draw):
+        if self._has_box():
+            fill = 255 if self.inverted else 0
+            draw.rectangle(self.box, outline=fill, fill=fill)
+        text_cache.draw_text(draw, self.xy, self.text, self.font, self._fill())
+
+
+class Group:
+    """Agrupa widgets; a Screen percorre os filhos na ordem de desenho."""
+
+    def __init__(self, children=None):
+        self.children = list(children or [])
+
+    def add(self, child):
+        self.children.append(child)
+        return child
+
+    def walk(self):
+        for child in self.children:
+            if isinstance(child, Group):
+                yield from child.walk()
+            else:
+                yield child
+
+
+class Screen(Group):
+    """
+    Tela completa: raiz da árvore de widgets.
+
+    Uso:
+        regions = screen.render(draw)
+        presenter.present(image, regions)
+    """
+
+    def __init__(self, width, height, children=None):
+        super().__init__(children)
+        self.width = width
+        self.height = height
+        self._full = True
+
+        self.frames = 0
+        self.widgets_painted = 0
+
+    def invalidate(self):
+        """Força redesenho completo (ex: ao voltar para esta tela)."""
+        self._full = True
+
+    def render(self, draw):
+        """
+        Redesenha o que mudou desde o último render.
+
+        Retorna:
+            list: Regiões (x0, y0, x1, y1) alteradas; vazia se nada mudou
+        """
+        widgets = list(self.walk())
+        full_area = (0, 0, self.width - 1, self.height - 1)
+
+        if self._full:
+            draw.rectangle(full_area, outline=0, fill=0)
+            for widget in widgets:
+                self._paint(draw, widget)
+            self._full = False
+            self.frames += 1
+            return [full_area]
+
+        damage = []
+        for widget in widgets:
+            if widget.dirty:
+                area = _union(widget.painted, widget.bounds())
+                if area is not None:
+                    damage.append(area)
+                else:
+                    widget.dirty = False
+        if not damage:
+            return []
+
+        # Propaga: quem encosta na área danificada também é redesenhado, e a
+        # área dele passa a fazer parte do dano (até estabilizar)
+        selected = set()
+        changed = True
+        while changed:
+            changed = False
+            for i, widget in enumerate(widgets):
+                if i in selected:
+                    continue
+                area = widget.bounds() if widget.dirty else widget.painted
+                if area is None:
+                    continue
+                if any(_intersects(area, d) for d in damage):
+                    selected.add(i)
+                    if area not in damage:
+                        damage.append(area)
+                    changed = True
+
+        for area in damage:
+            draw.rectangle(area, outline=0, fill=0)
+        for i, widget in enumerate(widgets):
+            if i in selected or widget.dirty:
+                self._paint(draw, widget)
+
+        self.frames += 1
+        return [_clip(area, full_area) for area in damage]
+
+    def _paint(self, draw, widget):
+        widget.paint(draw)
+        widget.painted = widget.bounds()
+        widget.dirty = False
+        self.widgets_painted += 1
+
+
+def _clip(area, limit):
+    return (max(area[0], limit[0]), max(area[1], limit[1]),
+            min(area[2], limit[2]), min(area[3], limit[3]))
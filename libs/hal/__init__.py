@@ -0,0 +1,79 @@
+# libs/hal/__init__.py
+"""
+Camada de abstração de hardware (HAL) do Harvest Bloom.
+
+Drivers e aplicações pedem GPIO, DHT11, I2C e display ao HAL em vez de
+importar lgpio/Blinka diretamente. O backend é escolhido pela variável de
+ambiente HARVEST_HAL:
+- 'hardware' (padrão): lgpio + Adafruit Blinka, na Raspberry Pi
+- 'sim': GPIO, DHT11, I2C e SSD1306 simulados, em qualquer Linux
+
+Os parâmetros da simulação (tempos, ruído, falhas) podem vir de um arquivo
+JSON apontado por HARVEST_HAL_CONFIG.
+"""
+
+import json
+import os
+import threading
+
+HAL_ENV = 'HARVEST_HAL'
+CONFIG_ENV = 'HARVEST_HAL_CONFIG'
+
+HARDWARE = 'hardware'
+SIM = 'sim'
+BACKENDS = (HARDWARE, SIM)
+
+_hal = None
+_hal_lock = threading.Lock()
+
+
+def create_hal(backend=HARDWARE, config=None):
+    """
+    Cria um HAL do backend pedido.
+
+    Args:
+        backend: HARDWARE ou SIM
+        config: dict com parâmetros da simulação (ignorado no hardware)
+
+    Levanta:
+        ValueError: backend desconhecido
+    """
+    if backend == HARDWARE:
+        from .hardware import HardwareHal
+        return HardwareHal()
+    if backend == SIM:
+        from .sim import SimHal
+        return SimHal(config)
+    raise ValueError(f"Backend de HAL inválido: {backend}")
+
+
+def _load_config(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def get_hal():
+    """
+    HAL do processo, criado na primeira chamada a partir do ambiente.
+
+    Retorna:
+        HardwareHal ou SimHal
+    """
+    global _hal
+    with _hal_lock:
+        if _hal is None:
+            backend = os.environ.get(HAL_ENV, HARDWARE)
+            config_path = os.environ.get(CONFIG_ENV)
+            config = _load_config(config_path) if config_path else None
+            _hal = create_hal(backend, config)
+        return _hal
+
+
+def set_hal(hal):
+    """Define o HAL do processo (ex: benchmarks com simulação customizada)."""
+    global _hal
+    with _hal_lock:
+        _hal = hal
+
+
+__all__ = ['create_hal', 'get_hal', 'set_hal', 'BACKENDS', 'HARDWARE', 'SIM']
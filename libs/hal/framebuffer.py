@@ -0,0 +1,430 @@
+# libs/hal/framebuffer.py
+"""
+Display SSD1306 sem hardware: emulador do controlador e gravação de quadros.
+
+- SSD1306Emulator decodifica as transações I2C enviadas ao display (control
+  bytes 0x00/0x80/0x40/0xC0, comandos de endereçamento, janelas 0x21/0x22,
+  modo página 0xB0-0xB7) e mantém a GDDRAM como o painel real. Conta bytes
+  no fio, comandos, escritas completas e parciais.
+- FramebufferDisplay é o SimSSD1306 do HAL simulado com o emulador ligado
+  ao barramento: aceita as mesmas chamadas (image/show/fill) e, a cada
+  quadro, entrega o conteúdo do painel às saídas configuradas:
+    MemorySink        lista em memória (testes e benchmarks)
+    PngSink           sequência de PNGs em um diretório
+    SharedMemorySink  último quadro em memória compartilhada, para um
+                      visualizador em outro processo (read_shared_frame)
+
+Como o conteúdo gravado vem do emulador, o que aparece nos quadros é o que
+o painel mostraria, inclusive com atualizações parciais do DisplayPresenter.
+"""
+
+import os
+import struct
+import time
+from collections import deque, namedtuple
+
+from PIL import Image
+
+from .sim import SimSSD1306
+
+
+def init_sequence(width, height):
+    """Comandos de inicialização do driver da Adafruit (charge pump interno)."""
+    return (
+        0xAE,  # display off
+        0x20, 0x00,  # endereçamento horizontal
+        0x40,  # linha inicial 0
+        0xA1,  # remapeamento de segmentos
+        0xA8, height - 1,  # multiplex
+        0xC8,  # varredura COM invertida
+        0xD3, 0x00,  # deslocamento vertical
+        0xDA, 0x02 if width > 2 * height else 0x12,  # pinos COM
+        0xD5, 0x80,  # clock
+        0xD9, 0xF1,  # pré-carga
+        0xDB, 0x30,  # VCOM
+        0x81, 0xFF,  # contraste
+        0xA4,  # mostra a RAM
+        0xA6,  # não invertido
+        0x8D, 0x14,  # charge pump
+        0xAF,  # display on
+    )
+
+
+# Bytes de argumento dos comandos com parâmetros
+COMMAND_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5,
+    0x81: 1, 0x8D: 1, 0xA3: 2, 0xA8: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1,
+    0xDA: 1, 0xDB: 1,
+}
+
+HORIZONTAL = 0
+VERTICAL = 1
+PAGE = 2
+
+# _REVERSE[b] = b com os 8 bits espelhados
+_REVERSE = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+
+Frame = namedtuple('Frame', 'index time_ns pages wire_bytes data_writes')
+
+
+def pages_to_image(pages, width, height):
+    """Converte um buffer em páginas (MVLSB) para imagem PIL modo '1'."""
+    npages = height // 8
+    columns = bytearray(width * npages)
+    for page in range(npages):
+        columns[page::npages] = pages[page * width:(page + 1) * width]
+    raw = bytes(columns).translate(_REVERSE)
+    return Image.frombytes('1', (height, width), raw).transpose(
+        Image.Transpose.TRANSPOSE)
+
+
+class SSD1306Emulator:
+    """
+    Controlador SSD1306 que recebe as transações I2C enviadas ao endereço.
+
+    Uso:
+        emu = SSD1306Emulator(128, 64)
+        i2c.attach(0x3c, emu)   # SimI2C entrega cada writeto em emu.write
+        emu.to_image()          # o que o painel está mostrando
+    """
+
+    def __init__(self, width=128, height=64):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.ram = bytearray(width * self.pages)
+
+        # Estado após reset (datasheet): modo página, janela inteira
+        self.mode = PAGE
+        self.col_start, self.col_end = 0, width - 1
+        self.page_start, self.page_end = 0, self.pages - 1
+        self.col, self.page = 0, 0
+        self.display_on = False
+        self.contrast = 0x7F
+        self.inverted = False
+        self._pending = []  # comando com argumentos ainda incompletos
+
+        self.transactions = 0
+        self.wire_bytes = 0  # endereço + control bytes + conteúdo
+        self.command_bytes = 0
+        self.data_bytes = 0
+        self.commands = 0
+        self.full_writes = 0
+        self.partial_writes = 0
+        self.changed = False  # RAM escrita desde o último take_changed()
+
+    def write(self, data):
+        """Processa uma transação I2C (bytes após o endereço)."""
+        self.transactions += 1
+        self.wire_bytes += len(data) + 1
+        i = 0
+        while i < len(data):
+            control = data[i]
+            i += 1
+            if control & 0x80:
+                # Co=1: um único byte e depois outro control byte
+                chunk = data[i:i + 1]
+                i += 1
+            else:
+                chunk = data[i:]
+                i = len(data)
+            if control & 0x40:
+                self._write_data(chunk)
+            else:
+                for byte in chunk:
+                    self._command_byte(byte)
+
+    def _command_byte(self, byte):
+        self.command_bytes += 1
+        self._pending.append(byte)
+        if len(self._pending) > COMMAND_ARGS.get(self._pending[0], 0):
+            self._execute(self._pending)
+            self._pending = []
+            self.commands += 1
+
+    def _execute(self, cmd):
+        op = cmd[0]
+        if op == 0x20:
+            self.mode = cmd[1] & 0x03
+        elif op == 0x21:
+            self.col_start = min(cmd[1] & 0x7F, self.width - 1)
+            self.col_end = min(cmd[2] & 0x7F, self.width - 1)
+            self.col = self.col_start
+        elif op == 0x22:
+            self.page_start = min(cmd[1] & 0x07, self.pages - 1)
+            self.page_end = min(cmd[2] & 0x07, self.pages - 1)
+            self.page = self.page_start
+        elif 0xB0 <= op <= 0xB7:
+            self.page = min(op & 0x07, self.pages - 1)
+        elif op <= 0x0F:
+            self.col = (self.col & 0xF0) | op
+        elif 0x10 <= op <= 0x1F:
+            self.col = ((op & 0x0F) << 4) | (self.col & 0x0F)
+        elif op == 0x81:
+            self.contrast = cmd[1]
+        elif op in (0xA6, 0xA7):
+            self.inverted = op == 0xA7
+        elif op in (0xAE, 0xAF):
+            self.display_on = op == 0xAF
+        # Demais comandos (hardware/scroll) não alteram a RAM
+
+    def _write_data(self, chunk):
+        n = len(chunk)
+        if not n:
+            return
+        self.data_bytes += n
+        self.changed = True
+        window = ((self.col_end - self.col_start + 1)
+                  * (self.page_end - self.page_start + 1))
+        full = (self.mode == HORIZONTAL and n >= self.width * self.pages
+                and window == self.width * self.pages)
+        if full:
+            self.full_writes += 1
+        else:
+            self.partial_writes += 1
+
+        width = self.width
+        if self.mode == HORIZONTAL:
+            pos = 0
+            while pos < n:
+                count = min(n - pos, self.col_end - self.col + 1)
+                base = self.page * width + self.col
+                self.ram[base:base + count] = chunk[pos:pos + count]
+                pos += count
+                self.col += count
+                if self.col > self.col_end:
+                    self.col = self.col_start
+                    self.page = (self.page + 1 if self.page < self.page_end
+                                 else self.page_start)
+        elif self.mode == VERTICAL:
+            for byte in chunk:
+                self.ram[self.page * width + self.col] = byte
+                self.page += 1
+                if self.page > self.page_end:
+                    self.page = self.page_start
+                    self.col = (self.col + 1 if self.col < self.col_end
+                                else self.col_start)
+        else:
+            # Modo página: só a coluna avança, voltando ao início da linha
+            for byte in chunk:
+                self.ram[self.page * width + self.col] = byte
+                self.col = self.col + 1 if self.col < width - 1 else 0
+
+    def take_changed(self):
+        """Retorna se a RAM foi escrita desde a última chamada e zera a marca."""
+        changed = self.changed
+        self.changed = False
+        return changed
+
+    def to_image(self):
+        """Conteúdo da GDDRAM como imagem PIL modo '1'."""
+        return pages_to_image(self.ram, self.width, self.height)
+
+    def stats(self):
+        return {
+            'transactions': self.transactions,
+            'wire_bytes': self.wire_bytes,
+            'command_bytes': self.command_bytes,
+            'data_bytes': self.data_bytes,
+            'commands': self.commands,
+            'full_writes': self.full_writes,
+            'partial_writes': self.partial_writes,
+        }
+
+
+class MemorySink:
+    """Guarda os quadros em memória (os mais recentes, se limitado)."""
+
+    def __init__(self, max_frames=None):
+        self.frames = deque(maxlen=max_frames)
+        self._size = None
+
+    def bind(self, display):
+        self._size = (display.width, display.height)
+
+    def record(self, frame, display):
+        self.frames.append(frame)
+
+    def images(self):
+        """Quadros guardados como imagens PIL."""
+        return [pages_to_image(f.pages, *self._size) for f in self.frames]
+
+    def close(self):
+        pass
+
+
+class PngSink:
+    """Grava cada quadro como <diretório>/<prefixo>_000001.png."""
+
+    def __init__(self, directory, prefix='frame'):
+        self.directory = directory
+        self.prefix = prefix
+        os.makedirs(directory, exist_ok=True)
+
+    def bind(self, display):
+        pass
+
+    def record(self, frame, display):
+        path = os.path.join(self.directory, f'{self.prefix}_{frame.index:06d}.png')
+        pages_to_image(frame.pages, display.width, display.height).save(path)
+
+    def close(self):
+        pass
+
+
+# Cabeçalho da memória compartilhada: sequência, largura, altura, tempo (ns)
+_SHM_HEADER = struct.Struct('<IHHQ')
+
+
+class SharedMemorySink:
+    """
+    Mantém o último quadro em multiprocessing.shared_memory.
+
+    Layout: cabeçalho (_SHM_HEADER) seguido das páginas do SSD1306. A
+    sequência é escrita por último, então um leitor que vê a mesma
+    sequência antes e depois da cópia tem um quadro consistente.
+    """
+
+    def __init__(self, name='harvest_oled'):
+        self.name = name
+        self._shm = None
+        self._owner = False
+
+    def bind(self, display):
+        from multiprocessing import shared_memory
+        size = _SHM_HEADER.size + display.width * display.height // 8
+        try:
+            self._shm = shared_memory.SharedMemory(self.name, create=True, size=size)
+            self._owner = True
+        except FileExistsError:
+            # Sobra de uma execução anterior: reaproveita se couber
+            self._shm = shared_memory.SharedMemory(self.name)
+            if self._shm.size < size:
+                self._shm.close()
+                raise ValueError(
+                    f"Memória compartilhada {self.name} menor que o quadro")
+
+    def record(self, frame, display):
+        buf = self._shm.buf
+        buf[_SHM_HEADER.size:_SHM_HEADER.size + len(frame.pages)] = frame.pages
+        _SHM_HEADER.pack_into(buf, 0, frame.index, display.width,
+                              display.height, frame.time_ns)
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+
+def read_shared_frame(name='harvest_oled'):
+    """
+    Lê o último quadro publicado por um SharedMemorySink.
+
+    Retorna:
+        tuple: (sequência, imagem PIL) ou None se ainda não há quadro
+    """
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name)
+    try:
+        while True:
+            seq, width, height, _ = _SHM_HEADER.unpack_from(shm.buf, 0)
+            if not seq:
+                return None
+            size = width * height // 8
+            pages = bytes(shm.buf[_SHM_HEADER.size:_SHM_HEADER.size + size])
+            if _SHM_HEADER.unpack_from(shm.buf, 0)[0] == seq:
+                return seq, pages_to_image(pages, width, height)
+    finally:
+        shm.close()
+
+
+def create_sinks(config):
+    """
+    Cria as saídas de quadros a partir da seção 'display' da configuração.
+
+    Args:
+        config: {'record': ['memory', 'png', 'shm'], 'max_frames',
+                 'png_dir', 'shm_name'}
+
+    Levanta:
+        ValueError: saída desconhecida
+    """
+    sinks = []
+    for kind in config.get('record') or ():
+        if kind == 'memory':
+            sinks.append(MemorySink(config.get('max_frames')))
+        elif kind == 'png':
+            sinks.append(PngSink(config.get('png_dir', 'frames')))
+        elif kind == 'shm':
+            sinks.append(SharedMemorySink(config.get('shm_name', 'harvest_oled')))
+        else:
+            raise ValueError(f"Saída de quadros inválida: {kind}")
+    return sinks
+
+
+class FramebufferDisplay(SimSSD1306):
+    """
+    SSD1306 simulado com emulador do controlador e gravação de quadros.
+
+    Uso:
+        sink = MemorySink()
+        disp = FramebufferDisplay(128, 64, SimI2C(realtime=False), sinks=[sink])
+        presenter = DisplayPresenter(disp)  # chama disp.frame_done()
+    """
+
+    def __init__(self, width, height, i2c, addr=0x3c, sinks=()):
+        """
+        Args:
+            width, height: Dimensões do painel
+            i2c: SimI2C (o emulador é ligado ao endereço addr)
+            sinks: Saídas de quadros (MemorySink, PngSink, SharedMemorySink)
+        """
+        super().__init__(width, height, i2c, addr=addr)
+        self.emulator = SSD1306Emulator(width, height)
+        i2c.attach(addr, self.emulator)
+        self.sinks = list(sinks)
+        for sink in self.sinks:
+            sink.bind(self)
+        self.frames = 0
+        self._wire_mark = 0
+        self._writes_mark = 0
+        self.init_display()
+
+    def init_display(self):
+        """Envia a sequência de inicialização do driver da Adafruit."""
+        for cmd in init_sequence(self.width, self.height):
+            self.write_cmd(cmd)
+        self.emulator.take_changed()
+
+    def show(self):
+        super().show()
+        self.frame_done()
+
+    def frame_done(self):
+        """
+        Fim de um quadro: se o painel mudou, registra-o nas saídas.
+
+        Chamado por show() e pelo DisplayPresenter após cada present().
+        """
+        if not self.emulator.take_changed():
+            return
+        emu = self.emulator
+        writes = emu.full_writes + emu.partial_writes
+        self.frames += 1
+        frame = Frame(self.frames, time.monotonic_ns(), bytes(emu.ram),
+                      emu.wire_bytes - self._wire_mark,
+                      writes - self._writes_mark)
+        self._wire_mark = emu.wire_bytes
+        self._writes_mark = writes
+        for sink in self.sinks:
+            sink.record(frame, self)
+
+    def panel_image(self):
+        """O que o painel está mostrando (GDDRAM do emulador)."""
+        return self.emulator.to_image()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
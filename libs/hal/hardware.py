@@ -0,0 +1,41 @@
+# libs/hal/hardware.py
+"""
+Backend real do HAL: lgpio para GPIO e Adafruit Blinka para DHT11/I2C/SSD1306.
+
+As bibliotecas só são importadas quando o recurso é pedido, então o DHT e o
+display não exigem Blinka em processos que só usam GPIO.
+"""
+
+
+class HardwareHal:
+    """Acesso ao hardware da Raspberry Pi."""
+
+    name = 'hardware'
+
+    def __init__(self):
+        import lgpio
+        # Módulo lgpio: os drivers usam a API dele diretamente
+        self.gpio = lgpio
+
+    def dht11(self, pin):
+        """
+        Sensor DHT11 no pino BCM informado.
+
+        Retorna:
+            adafruit_dht.DHT11 (propriedades temperature/humidity)
+        """
+        import adafruit_dht
+        import board
+        return adafruit_dht.DHT11(getattr(board, f'D{pin}'))
+
+    def i2c(self):
+        """Barramento I2C padrão (pinos SCL/SDA)."""
+        import busio
+        from board import SCL, SDA
+        return busio.I2C(SCL, SDA)
+
+    def display(self, width=128, height=64, i2c=None, addr=0x3c):
+        """Display SSD1306 via I2C."""
+        import adafruit_ssd1306
+        return adafruit_ssd1306.SSD1306_I2C(
+            width, height, i2c or self.i2c(), addr=addr)
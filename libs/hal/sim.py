@@ -0,0 +1,581 @@
+# libs/hal/sim.py
+"""
+Backend simulado do HAL: GPIO (API do lgpio), DHT11, I2C e SSD1306.
+
+Os modelos imitam o comportamento temporal do hardware do projeto:
+- pino RC do LDR: carrega depois de charge_us ao virar entrada
+- HC-SR04: a descida do TRIGGER gera um pulso de ECHO com largura
+  proporcional à distância
+- botões: entradas com pull-up, acionadas por press()
+- DHT11: leitura lenta, limitada a uma a cada 2 s, com falhas de checksum
+- SSD1306: buffer em páginas e transferência I2C com tempo proporcional aos
+  bytes enviados; o display do SimHal decodifica o que chega pelo I2C e
+  pode gravar os quadros (framebuffer.py)
+
+Ruído e falhas usam um random.Random com seed configurável, então uma mesma
+configuração gera a mesma sequência de valores. As bordas são entregues por
+uma thread própria com timestamp em ns do relógio monotônico, como o lgpio
+faz com o timestamp do kernel.
+"""
+
+import heapq
+import random
+import threading
+import time
+
+from PIL import Image
+
+
+SPEED_OF_SOUND_CM_S = 34300
+
+# Parâmetros padrão da simulação (pinagem do projeto)
+DEFAULT_CONFIG = {
+    'seed': None,
+    'gpio': {
+        'drop_edge_rate': 0.0,  # Fração de bordas RC/eco perdidas
+    },
+    # Pino BCM -> circuito RC do LDR
+    'rc_pins': {
+        21: {'charge_us': 20000, 'jitter_us': 300},
+    },
+    'sonars': [
+        {'trigger': 24, 'echo': 25, 'distance_cm': 50.0, 'noise_cm': 0.3},
+    ],
+    'dht11': {
+        'temperature': 24.0,
+        'humidity': 45.0,
+        'noise': 0.5,
+        'fail_rate': 0.1,  # Fração de leituras com erro de checksum
+        'read_time': 0.025,
+    },
+    'i2c': {
+        'frequency': 100000,  # Padrão do i2c_arm da Raspberry Pi
+        'realtime': True,  # Espera o tempo de transferência em show()
+        'fail_rate': 0.0,
+        'devices': [0x3c],
+    },
+    # Gravação dos quadros do display: 'memory', 'png' e/ou 'shm'
+    'display': {
+        'record': [],
+        'max_frames': 1000,  # Limite da gravação em memória
+        'png_dir': 'frames',
+        'shm_name': 'harvest_oled',
+    },
+}
+
+
+def merge_config(config=None):
+    """
+    Combina uma configuração parcial com DEFAULT_CONFIG.
+
+    Seções dict são mescladas chave a chave; listas e 'rc_pins' substituem o
+    padrão por inteiro. Chaves de pino vindas de JSON (str) viram int.
+    """
+    merged = {key: (dict(value) if isinstance(value, dict) else value)
+              for key, value in DEFAULT_CONFIG.items()}
+    for key, value in (config or {}).items():
+        if key in ('gpio', 'dht11', 'i2c', 'display'):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    merged['rc_pins'] = {int(pin): dict(cfg)
+                         for pin, cfg in merged['rc_pins'].items()}
+    return merged
+
+
+def _rng(seed, offset):
+    return random.Random(None if seed is None else seed + offset)
+
+
+class _Scheduler:
+    """Thread única que executa funções em instantes do relógio monotônico."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def schedule(self, at_ns, fn, *args):
+        with self._cond:
+            heapq.heappush(self._heap, (at_ns, self._seq, fn, args))
+            self._seq += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name='sim-gpio-edges', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                delay = (self._heap[0][0] - time.monotonic_ns()) / 1e9
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                _, _, fn, args = heapq.heappop(self._heap)
+            fn(*args)
+
+
+class _SimCallback:
+    """Equivalente ao objeto retornado por lgpio.callback."""
+
+    def __init__(self, gpio, pin, func):
+        self._gpio = gpio
+        self._pin = pin
+        self.func = func
+
+    def cancel(self):
+        with self._gpio._lock:
+            callbacks = self._gpio._callbacks.get(self._pin, [])
+            if self in callbacks:
+                callbacks.remove(self)
+
+
+class SimGpio:
+    """
+    Implementa a parte da API do lgpio usada pelo projeto.
+
+    Uso:
+        gpio = SimGpio(rc_pins={21: {'charge_us': 20000}})
+        h = gpio.gpiochip_open(0)
+        gpio.callback(h, 21, gpio.RISING_EDGE, on_edge)
+    """
+
+    SET_PULL_UP = 32
+    SET_PULL_DOWN = 64
+    RISING_EDGE = 1
+    FALLING_EDGE = 2
+    BOTH_EDGES = 3
+    TIMEOUT = 2
+
+    def __init__(self, rc_pins=None, sonars=None, drop_edge_rate=0.0,
+                 echo_delay_us=450, seed=None):
+        """
+        Args:
+            rc_pins: {pino: {'charge_us', 'jitter_us'}} circuitos RC
+            sonars: Lista de {'trigger', 'echo', 'distance_cm', 'noise_cm'}
+            drop_edge_rate: Fração de cargas RC / ecos que nunca chegam
+            echo_delay_us: Atraso entre a descida do TRIGGER e o ECHO
+            seed: Seed do gerador de ruído e falhas
+        """
+        self.rc_pins = {int(pin): dict(cfg) for pin, cfg in (rc_pins or {}).items()}
+        self.sonars = {int(s['trigger']): dict(s) for s in (sonars or [])}
+        self.drop_edge_rate = drop_edge_rate
+        self.echo_delay_us = echo_delay_us
+        self._rng = _rng(seed, 0)
+
+        self._lock = threading.Lock()
+        self._levels = {}  # pino -> nível atual
+        self._delivered = {}  # pino -> nível da última borda entregue
+        self._pulls = {}  # pino -> nível de repouso da entrada
+        self._timeline = {}  # pino -> [(instante_ns, nível)] agendados
+        self._gen = {}  # pino -> geração (invalida transições antigas)
+        self._alerts = {}  # pino -> flags de borda
+        self._callbacks = {}  # pino -> [_SimCallback]
+        self._scheduler = _Scheduler()
+
+    # --- Chip ---
+
+    def gpiochip_open(self, gpiochip):
+        return gpiochip
+
+    def gpiochip_close(self, handle):
+        pass
+
+    # --- Pinos ---
+
+    def gpio_claim_output(self, handle, gpio, level=0, lFlags=0):
+        with self._lock:
+            self._reset(gpio)
+            self._alerts.pop(gpio, None)
+            self._levels[gpio] = level
+            self._delivered[gpio] = level
+
+    def gpio_claim_input(self, handle, gpio, lFlags=0):
+        with self._lock:
+            self._claim_input(gpio, lFlags)
+
+    def gpio_claim_alert(self, handle, gpio, eFlags, lFlags=0,
+                         notify_handle=None):
+        with self._lock:
+            self._claim_input(gpio, lFlags)
+            self._alerts[gpio] = eFlags
+
+    def gpio_free(self, handle, gpio):
+        with self._lock:
+            self._reset(gpio)
+            self._alerts.pop(gpio, None)
+
+    def gpio_read(self, handle, gpio):
+        with self._lock:
+            self._settle(gpio, time.monotonic_ns())
+            return self._levels.get(gpio, self._pulls.get(gpio, 0))
+
+    def gpio_write(self, handle, gpio, level):
+        with self._lock:
+            previous = self._levels.get(gpio, 0)
+            self._levels[gpio] = level
+            if gpio in self.rc_pins and level == 0:
+                self._reset(gpio)
+            sonar = self.sonars.get(gpio)
+            if sonar and previous == 1 and level == 0:
+                self._start_echo(sonar)
+
+    def callback(self, handle, gpio, edge=RISING_EDGE, func=None):
+        cb = _SimCallback(self, gpio, func)
+        with self._lock:
+            self._callbacks.setdefault(gpio, []).append(cb)
+        return cb
+
+    # --- Estímulos externos ---
+
+    def set_input(self, gpio, level):
+        """Força o nível de uma entrada (ex: botão pressionado = 0)."""
+        with self._lock:
+            self._reset(gpio)
+            self._schedule(gpio, 0, level)
+
+    def press(self, gpio, duration=0.1):
+        """Simula um botão ativo em nível baixo pressionado por duration s."""
+        with self._lock:
+            self._reset(gpio)
+            self._schedule(gpio, 0, 0)
+            self._schedule(gpio, int(duration * 1e9), 1)
+
+    # --- Internos (chamados com _lock) ---
+
+    def _claim_input(self, gpio, lFlags):
+        self._reset(gpio)
+        if lFlags & self.SET_PULL_UP:
+            self._pulls[gpio] = 1
+        elif lFlags & self.SET_PULL_DOWN:
+            self._pulls[gpio] = 0
+        if gpio in self.rc_pins:
+            # Capacitor descarregado começa a carregar
+            self._levels[gpio] = 0
+            self._start_charge(gpio)
+        else:
+            self._levels[gpio] = self._pulls.get(gpio, 0)
+        self._delivered[gpio] = self._levels[gpio]
+
+    def _reset(self, gpio):
+        """Cancela transições agendadas do pino."""
+        self._gen[gpio] = self._gen.get(gpio, 0) + 1
+        self._timeline[gpio] = []
+
+    def _dropped(self):
+        return self._rng.random() < self.drop_edge_rate
+
+    def _start_charge(self, gpio):
+        cfg = self.rc_pins[gpio]
+        if self._dropped():
+            return
+        charge_us = self._rng.gauss(cfg['charge_us'], cfg.get('jitter_us', 0))
+        self._schedule(gpio, int(max(charge_us, 1) * 1000), 1)
+
+    def _start_echo(self, sonar):
+        echo = int(sonar['echo'])
+        self._reset(echo)
+        self._levels[echo] = self._delivered[echo] = 0
+        if self._dropped():
+            return
+        distance = self._rng.gauss(sonar['distance_cm'], sonar.get('noise_cm', 0))
+        # Fora do alcance o HC-SR04 devolve um pulso de ~38ms
+        if 2 <= distance <= 400:
+            width_ns = int(2 * distance / SPEED_OF_SOUND_CM_S * 1e9)
+        else:
+            width_ns = 38000000
+        rise_ns = int(self.echo_delay_us * 1000)
+        self._schedule(echo, rise_ns, 1)
+        self._schedule(echo, rise_ns + width_ns, 0)
+
+    def _schedule(self, gpio, delay_ns, level):
+        at_ns = time.monotonic_ns() + delay_ns
+        self._timeline.setdefault(gpio, []).append((at_ns, level))
+        self._scheduler.schedule(
+            at_ns, self._deliver, gpio, self._gen.get(gpio, 0), at_ns, level)
+
+    def _settle(self, gpio, now_ns):
+        """Aplica as transições do pino que já aconteceram."""
+        timeline = self._timeline.get(gpio)
+        while timeline and timeline[0][0] <= now_ns:
+            self._levels[gpio] = timeline.pop(0)[1]
+
+    def _deliver(self, gpio, gen, at_ns, level):
+        """Executado pela thread de bordas no instante da transição."""
+        with self._lock:
+            if self._gen.get(gpio) != gen:
+                return
+            # gpio_read pode já ter aplicado a transição; a borda é
+            # detectada contra o último nível entregue
+            previous = self._delivered.get(gpio)
+            self._delivered[gpio] = level
+            self._settle(gpio, at_ns)
+            if previous == level:
+                return
+            flags = self._alerts.get(gpio, 0)
+            edge = self.RISING_EDGE if level else self.FALLING_EDGE
+            callbacks = list(self._callbacks.get(gpio, ())) if flags & edge else []
+        for cb in callbacks:
+            if cb.func:
+                cb.func(0, gpio, level, at_ns)
+
+
+class SimDHT11:
+    """
+    Imita adafruit_dht.DHT11: cada acesso a temperature/humidity dispara uma
+    leitura, a no máximo uma a cada MIN_INTERVAL s (senão devolve o cache).
+    """
+
+    MIN_INTERVAL = 2.0
+
+    def __init__(self, temperature=24.0, humidity=45.0, noise=0.5,
+                 fail_rate=0.1, read_time=0.025, seed=None):
+        """
+        Args:
+            temperature, humidity: Valores médios do ambiente simulado
+            noise: Desvio padrão do ruído de cada leitura
+            fail_rate: Fração de leituras que falham com RuntimeError
+            read_time: Duração da transação com o sensor (s)
+        """
+        self.base_temperature = temperature
+        self.base_humidity = humidity
+        self.noise = noise
+        self.fail_rate = fail_rate
+        self.read_time = read_time
+        self._rng = _rng(seed, 1)
+        self._last_read = None
+        self._temperature = None
+        self._humidity = None
+        self.reads = 0
+        self.failures = 0
+
+    def measure(self):
+        now = time.monotonic()
+        if self._last_read is not None and now - self._last_read < self.MIN_INTERVAL:
+            return
+        self._last_read = now
+        self.reads += 1
+        time.sleep(self.read_time)
+        if self._rng.random() < self.fail_rate:
+            self.failures += 1
+            raise RuntimeError("Checksum did not validate. Try again.")
+        # DHT11 tem resolução de 1 unidade
+        self._temperature = round(self._rng.gauss(self.base_temperature, self.noise))
+        self._humidity = min(100, max(0, round(
+            self._rng.gauss(self.base_humidity, self.noise))))
+
+    @property
+    def temperature(self):
+        self.measure()
+        return self._temperature
+
+    @property
+    def humidity(self):
+        self.measure()
+        return self._humidity
+
+    def exit(self):
+        pass
+
+
+class SimI2C:
+    """
+    Barramento I2C que contabiliza bytes e o tempo de transferência.
+    """
+
+    def __init__(self, frequency=100000, realtime=True, fail_rate=0.0,
+                 devices=(0x3c,), seed=None):
+        """
+        Args:
+            frequency: Clock do barramento (Hz)
+            realtime: Se True, writeto() espera o tempo que a transferência
+                      levaria no barramento real
+            fail_rate: Fração de transferências que falham com OSError
+            devices: Endereços que respondem ao scan()
+        """
+        self.frequency = frequency
+        self.realtime = realtime
+        self.fail_rate = fail_rate
+        self.devices = list(devices)
+        self._rng = _rng(seed, 2)
+        self._lock = threading.Lock()
+        self._attached = {}  # endereço -> dispositivo emulado (write(data))
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bus_time = 0.0
+
+    def attach(self, address, device):
+        """Liga um dispositivo emulado que recebe cada escrita no endereço."""
+        self._attached[address] = device
+
+    def transfer_time(self, nbytes):
+        """Segundos para enviar endereço + nbytes (9 bits por byte com ACK)."""
+        return (nbytes + 1) * 9 / self.frequency
+
+    def try_lock(self):
+        return self._lock.acquire(blocking=False)
+
+    def unlock(self):
+        self._lock.release()
+
+    def scan(self):
+        return list(self.devices)
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        if address not in self.devices:
+            raise OSError(121, "Remote I/O error")
+        if self._rng.random() < self.fail_rate:
+            raise OSError(121, "Remote I/O error")
+        data = buffer[start:end]
+        elapsed = self.transfer_time(len(data))
+        self.transactions += 1
+        self.bytes_written += len(data)
+        self.bus_time += elapsed
+        device = self._attached.get(address)
+        if device is not None:
+            device.write(bytes(data))
+        if self.realtime:
+            time.sleep(elapsed)
+
+    def deinit(self):
+        pass
+
+
+class SimI2CDevice:
+    """Imita adafruit_bus_device.i2c_device.I2CDevice sobre um SimI2C."""
+
+    def __init__(self, i2c, device_address):
+        self.i2c = i2c
+        self.device_address = device_address
+
+    def __enter__(self):
+        while not self.i2c.try_lock():
+            time.sleep(0)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.i2c.unlock()
+        return False
+
+    def write(self, buf, *, start=0, end=None):
+        self.i2c.writeto(self.device_address, buf, start=start, end=end)
+
+
+class SimSSD1306:
+    """
+    Imita adafruit_ssd1306.SSD1306_I2C: framebuffer em páginas verticais
+    (MVLSB) e show() enviando comandos + buffer inteiro pelo I2C.
+    """
+
+    def __init__(self, width, height, i2c, addr=0x3c):
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.i2c = i2c
+        self.addr = addr
+        self.i2c_device = SimI2CDevice(i2c, addr)
+        # Byte 0 é o control byte de dados (0x40), como no driver da Adafruit
+        self.buffer = bytearray(self.pages * width + 1)
+        self.buffer[0] = 0x40
+        self.buf = memoryview(self.buffer)[1:]
+        self.shows = 0
+        self.last_show_ns = None
+
+    def fill(self, color):
+        value = 0xff if color else 0x00
+        for i in range(len(self.buf)):
+            self.buf[i] = value
+
+    def pixel(self, x, y, color=None):
+        index = (y >> 3) * self.width + x
+        bit = 1 << (y & 7)
+        if color is None:
+            return 1 if self.buf[index] & bit else 0
+        if color:
+            self.buf[index] |= bit
+        else:
+            self.buf[index] &= ~bit & 0xff
+        return None
+
+    def image(self, image):
+        """Copia uma imagem PIL modo '1' para o buffer (mesmo laço da Adafruit)."""
+        if image.mode != '1':
+            raise ValueError("Image must be in mode 1.")
+        if image.size != (self.width, self.height):
+            raise ValueError(
+                f"Image must be same dimensions as display ({self.width}x{self.height}).")
+        pix = image.load()
+        index = 0
+        for page in range(self.pages):
+            for x in range(self.width):
+                bits = 0
+                for bit in [0, 1, 2, 3, 4, 5, 6, 7]:
+                    bits = bits << 1
+                    bits |= 0 if pix[(x, page * 8 + 7 - bit)] == 0 else 1
+                self.buf[index] = bits
+                index += 1
+
+    def write_cmd(self, cmd):
+        with self.i2c_device:
+            self.i2c_device.write(bytes((0x80, cmd)))
+
+    def show(self):
+        # Janela de colunas e páginas, depois o framebuffer inteiro
+        for cmd in (0x21, 0, self.width - 1, 0x22, 0, self.pages - 1):
+            self.write_cmd(cmd)
+        with self.i2c_device:
+            self.i2c_device.write(self.buffer)
+        self.shows += 1
+        self.last_show_ns = time.monotonic_ns()
+
+    def to_image(self):
+        """Conteúdo atual do framebuffer como imagem PIL modo '1'."""
+        image = Image.new('1', (self.width, self.height))
+        pix = image.load()
+        for y in range(self.height):
+            for x in range(self.width):
+                if self.pixel(x, y):
+                    pix[x, y] = 1
+        return image
+
+    def poweroff(self):
+        pass
+
+    def poweron(self):
+        pass
+
+
+class SimHal:
+    """HAL com todos os dispositivos simulados."""
+
+    name = 'sim'
+
+    def __init__(self, config=None):
+        """
+        Args:
+            config: Configuração parcial (ver DEFAULT_CONFIG)
+        """
+        self.config = merge_config(config)
+        seed = self.config['seed']
+        self.gpio = SimGpio(rc_pins=self.config['rc_pins'],
+                            sonars=self.config['sonars'],
+                            seed=seed, **self.config['gpio'])
+        self._i2c = None
+
+    def dht11(self, pin):
+        return SimDHT11(seed=self.config['seed'], **self.config['dht11'])
+
+    def i2c(self):
+        if self._i2c is None:
+            self._i2c = SimI2C(seed=self.config['seed'], **self.config['i2c'])
+        return self._i2c
+
+    def display(self, width=128, height=64, i2c=None, addr=0x3c):
+        """SSD1306 emulado; grava os quadros conforme a seção 'display'."""
+        from .framebuffer import FramebufferDisplay, create_sinks
+        return FramebufferDisplay(width, height, i2c or self.i2c(), addr=addr,
+                                  sinks=create_sinks(self.config['display']))
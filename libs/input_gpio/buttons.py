@@ -1,19 +1,25 @@
 # libs/input_gpio/buttons.py
 """
-Gerenciamento de botões GPIO usando a biblioteca lgpio.
-Fornece leitura com debouncing e callbacks assíncronos.
+Gerenciamento de botões GPIO usando a API do lgpio (via HAL).
+Fornece leitura com debouncing e callbacks assíncronos disparados pelas
+bordas (alertas do lgpio), sem polling. LEFT/RIGHT repetem enquanto
+pressionados, para rolar listas e o teclado virtual.
 Compatível com Raspberry Pi 4/5 e sistemas modernos.
 """
 
-import lgpio
 import time
-from threading import Thread, Lock
+from threading import Lock, Timer, current_thread
+
+from ..hal import get_hal
 
 
 class ButtonManager:
     """
     Gerencia 4 botões físicos conectados aos pinos GPIO.
-    Usa lgpio para leitura com debouncing via polling.
+    Usa alertas de borda do GPIO do HAL: o callback do botão é chamado na
+    thread de alertas do lgpio logo após a borda, com debouncing por tempo.
+    Segurando um botão de REPEAT_BUTTONS, um timer (armado na descida e
+    cancelado na subida) repete o callback.
     """
 
     # Pinos GPIO (BCM) — ajuste conforme o hardware real
@@ -23,14 +29,26 @@ class ButtonManager:
     PIN_MODE = 23
 
     DEBOUNCE_TIME = 0.2  # 200ms
+    REPEAT_DELAY = 0.5  # Segurando: primeira repetição
+    REPEAT_INTERVAL = 0.2  # Segurando: repetições seguintes
+    REPEAT_BUTTONS = ("left", "right")
 
-    def __init__(self):
-        """Inicializa GPIO, configura pinos e inicia monitoramento."""
-        self.chip = lgpio.gpiochip_open(0)  # geralmente chip 0 no RPi
+    def __init__(self, gpio=None):
+        """
+        Inicializa GPIO, configura pinos e inicia monitoramento.
 
-        # Configura todos os pinos como entrada com pull-up
-        for pin in [self.PIN_LEFT, self.PIN_RIGHT, self.PIN_SELECT, self.PIN_MODE]:
-            lgpio.gpio_claim_input(self.chip, pin, lgpio.SET_PULL_UP)
+        Args:
+            gpio: Módulo GPIO com a API do lgpio (padrão: o do HAL)
+        """
+        self.gpio = gpio or get_hal().gpio
+        self.chip = self.gpio.gpiochip_open(0)  # geralmente chip 0 no RPi
+
+        self.pins = {
+            self.PIN_LEFT: "left",
+            self.PIN_RIGHT: "right",
+            self.PIN_SELECT: "select",
+            self.PIN_MODE: "mode",
+        }
 
         self.last_press = {
             "left": 0,
@@ -47,34 +65,68 @@ class ButtonManager:
         }
 
         self.lock = Lock()
-        self.running = True
-
-        # Thread de monitoramento
-        self.monitor_thread = Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
-
-    def _monitor_loop(self):
-        """Loop que monitora os botões e dispara callbacks."""
-        while self.running:
-            current_time = time.time()
-
-            # Leitura de todos os botões
-            buttons = {
-                "left": lgpio.gpio_read(self.chip, self.PIN_LEFT),
-                "right": lgpio.gpio_read(self.chip, self.PIN_RIGHT),
-                "select": lgpio.gpio_read(self.chip, self.PIN_SELECT),
-                "mode": lgpio.gpio_read(self.chip, self.PIN_MODE),
-            }
-
-            for name, value in buttons.items():
-                if value == 0:  # ativo em nível baixo
-                    if current_time - self.last_press[name] > self.DEBOUNCE_TIME:
-                        self.last_press[name] = current_time
-                        callback = self.callbacks[name]
-                        if callback:
-                            callback()
-
-            time.sleep(0.05)  # 50ms de polling
+        self._repeat_timers = {}  # Botão -> Timer da repetição
+
+        # Entradas com pull-up e alerta nas duas bordas (ativo em nível
+        # baixo: descida = pressionado, subida = solto)
+        self._edge_callbacks = []
+        for pin in self.pins:
+            self.gpio.gpio_claim_alert(
+                self.chip, pin, self.gpio.BOTH_EDGES, self.gpio.SET_PULL_UP)
+            self._edge_callbacks.append(self.gpio.callback(
+                self.chip, pin, self.gpio.BOTH_EDGES, self._on_edge))
+
+    def _on_edge(self, chip, gpio, level, timestamp):
+        """Callback do lgpio: borda em um dos botões."""
+        name = self.pins.get(gpio)
+        if name is None:
+            return
+        if level:
+            self._stop_repeat(name)
+            return
+        current_time = time.monotonic()
+        with self.lock:
+            fire = current_time - self.last_press[name] > self.DEBOUNCE_TIME
+            if fire:
+                self.last_press[name] = current_time
+            callback = self.callbacks[name]
+            # Também rearma em descidas do bounce, que seguem uma subida
+            # falsa (que cancelou o timer)
+            if name in self.REPEAT_BUTTONS:
+                self._arm_repeat(name, gpio, self.REPEAT_DELAY)
+        if fire and callback:
+            callback()
+
+    def _arm_repeat(self, name, gpio, delay):
+        """Agenda a próxima repetição (chamado com lock)."""
+        previous = self._repeat_timers.get(name)
+        if previous is not None:
+            previous.cancel()
+        timer = Timer(delay, self._repeat, args=(name, gpio))
+        timer.daemon = True
+        self._repeat_timers[name] = timer
+        timer.start()
+
+    def _stop_repeat(self, name):
+        with self.lock:
+            timer = self._repeat_timers.pop(name, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _repeat(self, name, gpio):
+        """Timer da repetição: repete o callback se o botão segue pressionado."""
+        with self.lock:
+            if self._repeat_timers.get(name) is not current_thread():
+                return  # Solto ou rearmado enquanto este timer disparava
+            # Borda de subida perdida: confere o nível antes de repetir
+            if self.gpio.gpio_read(self.chip, gpio) != 0:
+                del self._repeat_timers[name]
+                return
+            self.last_press[name] = time.monotonic()
+            callback = self.callbacks[name]
+            self._arm_repeat(name, gpio, self.REPEAT_INTERVAL)
+        if callback:
+            callback()
 
     def set_callbacks(self, on_left=None, on_right=None, on_select=None, on_mode=None):
         """
@@ -97,7 +149,14 @@ class ButtonManager:
                 self.callbacks["mode"] = on_mode
 
     def cleanup(self):
-        """Encerra monitoramento e libera recursos GPIO."""
-        self.running = False
-        self.monitor_thread.join(timeout=1.0)
-        lgpio.gpiochip_close(self.chip)
+        """Cancela os alertas e libera recursos GPIO."""
+        with self.lock:
+            timers, self._repeat_timers = list(self._repeat_timers.values()), {}
+        for timer in timers:
+            timer.cancel()
+        for cb in self._edge_callbacks:
+            cb.cancel()
+        self._edge_callbacks = []
+        for pin in self.pins:
+            self.gpio.gpio_free(self.chip, pin)
+        self.gpio.gpiochip_close(self.chip)
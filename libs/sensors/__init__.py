@@ -0,0 +1,9 @@
+# libs/sensors/__init__.py
+"""
+Módulo de sensores do Harvest Bloom.
+Fornece o hub de aquisição com cache de leituras.
+"""
+
+from .hub import SensorHub, Reading
+
+__all__ = ['SensorHub', 'Reading']
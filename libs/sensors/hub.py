@@ -0,0 +1,195 @@
+# libs/sensors/hub.py
+"""
+Hub central de aquisição de sensores.
+
+Cada sensor registrado é amostrado por uma thread própria, no seu próprio
+intervalo, e a última leitura válida fica publicada com timestamp. Rotas da
+API e o controle da bomba apenas consultam o cache (O(1)), então o número de
+leituras físicas não depende de quantos clientes estão consultando.
+"""
+
+import threading
+import time
+from collections import namedtuple
+
+
+# Última leitura válida de um sensor.
+# value: valor retornado pela função de leitura
+# timestamp: time.time() da leitura (para exibir/serializar)
+# monotonic: time.monotonic() da leitura (para calcular idade)
+Reading = namedtuple('Reading', ['value', 'timestamp', 'monotonic'])
+
+
+class _Source:
+    """Estado interno de um sensor registrado no hub."""
+
+    def __init__(self, name, read_fn, interval):
+        self.name = name
+        self.read_fn = read_fn
+        self.interval = interval
+        self.reads = 0
+        self.errors = 0
+        self.last_error = None
+        self.thread = None
+
+
+class SensorHub:
+    """
+    Dono único de todos os sensores físicos.
+
+    Uso:
+        hub = SensorHub()
+        hub.add_source('dht11', read_dht11, interval=2.5)
+        hub.start()
+        reading = hub.get('dht11')  # Reading ou None
+    """
+
+    def __init__(self):
+        """Inicializa o hub sem sensores registrados."""
+        self._sources = {}
+        self._readings = {}
+        self._listeners = []
+        self._stop_event = threading.Event()
+        self.running = False
+
+    def add_source(self, name, read_fn, interval):
+        """
+        Registra um sensor no hub.
+
+        Args:
+            name: Nome único do sensor (ex: 'dht11')
+            read_fn: Função sem argumentos que faz a leitura física.
+                     Deve retornar o valor ou levantar exceção em caso de falha.
+                     Retornar None também é tratado como leitura inválida.
+            interval: Intervalo entre leituras, em segundos
+        """
+        if name in self._sources:
+            raise ValueError(f"Sensor já registrado: {name}")
+        source = _Source(name, read_fn, interval)
+        self._sources[name] = source
+        if self.running:
+            self._start_source(source)
+
+    def subscribe(self, callback):
+        """
+        Registra uma função chamada a cada nova leitura válida.
+
+        O callback roda na thread de amostragem do sensor, então deve ser
+        rápido e não bloquear (ex: apenas enfileirar).
+
+        Args:
+            callback: callback(name, reading)
+        """
+        self._listeners.append(callback)
+
+    def start(self):
+        """Inicia uma thread de amostragem para cada sensor registrado."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self.running = True
+        for source in self._sources.values():
+            self._start_source(source)
+
+    def stop(self, timeout=2.0):
+        """Encerra as threads de amostragem."""
+        self.running = False
+        self._stop_event.set()
+        for source in self._sources.values():
+            if source.thread:
+                source.thread.join(timeout=timeout)
+                source.thread = None
+
+    def get(self, name):
+        """
+        Retorna a última leitura válida de um sensor.
+
+        Retorna:
+            Reading: (value, timestamp, monotonic) ou None se ainda não houve
+            nenhuma leitura válida
+        """
+        return self._readings.get(name)
+
+    def value(self, name, max_age=None):
+        """
+        Retorna apenas o valor da última leitura válida.
+
+        Args:
+            name: Nome do sensor
+            max_age: Se fornecido, leituras mais antigas que isso (segundos)
+                     são tratadas como inexistentes
+
+        Retorna:
+            Valor da leitura ou None
+        """
+        reading = self._readings.get(name)
+        if reading is None:
+            return None
+        if max_age is not None and time.monotonic() - reading.monotonic > max_age:
+            return None
+        return reading.value
+
+    def age(self, name):
+        """Idade da última leitura válida em segundos (None se não houver)."""
+        reading = self._readings.get(name)
+        if reading is None:
+            return None
+        return time.monotonic() - reading.monotonic
+
+    def stats(self):
+        """
+        Retorna contadores de leitura por sensor.
+
+        Retorna:
+            dict: {nome: {'reads', 'errors', 'last_error', 'interval'}}
+        """
+        return {
+            name: {
+                'reads': source.reads,
+                'errors': source.errors,
+                'last_error': source.last_error,
+                'interval': source.interval,
+            }
+            for name, source in self._sources.items()
+        }
+
+    def _notify(self, name, reading):
+        for callback in self._listeners:
+            try:
+                callback(name, reading)
+            except Exception as e:
+                print(f"[ERRO] Listener do hub falhou ({name}): {e}")
+
+    def _start_source(self, source):
+        source.thread = threading.Thread(
+            target=self._sample_loop, args=(source,),
+            name=f"sensor-{source.name}", daemon=True
+        )
+        source.thread.start()
+
+    def _sample_loop(self, source):
+        """Loop de amostragem de um sensor, com período fixo."""
+        next_read = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                value = source.read_fn()
+                if value is None:
+                    raise RuntimeError("Leitura inválida")
+                # Atribuição única de tupla imutável: leitores nunca veem
+                # um estado parcial
+                reading = Reading(value, time.time(), time.monotonic())
+                self._readings[source.name] = reading
+                source.reads += 1
+            except Exception as e:
+                source.errors += 1
+                source.last_error = str(e)
+            else:
+                self._notify(source.name, reading)
+
+            # Mantém o período fixo, sem acumular atraso da própria leitura
+            next_read += source.interval
+            delay = next_read - time.monotonic()
+            if delay < 0:
+                next_read = time.monotonic()
+                delay = 0
+            self._stop_event.wait(delay)
@@ -0,0 +1,119 @@
+# libs/sensors/ldr.py
+"""
+Leitura do LDR por tempo de carga RC usando alertas de borda do lgpio.
+
+O capacitor é descarregado com o pino em saída, depois o pino vira entrada
+com alerta de borda de subida. O tempo de carga é medido entre o instante da
+liberação e o timestamp (em ns) que o kernel atribui à borda, então o valor
+não depende da velocidade do interpretador e a thread fica bloqueada em um
+Event em vez de girar em loop.
+"""
+
+import math
+import threading
+import time
+from collections import namedtuple
+
+from ..hal import get_hal
+
+
+# Resultado de uma leitura do LDR.
+# charge_us: tempo de carga do capacitor em microssegundos (maior = mais escuro)
+# light_pct: luminosidade calibrada 0-100% (100 = claro)
+LdrMeasurement = namedtuple('LdrMeasurement', ['charge_us', 'light_pct'])
+
+
+class LdrSensor:
+    """
+    LDR em circuito RC lido por tempo de carga.
+    """
+
+    def __init__(self, chip, pin, discharge_time=0.1, timeout=0.5,
+                 bright_us=500, dark_us=300000, gpio=None):
+        """
+        Registra o callback de borda de subida do pino.
+
+        Args:
+            chip: Handle retornado por gpio.gpiochip_open
+            pin: Pino GPIO (BCM) ligado ao capacitor
+            discharge_time: Tempo com o pino em nível baixo para descarregar
+                            o capacitor (segundos)
+            timeout: Tempo máximo de carga; acima disso a leitura é
+                     considerada saturada (escuro total)
+            bright_us: Tempo de carga que corresponde a 100% de luz
+            dark_us: Tempo de carga que corresponde a 0% de luz
+            gpio: Módulo GPIO com a API do lgpio (padrão: o do HAL)
+        """
+        self.gpio = gpio or get_hal().gpio
+        self.chip = chip
+        self.pin = pin
+        self.discharge_time = discharge_time
+        self.timeout = timeout
+        self.bright_us = bright_us
+        self.dark_us = dark_us
+
+        self._edge_done = threading.Event()
+        self._armed = False
+        self._edge_ts = None
+
+        self._callback = self.gpio.callback(
+            chip, pin, self.gpio.RISING_EDGE, self._on_edge)
+
+    def _on_edge(self, chip, gpio, level, timestamp):
+        """Callback de borda: registra o instante em que o capacitor carregou."""
+        if self._armed and level == 1:
+            self._edge_ts = timestamp
+            self._armed = False
+            self._edge_done.set()
+
+    def read(self):
+        """
+        Faz uma leitura completa (descarga + carga).
+
+        Retorna:
+            LdrMeasurement
+        """
+        # Descarrega o capacitor
+        self.gpio.gpio_claim_output(self.chip, self.pin, 0)
+        time.sleep(self.discharge_time)
+
+        self._edge_ts = None
+        self._edge_done.clear()
+        self._armed = True
+
+        # A origem do timestamp do kernel varia (boot ou epoch), então
+        # guardamos as duas referências e usamos a mais próxima da borda
+        start_mono = time.monotonic_ns()
+        start_real = time.time_ns()
+        self.gpio.gpio_claim_alert(self.chip, self.pin, self.gpio.RISING_EDGE)
+
+        if not self._edge_done.wait(self.timeout):
+            self._armed = False
+            charge_us = self.timeout * 1e6
+        else:
+            edge = self._edge_ts
+            if abs(edge - start_mono) < abs(edge - start_real):
+                charge_us = (edge - start_mono) / 1000
+            else:
+                charge_us = (edge - start_real) / 1000
+
+        charge_us = max(charge_us, 1)
+        return LdrMeasurement(round(charge_us), self.light_percent(charge_us))
+
+    def light_percent(self, charge_us):
+        """
+        Converte tempo de carga em luminosidade 0-100%.
+
+        A resistência do LDR varia de forma aproximadamente logarítmica com a
+        luz, então a interpolação entre os pontos de calibração é feita em
+        escala log.
+        """
+        charge_us = min(max(charge_us, self.bright_us), self.dark_us)
+        span = math.log(self.dark_us) - math.log(self.bright_us)
+        pct = (math.log(self.dark_us) - math.log(charge_us)) / span * 100
+        return round(pct, 1)
+
+    def close(self):
+        """Cancela o callback e libera o pino."""
+        self._callback.cancel()
+        self.gpio.gpio_free(self.chip, self.pin)
@@ -0,0 +1,150 @@
+# libs/sensors/ultrasonic.py
+"""
+Driver do sensor ultrassônico HC-SR04 usando alertas de borda do lgpio.
+
+As bordas de subida/descida do ECHO são registradas com o timestamp do
+kernel dentro do callback, então a largura do pulso não depende de polling
+em Python. Cada ping tem timeout rígido e as medições são feitas em rajadas,
+retornando a mediana com um indicador de qualidade.
+"""
+
+import statistics
+import threading
+import time
+from collections import namedtuple
+
+from ..hal import get_hal
+
+
+SPEED_OF_SOUND_CM_S = 34300
+
+# Resultado de uma rajada de pings.
+# distance_cm: mediana das distâncias válidas
+# quality: 'ok' ou 'degraded' (poucos ecos válidos ou leituras dispersas)
+# valid: quantidade de pings com eco válido
+# samples: quantidade de pings disparados
+UltrasonicMeasurement = namedtuple(
+    'UltrasonicMeasurement', ['distance_cm', 'quality', 'valid', 'samples'])
+
+
+class UltrasonicSensor:
+    """
+    HC-SR04 com medição por alertas de borda e timeout por ping.
+    """
+
+    MIN_DISTANCE_CM = 2
+    MAX_DISTANCE_CM = 400
+    TRIGGER_PULSE = 0.00001  # 10us
+    MIN_VALID_RATIO = 0.6  # Fração mínima de ecos válidos para 'ok'
+    MAX_SPREAD_CM = 5.0  # Dispersão máxima (máx - mín) para 'ok'
+
+    def __init__(self, chip, trigger_pin, echo_pin, timeout=0.03, burst=5,
+                 ping_interval=0.06, gpio=None):
+        """
+        Configura os pinos e registra o callback de borda do ECHO.
+
+        Args:
+            chip: Handle retornado por gpio.gpiochip_open
+            trigger_pin, echo_pin: Pinos GPIO (BCM)
+            timeout: Tempo máximo de espera pelo eco de cada ping (segundos)
+            burst: Quantidade de pings por medição
+            ping_interval: Intervalo entre pings da rajada (segundos).
+                           O datasheet recomenda >= 60ms para evitar ecos
+                           do ping anterior.
+            gpio: Módulo GPIO com a API do lgpio (padrão: o do HAL)
+        """
+        self.gpio = gpio or get_hal().gpio
+        self.chip = chip
+        self.trigger_pin = trigger_pin
+        self.echo_pin = echo_pin
+        self.timeout = timeout
+        self.burst = burst
+        self.ping_interval = ping_interval
+
+        self._echo_done = threading.Event()
+        self._armed = False
+        self._rise_ts = None
+        self._width_ns = None
+
+        self.gpio.gpio_claim_output(chip, trigger_pin, 0)
+        self.gpio.gpio_claim_alert(chip, echo_pin, self.gpio.BOTH_EDGES)
+        self._callback = self.gpio.callback(
+            chip, echo_pin, self.gpio.BOTH_EDGES, self._on_edge)
+
+    def _on_edge(self, chip, gpio, level, timestamp):
+        """Callback do lgpio: registra as bordas do pulso de ECHO."""
+        if not self._armed:
+            return  # Eco atrasado de um ping que já expirou
+        if level == 1:
+            self._rise_ts = timestamp
+        elif level == 0 and self._rise_ts is not None:
+            self._width_ns = timestamp - self._rise_ts
+            self._armed = False
+            self._echo_done.set()
+
+    def ping(self):
+        """
+        Dispara um único ping e aguarda o eco.
+
+        Retorna:
+            float: Distância em cm, ou None se não houve eco válido
+                   dentro do timeout
+        """
+        self._rise_ts = None
+        self._width_ns = None
+        self._echo_done.clear()
+        self._armed = True
+
+        self.gpio.gpio_write(self.chip, self.trigger_pin, 1)
+        time.sleep(self.TRIGGER_PULSE)
+        self.gpio.gpio_write(self.chip, self.trigger_pin, 0)
+
+        if not self._echo_done.wait(self.timeout):
+            self._armed = False
+            return None
+
+        distance = self._width_ns / 1e9 * SPEED_OF_SOUND_CM_S / 2
+        if not self.MIN_DISTANCE_CM <= distance <= self.MAX_DISTANCE_CM:
+            return None
+        return distance
+
+    def measure(self, burst=None):
+        """
+        Faz uma rajada de pings e retorna a mediana das distâncias válidas.
+
+        Args:
+            burst: Quantidade de pings (padrão: self.burst)
+
+        Retorna:
+            UltrasonicMeasurement
+
+        Levanta:
+            TimeoutError: se nenhum ping da rajada recebeu eco válido
+        """
+        burst = burst or self.burst
+        distances = []
+        for i in range(burst):
+            distance = self.ping()
+            if distance is not None:
+                distances.append(distance)
+            if i < burst - 1:
+                time.sleep(self.ping_interval)
+
+        if not distances:
+            raise TimeoutError("Eco não recebido")
+
+        spread = max(distances) - min(distances)
+        if (len(distances) >= burst * self.MIN_VALID_RATIO
+                and spread <= self.MAX_SPREAD_CM):
+            quality = 'ok'
+        else:
+            quality = 'degraded'
+
+        return UltrasonicMeasurement(
+            statistics.median(distances), quality, len(distances), burst)
+
+    def close(self):
+        """Cancela o callback e libera os pinos."""
+        self._callback.cancel()
+        self.gpio.gpio_free(self.chip, self.echo_pin)
+        self.gpio.gpio_free(self.chip, self.trigger_pin)
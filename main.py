@@ -10,22 +10,26 @@ Fase 1: Inicialização e Interface Local
 - Modo desconectado: lista SSIDs disponíveis para configuração
 """
 
-import subprocess
 import time
-import busio
-from board import SCL, SDA
 from PIL import Image, ImageDraw, ImageFont
-import adafruit_ssd1306
 
+from libs.hal import get_hal
 from libs.input_gpio.buttons import ButtonManager
 from libs.input_gpio.virtual_keyboard import VirtualKeyboard
-from libs.display.display_utils import (
-    draw_info_screen, draw_wifi_list
-)
-from libs.display.virtual_keyboard_display import draw_virtual_keyboard
-from utils.wifi_utils import (
-    scan_wifi_networks, get_known_wifi_ssids, connect_to_wifi
+from libs.display.presenter import DisplayPresenter
+from libs.display.scheduler import RenderScheduler
+from libs.display.screens import (
+    InfoScreen, KeyboardScreen, MessageScreen, SurveyScreen, WifiListScreen
 )
+from utils.link_monitor import LinkMonitor
+from utils.ssh_sessions import SessionTracker
+from utils.system_collector import SystemInfoCollector
+from utils.system_info import SystemInfoProvider
+from utils.wifi_connect import ConnectionManager
+from utils.wifi_scanner import WifiScanner
+from utils.wifi_supervisor import ReconnectSupervisor
+from utils.wifi_survey import SiteSurvey
+from utils.wifi_profiles import get_profile_registry
 
 
 # ============================================================================
@@ -34,10 +38,13 @@ from utils.wifi_utils import (
 
 print("Inicializando hardware...")
 
+# HAL: hardware real ou simulado (variável de ambiente HARVEST_HAL)
+hal = get_hal()
+print(f"✓ HAL: {hal.name}")
+
 # Display SSD1306
 try:
-    i2c = busio.I2C(SCL, SDA)
-    disp = adafruit_ssd1306.SSD1306_I2C(128, 64, i2c)
+    disp = hal.display(128, 64)
     disp.fill(0)
     disp.show()
     print("✓ Display inicializado")
@@ -51,6 +58,9 @@ height = disp.height
 image = Image.new("1", (width, height))
 draw = ImageDraw.Draw(image)
 
+# Envia ao display só os quadros/páginas que mudaram
+presenter = DisplayPresenter(disp)
+
 # Fonte
 try:
     font = ImageFont.truetype("fonts/LSANS.ttf", 9)
@@ -59,6 +69,29 @@ except:
     print("! Fonte customizada não encontrada, usando padrão")
     font = ImageFont.load_default()
 
+# Telas (widgets em modo retido: só o que mudou é redesenhado)
+info_screen = InfoScreen(width, height, font)
+scan_screen = WifiListScreen(width, height, font, "L/R:Nav SEL:Conectar")
+wifi_list_screen = WifiListScreen(width, height, font, "L/R:Nav SEL:Ok MODE:Back")
+keyboard_screen = KeyboardScreen(width, height, font)
+splash_screen = MessageScreen(width, height, font, [(20, 20)])
+connecting_screen = MessageScreen(width, height, font, [(15, 20), (5, 35), (5, 50)])
+success_screen = MessageScreen(width, height, font, [(20, 25), (10, 40)])
+error_screen = MessageScreen(width, height, font, [(25, 20), (5, 35), (5, 50)])
+url_screen = MessageScreen(width, height, font, [(0, 20)], footer="MODE: Voltar")
+survey_screen = SurveyScreen(width, height, font)
+current_screen = None
+
+
+def show_screen(screen):
+    """Renderiza a tela (só widgets alterados) e envia ao display."""
+    global current_screen
+    if screen is not current_screen:
+        screen.invalidate()  # Troca de tela: redesenho completo
+        current_screen = screen
+    presenter.present(image, screen.render(draw))
+
+
 # Botões GPIO
 try:
     buttons = ButtonManager()
@@ -72,140 +105,148 @@ vkeyboard = VirtualKeyboard()
 print("✓ Teclado virtual inicializado")
 
 
-# ============================================================================
-# FUNÇÕES DE COLETA DE INFORMAÇÕES DO SISTEMA
-# ============================================================================
-
-def get_wifi_signal_level():
-    """
-    Obtém nível do sinal Wi-Fi em dBm.
-
-    Retorna:
-        str: Nível do sinal (ex: "-50 dBm") ou "N/A"
-    """
-    try:
-        output = subprocess.check_output(
-            "iw dev wlan0 link | awk '/signal/ {print $2 \" dBm\"}'",
-            shell=True,
-            text=True
-        ).strip()
-        return output if output else "N/A"
-    except:
-        return "N/A"
-
-
-def check_wifi_connected():
-    """
-    Verifica se Wi-Fi está conectado.
-
-    Retorna:
-        tuple: (conectado: bool, ssid: str)
-    """
-    try:
-        ssid = subprocess.check_output(
-            "iwgetid -r",
-            shell=True,
-            text=True
-        ).strip()
-        return True, ssid
-    except:
-        return False, ""
-
-
-def get_ssh_user_count():
-    """
-    Obtém número real de usuários SSH conectados.
-
-    Retorna:
-        int: Número de sessões SSH ativas
-    """
-    try:
-        count = subprocess.check_output(
-            "who | grep -c 'pts/' || echo 0",
-            shell=True,
-            text=True
-        ).strip()
-        return int(count)
-    except:
-        return 0
-
-
-def get_system_info():
-    """
-    Coleta todas as informações do sistema para Fase 1.
-
-    Retorna:
-        dict: Informações do sistema
-    """
-    info = {}
-
-    # Hostname
-    try:
-        info['host'] = subprocess.check_output(
-            "hostname",
-            shell=True,
-            text=True
-        ).strip()
-    except:
-        info['host'] = "N/A"
-
-    # IP
-    try:
-        info['ip'] = subprocess.check_output(
-            "hostname -I | awk '{print $1}'",
-            shell=True,
-            text=True
-        ).strip()
-    except:
-        info['ip'] = "N/A"
-
-    # Wi-Fi conectado?
-    is_connected, ssid = check_wifi_connected()
-    info['wifi_connected'] = is_connected
-    info['ssid'] = ssid if is_connected else "Desconectado"
-
-    # Nível do sinal Wi-Fi
-    if is_connected:
-        info['wifi_signal'] = get_wifi_signal_level()
-        info['wifi_status'] = "Conectado"
-    else:
-        info['wifi_signal'] = "N/A"
-        info['wifi_status'] = "Desconectado"
-
-    # SSH ativo?
-    try:
-        ssh_result = subprocess.check_output(
-            "systemctl is-active ssh",
-            shell=True,
-            text=True
-        ).strip()
-        info['ssh_status'] = "Ativo" if ssh_result == "active" else "Inativo"
-    except:
-        info['ssh_status'] = "Inativo"
-
-    # Usuários SSH (raw count)
-    info['ssh_users_raw'] = get_ssh_user_count()
-
-    return info
-
-
 # ============================================================================
 # VARIÁVEIS DE ESTADO DO MENU
 # ============================================================================
 
-# Estados: CHECK_WIFI, MAIN_CONNECTED, MAIN_DISCONNECTED, WIFI_LIST, PASSWORD_ENTRY, CONNECTING, SHOW_URL
+# Estados: CHECK_WIFI, MAIN_CONNECTED, MAIN_DISCONNECTED, WIFI_LIST, PASSWORD_ENTRY, CONNECTING, SHOW_URL, SURVEY
 menu_estado = 'CHECK_WIFI'
 wifi_lista = []
 wifi_sel = 0
 ssid_sel = ""
 sistema_info = {}
-last_update = 0
-UPDATE_INTERVAL = 2  # Atualiza info a cada 2 segundos
+info_seq = 0  # Snapshot da coleta mostrado na tela
+check_requested = None  # Instante do refresh pedido pelo CHECK_WIFI
+connect_job = None  # Conexão em andamento (CONNECTING)
+survey_view = 'aps'  # SURVEY: 'aps' (por BSSID) ou 'channels'
+survey_sel = 0
+SCAN_INTERVAL = 10  # Reescaneia redes a cada 10 s nas telas de lista
+RESULT_TIME = 3  # Segundos na tela de resultado da conexão
+CONNECTING_FRAME = 0.25  # Intervalo da animação "Conectando"
+MAX_FPS = 30
+SSH_USERS_TTL = 60  # Logins/logouts chegam pelo inotify; isso é só garantia
+LINK_RATE_HZ = 1.0  # Amostras por segundo do enlace Wi-Fi
+
+# Quadros só quando algo muda; callbacks dos botões rodam na thread do laço
+scheduler = RenderScheduler(max_fps=MAX_FPS)
+
+
+# ============================================================================
+# COLETA DE INFORMAÇÕES DO SISTEMA
+# ============================================================================
+
+def on_system_info(snapshot):
+    """Novo snapshot da coleta: redesenha se a tela atual depende dele."""
+    if menu_estado in ('CHECK_WIFI', 'MAIN_CONNECTED', 'SHOW_URL'):
+        scheduler.request_frame()
+
+
+# Sessões SSH: o utmp só é relido quando muda (inotify), e cada login ou
+# logout pede uma releitura imediata da contagem ao coletor
+ssh_sessions = SessionTracker(
+    on_change=lambda sessions: collector.refresh('ssh_users'))
+
+# Enlace Wi-Fi amostrado continuamente; a tela mostra o sinal suavizado.
+# Sem D-Bus, as amostras também avisam o supervisor de quedas
+link_monitor = LinkMonitor('wlan0', rate_hz=LINK_RATE_HZ,
+                           on_sample=lambda sample: supervisor.on_link_sample(sample))
+
+# Sondas (kernel/systemd, cache por campo) rodam numa thread de coleta;
+# o laço só lê o último snapshot publicado
+collector = SystemInfoCollector(
+    SystemInfoProvider(interface='wlan0', sessions=lambda: ssh_sessions.sessions,
+                       signal=link_monitor.smoothed,
+                       ttls={'ssh_users': SSH_USERS_TTL}),
+    on_change=on_system_info)
+
+
+def on_scan_update():
+    """Cache de redes mudou: redesenha se a tela mostra a lista."""
+    if menu_estado in ('MAIN_DISCONNECTED', 'WIFI_LIST'):
+        scheduler.request_frame()
+
+
+# Scans em segundo plano; as telas de lista só leem o cache
+scanner = WifiScanner(interval=SCAN_INTERVAL, on_update=on_scan_update)
+
+
+def on_survey_update():
+    """Scan acumulado no survey: redesenha a tela do survey."""
+    if menu_estado == 'SURVEY':
+        scheduler.request_frame()
+
+
+# Site survey: estatísticas por BSSID a partir dos scans do scanner
+survey = SiteSurvey(scanner, on_update=on_survey_update)
+
+
+def survey_items():
+    """Linhas da visão atual do survey (até 20 caracteres cada)."""
+    if survey_view == 'channels':
+        return [f"C{c['channel']:<3} {c['bssids']:>2} APs {c['per_scan']:4.1f}/sc"
+                for c in survey.channels()]
+    return [f"{(r['ssid'] or '<oculta>')[:7]:<7} {r['mean']:3.0f}±{r['stddev']:<2.0f} "
+            f"c{r['channel'] or '?'}" for r in survey.rows()]
+
+
+def open_survey():
+    """Entra no site survey (começa do zero)."""
+    global menu_estado, survey_view, survey_sel
+
+    menu_estado = 'SURVEY'
+    survey_view = 'aps'
+    survey_sel = 0
+    survey.start()
+
+
+def on_connect_update(job):
+    """Fase da conexão mudou: redesenha a tela de progresso."""
+    if menu_estado == 'CONNECTING':
+        scheduler.request_frame()
+
 
-# Controle de mudança de rede para SSH users
-previous_ssid = ""
-ssh_users_offset = 0  # Offset para ajustar contagem ao trocar rede
-ssh_users_at_connect = 0  # Usuários no momento da conexão
+# Perfis salvos: lidos uma vez, relidos só quando o NetworkManager avisa
+known_profiles = get_profile_registry()
+
+# Conexões rodam em segundo plano; a tela só mostra a fase do job
+connections = ConnectionManager(on_change=on_connect_update,
+                                profiles=known_profiles)
+
+
+def on_link_change(connected):
+    """Enlace caiu ou voltou: relê rede/IP já, sem esperar o TTL."""
+    collector.refresh('ip', 'ssid', 'signal')
+    if menu_estado == 'MAIN_DISCONNECTED':
+        scheduler.request_frame()
+
+
+# Queda do enlace: reconecta sozinho (última rede, depois failover)
+supervisor = ReconnectSupervisor(connections, known_profiles,
+                                 networks=scanner.networks,
+                                 request_scan=scanner.request,
+                                 on_change=on_link_change)
+
+
+def supervisor_footer():
+    """Rodapé da lista quando há reconexão automática em andamento."""
+    status = supervisor.status()
+    if status is None or status['next_attempt_s'] is None:
+        return None
+    if status['next_attempt_s'] < 1:
+        return "Reconectando..."
+    return f"Auto em {status['next_attempt_s']:.0f}s SEL:Con"
+
+
+def update_wifi_list():
+    """Copia o cache do scanner para a lista, mantendo a rede selecionada."""
+    global wifi_lista, wifi_sel
+
+    selected = wifi_lista[wifi_sel] if wifi_sel < len(wifi_lista) else None
+    wifi_lista = scanner.ssids()
+    if selected in wifi_lista:
+        wifi_sel = wifi_lista.index(selected)
+    else:
+        wifi_sel = min(wifi_sel, max(len(wifi_lista) - 1, 0))
 
 
 # ============================================================================
@@ -214,46 +255,47 @@ ssh_users_at_connect = 0  # Usuários no momento da conexão
 
 def on_button_left():
     """Botão LEFT: navega para esquerda."""
-    global wifi_sel
+    global wifi_sel, survey_sel
 
     if menu_estado == 'WIFI_LIST':
         if wifi_sel > 0:
             wifi_sel -= 1
     elif menu_estado == 'PASSWORD_ENTRY':
         vkeyboard.move_left()
+    elif menu_estado == 'SURVEY':
+        survey_sel = max(survey_sel - 1, 0)
 
 
 def on_button_right():
     """Botão RIGHT: navega para direita."""
-    global wifi_sel
+    global wifi_sel, survey_sel
 
     if menu_estado == 'WIFI_LIST':
         if wifi_sel < len(wifi_lista) - 1:
             wifi_sel += 1
     elif menu_estado == 'PASSWORD_ENTRY':
         vkeyboard.move_right()
+    elif menu_estado == 'SURVEY':
+        survey_sel += 1  # Limitado ao tamanho da lista no quadro
+    elif menu_estado == 'MAIN_CONNECTED':
+        open_survey()  # RIGHT não tem outro uso na tela principal
 
 
 def on_button_select():
     """Botão SELECT: confirma seleção."""
-    global menu_estado, wifi_sel, ssid_sel
-
-    if menu_estado == 'MAIN_CONNECTED':
-        menu_estado = 'WIFI_LIST'
-        wifi_lista[:] = scan_wifi_networks()
-        wifi_sel = 0
+    global menu_estado, wifi_sel, ssid_sel, survey_view, survey_sel
 
-    elif menu_estado == 'MAIN_DISCONNECTED':
+    if menu_estado in ('MAIN_CONNECTED', 'MAIN_DISCONNECTED'):
+        # Abre com o cache; o scan novo entra na lista conforme chega
         menu_estado = 'WIFI_LIST'
-        wifi_lista[:] = scan_wifi_networks()
         wifi_sel = 0
+        update_wifi_list()
+        scanner.request()
 
     elif menu_estado == 'WIFI_LIST':
         if wifi_lista:
             ssid_sel = wifi_lista[wifi_sel]
-            known_ssids = get_known_wifi_ssids()
-
-            if ssid_sel in known_ssids:
+            if ssid_sel in known_profiles:
                 menu_estado = 'CONNECTING'
             else:
                 vkeyboard.reset()
@@ -264,6 +306,10 @@ def on_button_select():
         if result == 'DONE':
             menu_estado = 'CONNECTING'
 
+    elif menu_estado == 'SURVEY':
+        survey_view = 'channels' if survey_view == 'aps' else 'aps'
+        survey_sel = 0
+
 
 def on_button_mode():
     """Botão MODE: modo/voltar."""
@@ -271,23 +317,38 @@ def on_button_mode():
 
     if menu_estado == 'WIFI_LIST':
         menu_estado = 'CHECK_WIFI'
+    elif menu_estado == 'CONNECTING':
+        connections.cancel()
     elif menu_estado == 'PASSWORD_ENTRY':
         vkeyboard.toggle_mode()
     elif menu_estado == 'MAIN_CONNECTED':
         menu_estado = 'SHOW_URL'
     elif menu_estado == 'SHOW_URL':
         menu_estado = 'MAIN_CONNECTED'
+    elif menu_estado == 'MAIN_DISCONNECTED':
+        open_survey()
+    elif menu_estado == 'SURVEY':
+        survey.stop()
+        menu_estado = 'CHECK_WIFI'
 
 
-# Configura callbacks dos botões
+# Configura callbacks dos botões (executados pelo laço principal)
 buttons.set_callbacks(
-    on_left=on_button_left,
-    on_right=on_button_right,
-    on_select=on_button_select,
-    on_mode=on_button_mode
+    on_left=lambda: scheduler.post(on_button_left),
+    on_right=lambda: scheduler.post(on_button_right),
+    on_select=lambda: scheduler.post(on_button_select),
+    on_mode=lambda: scheduler.post(on_button_mode)
 )
 
 print("✓ Callbacks configurados")
+
+link_monitor.start()
+collector.start()
+ssh_sessions.start()
+scanner.start()
+known_profiles.profiles()  # Primeira leitura fora dos botões
+supervisor.start()
+print("✓ Coleta de informações do sistema iniciada")
 print("\n" + "="*50)
 print("SISTEMA INICIADO - Fase 1")
 print("="*50)
@@ -297,15 +358,11 @@ print("="*50)
 # ============================================================================
 
 
-draw.rectangle((0, 0, width, height), outline=0, fill=0)
-text = "Harvest Bloom"
-draw.text((20, 20), text, font=font, fill=255)
-disp.image(image)
-disp.show()
+splash_screen.set_lines("Harvest Bloom")
+show_screen(splash_screen)
 time.sleep(3)
-draw.rectangle((0, 0, width, height), outline=0, fill=0)
-disp.image(image)
-disp.show()
+splash_screen.set_lines()
+show_screen(splash_screen)
 
 
 # ============================================================================
@@ -314,25 +371,21 @@ disp.show()
 
 
 try:
-    while True:
-        current_time = time.time()
+    for _ in scheduler.frames():
+        estado_anterior = menu_estado
 
         # ====== CHECK_WIFI: Verifica estado da conexão ======
         if menu_estado == 'CHECK_WIFI':
-            sistema_info = get_system_info()
-
-            # Detecta mudança de rede
-            current_ssid = sistema_info.get('ssid', '')
-            if current_ssid != previous_ssid:
-                # Mudou de rede: reseta contagem de SSH users
-                if sistema_info['wifi_connected']:
-                    ssh_users_at_connect = sistema_info['ssh_users_raw']
-                    ssh_users_offset = ssh_users_at_connect
-                else:
-                    ssh_users_offset = 0
-                    ssh_users_at_connect = 0
-
-                previous_ssid = current_ssid
+            # Pede uma releitura e espera o snapshot dela (on_system_info
+            # pede o quadro quando ele chegar)
+            if check_requested is None:
+                check_requested = collector.refresh()
+            snapshot = collector.snapshot
+            if snapshot.taken_at is None or snapshot.taken_at < check_requested:
+                continue
+            check_requested = None
+            sistema_info = snapshot.info
+            info_seq = snapshot.seq
 
             # Decide próximo estado
             if sistema_info['wifi_connected']:
@@ -340,140 +393,122 @@ try:
             else:
                 menu_estado = 'MAIN_DISCONNECTED'
 
-            last_update = current_time
-
         # ====== MAIN_CONNECTED: Mostra informações (Wi-Fi conectado) ======
         elif menu_estado == 'MAIN_CONNECTED':
-            # Atualiza info periodicamente
-            if current_time - last_update >= UPDATE_INTERVAL:
-                sistema_info = get_system_info()
-
-                # Detecta mudança de rede (enquanto conectado)
-                current_ssid = sistema_info.get('ssid', '')
-                if current_ssid != previous_ssid:
-                    ssh_users_at_connect = sistema_info['ssh_users_raw']
-                    ssh_users_offset = ssh_users_at_connect
-                    previous_ssid = current_ssid
-
-                last_update = current_time
+            # Snapshot novo da coleta (a thread de coleta pede o quadro)
+            snapshot = collector.snapshot
+            if snapshot.seq != info_seq:
+                sistema_info = snapshot.info
+                info_seq = snapshot.seq
 
                 # Se desconectou, muda estado
                 if not sistema_info['wifi_connected']:
                     menu_estado = 'CHECK_WIFI'
+                    scheduler.request_frame()
                     continue
 
-            # Calcula usuários SSH ajustados
-            ssh_users_display = max(
-                0, sistema_info['ssh_users_raw'] - ssh_users_offset)
-
-            # Desenha tela de informações
-            draw_info_screen(
-                draw, width, height, font,
+            # Atualiza tela de informações
+            signal_low = link_monitor.percentiles()['p10']
+            info_screen.update(
                 host=sistema_info['host'],
                 ip=sistema_info['ip'],
-                wifi_status=sistema_info['wifi_status'],
                 wifi_signal=sistema_info['wifi_signal'],
                 ssh_status=sistema_info['ssh_status'],
-                ssh_users=str(ssh_users_display),
-                ssid=sistema_info['ssid']
+                ssh_users=str(sistema_info['ssh_users']),
+                ssid=sistema_info['ssid'],
+                signal_low=str(round(signal_low)) if signal_low is not None else ""
             )
-
-            # Footer customizado
-            draw.rectangle((0, height - 9, width, height), outline=0, fill=0)
-            draw.text((0, height - 8), "SELECT: Trocar Rede",
-                      font=font, fill=255)
-
-            disp.image(image)
-            disp.show()
+            show_screen(info_screen)
 
         # ====== MAIN_DISCONNECTED: Mostra lista de SSIDs ======
         elif menu_estado == 'MAIN_DISCONNECTED':
-            if not wifi_lista or current_time - last_update >= 10:
-                wifi_lista = scan_wifi_networks()
-                last_update = current_time
-
-            if wifi_lista:
-                draw_wifi_list(draw, width, height, font, wifi_lista, wifi_sel)
-                draw.rectangle((0, height - 9, width, height),
-                               outline=0, fill=0)
-                draw.text((0, height - 8), "L/R:Nav SEL:Conectar",
-                          font=font, fill=255)
+            # O supervisor reconectou: volta para a tela principal
+            if supervisor.connected:
+                menu_estado = 'CHECK_WIFI'
             else:
-                draw.rectangle((0, 0, width, height), outline=0, fill=0)
-                draw.text((10, 20), "Nenhuma rede", font=font, fill=255)
-                draw.text((10, 30), "encontrada", font=font, fill=255)
-                draw.text((0, height - 8), "Escaneando...",
-                          font=font, fill=255)
-
-            disp.image(image)
-            disp.show()
+                update_wifi_list()
+                footer = supervisor_footer()
+                scan_screen.update(wifi_lista, wifi_sel, scanner.scanning, footer)
+                show_screen(scan_screen)
+                if footer is not None:
+                    scheduler.wake_in(1.0)  # Contagem regressiva
 
         # ====== WIFI_LIST: Lista de redes (modo conectado) ======
         elif menu_estado == 'WIFI_LIST':
-            if not wifi_lista:
-                wifi_lista = scan_wifi_networks()
-
-            draw_wifi_list(draw, width, height, font, wifi_lista, wifi_sel)
-            draw.rectangle((0, height - 9, width, height), outline=0, fill=0)
-            draw.text((0, height - 8), "L/R:Nav SEL:Ok MODE:Back",
-                      font=font, fill=255)
-
-            disp.image(image)
-            disp.show()
+            update_wifi_list()
+            wifi_list_screen.update(wifi_lista, wifi_sel, scanner.scanning)
+            show_screen(wifi_list_screen)
 
         # ====== PASSWORD_ENTRY: Entrada de senha ======
         elif menu_estado == 'PASSWORD_ENTRY':
-            draw_virtual_keyboard(draw, width, height,
-                                  font, vkeyboard, ssid_sel)
-            disp.image(image)
-            disp.show()
+            keyboard_screen.update(vkeyboard, ssid_sel)
+            show_screen(keyboard_screen)
 
         # ====== CONNECTING: Conectando à rede ======
         elif menu_estado == 'CONNECTING':
-            draw.rectangle((0, 0, width, height), outline=0, fill=0)
-            draw.text((15, 20), "Conectando...", font=font, fill=255)
-            draw.text((5, 35), ssid_sel[:18], font=font, fill=255)
-            disp.image(image)
-            disp.show()
-
-            # Tenta conectar
-            senha = vkeyboard.password if vkeyboard.password else None
-            sucesso, msg = connect_to_wifi(ssid_sel, senha)
-
-            # Mostra resultado
-            draw.rectangle((0, 0, width, height), outline=0, fill=0)
-            if sucesso:
-                draw.text((20, 25), "Conectado!", font=font, fill=255)
-                draw.text((10, 40), "Aguarde...", font=font, fill=255)
-            else:
-                draw.text((25, 20), "Erro!", font=font, fill=255)
-                draw.text((5, 35), msg[:20], font=font, fill=255)
-                draw.text((5, 50), "Voltando...", font=font, fill=255)
-
-            disp.image(image)
-            disp.show()
-            time.sleep(3)
+            # Conecta numa thread; MODE cancela (on_button_mode)
+            if connect_job is None:
+                senha = vkeyboard.password if vkeyboard.password else None
+                connect_job = connections.start(ssid_sel, senha)
+
+            if not connect_job.done:
+                dots = "." * (int(connect_job.elapsed() / CONNECTING_FRAME) % 4)
+                connecting_screen.set_lines(
+                    f"{connect_job.label}{dots}", ssid_sel[:18],
+                    f"{connect_job.elapsed():.0f}s MODE:Cancela")
+                show_screen(connecting_screen)
+                scheduler.wake_in(CONNECTING_FRAME)
+
+            # Mostra o resultado por RESULT_TIME s
+            elif time.monotonic() < connect_job.finished_at + RESULT_TIME:
+                if connect_job.success:
+                    success_screen.set_lines("Conectado!", "Aguarde...")
+                    show_screen(success_screen)
+                else:
+                    error_screen.set_lines(connect_job.label,
+                                           connect_job.message[:20], "Voltando...")
+                    show_screen(error_screen)
+                scheduler.wake_in(connect_job.finished_at + RESULT_TIME
+                                  - time.monotonic())
 
             # Reseta e volta ao início
-            vkeyboard.reset()
-            wifi_lista = []
-            menu_estado = 'CHECK_WIFI'
+            else:
+                vkeyboard.reset()
+                wifi_lista = []
+                connect_job = None
+                menu_estado = 'CHECK_WIFI'
 
         elif menu_estado == 'SHOW_URL':
-            draw.rectangle((0, 0, width, height), outline=0, fill=0)
-            url = f"http://{sistema_info['ip']}:8080"
-
-            draw.text((0, 20),
-                      url, font=font, fill=255)
-            draw.rectangle((0, height - 9, width, height), outline=0, fill=0)
-            draw.text((0, height - 8), "MODE: Voltar", font=font, fill=255)
-            disp.image(image)
-            disp.show()
-
-        time.sleep(0.05)
+            url_screen.set_lines(f"http://{sistema_info['ip']}:8080")
+            show_screen(url_screen)
+
+        # ====== SURVEY: Estatísticas de sinal por BSSID/canal ======
+        elif menu_estado == 'SURVEY':
+            # Redesenha a cada scan acumulado (on_survey_update)
+            items = survey_items()
+            survey_sel = min(survey_sel, max(len(items) - 1, 0))
+            survey_screen.update(survey.summary(), items, survey_sel, survey_view)
+            show_screen(survey_screen)
+
+        # Reescaneamento periódico só nas telas de lista; reconexão
+        # automática suspensa enquanto o usuário mexe no Wi-Fi
+        # (o survey liga o próprio intervalo de scan)
+        scanner.set_periodic(menu_estado in ('MAIN_DISCONNECTED', 'WIFI_LIST', 'SURVEY'))
+        supervisor.hold(menu_estado in ('WIFI_LIST', 'PASSWORD_ENTRY', 'CONNECTING'))
+
+        # Próximo quadro: mudança de estado já (as telas principal e de
+        # lista são redesenhadas pelos snapshots da coleta e pelo scanner)
+        if menu_estado != estado_anterior:
+            scheduler.request_frame()
 
 except KeyboardInterrupt:
     print("\n\nEncerrando aplicação...")
+    ssh_sessions.stop()
+    supervisor.stop()
+    survey.stop()
+    scanner.stop()
+    collector.stop()
+    link_monitor.stop()
     buttons.cleanup()
     disp.fill(0)
     disp.show()
@@ -482,6 +517,12 @@ except Exception as e:
     print(f"\n✗ Erro durante execução: {e}")
     import traceback
     traceback.print_exc()
+    ssh_sessions.stop()
+    supervisor.stop()
+    survey.stop()
+    scanner.stop()
+    collector.stop()
+    link_monitor.stop()
     buttons.cleanup()
     disp.fill(0)
     disp.show()
@@ -0,0 +1,120 @@
+# utils/inotify.py
+"""
+inotify do Linux via ctypes (sem dependências externas).
+
+Só o necessário para acordar quando um arquivo muda: criar a instância,
+adicionar watches e ler os eventos pendentes. O descritor é não bloqueante,
+então quem usa espera com select() e depois chama read_events().
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+from collections import namedtuple
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_EVENT = struct.Struct('iIII')  # wd, mask, cookie, len (+ nome com len bytes)
+
+Event = namedtuple('Event', 'wd mask cookie name')
+
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6',
+                            use_errno=True)
+        _libc.inotify_init1.argtypes = [ctypes.c_int]
+        _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                                            ctypes.c_uint32]
+    return _libc
+
+
+def parse_events(data):
+    """
+    Decodifica o buffer lido do descritor.
+
+    Retorna:
+        list: Event(wd, mask, cookie, name) na ordem do kernel
+    """
+    events = []
+    offset = 0
+    while offset + _EVENT.size <= len(data):
+        wd, mask, cookie, length = _EVENT.unpack_from(data, offset)
+        offset += _EVENT.size
+        name = data[offset:offset + length].split(b'\0', 1)[0]
+        offset += length
+        events.append(Event(wd, mask, cookie, os.fsdecode(name)))
+    return events
+
+
+class Inotify:
+    """
+    Instância do inotify.
+
+    Uso:
+        watcher = Inotify()
+        watcher.add_watch('/var/run', IN_CLOSE_WRITE | IN_MODIFY)
+        select.select([watcher], [], [])
+        for event in watcher.read_events():
+            ...
+
+    Levanta OSError se o sistema não tem inotify (ou a libc não o expõe).
+    """
+
+    def __init__(self):
+        try:
+            libc = _load_libc()
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (AttributeError, OSError) as e:
+            raise OSError(f"inotify indisponível: {e}") from e
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+    def add_watch(self, path, mask):
+        """
+        Observa path (arquivo ou diretório).
+
+        Retorna:
+            int: Descritor do watch (campo wd dos eventos)
+        """
+        wd = _load_libc().inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        return wd
+
+    def read_events(self):
+        """Eventos pendentes (lista vazia se não há nenhum)."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return events
+            if not data:
+                return events
+            events.extend(parse_events(data))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
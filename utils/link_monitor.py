@@ -0,0 +1,231 @@
+# utils/link_monitor.py
+"""
+Monitor contínuo da qualidade do enlace Wi-Fi.
+
+Amostra sinal, ruído (/proc/net/wireless) e taxa de transmissão (ioctl
+SIOCGIWRATE) a uma taxa fixa, sem criar processos, e guarda as amostras em
+buffers circulares de tamanho fixo (array de floats, sem um objeto Python
+por amostra). Expõe o sinal suavizado (média móvel exponencial), percentis
+da janela e o histórico para a API.
+
+Amostras sem associação (Wi-Fi desconectado) entram como NaN: aparecem no
+histórico como lacunas e ficam fora dos percentis.
+
+Uso:
+    monitor = LinkMonitor('wlan0', rate_hz=1.0)
+    monitor.start()
+    monitor.smoothed()  # sinal suavizado em dBm
+    monitor.summary()   # último, suavizado, p10/p50/p90 de cada campo
+"""
+
+import array
+import math
+import threading
+import time
+from collections import namedtuple
+
+from .stats import percentile
+from .system_info import parse_wireless_stats, read_bitrate, WIRELESS_PATH
+
+
+FIELDS = ('signal', 'noise', 'bitrate')
+PERCENTILES = (10, 50, 90)
+
+# signal/noise em dBm, bitrate em Mbit/s (None se não disponível)
+LinkSample = namedtuple('LinkSample', 'signal noise bitrate')
+
+
+def read_link(interface='wlan0', path=WIRELESS_PATH):
+    """
+    Uma amostra do enlace.
+
+    Retorna:
+        LinkSample ou None se a interface não está associada
+    """
+    try:
+        with open(path) as f:
+            stats = parse_wireless_stats(f.read(), interface)
+    except FileNotFoundError:
+        return None
+    if stats is None:
+        return None
+    try:
+        rate = read_bitrate(interface)
+    except OSError:
+        rate = None
+    _, signal, noise = stats
+    return LinkSample(signal, noise, rate / 1e6 if rate else None)
+
+
+class RingBuffer:
+    """Buffer circular de floats sobre um array de tamanho fixo."""
+
+    def __init__(self, size, typecode='d'):
+        self.size = size
+        self._data = array.array(typecode, [math.nan]) * size
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        self._data[self._next] = value
+        self._next = (self._next + 1) % self.size
+        self._count = min(self._count + 1, self.size)
+
+    def last(self):
+        if not self._count:
+            return None
+        return self._data[self._next - 1]
+
+    def values(self, limit=None):
+        """Valores em ordem cronológica (os limit mais recentes)."""
+        count = self._count if limit is None else min(limit, self._count)
+        start = (self._next - count) % self.size
+        if start + count <= self.size:
+            return self._data[start:start + count].tolist()
+        return (self._data[start:] + self._data[:self._next]).tolist()
+
+
+class LinkMonitor:
+    """
+    Amostra o enlace numa thread própria e guarda a janela recente.
+
+    Leituras (smoothed, summary, history) podem vir de qualquer thread.
+    """
+
+    def __init__(self, interface='wlan0', rate_hz=1.0, size=300, alpha=0.3,
+                 read=None, on_sample=None, clock=time.time):
+        """
+        Args:
+            interface: Interface Wi-Fi
+            rate_hz: Amostras por segundo
+            size: Amostras guardadas por campo (300 a 1 Hz = 5 min)
+            alpha: Peso da amostra nova na média móvel exponencial
+            read: Função de leitura (padrão read_link(interface))
+            on_sample: Função chamada com cada LinkSample (ou None)
+            clock: Relógio dos timestamps do histórico
+        """
+        self.interface = interface
+        self.interval = 1.0 / rate_hz
+        self.alpha = alpha
+        self.read = read or (lambda: read_link(interface))
+        self.on_sample = on_sample
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._times = RingBuffer(size)
+        self._buffers = {field: RingBuffer(size, 'f') for field in FIELDS}
+        self._smoothed = dict.fromkeys(FIELDS)
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.samples = 0
+        self.read_errors = 0
+
+    # --- Amostragem ---
+
+    def sample(self):
+        """Lê uma amostra, guarda nos buffers e atualiza as médias."""
+        try:
+            link = self.read()
+        except OSError:
+            self.read_errors += 1
+            link = None
+        now = self.clock()
+        with self._lock:
+            self._times.append(now)
+            for i, field in enumerate(FIELDS):
+                value = link[i] if link is not None else None
+                self._buffers[field].append(math.nan if value is None else value)
+                if value is None:
+                    # Sem valor (ex: desassociou): recomeça a média do zero
+                    self._smoothed[field] = None
+                elif self._smoothed[field] is None:
+                    self._smoothed[field] = float(value)
+                else:
+                    self._smoothed[field] += self.alpha * (value - self._smoothed[field])
+            self.samples += 1
+        if self.on_sample is not None:
+            self.on_sample(link)
+        return link
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name='link-monitor')
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        next_sample = time.monotonic()
+        while not self._stop.is_set():
+            self.sample()
+            # Grade fixa: o tempo da leitura não desloca as próximas amostras
+            next_sample += self.interval
+            delay = next_sample - time.monotonic()
+            if delay < 0:
+                next_sample = time.monotonic()
+                delay = 0
+            self._stop.wait(delay)
+
+    # --- Leituras ---
+
+    def smoothed(self, field='signal'):
+        """Média móvel exponencial do campo (None sem amostra válida)."""
+        value = self._smoothed[field]
+        return round(value, 1) if value is not None else None
+
+    def percentiles(self, field='signal', pcts=PERCENTILES):
+        """
+        Percentis do campo na janela, ignorando as lacunas.
+
+        Retorna:
+            dict: {'p10': ..., ...} (None sem amostras válidas)
+        """
+        with self._lock:
+            values = self._buffers[field].values()
+        valid = sorted(v for v in values if not math.isnan(v))
+        result = {}
+        for pct in pcts:
+            value = percentile(valid, pct)
+            result[f'p{pct}'] = round(value, 1) if value is not None else None
+        return result
+
+    def summary(self):
+        """Último valor, suavizado e percentis de cada campo."""
+        result = {'interface': self.interface, 'samples': self.samples,
+                  'window': len(self._times),
+                  'interval_s': round(self.interval, 3)}
+        for field in FIELDS:
+            with self._lock:
+                last = self._buffers[field].last()
+            stats = {
+                'last': None if last is None or math.isnan(last) else round(last, 1),
+                'smoothed': self.smoothed(field),
+            }
+            stats.update(self.percentiles(field))
+            result[field] = stats
+        return result
+
+    def history(self, limit=None):
+        """
+        Amostras da janela em ordem cronológica.
+
+        Retorna:
+            dict: {'t': [epoch, ...], 'signal': [...], 'noise': [...],
+                   'bitrate': [...]} com None nas lacunas
+        """
+        with self._lock:
+            result = {'t': [round(t, 3) for t in self._times.values(limit)]}
+            for field in FIELDS:
+                result[field] = [None if math.isnan(v) else round(v, 1)
+                                 for v in self._buffers[field].values(limit)]
+        return result
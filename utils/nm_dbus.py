@@ -0,0 +1,561 @@
+# utils/nm_dbus.py
+"""
+Cliente D-Bus do NetworkManager (jeepney), no lugar do `sudo nmcli`.
+
+Uma única conexão com o barramento do sistema fica aberta durante a vida
+do processo. Os pontos de acesso do Wi-Fi são mantidos em cache, com as
+propriedades já lidas, e atualizados pelos sinais do NetworkManager
+(AccessPointAdded/Removed, PropertiesChanged, StateChanged). Assim listar
+redes ou saber o estado não custa nenhuma chamada, e um scan ou uma
+conexão esperam pelo sinal certo em vez de dormir um tempo fixo.
+
+O barramento pode ser trocado pela variável HARVEST_NM_BUS (endereço
+D-Bus), usada com o NetworkManager simulado de utils/nm_standin.py.
+
+Sem root, as ações (scan, conectar) dependem da política do polkit para o
+usuário do serviço.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from jeepney import (
+    DBusAddress, DBusErrorResponse, HeaderFields, MatchRule, MessageType,
+    Properties, message_bus, new_method_call
+)
+from jeepney.io.threading import DBusRouter, open_dbus_connection
+
+from .wifi_utils import KEY_MGMT_PSK, ap_security, dbus_profiles
+
+
+BUS_ENV = 'HARVEST_NM_BUS'
+
+NM_BUS_NAME = 'org.freedesktop.NetworkManager'
+NM_PATH = '/org/freedesktop/NetworkManager'
+NM_IFACE = 'org.freedesktop.NetworkManager'
+DEVICE_IFACE = NM_IFACE + '.Device'
+WIRELESS_IFACE = DEVICE_IFACE + '.Wireless'
+AP_IFACE = NM_IFACE + '.AccessPoint'
+ACTIVE_IFACE = NM_IFACE + '.Connection.Active'
+SETTINGS_PATH = NM_PATH + '/Settings'
+SETTINGS_IFACE = NM_IFACE + '.Settings'
+CONNECTION_IFACE = SETTINGS_IFACE + '.Connection'
+PROPERTIES_IFACE = 'org.freedesktop.DBus.Properties'
+
+NM_STATE_CONNECTED_LOCAL = 50  # 50/60/70: conectado (local, site, global)
+
+ACTIVE_ACTIVATED = 2
+ACTIVE_DEACTIVATED = 4
+MAX_ACTIVE_STATES = 64  # Estados de conexões ativas guardados para espera
+
+# NMDeviceState: etapas da ativação no dispositivo
+DEVICE_DISCONNECTED = 30
+DEVICE_PREPARE = 40
+DEVICE_CONFIG = 50  # Associando ao AP
+DEVICE_NEED_AUTH = 60  # Esperando segredos (senha)
+DEVICE_IP_CONFIG = 70  # DHCP
+DEVICE_IP_CHECK = 80
+DEVICE_SECONDARIES = 90
+DEVICE_ACTIVATED = 100
+DEVICE_FAILED = 120
+
+# NMActiveConnectionStateReason -> mensagem curta para o OLED
+ACTIVE_REASONS = {
+    5: "Falha ao obter IP",
+    6: "Timeout na conexão",
+    9: "Senha incorreta",
+    10: "Falha de autenticação",
+    11: "Conexão removida",
+}
+
+AccessPoint = namedtuple(
+    'AccessPoint',
+    'path ssid bssid strength frequency flags wpa_flags rsn_flags last_seen')
+
+
+def wireless_security(ap, password):
+    """
+    Grupo 802-11-wireless-security de uma rede nova, pelos flags do AP
+    (como o `nmcli device wifi connect` faz).
+
+    Args:
+        ap: AccessPoint da rede, ou None se ela não está no scan (supõe
+            WPA/WPA2 pessoal)
+        password: Senha digitada
+
+    Retorna:
+        dict ou None (rede aberta: sem grupo de segurança)
+
+    Levanta:
+        ValueError: senha ausente ou rede 802.1X (exige usuário/certificado)
+    """
+    security = 'WPA2' if ap is None else ap_security(ap.flags, ap.wpa_flags,
+                                                      ap.rsn_flags)
+    if not security:
+        return None
+    if security == 'WPA-EAP':
+        raise ValueError("Rede 802.1X não suportada")
+    if not password:
+        raise ValueError("Senha obrigatória para rede nova")
+    if security == 'WEP':
+        # 5/13 caracteres ou 10/26 hex: chave; senão, frase-senha
+        key_type = 1 if len(password) in (5, 10, 13, 26) else 2
+        return {'key-mgmt': ('s', 'none'), 'wep-key0': ('s', password),
+                'wep-key-type': ('u', key_type)}
+    # WPA3 só com SAE; em modo de transição (SAE + PSK) o PSK basta
+    if security == 'WPA3' and not ap.rsn_flags & KEY_MGMT_PSK:
+        return {'key-mgmt': ('s', 'sae'), 'psk': ('s', password)}
+    return {'key-mgmt': ('s', 'wpa-psk'), 'psk': ('s', password)}
+
+
+def _body(reply):
+    """Corpo da resposta, ou DBusErrorResponse se for um erro."""
+    if reply.header.message_type == MessageType.error:
+        raise DBusErrorResponse(reply)
+    return reply.body
+
+
+def _variant_value(variant):
+    """Valor de um 'v' do jeepney: tupla (assinatura, valor)."""
+    return variant[1]
+
+
+def _access_point(path, props):
+    ssid = bytes(props.get('Ssid', ('ay', b''))[1])
+    return AccessPoint(
+        path=path,
+        ssid=ssid.decode('utf-8', 'replace'),
+        bssid=props.get('HwAddress', ('s', ''))[1],
+        strength=props.get('Strength', ('y', 0))[1],
+        frequency=props.get('Frequency', ('u', 0))[1],
+        flags=props.get('Flags', ('u', 0))[1],
+        wpa_flags=props.get('WpaFlags', ('u', 0))[1],
+        rsn_flags=props.get('RsnFlags', ('u', 0))[1],
+        last_seen=props.get('LastSeen', ('i', -1))[1],
+    )
+
+
+def error_message(error):
+    """Mensagem curta (OLED) de um DBusErrorResponse."""
+    return str(error.data[0] if error.data else error.name)[:40]
+
+
+class _SignalSink:
+    """
+    "Fila" do filtro do DBusRouter que repassa o sinal para a fila real.
+
+    O DBusRouter chama put_nowait() na thread de recepção; o tratamento
+    (que pode fazer chamadas D-Bus) roda na thread de sinais do cliente.
+    """
+
+    def __init__(self, target, handler):
+        self.target = target
+        self.handler = handler
+
+    def put_nowait(self, msg):
+        self.target.put((self.handler, msg))
+
+
+class NMClient:
+    """
+    Conexão persistente com o NetworkManager para uma interface Wi-Fi.
+
+    Uso:
+        nm = NMClient('wlan0')
+        nm.request_scan()
+        nm.ssids()
+        nm.activate('MinhaRede', 'senha')
+    """
+
+    def __init__(self, interface='wlan0', bus=None, timeout=5.0):
+        """
+        Args:
+            interface: Interface Wi-Fi gerenciada pelo NetworkManager
+            bus: 'SYSTEM', 'SESSION' ou endereço D-Bus (padrão: HARVEST_NM_BUS
+                 ou o barramento do sistema)
+            timeout: Timeout de cada chamada D-Bus em segundos
+
+        Levanta:
+            OSError: barramento indisponível
+            DBusErrorResponse: NetworkManager ausente ou interface desconhecida
+        """
+        self.interface = interface
+        self.timeout = timeout
+        self._conn = open_dbus_connection(bus or os.environ.get(BUS_ENV, 'SYSTEM'))
+        self._router = DBusRouter(self._conn)
+        self._cond = threading.Condition()
+        self._events = queue.Queue()
+        self._filters = []
+        self._listeners = []
+
+        self.calls = 0
+        self.signals = 0
+
+        self.device = self._call(NM_PATH, NM_IFACE, 'GetDeviceByIpIface',
+                                 's', (interface,))[0]
+
+        # Assina os sinais antes de ler o estado inicial: nada se perde
+        self._subscribe(self._on_ap_added, interface=WIRELESS_IFACE,
+                        member='AccessPointAdded', path=self.device)
+        self._subscribe(self._on_ap_removed, interface=WIRELESS_IFACE,
+                        member='AccessPointRemoved', path=self.device)
+        self._subscribe(self._on_state, interface=NM_IFACE,
+                        member='StateChanged', path=NM_PATH)
+        self._subscribe(self._on_device_state, interface=DEVICE_IFACE,
+                        member='StateChanged', path=self.device)
+        self._subscribe(self._on_active_state, interface=ACTIVE_IFACE,
+                        member='StateChanged',
+                        path_namespace=NM_PATH + '/ActiveConnection')
+        self._subscribe(self._on_properties, interface=PROPERTIES_IFACE,
+                        member='PropertiesChanged', path_namespace=NM_PATH)
+        for member in ('NewConnection', 'ConnectionRemoved'):
+            self._subscribe(self._on_connections, interface=SETTINGS_IFACE,
+                            member=member, path=SETTINGS_PATH)
+        self._subscribe(self._on_connections, interface=CONNECTION_IFACE,
+                        member='Updated', path_namespace=SETTINGS_PATH)
+
+        self._state = self._get(NM_PATH, NM_IFACE, 'State')
+        self._device_state = self._get(self.device, DEVICE_IFACE, 'State')
+        wireless = self._get_all(self.device, WIRELESS_IFACE)
+        self._last_scan = _variant_value(wireless.get('LastScan', ('x', -1)))
+        self._active_ap = _variant_value(wireless.get('ActiveAccessPoint', ('o', '/')))
+        self._active_states = {}  # ActiveConnection -> (estado, motivo)
+        self._waiting = set()  # Conexões ativas com wait_active em andamento
+        self._aps = {}
+        for path in self._call(self.device, WIRELESS_IFACE,
+                               'GetAllAccessPoints')[0]:
+            self._load_ap(path)
+
+        self._worker = threading.Thread(target=self._run_signals, daemon=True,
+                                        name='nm-signals')
+        self._worker.start()
+
+    # --- D-Bus ---
+
+    def _call(self, path, interface, method, signature=None, body=()):
+        address = DBusAddress(path, bus_name=NM_BUS_NAME, interface=interface)
+        msg = new_method_call(address, method, signature, body)
+        self.calls += 1
+        return _body(self._router.send_and_get_reply(msg, timeout=self.timeout))
+
+    def _get(self, path, interface, name):
+        address = DBusAddress(path, bus_name=NM_BUS_NAME, interface=interface)
+        self.calls += 1
+        reply = self._router.send_and_get_reply(Properties(address).get(name),
+                                                timeout=self.timeout)
+        return _variant_value(_body(reply)[0])
+
+    def _get_all(self, path, interface):
+        address = DBusAddress(path, bus_name=NM_BUS_NAME, interface=interface)
+        self.calls += 1
+        reply = self._router.send_and_get_reply(Properties(address).get_all(),
+                                                timeout=self.timeout)
+        return _body(reply)[0]
+
+    def _subscribe(self, handler, **rule_args):
+        rule = MatchRule(type='signal', **rule_args)
+        self._router.send_and_get_reply(message_bus.AddMatch(rule),
+                                        timeout=self.timeout)
+        sink = _SignalSink(self._events, handler)
+        self._filters.append(self._router.filter(rule, queue=sink))
+
+    def add_listener(self, callback):
+        """
+        Registra callback(evento, dados) para mudanças vindas dos sinais.
+
+        Eventos: 'ap_added', 'ap_removed', 'ap_changed' (AccessPoint),
+        'scan_done' (LastScan), 'state' (estado global), 'device_state'
+        (NMDeviceState da interface), 'connections_changed' (caminho do
+        perfil criado, alterado ou removido).
+        Chamado na thread de sinais do cliente.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, event, data):
+        for callback in self._listeners:
+            try:
+                callback(event, data)
+            except Exception as e:
+                print(f"[ERRO] Listener do NetworkManager: {e}")
+
+    # --- Thread de sinais ---
+
+    def _run_signals(self):
+        while True:
+            handler, msg = self._events.get()
+            if handler is None:
+                return
+            self.signals += 1
+            try:
+                handler(msg)
+            except (DBusErrorResponse, TimeoutError) as e:
+                # Ex: o AP sumiu entre o sinal e a leitura das propriedades
+                print(f"[INFO] Sinal do NetworkManager ignorado: {e}")
+
+    def _load_ap(self, path):
+        try:
+            ap = _access_point(path, self._get_all(path, AP_IFACE))
+        except DBusErrorResponse:
+            return None
+        with self._cond:
+            self._aps[path] = ap
+        return ap
+
+    def _on_ap_added(self, msg):
+        ap = self._load_ap(msg.body[0])
+        if ap is not None:
+            self._notify('ap_added', ap)
+
+    def _on_ap_removed(self, msg):
+        with self._cond:
+            ap = self._aps.pop(msg.body[0], None)
+        if ap is not None:
+            self._notify('ap_removed', ap)
+
+    def _on_state(self, msg):
+        with self._cond:
+            self._state = msg.body[0]
+            self._cond.notify_all()
+        self._notify('state', self._state)
+
+    def _on_device_state(self, msg):
+        with self._cond:
+            self._device_state = msg.body[0]
+            self._cond.notify_all()
+        self._notify('device_state', self._device_state)
+
+    def _on_connections(self, msg):
+        path = msg.body[0] if msg.body else msg.header.fields[HeaderFields.path]
+        self._notify('connections_changed', path)
+
+    def _on_active_state(self, msg):
+        path = msg.header.fields[HeaderFields.path]
+        with self._cond:
+            self._active_states[path] = (msg.body[0], msg.body[1])
+            if len(self._active_states) > MAX_ACTIVE_STATES:
+                # Ativações feitas por outros programas: descarta a mais
+                # antiga que ninguém está esperando
+                oldest = next((p for p in self._active_states
+                               if p not in self._waiting), None)
+                if oldest is not None:
+                    del self._active_states[oldest]
+            self._cond.notify_all()
+
+    def _on_properties(self, msg):
+        path = msg.header.fields[HeaderFields.path]
+        interface, changed, _ = msg.body
+        if interface == AP_IFACE:
+            with self._cond:
+                ap = self._aps.get(path)
+                if ap is None:
+                    return
+                props = {field: changed[name] for name, field in
+                         (('Strength', 'strength'), ('LastSeen', 'last_seen'))
+                         if name in changed}
+                ap = ap._replace(**{k: _variant_value(v) for k, v in props.items()})
+                self._aps[path] = ap
+            self._notify('ap_changed', ap)
+        elif interface == WIRELESS_IFACE and path == self.device:
+            with self._cond:
+                if 'ActiveAccessPoint' in changed:
+                    self._active_ap = _variant_value(changed['ActiveAccessPoint'])
+                scanned = 'LastScan' in changed
+                if scanned:
+                    self._last_scan = _variant_value(changed['LastScan'])
+                self._cond.notify_all()
+            if scanned:
+                self._notify('scan_done', self._last_scan)
+
+    # --- API ---
+
+    def access_points(self):
+        """Pontos de acesso visíveis, do sinal mais forte para o mais fraco."""
+        with self._cond:
+            aps = list(self._aps.values())
+        return sorted(aps, key=lambda ap: ap.strength, reverse=True)
+
+    def ssids(self):
+        """SSIDs visíveis (sem vazios nem repetidos), mais fortes primeiro."""
+        seen = set()
+        result = []
+        for ap in self.access_points():
+            if ap.ssid and ap.ssid not in seen:
+                seen.add(ap.ssid)
+                result.append(ap.ssid)
+        return result
+
+    def request_scan(self, wait=True, timeout=10.0):
+        """
+        Pede um scan e espera o NetworkManager concluir (LastScan muda).
+
+        Retorna:
+            bool: Se um scan novo terminou dentro do timeout
+        """
+        with self._cond:
+            previous = self._last_scan
+        try:
+            self._call(self.device, WIRELESS_IFACE, 'RequestScan', 'a{sv}', ({},))
+        except DBusErrorResponse as e:
+            # Scan recusado (ex: outro em andamento): fica com o cache
+            print(f"[INFO] Scan recusado pelo NetworkManager: {e.data}")
+            return False
+        if not wait:
+            return True
+        with self._cond:
+            return self._cond.wait_for(lambda: self._last_scan != previous,
+                                       timeout)
+
+    def state(self):
+        """Estado global do NetworkManager (NMState)."""
+        return self._state
+
+    def device_state(self):
+        """Estado da interface Wi-Fi (NMDeviceState)."""
+        return self._device_state
+
+    def connected(self):
+        """Se há conectividade (local, site ou global)."""
+        return self._state >= NM_STATE_CONNECTED_LOCAL
+
+    def active_ssid(self):
+        """SSID do ponto de acesso associado, ou None."""
+        with self._cond:
+            path = self._active_ap
+            ap = self._aps.get(path)
+        if path in ('/', '') or path is None:
+            return None
+        if ap is None:
+            ap = self._load_ap(path)
+        return ap.ssid if ap is not None else None
+
+    def connections(self):
+        """
+        Conexões Wi-Fi salvas, uma por SSID (o nome do perfil pode ser outro;
+        mesma escolha do ProfileRegistry.paths()).
+
+        Retorna:
+            dict: {ssid (802-11-wireless.ssid): caminho D-Bus}
+        """
+        return {ssid: profile.path
+                for ssid, profile in dbus_profiles(self).items()}
+
+    def connection_settings(self):
+        """
+        Configuração de cada conexão salva (sem segredos).
+
+        Retorna:
+            dict: {caminho D-Bus: {grupo: {chave: valor}}}, valores já
+                  sem o variant (ex: settings['connection']['uuid'])
+        """
+        result = {}
+        for path in self._call(SETTINGS_PATH, SETTINGS_IFACE, 'ListConnections')[0]:
+            settings = self._call(path, CONNECTION_IFACE, 'GetSettings')[0]
+            result[path] = {group: {key: _variant_value(value)
+                                    for key, value in values.items()}
+                            for group, values in settings.items()}
+        return result
+
+    def activate(self, ssid, password=None, timeout=30.0, known=None):
+        """
+        Conecta à rede: ativa a conexão salva do SSID ou cria uma nova.
+
+        Args:
+            ssid: Rede
+            password: Senha (obrigatória para redes novas protegidas)
+            timeout: Segundos até desistir de esperar a ativação
+            known: {ssid: caminho} das conexões salvas (evita relistá-las)
+
+        Retorna:
+            tuple: (sucesso: bool, mensagem: str)
+        """
+        try:
+            active = self.start_activation(ssid, password, known)
+        except ValueError as e:
+            return False, str(e)
+        except DBusErrorResponse as e:
+            return False, error_message(e)
+        return self.activation_result(*self.wait_active(active, timeout))
+
+    def start_activation(self, ssid, password=None, known=None):
+        """
+        Pede a ativação e retorna sem esperar (ver wait_active).
+
+        Retorna:
+            str: Caminho da conexão ativa (ActiveConnection)
+
+        Levanta:
+            ValueError: rede nova sem senha (ou 802.1X)
+            DBusErrorResponse: o NetworkManager recusou o pedido
+        """
+        connections = known if known is not None else self.connections()
+        if ssid in connections:
+            return self._call(NM_PATH, NM_IFACE, 'ActivateConnection',
+                              'ooo', (connections[ssid], self.device, '/'))[0]
+        # AP de melhor sinal da rede: define a segurança e a ativação
+        aps = [ap for ap in self.access_points() if ap.ssid == ssid]
+        ap = max(aps, key=lambda ap: ap.strength) if aps else None
+        settings = {
+            'connection': {'id': ('s', ssid), 'type': ('s', '802-11-wireless')},
+            '802-11-wireless': {'ssid': ('ay', ssid.encode())},
+        }
+        security = wireless_security(ap, password)
+        if security is not None:
+            settings['802-11-wireless-security'] = security
+        return self._call(NM_PATH, NM_IFACE, 'AddAndActivateConnection',
+                          'a{sa{sv}}oo', (settings, self.device,
+                                          ap.path if ap else '/'))[1]
+
+    @staticmethod
+    def activation_result(state, reason):
+        """(sucesso, mensagem) a partir do retorno de wait_active."""
+        if state == ACTIVE_ACTIVATED:
+            return True, "Conectado com sucesso"
+        if state is None:
+            return False, "Timeout na conexão"
+        return False, ACTIVE_REASONS.get(reason, f"Falha (motivo {reason})")
+
+    def deactivate(self, active):
+        """Interrompe uma ativação em andamento (ou desconecta)."""
+        self._call(NM_PATH, NM_IFACE, 'DeactivateConnection', 'o', (active,))
+
+    def wait_connected(self, timeout):
+        """Espera o estado global indicar conectividade."""
+        with self._cond:
+            return self._cond.wait_for(self.connected, timeout)
+
+    def wait_active(self, active, timeout):
+        """
+        Espera a conexão ativa chegar a ACTIVATED ou DEACTIVATED.
+
+        Retorna:
+            tuple: (estado, motivo), ou (None, None) no timeout
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            # O sinal pode ter chegado antes de sabermos o caminho
+            initial = self._get(active, ACTIVE_IFACE, 'State')
+        except DBusErrorResponse:
+            initial = ACTIVE_DEACTIVATED  # Objeto já removido: falhou
+        with self._cond:
+            self._active_states.setdefault(active, (initial, 0))
+            self._waiting.add(active)
+            try:
+                done = self._cond.wait_for(
+                    lambda: self._active_states.get(active, (initial, 0))[0] in
+                    (ACTIVE_ACTIVATED, ACTIVE_DEACTIVATED),
+                    max(0.0, deadline - time.monotonic()))
+            finally:
+                self._waiting.discard(active)
+            state, reason = self._active_states.pop(active, (initial, 0))
+        return (state, reason) if done else (None, None)
+
+    def close(self):
+        """Fecha a conexão com o barramento."""
+        self._events.put((None, None))
+        for handle in self._filters:
+            handle.close()
+        self._router.close()
+        self._conn.close()
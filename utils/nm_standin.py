@@ -0,0 +1,518 @@
+# utils/nm_standin.py
+"""
+NetworkManager simulado em D-Bus, para testar sem Wi-Fi nem root.
+
+Exporta no barramento o subconjunto da API do NetworkManager que o
+NMClient (utils/nm_dbus.py) usa: estado global, um dispositivo Wi-Fi com
+pontos de acesso, scan (RequestScan + LastScan), conexões salvas e a
+ativação de conexões com os mesmos sinais do serviço real. Redes, senhas e
+tempos vêm de um dict de configuração.
+
+Roda num dbus-daemon privado, então não interfere no NetworkManager real:
+
+    python -m utils.nm_standin            # imprime o HARVEST_NM_BUS a usar
+    HARVEST_NM_BUS=<endereço> python main.py
+
+Ou dentro de um processo (benchmarks):
+
+    bus = PrivateBus()
+    standin = StandInNetworkManager(bus.address).start()
+    ...
+    standin.stop(); bus.close()
+"""
+
+import argparse
+import random
+import subprocess
+import threading
+import time
+import uuid
+
+from jeepney import (
+    DBusAddress, HeaderFields, MessageType, message_bus, new_error,
+    new_method_return, new_signal
+)
+from jeepney.io.blocking import open_dbus_connection
+
+from .nm_dbus import (
+    ACTIVE_IFACE, AP_IFACE, CONNECTION_IFACE, DEVICE_IFACE, NM_BUS_NAME,
+    NM_IFACE, NM_PATH, PROPERTIES_IFACE, SETTINGS_IFACE, SETTINGS_PATH,
+    WIRELESS_IFACE
+)
+
+
+DEVICE_PATH = NM_PATH + '/Devices/1'
+
+NM_STATE_DISCONNECTED = 20
+NM_STATE_CONNECTED_GLOBAL = 70
+DEVICE_STATE_DISCONNECTED = 30
+DEVICE_STATE_PREPARE = 40
+DEVICE_STATE_CONFIG = 50
+DEVICE_STATE_NEED_AUTH = 60
+DEVICE_STATE_IP_CONFIG = 70
+DEVICE_STATE_ACTIVATED = 100
+DEVICE_STATE_FAILED = 120
+ACTIVE_ACTIVATING = 1
+ACTIVE_ACTIVATED = 2
+ACTIVE_DEACTIVATED = 4
+REASON_NONE = 1
+REASON_USER_DISCONNECTED = 2
+REASON_CONNECT_TIMEOUT = 6
+REASON_NO_SECRETS = 9
+DEVICE_REASON_NO_SECRETS = 7
+DEVICE_REASON_SSID_NOT_FOUND = 53
+
+# Flags de segurança (NM80211ApFlags / NM80211ApSecurityFlags)
+AP_FLAGS_PRIVACY = 0x1
+RSN_PSK = 0x100 | 0x8 | 0x80  # KEY_MGMT_PSK | PAIR_CCMP | GROUP_CCMP
+
+DEFAULT_CONFIG = {
+    'interface': 'wlan0',
+    'networks': [
+        {'ssid': 'Lab-Embarcados', 'bssid': '02:00:00:00:01:01',
+         'strength': 78, 'frequency': 2437, 'password': 'embarcados'},
+        {'ssid': 'Lab-Embarcados', 'bssid': '02:00:00:00:01:02',
+         'strength': 52, 'frequency': 5180, 'password': 'embarcados'},
+        {'ssid': 'Harvest-Guest', 'bssid': '02:00:00:00:02:01',
+         'strength': 64, 'frequency': 2412, 'password': None},
+        {'ssid': 'Vizinho-5G', 'bssid': '02:00:00:00:03:01',
+         'strength': 35, 'frequency': 5745, 'password': 'segredo123'},
+        {'ssid': 'Casa', 'bssid': '02:00:00:00:04:01',
+         'strength': 58, 'frequency': 2462, 'password': 'casa2024'},
+    ],
+    'known': ['Casa'],  # Conexões salvas
+    'connected': None,  # SSID conectado no início
+    'scan_delay': 0.05,  # Segundos até o LastScan mudar
+    'connect_delay': 0.05,  # Segundos até a ativação terminar
+    'strength_jitter': 5,  # Variação do sinal a cada scan
+    'seed': 1,
+}
+
+
+class PrivateBus:
+    """dbus-daemon próprio (barramento de sessão descartável)."""
+
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ['dbus-daemon', '--session', '--nofork', '--print-address'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        self.address = self.process.stdout.readline().strip()
+
+    def close(self):
+        self.process.terminate()
+        self.process.wait(5)
+
+
+class StandInNetworkManager:
+    """
+    Serviço org.freedesktop.NetworkManager simulado.
+
+    Uma thread atende as chamadas e dispara os eventos agendados (fim do
+    scan, fim da ativação), então os sinais saem na mesma ordem do real.
+    """
+
+    def __init__(self, address, config=None):
+        """
+        Args:
+            address: Endereço do barramento (ex: PrivateBus().address)
+            config: Configuração parcial (ver DEFAULT_CONFIG)
+        """
+        self.config = dict(DEFAULT_CONFIG, **(config or {}))
+        self.rng = random.Random(self.config['seed'])
+        self.conn = open_dbus_connection(address)
+        self.conn.send_and_get_reply(message_bus.RequestName(NM_BUS_NAME))
+
+        self.calls = 0
+        self._timers = []  # (instante, função)
+        self._timers_lock = threading.Lock()
+        self._removed = {}  # APs tirados do ar por drop_link
+        self.dropped_at = None  # Instante (monotonic) da última queda
+        self._thread = None
+        self._running = False
+        self._next_id = 1
+
+        self.state = NM_STATE_DISCONNECTED
+        self.device_state = DEVICE_STATE_DISCONNECTED
+        self.last_scan = -1
+        self.active_ap = '/'
+        self.scanning = False
+
+        self.aps = {}  # caminho -> dict do AP
+        for network in self.config['networks']:
+            self._add_ap(network)
+        self.connections = {}  # caminho -> {'id', 'ssid', 'password', ...}
+        for ssid in self.config['known']:
+            self._add_connection(ssid, self._password(ssid))
+        self.active = {}  # caminho -> {'state', 'connection', 'ap'}
+
+        if self.config['connected']:
+            ap = self._find_ap(self.config['connected'])
+            self.active_ap = ap or '/'
+            self.state = NM_STATE_CONNECTED_GLOBAL
+            self.device_state = DEVICE_STATE_ACTIVATED
+
+    # --- Objetos ---
+
+    def _path(self, kind):
+        path = f"{NM_PATH}/{kind}/{self._next_id}"
+        self._next_id += 1
+        return path
+
+    def _add_ap(self, network):
+        path = self._path('AccessPoint')
+        self.aps[path] = dict(network, last_seen=int(time.monotonic()))
+        return path
+
+    def _add_connection(self, ssid, password):
+        path = f"{SETTINGS_PATH}/{self._next_id}"
+        self._next_id += 1
+        self.connections[path] = {
+            'id': ssid, 'ssid': ssid, 'password': password,
+            'uuid': str(uuid.UUID(int=self.rng.getrandbits(128), version=4)),
+            'timestamp': 0}
+        return path
+
+    def _password(self, ssid):
+        for network in self.config['networks']:
+            if network['ssid'] == ssid:
+                return network['password']
+        return None
+
+    def _find_ap(self, ssid):
+        candidates = [(ap['strength'], path) for path, ap in self.aps.items()
+                      if ap['ssid'] == ssid]
+        return max(candidates)[1] if candidates else None
+
+    def _properties(self, path, interface):
+        """Propriedades (variants) de um objeto/interface, ou None."""
+        if path == NM_PATH and interface == NM_IFACE:
+            return {'State': ('u', self.state), 'Version': ('s', '1.42.0-standin')}
+        if path == DEVICE_PATH and interface == DEVICE_IFACE:
+            return {'Interface': ('s', self.config['interface']),
+                    'State': ('u', self.device_state),
+                    'DeviceType': ('u', 2)}
+        if path == DEVICE_PATH and interface == WIRELESS_IFACE:
+            return {'LastScan': ('x', self.last_scan),
+                    'ActiveAccessPoint': ('o', self.active_ap),
+                    'AccessPoints': ('ao', list(self.aps))}
+        if path in self.aps and interface == AP_IFACE:
+            ap = self.aps[path]
+            secured = ap['password'] is not None
+            return {
+                'Ssid': ('ay', ap['ssid'].encode()),
+                'HwAddress': ('s', ap['bssid']),
+                'Strength': ('y', ap['strength']),
+                'Frequency': ('u', ap['frequency']),
+                'Flags': ('u', AP_FLAGS_PRIVACY if secured else 0),
+                'WpaFlags': ('u', 0),
+                'RsnFlags': ('u', RSN_PSK if secured else 0),
+                'LastSeen': ('i', ap['last_seen']),
+            }
+        if path in self.active and interface == ACTIVE_IFACE:
+            active = self.active[path]
+            return {'State': ('u', active['state']),
+                    'Connection': ('o', active['connection']),
+                    'SpecificObject': ('o', active['ap']),
+                    'Id': ('s', self.connections[active['connection']]['id'])}
+        return None
+
+    # --- Sinais ---
+
+    def _emit(self, path, interface, member, signature, body):
+        address = DBusAddress(path, interface=interface)
+        self.conn.send(new_signal(address, member, signature, body))
+
+    def _emit_changed(self, path, interface, changed):
+        self._emit(path, PROPERTIES_IFACE, 'PropertiesChanged', 'sa{sv}as',
+                   (interface, changed, []))
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self._emit(NM_PATH, NM_IFACE, 'StateChanged', 'u', (state,))
+            self._emit_changed(NM_PATH, NM_IFACE, {'State': ('u', state)})
+
+    def _set_active_state(self, path, state, reason):
+        self.active[path]['state'] = state
+        self._emit(path, ACTIVE_IFACE, 'StateChanged', 'uu', (state, reason))
+        self._emit_changed(path, ACTIVE_IFACE, {'State': ('u', state)})
+
+    def _set_device_state(self, state, reason=0):
+        old, self.device_state = self.device_state, state
+        self._emit(DEVICE_PATH, DEVICE_IFACE, 'StateChanged', 'uuu',
+                   (state, old, reason))
+        self._emit_changed(DEVICE_PATH, DEVICE_IFACE, {'State': ('u', state)})
+
+    def _after(self, delay, func):
+        with self._timers_lock:
+            self._timers.append((time.monotonic() + delay, func))
+            self._timers.sort(key=lambda t: t[0])
+
+    # --- Comportamento ---
+
+    def _finish_scan(self):
+        jitter = self.config['strength_jitter']
+        now = int(time.monotonic())
+        for path, ap in self.aps.items():
+            ap['strength'] = max(1, min(100, ap['strength'] +
+                                        self.rng.randint(-jitter, jitter)))
+            ap['last_seen'] = now
+            self._emit_changed(path, AP_IFACE, {
+                'Strength': ('y', ap['strength']),
+                'LastSeen': ('i', now)})
+        self.scanning = False
+        self.last_scan = int(time.monotonic() * 1000)
+        self._emit_changed(DEVICE_PATH, WIRELESS_IFACE,
+                           {'LastScan': ('x', self.last_scan)})
+
+    def _activate(self, connection, ap):
+        # Desativa a conexão anterior, como o NetworkManager faz
+        for path, active in list(self.active.items()):
+            if active['state'] == ACTIVE_ACTIVATED:
+                self._set_active_state(path, ACTIVE_DEACTIVATED, REASON_NONE)
+                del self.active[path]
+
+        path = self._path('ActiveConnection')
+        self.active[path] = {'state': ACTIVE_ACTIVATING,
+                             'connection': connection, 'ap': ap}
+        self._set_device_state(DEVICE_STATE_PREPARE)
+
+        # Etapas do dispositivo distribuídas ao longo do connect_delay
+        delay = self.config['connect_delay']
+        for i, state in enumerate((DEVICE_STATE_CONFIG, DEVICE_STATE_NEED_AUTH,
+                                   DEVICE_STATE_IP_CONFIG), start=1):
+            self._after(delay * i / 4, lambda state=state:
+                        self._activation_step(path, state))
+        self._after(delay, lambda: self._finish_activation(path))
+        return path
+
+    def _activation_step(self, path, state):
+        if path in self.active:  # Não foi cancelada
+            self._set_device_state(state)
+
+    def _deactivate(self, path):
+        if self.active[path]['state'] == ACTIVE_ACTIVATED:
+            self.active_ap = '/'
+            self._emit_changed(DEVICE_PATH, WIRELESS_IFACE,
+                               {'ActiveAccessPoint': ('o', '/')})
+            self._set_state(NM_STATE_DISCONNECTED)
+        self._set_device_state(DEVICE_STATE_DISCONNECTED)
+        self._set_active_state(path, ACTIVE_DEACTIVATED, REASON_USER_DISCONNECTED)
+        del self.active[path]
+
+    def _drop(self, remove):
+        ssid = None
+        for path, active in list(self.active.items()):
+            if active['state'] == ACTIVE_ACTIVATED:
+                ssid = self.connections[active['connection']]['ssid']
+                self._deactivate(path)
+        if self.state != NM_STATE_DISCONNECTED:  # Conectado pelo config
+            if self.active_ap in self.aps:
+                ssid = self.aps[self.active_ap]['ssid']
+            self.active_ap = '/'
+            self._emit_changed(DEVICE_PATH, WIRELESS_IFACE,
+                               {'ActiveAccessPoint': ('o', '/')})
+            self._set_device_state(DEVICE_STATE_DISCONNECTED)
+            self._set_state(NM_STATE_DISCONNECTED)
+        if remove and ssid is not None:
+            for path, ap in list(self.aps.items()):
+                if ap['ssid'] == ssid:
+                    self._removed[path] = self.aps.pop(path)
+                    self._emit(DEVICE_PATH, WIRELESS_IFACE, 'AccessPointRemoved',
+                               'o', (path,))
+        self.dropped_at = time.monotonic()
+
+    def _restore(self):
+        for path, ap in self._removed.items():
+            self.aps[path] = ap
+            self._emit(DEVICE_PATH, WIRELESS_IFACE, 'AccessPointAdded', 'o', (path,))
+        self._removed.clear()
+
+    def drop_link(self, remove_network=False):
+        """
+        Simula a queda do enlace (pode ser chamado de outra thread).
+
+        Args:
+            remove_network: Também tira do ar os APs da rede que caiu
+        """
+        self._after(0, lambda: self._drop(remove_network))
+
+    def restore_networks(self):
+        """Devolve os APs tirados do ar por drop_link."""
+        self._after(0, self._restore)
+
+    def _finish_activation(self, path):
+        active = self.active.get(path)
+        if active is None:  # Cancelada (DeactivateConnection)
+            return
+        settings = self.connections[active['connection']]
+        ap = active['ap'] if active['ap'] != '/' else self._find_ap(settings['ssid'])
+        expected = self.aps[ap]['password'] if ap in self.aps else None
+        if ap not in self.aps or settings['password'] != expected:
+            # Sem AP da rede o NetworkManager desiste por timeout
+            missing = ap not in self.aps
+            self._set_device_state(DEVICE_STATE_FAILED,
+                                   DEVICE_REASON_SSID_NOT_FOUND if missing
+                                   else DEVICE_REASON_NO_SECRETS)
+            self._set_device_state(DEVICE_STATE_DISCONNECTED)
+            self._set_active_state(path, ACTIVE_DEACTIVATED,
+                                   REASON_CONNECT_TIMEOUT if missing
+                                   else REASON_NO_SECRETS)
+            del self.active[path]
+            return
+        self.active_ap = ap
+        settings['timestamp'] = int(time.time())
+        self._emit_changed(DEVICE_PATH, WIRELESS_IFACE,
+                           {'ActiveAccessPoint': ('o', ap)})
+        self._set_device_state(DEVICE_STATE_ACTIVATED)
+        self._set_state(NM_STATE_CONNECTED_GLOBAL)
+        self._set_active_state(path, ACTIVE_ACTIVATED, REASON_NONE)
+
+    # --- Métodos D-Bus ---
+
+    def _handle(self, msg):
+        fields = msg.header.fields
+        path = fields.get(HeaderFields.path)
+        interface = fields.get(HeaderFields.interface)
+        member = fields.get(HeaderFields.member)
+        body = msg.body
+        self.calls += 1
+
+        if interface == PROPERTIES_IFACE:
+            props = self._properties(path, body[0])
+            if props is None:
+                return new_error(msg, 'org.freedesktop.DBus.Error.UnknownInterface',
+                                 's', (f"{body[0]} em {path}",))
+            if member == 'GetAll':
+                return new_method_return(msg, 'a{sv}', (props,))
+            if member == 'Get' and body[1] in props:
+                return new_method_return(msg, 'v', (props[body[1]],))
+            return new_error(msg, 'org.freedesktop.DBus.Error.UnknownProperty',
+                             's', (str(body[-1]),))
+
+        if path == NM_PATH and interface == NM_IFACE:
+            if member == 'GetDeviceByIpIface':
+                if body[0] != self.config['interface']:
+                    return new_error(msg, NM_IFACE + '.UnknownDevice', 's',
+                                     (f"Sem dispositivo {body[0]}",))
+                return new_method_return(msg, 'o', (DEVICE_PATH,))
+            if member == 'GetDevices':
+                return new_method_return(msg, 'ao', ([DEVICE_PATH],))
+            if member == 'ActivateConnection':
+                connection, _, ap = body
+                if connection not in self.connections:
+                    return new_error(msg, SETTINGS_IFACE + '.InvalidConnection',
+                                     's', ("Conexão desconhecida",))
+                return new_method_return(msg, 'o', (self._activate(connection, ap),))
+            if member == 'DeactivateConnection':
+                if body[0] not in self.active:
+                    return new_error(msg, NM_IFACE + '.ConnectionNotActive', 's',
+                                     ("The connection was not active.",))
+                self._deactivate(body[0])
+                return new_method_return(msg)
+            if member == 'AddAndActivateConnection':
+                settings, _, ap = body
+                ssid = bytes(settings['802-11-wireless']['ssid'][1]).decode()
+                security = settings.get('802-11-wireless-security', {})
+                password = security['psk'][1] if 'psk' in security else None
+                connection = self._add_connection(ssid, password)
+                self._emit(SETTINGS_PATH, SETTINGS_IFACE, 'NewConnection', 'o',
+                           (connection,))
+                return new_method_return(msg, 'oo', (
+                    connection, self._activate(connection, ap)))
+
+        if path == DEVICE_PATH and interface == WIRELESS_IFACE:
+            if member in ('GetAllAccessPoints', 'GetAccessPoints'):
+                return new_method_return(msg, 'ao', (list(self.aps),))
+            if member == 'RequestScan':
+                if self.scanning:
+                    return new_error(msg, DEVICE_IFACE + '.NotAllowed', 's',
+                                     ("Scanning not allowed while already scanning",))
+                self.scanning = True
+                self._after(self.config['scan_delay'], self._finish_scan)
+                return new_method_return(msg)
+
+        if path == SETTINGS_PATH and interface == SETTINGS_IFACE:
+            if member == 'ListConnections':
+                return new_method_return(msg, 'ao', (list(self.connections),))
+
+        if path in self.connections and interface == CONNECTION_IFACE:
+            if member == 'GetSettings':
+                settings = self.connections[path]
+                return new_method_return(msg, 'a{sa{sv}}', ({
+                    'connection': {'id': ('s', settings['id']),
+                                   'uuid': ('s', settings['uuid']),
+                                   'type': ('s', '802-11-wireless'),
+                                   'autoconnect-priority': ('i', 0),
+                                   'timestamp': ('t', settings['timestamp'])},
+                    '802-11-wireless': {'ssid': ('ay', settings['ssid'].encode())},
+                },))
+            if member == 'Delete':
+                del self.connections[path]
+                self._emit(path, CONNECTION_IFACE, 'Removed', '', ())
+                self._emit(SETTINGS_PATH, SETTINGS_IFACE, 'ConnectionRemoved',
+                           'o', (path,))
+                return new_method_return(msg)
+
+        return new_error(msg, 'org.freedesktop.DBus.Error.UnknownMethod', 's',
+                         (f"{interface}.{member} em {path}",))
+
+    # --- Laço ---
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='nm-standin')
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(2.0)
+            self._thread = None
+        self.conn.close()
+
+    def _run(self):
+        while self._running:
+            now = time.monotonic()
+            while True:
+                with self._timers_lock:
+                    if not self._timers or self._timers[0][0] > now:
+                        break
+                    _, func = self._timers.pop(0)
+                func()
+            timeout = 0.1
+            with self._timers_lock:
+                if self._timers:
+                    timeout = min(timeout, max(0.0, self._timers[0][0] - now))
+            try:
+                msg = self.conn.receive(timeout=timeout)
+            except TimeoutError:
+                continue
+            if msg.header.message_type == MessageType.method_call:
+                self.conn.send(self._handle(msg))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--connected', help="SSID conectado no início")
+    args = parser.parse_args()
+
+    bus = PrivateBus()
+    standin = StandInNetworkManager(bus.address, {'connected': args.connected})
+    standin.start()
+    print(f"export HARVEST_NM_BUS='{bus.address}'")
+    print("[INFO] NetworkManager simulado rodando (Ctrl+C para sair)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.stop()
+        bus.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+# utils/ssh_sessions.py
+"""
+Sessões SSH abertas, atualizadas quando alguém entra ou sai.
+
+O sshd grava um registro no /var/run/utmp a cada login e logout. Em vez de
+reler o arquivo (ou rodar `who`) periodicamente, o SessionTracker observa o
+diretório do utmp com inotify e só relê os registros quando o arquivo muda.
+Observar o diretório (e não o arquivo) cobre o utmp sendo recriado no boot.
+
+Sem inotify (outro sistema operacional, libc sem suporte) cai para conferir
+o mtime do arquivo a cada poll_interval, o que também não cria processos.
+
+Uso:
+    tracker = SessionTracker(on_change=lambda sessions: ...)
+    tracker.start()
+    tracker.remote()  # sessões em pts/ (SSH)
+"""
+
+import os
+import select
+import threading
+
+from .inotify import IN_CLOSE_WRITE, IN_CREATE, IN_MODIFY, IN_MOVED_TO, Inotify
+from .utmp import UTMP_PATH, is_remote, read_sessions
+
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE | IN_MOVED_TO
+
+
+def session_details(session):
+    """Dict público de uma sessão (usuário, terminal, origem, login)."""
+    return {
+        'user': session.user,
+        'tty': session.line,
+        'host': session.host,
+        'ip': session.addr or None,
+        'pid': session.pid,
+        'login_time': session.login_time,
+    }
+
+
+class SessionTracker:
+    """
+    Mantém a lista de sessões do utmp sempre atualizada.
+
+    A lista é trocada inteira (tupla nova) a cada mudança, então quem lê
+    tracker.sessions de outra thread sempre vê um estado consistente.
+    """
+
+    def __init__(self, path=UTMP_PATH, on_change=None, poll_interval=2.0):
+        """
+        Args:
+            path: Arquivo utmp
+            on_change: Função chamada com as sessões novas (na thread do tracker)
+            poll_interval: Intervalo de conferência do mtime sem inotify
+        """
+        self.path = path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.sessions = tuple(read_sessions(path))
+
+        self.reloads = 0  # Releituras do arquivo
+        self.changes = 0  # Releituras que mudaram as sessões
+        self.mode = None  # 'inotify' ou 'poll', definido no start()
+
+        self._stop_r = self._stop_w = None  # Pipe que acorda a thread no stop()
+        self._thread = None
+
+    def remote(self):
+        """Sessões em pts/ (SSH e afins), na ordem do utmp."""
+        return [s for s in self.sessions if is_remote(s)]
+
+    def count(self):
+        """Número de sessões remotas (o antigo `who | grep -c pts/`)."""
+        return len(self.remote())
+
+    def details(self):
+        """Detalhes das sessões remotas para a API."""
+        return [session_details(s) for s in self.remote()]
+
+    def reload(self):
+        """
+        Relê o utmp e avisa on_change se as sessões mudaram.
+
+        Retorna:
+            bool: Se houve mudança
+        """
+        sessions = tuple(read_sessions(self.path))
+        self.reloads += 1
+        if sessions == self.sessions:
+            return False
+        self.sessions = sessions
+        self.changes += 1
+        if self.on_change is not None:
+            self.on_change(sessions)
+        return True
+
+    def start(self):
+        if self._thread is None:
+            self._stop_r, self._stop_w = os.pipe()
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name='ssh-sessions')
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        """Encerra a thread (pode ser chamado mais de uma vez)."""
+        if self._thread is None:
+            return
+        os.write(self._stop_w, b'x')
+        self._thread.join(timeout)
+        self._thread = None
+        os.close(self._stop_r)
+        os.close(self._stop_w)
+        self._stop_r = self._stop_w = None
+
+    def _run(self):
+        try:
+            watcher = Inotify()
+            watcher.add_watch(os.path.dirname(self.path) or '.', WATCH_MASK)
+        except OSError as e:
+            print(f"[INFO] Sessões SSH sem inotify ({e}), conferindo mtime")
+            self.mode = 'poll'
+            self._poll()
+            return
+
+        self.mode = 'inotify'
+        name = os.path.basename(self.path)
+        try:
+            self.reload()  # Pode ter mudado entre o __init__ e o watch
+            while True:
+                ready, _, _ = select.select([watcher, self._stop_r], [], [])
+                if self._stop_r in ready:
+                    return
+                # Um login gera vários eventos: uma releitura por lote
+                if any(event.name == name for event in watcher.read_events()):
+                    self.reload()
+        finally:
+            watcher.close()
+
+    def _poll(self):
+        last = self._stat()
+        while True:
+            ready, _, _ = select.select([self._stop_r], [], [],
+                                        self.poll_interval)
+            if ready:
+                return
+            current = self._stat()
+            if current != last:
+                last = current
+                self.reload()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
@@ -0,0 +1,31 @@
+# utils/stats.py
+"""
+Estatísticas compartilhadas pelo agendador do OLED, pela coleta
+de informações do sistema, pelo monitor do enlace e pelos benchmarks.
+
+Todos os percentis (p50_ms, p95_ms, ...) usam percentile(), por interpolação
+linear.
+"""
+
+
+def percentile(sorted_values, pct):
+    """Percentil por interpolação linear de uma lista já ordenada."""
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def latency_summary(values):
+    """Resumo em ms (n, p50, p95, máx) de uma lista de durações em s."""
+    if not values:
+        return {'n': 0}
+    ordered = sorted(values)
+    return {
+        'n': len(ordered),
+        'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 95) * 1000, 3),
+        'max_ms': round(ordered[-1] * 1000, 3),
+    }
@@ -0,0 +1,231 @@
+# utils/system_collector.py
+"""
+Coleta das informações do sistema fora da thread da interface.
+
+O laço do OLED não chama mais as sondas: uma thread de coleta dispara as
+sondas vencidas (TTL do SystemInfoProvider) em paralelo num pool pequeno,
+espera cada uma no máximo o seu timeout e publica um snapshot imutável.
+A interface só lê collector.snapshot, então uma sonda travada (systemd,
+driver Wi-Fi) nunca congela a tela nem os botões.
+
+Uma sonda que estoura o timeout mantém o último valor conhecido e não é
+disparada de novo enquanto a execução anterior não terminar, para não
+ocupar todos os workers.
+
+Uso:
+    collector = SystemInfoCollector(SystemInfoProvider(),
+                                    on_change=lambda s: scheduler.request_frame())
+    collector.start()
+    info = collector.snapshot.info  # leitura sem bloqueio
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from types import MappingProxyType
+
+from .stats import latency_summary
+from .system_info import build_info
+
+
+HISTORY = 128  # Latências guardadas por sonda
+
+# Segundos que cada sonda pode levar antes de ser abandonada
+DEFAULT_TIMEOUTS = {
+    'host': 0.5,
+    'ip': 0.5,
+    'ssid': 0.5,
+    'signal': 0.5,
+    'ssh_status': 1.0,
+    'ssh_users': 0.5,
+}
+
+# seq: número da publicação; taken_at: início (monotonic) do ciclo de coleta;
+# info: dict somente leitura no formato de build_info()
+Snapshot = namedtuple('Snapshot', 'seq taken_at info')
+
+EMPTY_SNAPSHOT = Snapshot(0, None, MappingProxyType({}))
+
+
+class SystemInfoCollector:
+    """
+    Roda as sondas do SystemInfoProvider em segundo plano.
+
+    A cada ciclo (no vencimento do menor TTL ou após refresh()) as sondas
+    vencidas rodam em paralelo; o resultado vira um novo Snapshot, trocado
+    por atribuição simples (atômica), e on_change é chamado se o conteúdo
+    mudou ou se alguém pediu refresh.
+    """
+
+    def __init__(self, provider, workers=3, timeouts=None, on_change=None):
+        """
+        Args:
+            provider: SystemInfoProvider com as sondas e os TTLs
+            workers: Threads do pool de sondas
+            timeouts: Timeouts parciais em segundos (ver DEFAULT_TIMEOUTS)
+            on_change: Função chamada com o Snapshot novo (na thread de coleta)
+        """
+        self.provider = provider
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.on_change = on_change
+        self.snapshot = EMPTY_SNAPSHOT
+
+        self._pool = ThreadPoolExecutor(max_workers=workers,
+                                        thread_name_prefix='probe')
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pending = set()  # Campos a invalidar no próximo ciclo
+        self._forced = False
+        self._in_flight = {}  # Campo -> future que estourou o timeout
+
+        self.cycles = 0
+        self.published = 0
+        self._latencies = {name: deque(maxlen=HISTORY)
+                           for name in provider.probes}
+        self._timeouts = dict.fromkeys(provider.probes, 0)
+        self._errors = dict.fromkeys(provider.probes, 0)
+
+    # --- Chamados de qualquer thread ---
+
+    def start(self):
+        """Inicia a thread de coleta (o primeiro ciclo é imediato)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name='system-info')
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        """Para a coleta e o pool (sondas travadas são abandonadas)."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._pool.shutdown(wait=False)
+
+    def refresh(self, *names):
+        """
+        Pede um ciclo imediato, relendo os campos dados (todos se nenhum).
+
+        Retorna:
+            float: Instante (monotonic) do pedido; o primeiro snapshot com
+                   taken_at >= esse instante já inclui a releitura
+        """
+        requested_at = time.monotonic()
+        with self._lock:
+            self._pending.update(names or self.provider.probes)
+            self._forced = True
+        self._wake.set()
+        return requested_at
+
+    def stats(self):
+        """Latência, timeouts e erros de cada sonda, mais os contadores."""
+        probes = {}
+        for name, samples in self._latencies.items():
+            probes[name] = {
+                'latency': latency_summary(list(samples)),
+                'timeouts': self._timeouts[name],
+                'errors': self._errors[name],
+            }
+        return {
+            'cycles': self.cycles,
+            'published': self.published,
+            'probes': probes,
+        }
+
+    # --- Thread de coleta ---
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.collect()
+            self._wake.wait(self._next_delay())
+            self._wake.clear()
+
+    def _next_delay(self):
+        """Segundos até o próximo campo vencer."""
+        expiry = self.provider.next_expiry()
+        if expiry is None:
+            return 0.0
+        return max(0.0, expiry - self.provider.clock())
+
+    def collect(self):
+        """
+        Um ciclo de coleta: roda as sondas vencidas e publica o snapshot.
+
+        Retorna:
+            Snapshot: O snapshot publicado
+        """
+        taken_at = time.monotonic()
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            forced, self._forced = self._forced, False
+        if pending:
+            self.provider.invalidate(*pending)
+
+        # Segunda rodada: uma troca de SSID invalida IP e sinal
+        for _ in range(2):
+            names = []
+            for name in self.provider.due():
+                if self._busy(name):
+                    self.provider.postpone(name)  # Ainda travada: espera outro TTL
+                else:
+                    names.append(name)
+            if not names:
+                break
+            self._run_probes(names)
+
+        self.cycles += 1
+        info = build_info(self.provider.values())
+        changed = info != dict(self.snapshot.info)
+        if changed or forced or self.snapshot is EMPTY_SNAPSHOT:
+            self.published += 1
+            self.snapshot = Snapshot(self.published, taken_at,
+                                     MappingProxyType(info))
+            if self.on_change is not None:
+                self.on_change(self.snapshot)
+        return self.snapshot
+
+    def _busy(self, name):
+        """Se a execução anterior da sonda (que estourou o timeout) segue rodando."""
+        future = self._in_flight.get(name)
+        if future is None:
+            return False
+        if future.done():
+            del self._in_flight[name]
+            return False
+        return True
+
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            return self.provider.probes[name]()
+        finally:
+            self._latencies[name].append(time.perf_counter() - start)
+
+    def _run_probes(self, names):
+        """Dispara as sondas em paralelo e guarda o que chegar no prazo."""
+        start = time.monotonic()
+        futures = [(name, self._pool.submit(self._timed, name))
+                   for name in names]
+        for name, future in futures:
+            remaining = start + self.timeouts[name] - time.monotonic()
+            try:
+                value = future.result(timeout=max(0.0, remaining))
+            except FutureTimeout:
+                # Mantém o último valor e só tenta de novo depois do TTL
+                self._timeouts[name] += 1
+                self._in_flight[name] = future
+                self.provider.postpone(name)
+                continue
+            except OSError:
+                value = None
+            except Exception as e:
+                self._errors[name] += 1
+                print(f"[ERRO] Sonda {name}: {e}")
+                value = None
+            self.provider.store(name, value)
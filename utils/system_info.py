@@ -0,0 +1,314 @@
+# utils/system_info.py
+"""
+Informações do sistema para a tela do OLED sem criar processos.
+
+Substitui os comandos de shell do main.py (hostname, hostname -I, iwgetid,
+iw, systemctl, who) por leituras diretas do kernel e do systemd:
+- host: socket.gethostname()
+- IP: ioctl SIOCGIFADDR em cada interface, na ordem do kernel
+- SSID: ioctl SIOCGIWESSID (wireless extensions, o mesmo que o iwgetid usa)
+- sinal: coluna "level" de /proc/net/wireless
+- SSH ativo: unidade em /run/systemd/units (ou o pidfile do sshd)
+- sessões SSH: registros do /var/run/utmp (utils/utmp.py), ou a lista
+  mantida pelo SessionTracker (utils/ssh_sessions.py)
+
+Cada campo tem um TTL próprio: o hostname quase nunca muda, o sinal muda a
+todo instante, então cada sonda só roda quando o valor em cache expira.
+"""
+
+import array
+import fcntl
+import os
+import socket
+import struct
+import time
+
+from .utmp import UTMP_PATH, count_remote_sessions, read_sessions
+
+
+SIOCGIFADDR = 0x8915
+SIOCGIWESSID = 0x8B1B
+SIOCGIWRATE = 0x8B21
+IW_ESSID_MAX_SIZE = 32
+IWREQ_SIZE = 32  # sizeof(struct iwreq)
+
+WIRELESS_PATH = '/proc/net/wireless'
+SYSTEMD_UNITS_DIR = '/run/systemd/units'
+SSHD_PIDFILE = '/run/sshd.pid'
+
+# Segundos que cada campo fica em cache
+DEFAULT_TTLS = {
+    'host': 60.0,
+    'ip': 5.0,
+    'ssid': 2.0,
+    'signal': 2.0,
+    'ssh_status': 10.0,
+    'ssh_users': 2.0,
+}
+
+
+def read_hostname():
+    return socket.gethostname()
+
+
+def read_ipv4(exclude=('lo',)):
+    """
+    Primeiro endereço IPv4 das interfaces (como `hostname -I | awk '{print $1}'`).
+
+    Retorna:
+        str ou None se nenhuma interface tem IPv4
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _, name in socket.if_nameindex():
+            if name in exclude:
+                continue
+            ifreq = struct.pack('256s', name.encode()[:15])
+            try:
+                result = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, ifreq)
+            except OSError:
+                continue  # Interface sem IPv4
+            return socket.inet_ntoa(result[20:24])
+    return None
+
+
+def read_ssid(interface='wlan0'):
+    """
+    SSID da rede associada (como `iwgetid -r`).
+
+    Retorna:
+        str ou None se a interface não está associada
+
+    Levanta:
+        OSError: interface inexistente ou sem suporte a wireless extensions
+    """
+    essid = array.array('B', bytes(IW_ESSID_MAX_SIZE + 1))
+    pointer, _ = essid.buffer_info()
+    iwreq = struct.pack('16sPHH', interface.encode()[:15], pointer, len(essid), 0)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        result = fcntl.ioctl(sock.fileno(), SIOCGIWESSID,
+                             iwreq.ljust(IWREQ_SIZE, b'\0'))
+    length = struct.unpack_from('16sPHH', result)[2]
+    ssid = essid.tobytes()[:length].decode('utf-8', 'replace')
+    return ssid or None
+
+
+def _dbm(field):
+    value = int(float(field.rstrip('.')))
+    # Alguns drivers reportam o dBm como byte sem sinal
+    return value - 256 if value > 63 else value
+
+
+def parse_wireless_stats(text, interface='wlan0'):
+    """
+    Qualidade, sinal e ruído da interface em /proc/net/wireless.
+
+    Retorna:
+        tuple: (qualidade, sinal dBm, ruído dBm ou None) ou None se a
+               interface não aparece
+    """
+    for line in text.splitlines()[2:]:
+        name, _, rest = line.partition(':')
+        if name.strip() != interface:
+            continue
+        fields = rest.split()
+        quality = int(float(fields[1].rstrip('.')))
+        noise = _dbm(fields[3])
+        # -256/0: driver não mede ruído
+        return quality, _dbm(fields[2]), noise if -256 < noise < 0 else None
+    return None
+
+
+def parse_wireless(text, interface='wlan0'):
+    """
+    Nível do sinal em dBm da interface em /proc/net/wireless.
+
+    Retorna:
+        int ou None se a interface não aparece
+    """
+    stats = parse_wireless_stats(text, interface)
+    return stats[1] if stats is not None else None
+
+
+def read_signal(interface='wlan0', path=WIRELESS_PATH):
+    try:
+        with open(path) as f:
+            return parse_wireless(f.read(), interface)
+    except FileNotFoundError:
+        return None
+
+
+def read_bitrate(interface='wlan0'):
+    """
+    Taxa de transmissão atual em bit/s (como o "Bit Rate" do iwconfig).
+
+    Retorna:
+        int ou None se o driver não informa
+
+    Levanta:
+        OSError: interface inexistente ou sem wireless extensions
+    """
+    iwreq = struct.pack('16s16x', interface.encode()[:15])
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        result = fcntl.ioctl(sock.fileno(), SIOCGIWRATE, iwreq)
+    value, _, disabled, _ = struct.unpack_from('iBBH', result, 16)
+    return value if value > 0 and not disabled else None
+
+
+def read_service_active(unit='ssh', units_dir=SYSTEMD_UNITS_DIR,
+                        pidfile=SSHD_PIDFILE):
+    """
+    Se o serviço está rodando (como `systemctl is-active`).
+
+    O systemd mantém um link invocation:<unidade> enquanto a unidade está
+    ativa. Sem systemd, verifica se o processo do pidfile existe.
+    """
+    if os.path.lexists(os.path.join(units_dir, f'invocation:{unit}.service')):
+        return True
+    try:
+        with open(pidfile) as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return False
+    return os.path.exists(f'/proc/{pid}')
+
+
+def build_info(values):
+    """
+    Monta o dict da tela principal a partir dos valores brutos das sondas.
+
+    Args:
+        values: {campo: valor} (campos ausentes contam como None)
+
+    Retorna:
+        dict: host, ip, wifi_connected, ssid, wifi_signal, wifi_status,
+              ssh_status, ssh_users
+    """
+    ssid = values.get('ssid')
+    connected = bool(ssid)
+    info = {
+        'host': values.get('host') or "N/A",
+        'ip': values.get('ip') or "N/A",
+        'wifi_connected': connected,
+        'ssid': ssid if connected else "Desconectado",
+    }
+    if connected:
+        signal = values.get('signal')
+        info['wifi_signal'] = f"{round(signal)} dBm" if signal is not None else "N/A"
+        info['wifi_status'] = "Conectado"
+    else:
+        info['wifi_signal'] = "N/A"
+        info['wifi_status'] = "Desconectado"
+
+    info['ssh_status'] = "Ativo" if values.get('ssh_status') else "Inativo"
+    info['ssh_users'] = values.get('ssh_users') or 0
+    return info
+
+
+class SystemInfoProvider:
+    """
+    Coleta as informações da tela principal com cache por campo.
+
+    Uso:
+        provider = SystemInfoProvider()
+        info = provider.read()  # mesmo dict do antigo get_system_info()
+    """
+
+    def __init__(self, interface='wlan0', ttls=None, utmp_path=UTMP_PATH,
+                 clock=time.monotonic, sessions=None, signal=None):
+        """
+        Args:
+            interface: Interface Wi-Fi
+            ttls: TTLs parciais em segundos (ver DEFAULT_TTLS)
+            utmp_path: Arquivo utmp com as sessões
+            clock: Relógio usado para os TTLs
+            sessions: Função que retorna as sessões atuais (ex: os dados
+                      de um SessionTracker); sem ela o utmp é relido
+            signal: Função que retorna o sinal em dBm (ex: o valor suavizado
+                    de um LinkMonitor); sem ela /proc/net/wireless é lido
+        """
+        if sessions is None:
+            sessions = lambda: read_sessions(utmp_path)  # noqa: E731
+        self.interface = interface
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.clock = clock
+        self.probes = {
+            'host': read_hostname,
+            'ip': read_ipv4,
+            'ssid': lambda: read_ssid(interface),
+            'signal': signal or (lambda: read_signal(interface)),
+            'ssh_status': read_service_active,
+            'ssh_users': lambda: count_remote_sessions(sessions()),
+        }
+        self._cache = {}  # campo -> (valor, expira em)
+        self._last_ssid = None
+        self.probe_calls = dict.fromkeys(self.probes, 0)
+
+    def due(self):
+        """Campos cujo cache expirou (ou nunca foi preenchido)."""
+        now = self.clock()
+        return [name for name in self.probes
+                if name not in self._cache or now >= self._cache[name][1]]
+
+    def store(self, name, value):
+        """
+        Guarda o resultado de uma sonda e reinicia o TTL do campo.
+
+        Trocar de rede invalida IP e sinal, que pertenciam à rede antiga.
+        """
+        self.probe_calls[name] += 1
+        self._cache[name] = (value, self.clock() + self.ttls[name])
+        if name == 'ssid' and value != self._last_ssid:
+            self._last_ssid = value
+            self.invalidate('ip', 'signal')
+
+    def next_expiry(self):
+        """Instante (no relógio do provider) em que o próximo campo vence."""
+        expires = [entry[1] for entry in list(self._cache.values())]
+        return min(expires) if expires else None
+
+    def postpone(self, name):
+        """Reinicia o TTL do campo mantendo o último valor (sem rodar a sonda)."""
+        self._cache[name] = (self.cached(name), self.clock() + self.ttls[name])
+
+    def cached(self, name):
+        """Último valor do campo, sem rodar a sonda (None se nunca lido)."""
+        entry = self._cache.get(name)
+        return entry[0] if entry is not None else None
+
+    def values(self):
+        """{campo: último valor} de todos os campos já lidos."""
+        return {name: entry[0] for name, entry in list(self._cache.items())}
+
+    def field(self, name):
+        """Valor do campo, rodando a sonda só se o cache expirou."""
+        cached = self._cache.get(name)
+        if cached is not None and self.clock() < cached[1]:
+            return cached[0]
+        try:
+            value = self.probes[name]()
+        except OSError:
+            value = None
+        self.store(name, value)
+        return value
+
+    def invalidate(self, *names):
+        """Descarta o cache dos campos (todos, se nenhum for dado)."""
+        for name in names or list(self._cache):
+            self._cache.pop(name, None)
+
+    def read(self):
+        """
+        Informações do sistema para a tela principal.
+
+        Retorna:
+            dict: host, ip, wifi_connected, ssid, wifi_signal, wifi_status,
+                  ssh_status, ssh_users
+        """
+        # SSID primeiro: se a rede mudou, IP e sinal são relidos em seguida
+        ssid = self.field('ssid')
+        values = {name: self.field(name)
+                  for name in ('host', 'ip', 'ssh_status', 'ssh_users')}
+        values['ssid'] = ssid
+        if ssid:
+            values['signal'] = self.field('signal')
+        return build_info(values)
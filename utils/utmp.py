@@ -0,0 +1,87 @@
+# utils/utmp.py
+"""
+Leitura direta do /var/run/utmp (sessões abertas), sem chamar o `who`.
+
+Formato dos registros da glibc no Linux (384 bytes, igual em 32 e 64 bits):
+tipo, pid, terminal (ut_line), id, usuário, host de origem, status de
+saída, sessão, horário de login (s, µs) e endereço IP.
+"""
+
+import ipaddress
+import struct
+from collections import namedtuple
+
+
+UTMP_PATH = '/var/run/utmp'
+
+USER_PROCESS = 7  # ut_type de uma sessão de usuário ativa
+
+_RECORD = struct.Struct('<h2xi32s4s32s256shhiii4i20x')
+
+Session = namedtuple('Session', 'user line host pid login_time addr')
+
+
+def _text(raw):
+    return raw.split(b'\0', 1)[0].decode('utf-8', 'replace')
+
+
+def _addr(words):
+    """ut_addr_v6: IPv4 só na primeira palavra, IPv6 nas quatro."""
+    raw = struct.pack('<4i', *words)
+    if not any(raw):
+        return ''
+    if not any(raw[4:]):
+        return str(ipaddress.IPv4Address(raw[:4]))
+    return str(ipaddress.IPv6Address(raw))
+
+
+def parse_utmp(data):
+    """
+    Extrai as sessões de usuário de um conteúdo de utmp.
+
+    Args:
+        data: Bytes do arquivo
+
+    Retorna:
+        list: Session(user, line, host, pid, login_time, addr) dos
+              registros USER_PROCESS, na ordem do arquivo
+    """
+    sessions = []
+    usable = len(data) - len(data) % _RECORD.size
+    for fields in _RECORD.iter_unpack(data[:usable]):
+        (ut_type, pid, line, _, user, host, _, _, _, tv_sec, _) = fields[:11]
+        if ut_type != USER_PROCESS:
+            continue
+        sessions.append(Session(
+            user=_text(user),
+            line=_text(line),
+            host=_text(host),
+            pid=pid,
+            login_time=tv_sec,
+            addr=_addr(fields[11:15]),
+        ))
+    return sessions
+
+
+def read_sessions(path=UTMP_PATH):
+    """
+    Sessões de usuário abertas segundo o utmp.
+
+    Retorna:
+        list: Session, ou lista vazia se o arquivo não existe
+    """
+    try:
+        with open(path, 'rb') as f:
+            return parse_utmp(f.read())
+    except FileNotFoundError:
+        return []
+
+
+def is_remote(session):
+    """Sessão em pseudo-terminal (pts/N), o que inclui as do SSH."""
+    return session.line.startswith('pts/')
+
+
+def count_remote_sessions(sessions):
+    """Sessões em pseudo-terminais (pts/N), o mesmo que `who | grep -c pts/`."""
+    return sum(1 for s in sessions if is_remote(s))
@@ -0,0 +1,337 @@
+# utils/wifi_connect.py
+"""
+Conexões Wi-Fi em segundo plano, com fases e cancelamento.
+
+connect_to_wifi() bloqueia até o fim da ativação (até 60 s). Aqui cada
+pedido vira um ConnectJob executado numa thread própria: quem pediu
+(laço do OLED, rota da API) só consulta a fase atual e o tempo gasto em
+cada uma, e pode cancelar a qualquer momento.
+
+Fases: starting -> associating -> authenticating -> dhcp -> verifying,
+terminando em verified, failed ou cancelled. Com o cliente D-Bus, as fases
+vêm dos sinais de estado do dispositivo (NMDeviceState) e o cancelamento
+usa DeactivateConnection. Pelo nmcli não há fases intermediárias (fica em
+associating) e cancelar encerra o processo.
+
+Uso:
+    connections = ConnectionManager(on_change=lambda job: scheduler.request_frame())
+    job = connections.start('MinhaRede', 'senha')
+    job.phase, job.elapsed()
+    connections.cancel()
+"""
+
+import itertools
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+
+from .wifi_profiles import get_profile_registry
+from .wifi_utils import (
+    CONNECT_TIMEOUT, _drop_nm_client, get_nm_client, is_connected_to_network
+)
+
+
+PHASES = ('starting', 'associating', 'authenticating', 'dhcp', 'verifying')
+FINAL_PHASES = ('verified', 'failed', 'cancelled')
+
+# Texto curto de cada fase para o OLED
+PHASE_LABELS = {
+    'starting': "Iniciando",
+    'associating': "Associando",
+    'authenticating': "Autenticando",
+    'dhcp': "Obtendo IP",
+    'verifying': "Verificando",
+    'verified': "Conectado!",
+    'failed': "Erro!",
+    'cancelled': "Cancelado",
+}
+
+# NMDeviceState (ver nm_dbus) -> fase do job
+DEVICE_PHASES = {
+    40: 'associating',  # PREPARE
+    50: 'associating',  # CONFIG
+    60: 'authenticating',  # NEED_AUTH
+    70: 'dhcp',  # IP_CONFIG
+    80: 'verifying',  # IP_CHECK
+    90: 'verifying',  # SECONDARIES
+    100: 'verifying',  # ACTIVATED (falta conferir a conectividade)
+}
+
+VERIFY_TIMEOUT = 10  # Segundos até o NetworkManager indicar conectividade
+MAX_JOBS = 16  # Jobs terminados guardados para consulta (API)
+
+
+class ConnectJob:
+    """
+    Uma tentativa de conexão.
+
+    Os campos são escritos só pela thread do job (ou por cancel) e podem
+    ser lidos de qualquer thread.
+    """
+
+    def __init__(self, job_id, ssid, clock=time.monotonic):
+        self.id = job_id
+        self.ssid = ssid
+        self.clock = clock
+        self.phase = 'starting'
+        self.started_at = clock()
+        self.finished_at = None
+        self.phases = [('starting', self.started_at)]  # (fase, início)
+        self.success = None
+        self.message = ""
+        self.active = None  # ActiveConnection (D-Bus)
+        self.process = None  # Processo do nmcli
+        self.cancel_requested = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    @property
+    def label(self):
+        return PHASE_LABELS[self.phase]
+
+    def wait(self, timeout=None):
+        """Espera o job terminar; retorna False no timeout."""
+        return self._done.wait(timeout)
+
+    def elapsed(self):
+        """Segundos desde o início (até o fim, se já terminou)."""
+        end = self.finished_at if self.finished_at is not None else self.clock()
+        return end - self.started_at
+
+    def phase_times(self):
+        """
+        Tempo em cada fase percorrida.
+
+        Retorna:
+            list: [(fase, segundos), ...] na ordem em que ocorreram
+        """
+        phases = list(self.phases)
+        end = self.finished_at if self.finished_at is not None else self.clock()
+        ends = [start for _, start in phases[1:]] + [end]
+        return [(phase, stop - start)
+                for (phase, start), stop in zip(phases, ends)
+                if phase not in FINAL_PHASES]
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'ssid': self.ssid,
+            'phase': self.phase,
+            'done': self.done,
+            'success': self.success,
+            'message': self.message,
+            'elapsed_s': round(self.elapsed(), 3),
+            'phases': [{'phase': phase, 'elapsed_s': round(seconds, 3)}
+                       for phase, seconds in self.phase_times()],
+        }
+
+
+class ConnectionManager:
+    """
+    Executa os pedidos de conexão, um de cada vez.
+
+    Um pedido novo cancela o que estiver em andamento. Os últimos MAX_JOBS
+    jobs ficam disponíveis por ID (consulta da API).
+    """
+
+    def __init__(self, on_change=None, timeout=CONNECT_TIMEOUT,
+                 verify_timeout=VERIFY_TIMEOUT, nm_client=get_nm_client,
+                 profiles=None, clock=time.monotonic):
+        """
+        Args:
+            on_change: Função chamada com o job a cada mudança de fase
+            timeout: Segundos até desistir da ativação
+            verify_timeout: Segundos até desistir da conectividade
+            nm_client: Função que devolve o NMClient compartilhado (ou None)
+            profiles: ProfileRegistry dos perfis salvos (padrão: o compartilhado)
+            clock: Relógio monotônico
+        """
+        self.on_change = on_change
+        self.timeout = timeout
+        self.verify_timeout = verify_timeout
+        self.nm_client = nm_client
+        self.profiles = profiles or get_profile_registry()
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs = OrderedDict()
+        self._current = None
+        self._listening = None  # NMClient com o listener registrado
+
+    # --- API ---
+
+    def start(self, ssid, password=None):
+        """Começa a conectar (cancelando o job anterior) e retorna o job."""
+        job = ConnectJob(next(self._ids), ssid, self.clock)
+        with self._lock:
+            previous, self._current = self._current, job
+            self._jobs[job.id] = job
+            while len(self._jobs) > MAX_JOBS:
+                self._jobs.popitem(last=False)
+        if previous is not None and not previous.done:
+            self._cancel(previous)
+        threading.Thread(target=self._run, args=(job, password), daemon=True,
+                         name='wifi-connect').start()
+        return job
+
+    def cancel(self, job_id=None):
+        """
+        Cancela o job (padrão: o atual).
+
+        Retorna:
+            bool: False se o job não existe ou já terminou
+        """
+        job = self._current if job_id is None else self.job(job_id)
+        if job is None or job.done:
+            return False
+        self._cancel(job)
+        return True
+
+    def job(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    @property
+    def current(self):
+        """Último job iniciado (ou None)."""
+        return self._current
+
+    # --- Execução ---
+
+    def _cancel(self, job):
+        job.cancel_requested.set()
+        nm = self._listening
+        try:
+            if job.active is not None and nm is not None:
+                nm.deactivate(job.active)
+            elif job.process is not None:
+                job.process.terminate()
+        except Exception as e:
+            # Ex: a ativação terminou entre o pedido e o cancelamento
+            print(f"[INFO] Cancelamento da conexão: {e}")
+
+    def _set_phase(self, job, phase):
+        with self._lock:
+            if job.done or job.phase == phase:
+                return
+            job.phase = phase
+            job.phases.append((phase, self.clock()))
+        if self.on_change is not None:
+            self.on_change(job)
+
+    def _finish(self, job, phase, message):
+        if job.cancel_requested.is_set() and phase != 'verified':
+            phase, message = 'cancelled', "Cancelado"
+        with self._lock:
+            job.finished_at = self.clock()
+            job.phase = phase
+            job.phases.append((phase, job.finished_at))
+            job.success = phase == 'verified'
+            job.message = message
+            job._done.set()
+        if job.success:
+            # Último uso do perfil mudou (e a rede pode ter virado um perfil)
+            self.profiles.invalidate()
+        print(f"[INFO] Conexão com {job.ssid}: {phase} "
+              f"({job.elapsed():.1f} s) {message}")
+        if self.on_change is not None:
+            self.on_change(job)
+
+    def _run(self, job, password):
+        nm = self.nm_client() if self.nm_client is not None else None
+        if nm is not None:
+            try:
+                self._run_dbus(nm, job, password)
+                return
+            except Exception as e:
+                _drop_nm_client(e)
+                self._listening = None
+                if job.cancel_requested.is_set():
+                    self._finish(job, 'cancelled', "Cancelado")
+                    return
+        try:
+            self._run_nmcli(job, password)
+        except Exception as e:
+            self._finish(job, 'failed', str(e)[:40])
+
+    def _on_nm_event(self, event, data):
+        if event != 'device_state':
+            return
+        job = self._current
+        phase = DEVICE_PHASES.get(data)
+        if job is None or job.done or phase is None:
+            return
+        # Só avança: um estado atrasado não volta a fase
+        if PHASES.index(phase) > PHASES.index(job.phase):
+            self._set_phase(job, phase)
+
+    def _run_dbus(self, nm, job, password):
+        from jeepney import DBusErrorResponse
+
+        from .nm_dbus import error_message
+
+        if nm is not self._listening:
+            nm.add_listener(self._on_nm_event)
+            self._listening = nm
+
+        try:
+            job.active = nm.start_activation(job.ssid, password,
+                                             known=self.profiles.paths())
+        except ValueError as e:
+            self._finish(job, 'failed', str(e))
+            return
+        except DBusErrorResponse as e:
+            self._finish(job, 'failed', error_message(e))
+            return
+        if job.cancel_requested.is_set():
+            self._cancel(job)
+
+        success, message = nm.activation_result(
+            *nm.wait_active(job.active, self.timeout))
+        if not success:
+            self._finish(job, 'failed', message)
+            return
+
+        self._set_phase(job, 'verifying')
+        if nm.wait_connected(self.verify_timeout) and nm.active_ssid() == job.ssid:
+            self._finish(job, 'verified', message)
+        else:
+            self._finish(job, 'failed', "Sem conectividade")
+
+    def _run_nmcli(self, job, password):
+        profile = self.profiles.get(job.ssid)
+        if profile is not None:
+            command = ["sudo", "nmcli", "connection", "up", "uuid", profile.uuid]
+        elif not password:
+            self._finish(job, 'failed', "Senha obrigatória para rede nova")
+            return
+        else:
+            command = ["sudo", "nmcli", "device", "wifi", "connect", job.ssid,
+                       "password", password]
+
+        self._set_phase(job, 'associating')
+        job.process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE, text=True)
+        if job.cancel_requested.is_set():
+            job.process.terminate()
+        try:
+            stdout, stderr = job.process.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            job.process.kill()
+            job.process.communicate()
+            self._finish(job, 'failed', "Timeout na conexão")
+            return
+
+        if job.process.returncode != 0:
+            self._finish(job, 'failed', (stderr.strip() or stdout.strip())[:40])
+            return
+        self._set_phase(job, 'verifying')
+        if is_connected_to_network(job.ssid):
+            self._finish(job, 'verified', "Conectado com sucesso")
+        else:
+            self._finish(job, 'failed', "Sem conectividade")
@@ -0,0 +1,167 @@
+# utils/wifi_profiles.py
+"""
+Registro dos perfis Wi-Fi salvos, lido uma vez e invalidado por aviso.
+
+get_known_wifi_ssids() rodava `nmcli connection show` a cada SELECT na
+lista de redes e de novo dentro do connect_to_wifi. O ProfileRegistry lê
+os perfis uma vez (D-Bus ou nmcli) e guarda um Profile por SSID; a leitura
+só é refeita depois de uma mudança, avisada por:
+- sinais do NetworkManager (NewConnection, ConnectionRemoved, Updated),
+  com o cliente D-Bus;
+- inotify em /etc/NetworkManager/system-connections, quando o diretório
+  pode ser observado (root). Os eventos são lidos sem bloqueio na próxima
+  consulta, sem thread própria.
+
+Sem nenhum dos dois (nmcli sem root), o registro expira após FALLBACK_TTL.
+
+Uso:
+    profiles = get_profile_registry()  # compartilhado pelo processo
+    'MinhaRede' in profiles
+    profiles.get('MinhaRede').uuid
+"""
+
+import threading
+import time
+
+from .inotify import (
+    IN_CLOSE_WRITE, IN_CREATE, IN_DELETE, IN_MOVED_TO, Inotify
+)
+from .wifi_utils import get_nm_client, load_profiles
+
+
+SYSTEM_CONNECTIONS_DIR = '/etc/NetworkManager/system-connections'
+WATCH_MASK = IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_TO
+FALLBACK_TTL = 60  # Segundos de validade sem sinais nem inotify
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_profile_registry():
+    """ProfileRegistry compartilhado pelo processo (interface e API)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ProfileRegistry()
+        return _registry
+
+
+class ProfileRegistry:
+    """
+    Perfis Wi-Fi salvos, por SSID.
+
+    O dict é trocado inteiro a cada releitura, então leituras de outras
+    threads sempre veem um estado consistente.
+    """
+
+    def __init__(self, nm_client=get_nm_client, load=load_profiles,
+                 watch_dir=SYSTEM_CONNECTIONS_DIR, ttl=FALLBACK_TTL,
+                 clock=time.monotonic):
+        """
+        Args:
+            nm_client: Função que devolve o NMClient compartilhado (ou None)
+            load: Função de leitura dos perfis ({ssid: Profile})
+            watch_dir: Diretório dos perfis observado com inotify (None desliga)
+            ttl: Validade quando não há sinais nem inotify
+            clock: Relógio monotônico
+        """
+        self.nm_client = nm_client
+        self.load = load
+        self.ttl = ttl
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._profiles = None
+        self._loaded_at = None
+        self._listening = None
+        self._watcher = self._watch(watch_dir) if watch_dir else None
+
+        self.loads = 0
+        self.invalidations = 0
+
+    def _watch(self, path):
+        try:
+            watcher = Inotify()
+        except OSError:
+            return None
+        try:
+            watcher.add_watch(path, WATCH_MASK)
+        except OSError:
+            # Diretório ausente ou só legível pelo root
+            watcher.close()
+            return None
+        return watcher
+
+    def invalidate(self):
+        """Descarta os perfis; a próxima consulta relê."""
+        self._profiles = None
+        self.invalidations += 1
+
+    def _on_nm_event(self, event, data):
+        if event == 'connections_changed':
+            self.invalidate()
+
+    def _check(self):
+        """Aplica os avisos pendentes (cliente novo, inotify, TTL)."""
+        if self.nm_client is not None:
+            nm = self.nm_client()
+            if nm is not self._listening:
+                # Cliente novo (ou perdido): os perfis vêm de outra fonte
+                if nm is not None:
+                    nm.add_listener(self._on_nm_event)
+                self._listening = nm
+                self.invalidate()
+        if self._watcher is not None:
+            if self._watcher.read_events():
+                self.invalidate()
+        elif (self._listening is None and self._loaded_at is not None and
+              self.clock() - self._loaded_at >= self.ttl):
+            self.invalidate()
+
+    def profiles(self):
+        """
+        Perfis atuais.
+
+        Retorna:
+            dict: {ssid: Profile} (não alterar; vazio se a leitura falhar)
+        """
+        with self._lock:
+            self._check()
+            profiles = self._profiles
+            if profiles is None:
+                generation = self.invalidations
+                try:
+                    profiles = self.load()
+                except Exception as e:
+                    # Não guarda a falha: a próxima consulta tenta de novo
+                    print(f"Erro ao obter redes conhecidas: {e}")
+                    return {}
+                self.loads += 1
+                # Um aviso durante a leitura torna o resultado suspeito
+                if generation == self.invalidations:
+                    self._profiles = profiles
+                    self._loaded_at = self.clock()
+            return profiles
+
+    def __contains__(self, ssid):
+        return ssid in self.profiles()
+
+    def get(self, ssid):
+        """Profile do SSID (None se não há perfil salvo)."""
+        return self.profiles().get(ssid)
+
+    def ssids(self):
+        return frozenset(self.profiles())
+
+    def paths(self):
+        """{ssid: caminho D-Bus} para NMClient.activate(known=...)."""
+        return {ssid: profile.path for ssid, profile in self.profiles().items()
+                if profile.path is not None}
+
+    def details(self):
+        """Lista pública dos perfis (API), do usado por último ao mais antigo."""
+        profiles = sorted(self.profiles().values(),
+                          key=lambda p: p.timestamp, reverse=True)
+        return [{'name': p.name, 'ssid': p.ssid, 'uuid': p.uuid,
+                 'priority': p.priority, 'last_used': p.timestamp or None}
+                for p in profiles]
@@ -0,0 +1,217 @@
+# utils/wifi_scanner.py
+"""
+Scanner de redes Wi-Fi em segundo plano, com cache dos resultados.
+
+Os scans (RequestScan via D-Bus ou nmcli) rodam numa thread própria: em
+intervalo fixo enquanto o modo periódico está ligado (telas de lista de
+redes) e sob demanda com request(). A interface só lê o cache, então abrir
+a lista é instantâneo e nenhum botão espera o scan.
+
+O cache guarda um ScanRecord por BSSID (SSID, sinal, canal, segurança e o
+instante em que foi visto). Um scan completo substitui o cache; com o
+cliente D-Bus, os sinais do NetworkManager (AP adicionado, removido, sinal
+alterado) atualizam o cache durante o scan, então a lista aparece aos
+poucos em vez de só no fim.
+
+Uso:
+    scanner = WifiScanner(interval=10, on_update=scheduler.request_frame)
+    scanner.start()
+    scanner.set_periodic(True)  # reescaneia a cada 10 s
+    scanner.request()           # scan já (ex: ao abrir a lista)
+    scanner.ssids()             # SSIDs do cache, do mais forte ao mais fraco
+"""
+
+import threading
+import time
+
+from .wifi_utils import access_point_record, get_nm_client, scan_records
+
+
+class WifiScanner:
+    """
+    Mantém o cache de redes visíveis atualizado numa thread própria.
+
+    Leituras (records, networks, ssids, age) podem vir de qualquer thread.
+    """
+
+    def __init__(self, interval=10.0, on_update=None, scan=None,
+                 nm_client=get_nm_client, clock=time.monotonic):
+        """
+        Args:
+            interval: Segundos entre scans no modo periódico
+            on_update: Função chamada (sem argumentos) quando o cache muda
+            scan: Função de scan completo (padrão wifi_utils.scan_records)
+            nm_client: Função que devolve o NMClient compartilhado (ou None),
+                       para as atualizações incrementais; None desliga
+            clock: Relógio monotônico
+        """
+        self.interval = interval
+        self.on_update = on_update
+        self.scan = scan or scan_records
+        self.nm_client = nm_client
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._cache = {}  # BSSID -> ScanRecord
+        self._scanned_at = None
+        self._scanning = False
+        self._periodic = False
+        self._requested = False
+        self._nm = None
+        self._listeners = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.scans = 0
+        self.updates = 0
+        self.last_duration = None
+
+    # --- Controle ---
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name='wifi-scanner')
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def request(self):
+        """Pede um scan imediato (ignorado se já há um em andamento)."""
+        if not self._scanning:
+            self._requested = True
+            self._wake.set()
+
+    def set_periodic(self, enabled, interval=None):
+        """Liga/desliga o reescaneamento a cada interval segundos."""
+        if interval is not None and interval != self.interval:
+            self.interval = interval
+        elif enabled == self._periodic:
+            return
+        self._periodic = enabled
+        # Acorda a thread para recalcular a espera (escaneia já se o cache
+        # estiver velho)
+        self._wake.set()
+
+    def add_listener(self, callback):
+        """
+        Registra callback(records) chamado a cada scan completo.
+
+        Roda na thread de scan: deve ser rápido (ex: acumular estatísticas).
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    @property
+    def scanning(self):
+        return self._scanning
+
+    # --- Thread de scan ---
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self._next_scan_in())
+            if self._stop.is_set():
+                return
+            self._wake.clear()
+            if self._requested or self._due():
+                self._requested = False
+                self._scan_once()
+
+    def _due(self):
+        return self._periodic and (self._scanned_at is None or
+                                   self.clock() - self._scanned_at >= self.interval)
+
+    def _next_scan_in(self):
+        if not self._periodic:
+            return None
+        if self._scanned_at is None:
+            return 0
+        return max(self._scanned_at + self.interval - self.clock(), 0)
+
+    def _scan_once(self):
+        self._attach()
+        self._scanning = True
+        start = self.clock()
+        try:
+            records = self.scan()
+        except Exception as e:
+            print(f"[ERRO] Scan Wi-Fi: {e}")
+            records = None
+        finally:
+            self._scanning = False
+        now = self.clock()
+        self.last_duration = now - start
+        self.scans += 1
+        with self._lock:
+            self._scanned_at = now
+            if records is not None:
+                self._cache = {r.bssid: r for r in records}
+        if records is not None:
+            for callback in list(self._listeners):
+                try:
+                    callback(records)
+                except Exception as e:
+                    print(f"[ERRO] Listener do scan Wi-Fi: {e}")
+        self._updated()
+
+    def _attach(self):
+        """Assina os sinais do cliente D-Bus (de novo se ele foi recriado)."""
+        if self.nm_client is None:
+            return
+        nm = self.nm_client()
+        if nm is not None and nm is not self._nm:
+            nm.add_listener(self._on_nm_event)
+            self._nm = nm
+
+    def _on_nm_event(self, event, data):
+        if event in ('ap_added', 'ap_changed'):
+            record = access_point_record(data, self.clock())
+            with self._lock:
+                self._cache[record.bssid] = record
+        elif event == 'ap_removed':
+            with self._lock:
+                if self._cache.pop(data.bssid, None) is None:
+                    return
+        else:
+            return
+        self._updated()
+
+    def _updated(self):
+        self.updates += 1
+        if self.on_update is not None:
+            self.on_update()
+
+    # --- Leituras ---
+
+    def records(self):
+        """Todos os APs do cache, do sinal mais forte para o mais fraco."""
+        with self._lock:
+            records = list(self._cache.values())
+        return sorted(records, key=lambda r: r.signal, reverse=True)
+
+    def networks(self):
+        """Melhor AP de cada SSID (redes ocultas fora), do mais forte ao mais fraco."""
+        best = {}
+        for record in self.records():
+            if record.ssid and record.ssid not in best:
+                best[record.ssid] = record
+        return list(best.values())
+
+    def ssids(self):
+        return [record.ssid for record in self.networks()]
+
+    def age(self):
+        """Segundos desde o último scan completo (None se nunca escaneou)."""
+        scanned_at = self._scanned_at
+        return None if scanned_at is None else self.clock() - scanned_at
@@ -0,0 +1,304 @@
+# utils/wifi_supervisor.py
+"""
+Reconexão automática do Wi-Fi, para nós da estufa sem ninguém por perto.
+
+Quando o enlace cai, o ReconnectSupervisor espera um período de carência
+(o autoconnect do próprio NetworkManager costuma resolver quedas curtas) e
+então tenta reconectar pelo ConnectionManager:
+- primeiro a última rede, LAST_NETWORK_RETRIES vezes (se ela ainda
+  aparece no scan);
+- depois as outras redes salvas visíveis no cache do scanner, da de melhor
+  sinal para a pior, em rodízio.
+Entre tentativas o intervalo dobra (BACKOFF_BASE até BACKOFF_MAX) com um
+jitter de ±JITTER, para vários nós não tentarem todos juntos quando o AP
+volta.
+
+A queda é detectada por eventos: os sinais de estado do NetworkManager
+(cliente D-Bus) ou, sem D-Bus, as amostras que o LinkMonitor já coleta
+(on_link_sample). Cada queda vira um registro com a duração, o número de
+tentativas e a rede de volta; stats() resume o tempo até reconectar.
+
+Uso:
+    supervisor = ReconnectSupervisor(connections, profiles,
+                                     networks=scanner.networks,
+                                     request_scan=scanner.request)
+    supervisor.start()
+    supervisor.hold(True)  # usuário mexendo no Wi-Fi: não interfere
+"""
+
+import random
+import threading
+import time
+from collections import deque
+
+from .wifi_utils import get_nm_client
+
+
+GRACE_PERIOD = 10  # Segundos de espera pelo autoconnect do NetworkManager
+BACKOFF_BASE = 2  # Segundos antes da segunda tentativa (dobra a cada falha)
+BACKOFF_MAX = 120
+JITTER = 0.3  # Variação relativa do intervalo (±30%)
+LAST_NETWORK_RETRIES = 2  # Tentativas na última rede antes do failover
+MAX_OUTAGES = 50  # Quedas guardadas para as estatísticas
+
+NM_STATE_CONNECTED_LOCAL = 50  # NMState (ver nm_dbus)
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, maximum=BACKOFF_MAX,
+                  jitter=JITTER, rng=random):
+    """Espera antes da tentativa seguinte à de número attempt (0, 1, ...)."""
+    delay = min(base * 2 ** attempt, maximum)
+    return delay * rng.uniform(1 - jitter, 1 + jitter)
+
+
+class ReconnectSupervisor:
+    """
+    Detecta quedas do enlace e reconecta sozinho numa thread própria.
+
+    Os avisos de enlace (notify_link) podem vir de qualquer thread.
+    """
+
+    def __init__(self, connections, profiles, networks=None, request_scan=None,
+                 nm_client=get_nm_client, grace=GRACE_PERIOD,
+                 backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX,
+                 jitter=JITTER, last_retries=LAST_NETWORK_RETRIES,
+                 on_change=None, clock=time.monotonic, rng=None):
+        """
+        Args:
+            connections: ConnectionManager usado nas tentativas
+            profiles: ProfileRegistry (só redes salvas são tentadas)
+            networks: Função com os ScanRecord visíveis, do melhor sinal ao
+                      pior (ex: WifiScanner.networks)
+            request_scan: Função que pede um scan novo (ex: WifiScanner.request)
+            nm_client: Função que devolve o NMClient compartilhado (ou None)
+            grace: Segundos entre a queda e a primeira tentativa
+            backoff_base, backoff_max, jitter: Intervalo entre tentativas
+            last_retries: Tentativas na última rede antes de trocar de rede
+            on_change: Função chamada com connected (bool) quando o enlace
+                       cai ou volta
+            clock: Relógio monotônico
+            rng: random.Random do jitter
+        """
+        self.connections = connections
+        self.profiles = profiles
+        self.networks = networks or (lambda: [])
+        self.request_scan = request_scan
+        self.nm_client = nm_client
+        self.grace = grace
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.last_retries = last_retries
+        self.on_change = on_change
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self._cond = threading.Condition()
+        self._connected = None  # None até o primeiro aviso
+        self._held = False
+        self._last_ssid = None
+        self._outage = None  # Queda em andamento (dict)
+        self._outages = deque(maxlen=MAX_OUTAGES)
+        self._listening = None
+        self._stop = False
+        self._thread = None
+
+        self.attempts = 0
+        self.reconnects = 0  # Quedas resolvidas por uma tentativa nossa
+
+    # --- Controle ---
+
+    def start(self):
+        if self._thread is None:
+            self._attach()
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name='wifi-supervisor')
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def hold(self, held):
+        """Suspende as tentativas (ex: usuário escolhendo rede no OLED)."""
+        with self._cond:
+            if held != self._held:
+                self._held = held
+                self._cond.notify_all()
+
+    def _attach(self):
+        """Assina os sinais de estado do cliente D-Bus (de novo se recriado)."""
+        if self.nm_client is None:
+            return
+        nm = self.nm_client()
+        if nm is not None and nm is not self._listening:
+            nm.add_listener(self._on_nm_event)
+            self._listening = nm
+            connected = nm.connected()
+            self.notify_link(connected, nm.active_ssid() if connected else None)
+
+    # --- Avisos de enlace ---
+
+    def _on_nm_event(self, event, data):
+        if event == 'state':
+            connected = data >= NM_STATE_CONNECTED_LOCAL
+            ssid = self._listening.active_ssid() if connected else None
+            self.notify_link(connected, ssid)
+
+    def on_link_sample(self, sample):
+        """Amostra do LinkMonitor (None = sem associação); usada sem D-Bus."""
+        # Antes do start() o cliente D-Bus ainda não foi consultado
+        if self._thread is not None and self._listening is None:
+            self.notify_link(sample is not None)
+
+    def notify_link(self, connected, ssid=None):
+        """Enlace subiu (connected=True, na rede ssid) ou caiu."""
+        with self._cond:
+            if connected and ssid:
+                self._last_ssid = ssid
+            if connected == self._connected:
+                return
+            self._connected = connected
+            now = self.clock()
+            if not connected:
+                self._outage = {'start': now, 'started_at': time.time(),
+                                'attempts': 0, 'ssid': self._last_ssid,
+                                'next_attempt': now + self.grace}
+                if self._last_ssid is not None:
+                    print(f"[INFO] Wi-Fi caiu (última rede: {self._last_ssid})")
+                else:
+                    print("[INFO] Wi-Fi desconectado")
+            elif self._outage is not None:
+                outage, self._outage = self._outage, None
+                duration = now - outage['start']
+                self._outages.append({
+                    'started_at': round(outage['started_at'], 3),
+                    'duration_s': round(duration, 3),
+                    'attempts': outage['attempts'],
+                    'lost_ssid': outage['ssid'],
+                    'ssid': ssid,  # Rede de volta
+                })
+                print(f"[INFO] Wi-Fi de volta em {duration:.1f} s "
+                      f"({outage['attempts']} tentativas)")
+            self._cond.notify_all()
+        if self.on_change is not None:
+            self.on_change(connected)
+
+    # --- Tentativas ---
+
+    def candidates(self, attempt):
+        """
+        Ordem das redes para a tentativa de número attempt.
+
+        Retorna:
+            list: SSIDs, a primeira é a que será tentada
+        """
+        known = self.profiles.ssids()
+        visible = [r.ssid for r in self.networks() if r.ssid in known]
+        last = self._last_ssid if self._last_ssid in known else None
+        others = [ssid for ssid in visible if ssid != last]
+        # A última rede sumiu do scan: não adianta insistir nela
+        retry_last = attempt < self.last_retries and last in visible
+        if last is not None and (retry_last or not others):
+            return [last] + others
+        if not others:
+            return []
+        # Failover em rodízio, começando pelo melhor sinal
+        start = max(attempt - (self.last_retries if last else 0), 0) % len(others)
+        order = others[start:] + others[:start]
+        return order + ([last] if last else [])
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stop and (self._outage is None or self._held or
+                                          self.clock() < self._outage['next_attempt']):
+                    if self._outage is None or self._held:
+                        timeout = None
+                    else:
+                        timeout = self._outage['next_attempt'] - self.clock()
+                    self._cond.wait(timeout)
+                if self._stop:
+                    return
+                outage = self._outage
+                attempt = outage['attempts']
+                outage['attempts'] = attempt + 1
+            self._attach()
+            self._attempt(outage, attempt)
+
+    def _attempt(self, outage, attempt):
+        order = self.candidates(attempt)
+        if attempt == 0 and self.request_scan is not None:
+            self.request_scan()  # Cache fresco para o failover
+        ssid = order[0] if order else None
+
+        success = False
+        if ssid is not None:
+            print(f"[INFO] Reconectando a {ssid} (tentativa {attempt + 1})")
+            self.attempts += 1
+            job = self.connections.start(ssid)
+            job.wait()
+            success = job.success
+            if success:
+                self.reconnects += 1
+                self.notify_link(True, ssid)
+
+        with self._cond:
+            if self._outage is not outage:
+                return  # Voltou durante a tentativa
+            outage['next_attempt'] = self.clock() + backoff_delay(
+                attempt, self.backoff_base, self.backoff_max, self.jitter,
+                self.rng)
+
+    # --- Leituras ---
+
+    @property
+    def connected(self):
+        return self._connected
+
+    def status(self):
+        """
+        Queda em andamento.
+
+        Retorna:
+            dict ou None: {'down_s', 'attempts', 'next_attempt_s', 'ssid'}
+        """
+        with self._cond:
+            outage = self._outage
+            if outage is None:
+                return None
+            now = self.clock()
+            return {
+                'down_s': round(now - outage['start'], 1),
+                'attempts': outage['attempts'],
+                'next_attempt_s': None if self._held else
+                round(max(outage['next_attempt'] - now, 0), 1),
+                'ssid': outage['ssid'],
+            }
+
+    def stats(self):
+        """Quedas recentes e o resumo do tempo até reconectar."""
+        with self._cond:
+            outages = list(self._outages)
+        durations = sorted(o['duration_s'] for o in outages)
+        summary = {'n': len(durations)}
+        if durations:
+            last = len(durations) - 1
+            summary.update({
+                'p50_s': durations[last // 2],
+                'p95_s': durations[int(last * 0.95)],
+                'max_s': durations[-1],
+            })
+        return {
+            'connected': self._connected,
+            'current': self.status(),
+            'attempts': self.attempts,
+            'reconnects': self.reconnects,
+            'time_to_reconnect': summary,
+            'outages': outages,
+        }
@@ -0,0 +1,282 @@
+# utils/wifi_survey.py
+"""
+Site survey Wi-Fi: estatísticas de sinal por BSSID para escolher onde
+instalar um nó.
+
+scan_wifi_networks() só devolve SSIDs sem repetição. No modo survey, cada
+scan completo do WifiScanner alimenta uma tabela por BSSID com número de
+amostras, sinal mínimo, médio, máximo e desvio padrão (Welford, sem guardar
+as amostras), e uma contagem de APs por canal (congestionamento).
+
+Memória limitada para rodar por horas: a tabela é um conjunto de arrays de
+tamanho fixo (capacity BSSIDs); com a tabela cheia, um BSSID novo ocupa a
+vaga do visto há mais tempo. A contagem por canal é um array indexado pelo
+número do canal. O processamento roda na thread do scanner e custa O(APs)
+por scan; o intervalo entre scans (interval) limita o uso de CPU e de rádio.
+
+O sinal é a intensidade do NetworkManager (0-100 %), a mesma da lista de
+redes.
+
+Uso:
+    survey = SiteSurvey(scanner, on_update=scheduler.request_frame)
+    survey.start()          # zera e começa a acumular
+    survey.rows()           # BSSIDs, do melhor sinal médio ao pior
+    survey.channels()       # APs por canal
+    survey.write_csv(f)
+    survey.stop()
+"""
+
+import array
+import csv
+import io
+import math
+import threading
+import time
+
+SURVEY_INTERVAL = 5  # Segundos entre scans durante o survey
+MAX_BSSIDS = 128  # Vagas da tabela (memória fixa)
+MAX_CHANNEL = 255  # Canais acima disso ficam fora da contagem
+
+CSV_FIELDS = ('bssid', 'ssid', 'channel', 'security', 'samples', 'min',
+              'mean', 'max', 'stddev', 'first_seen', 'last_seen')
+
+
+class BssidStats:
+    """
+    Tabela de estatísticas por BSSID sobre arrays de tamanho fixo.
+
+    Não é thread-safe: o SiteSurvey serializa o acesso.
+    """
+
+    def __init__(self, capacity=MAX_BSSIDS):
+        self.capacity = capacity
+        self._slots = {}  # BSSID -> índice nos arrays
+        self._bssid = [None] * capacity
+        self._ssid = [''] * capacity
+        self._security = [''] * capacity
+        self._count = array.array('L', [0]) * capacity
+        self._mean = array.array('d', [0.0]) * capacity
+        self._m2 = array.array('d', [0.0]) * capacity
+        self._min = array.array('b', [0]) * capacity
+        self._max = array.array('b', [0]) * capacity
+        self._channel = array.array('H', [0]) * capacity
+        self._first_seen = array.array('d', [0.0]) * capacity
+        self._last_seen = array.array('d', [0.0]) * capacity
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _slot(self, bssid):
+        """Vaga do BSSID, liberando a do visto há mais tempo se preciso."""
+        slot = self._slots.get(bssid)
+        if slot is not None:
+            return slot, False
+        if len(self._slots) < self.capacity:
+            slot = len(self._slots)
+        else:
+            slot = min(range(self.capacity), key=self._last_seen.__getitem__)
+            del self._slots[self._bssid[slot]]
+            self.evictions += 1
+        self._slots[bssid] = slot
+        self._bssid[slot] = bssid
+        self._count[slot] = 0
+        self._mean[slot] = 0.0
+        self._m2[slot] = 0.0
+        return slot, True
+
+    def add(self, record, now):
+        """Acumula uma amostra (ScanRecord) vista em now (epoch)."""
+        slot, new = self._slot(record.bssid)
+        signal = max(0, min(int(record.signal), 100))
+        if new:
+            self._first_seen[slot] = now
+            self._min[slot] = signal
+            self._max[slot] = signal
+        else:
+            self._min[slot] = min(self._min[slot], signal)
+            self._max[slot] = max(self._max[slot], signal)
+        # Welford: média e soma dos quadrados dos desvios, sem as amostras
+        count = self._count[slot] + 1
+        delta = signal - self._mean[slot]
+        self._mean[slot] += delta / count
+        self._m2[slot] += delta * (signal - self._mean[slot])
+        self._count[slot] = count
+        self._last_seen[slot] = now
+        self._ssid[slot] = record.ssid
+        self._security[slot] = record.security
+        self._channel[slot] = record.channel if 0 < record.channel <= MAX_CHANNEL else 0
+
+    def row(self, slot):
+        count = self._count[slot]
+        stddev = math.sqrt(self._m2[slot] / (count - 1)) if count > 1 else 0.0
+        return {
+            'bssid': self._bssid[slot],
+            'ssid': self._ssid[slot],
+            'channel': self._channel[slot] or None,
+            'security': self._security[slot],
+            'samples': count,
+            'min': self._min[slot],
+            'mean': round(self._mean[slot], 1),
+            'max': self._max[slot],
+            'stddev': round(stddev, 1),
+            'first_seen': round(self._first_seen[slot], 1),
+            'last_seen': round(self._last_seen[slot], 1),
+        }
+
+    def rows(self):
+        """Todos os BSSIDs, do melhor sinal médio ao pior."""
+        slots = sorted(self._slots.values(), key=self._mean.__getitem__,
+                       reverse=True)
+        return [self.row(slot) for slot in slots]
+
+    def bssids_per_channel(self):
+        """{canal: BSSIDs da tabela nesse canal}"""
+        counts = {}
+        for slot in self._slots.values():
+            channel = self._channel[slot]
+            if channel:
+                counts[channel] = counts.get(channel, 0) + 1
+        return counts
+
+
+class SiteSurvey:
+    """
+    Acumula os scans do WifiScanner enquanto o survey está ligado.
+
+    Leituras (summary, rows, channels, CSV) podem vir de qualquer thread.
+    """
+
+    def __init__(self, scanner, interval=SURVEY_INTERVAL, capacity=MAX_BSSIDS,
+                 on_update=None, clock=time.time):
+        """
+        Args:
+            scanner: WifiScanner que faz os scans
+            interval: Segundos entre scans enquanto o survey roda
+            capacity: BSSIDs acompanhados (memória fixa)
+            on_update: Função chamada (sem argumentos) após cada scan acumulado
+            clock: Relógio dos instantes de primeira/última vez visto (epoch)
+        """
+        self.scanner = scanner
+        self.interval = interval
+        self.capacity = capacity
+        self.on_update = on_update
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._stats = BssidStats(capacity)
+        self._channel_hits = array.array('L', [0]) * (MAX_CHANNEL + 1)
+        self._running = False
+        self._previous_interval = None
+        self._started_at = None
+        self._stopped_at = None
+        self.scans = 0
+        self.samples = 0
+
+    # --- Controle ---
+
+    def start(self, reset=True):
+        """Liga o survey (reset=False continua o anterior)."""
+        with self._lock:
+            if self._running:
+                return self
+            if reset or self._started_at is None:
+                self._stats = BssidStats(self.capacity)
+                self._channel_hits = array.array('L', [0]) * (MAX_CHANNEL + 1)
+                self.scans = 0
+                self.samples = 0
+                self._started_at = self.clock()
+            self._stopped_at = None
+            self._running = True
+        self._previous_interval = self.scanner.interval
+        self.scanner.add_listener(self._on_scan)
+        self.scanner.start()
+        self.scanner.set_periodic(True, self.interval)
+        print("[INFO] Site survey iniciado")
+        return self
+
+    def stop(self):
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._stopped_at = self.clock()
+        self.scanner.remove_listener(self._on_scan)
+        self.scanner.set_periodic(False, self._previous_interval)
+        print(f"[INFO] Site survey parado ({self.scans} scans)")
+
+    @property
+    def running(self):
+        return self._running
+
+    # --- Acúmulo (thread do scanner) ---
+
+    def _on_scan(self, records):
+        now = self.clock()
+        with self._lock:
+            if not self._running:
+                return
+            for record in records:
+                self._stats.add(record, now)
+                if 0 < record.channel <= MAX_CHANNEL:
+                    self._channel_hits[record.channel] += 1
+            self.scans += 1
+            self.samples += len(records)
+        if self.on_update is not None:
+            self.on_update()
+
+    # --- Leituras ---
+
+    def summary(self):
+        with self._lock:
+            end = self._stopped_at if self._stopped_at is not None else self.clock()
+            return {
+                'running': self._running,
+                'duration_s': round(end - self._started_at, 1)
+                if self._started_at is not None else 0,
+                'scans': self.scans,
+                'samples': self.samples,
+                'bssids': len(self._stats),
+                'capacity': self.capacity,
+                'evictions': self._stats.evictions,
+            }
+
+    def rows(self, limit=None):
+        """
+        Estatísticas por BSSID.
+
+        Retorna:
+            list: dicts com os campos de CSV_FIELDS, do melhor sinal médio
+                  ao pior (os limit primeiros)
+        """
+        with self._lock:
+            rows = self._stats.rows()
+        return rows if limit is None else rows[:limit]
+
+    def channels(self):
+        """
+        Congestionamento por canal, do mais ocupado ao menos.
+
+        Retorna:
+            list: [{'channel', 'bssids', 'per_scan'}, ...]: BSSIDs distintos
+                  vistos no canal e média de APs no canal por scan
+        """
+        with self._lock:
+            bssids = self._stats.bssids_per_channel()
+            scans = self.scans
+            hits = {channel: self._channel_hits[channel] for channel in bssids}
+        result = [{'channel': channel, 'bssids': count,
+                   'per_scan': round(hits[channel] / scans, 2) if scans else 0}
+                  for channel, count in bssids.items()]
+        return sorted(result, key=lambda c: (-c['per_scan'], c['channel']))
+
+    def write_csv(self, f):
+        """Escreve uma linha por BSSID (cabeçalho CSV_FIELDS) no arquivo f."""
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(self.rows())
+
+    def to_csv(self):
+        buffer = io.StringIO()
+        self.write_csv(buffer)
+        return buffer.getvalue()
@@ -1,11 +1,314 @@
 # utils/wifi_utils.py
 """
-Funções utilitárias para gerenciar conexões Wi-Fi usando nmcli.
+Funções utilitárias para gerenciar conexões Wi-Fi via NetworkManager.
 Fornece scan de redes, verificação de conexões conhecidas e conexão a redes.
+
+O caminho principal é o cliente D-Bus persistente (utils/nm_dbus.py): uma
+conexão aberta, pontos de acesso em cache e espera por sinais. Sem jeepney
+ou sem acesso ao NetworkManager pelo D-Bus, as mesmas funções usam o nmcli.
 """
 
 import subprocess
+import threading
 import time
+from collections import namedtuple
+
+
+NM_INTERFACE = 'wlan0'
+NM_RETRY_INTERVAL = 30  # Segundos até tentar o D-Bus de novo após falha
+SCAN_TIMEOUT = 10  # Espera máxima pelo fim de um scan (D-Bus)
+CONNECT_TIMEOUT = 60  # Espera máxima pela ativação da conexão (D-Bus)
+
+# Registro de um AP num scan: signal em % (0-100), channel 0 se desconhecido,
+# security '' para rede aberta, seen_at no relógio monotônico
+ScanRecord = namedtuple('ScanRecord', 'ssid bssid signal channel security seen_at')
+
+# Flags do NetworkManager (NM80211ApFlags / NM80211ApSecurityFlags)
+AP_FLAGS_PRIVACY = 0x1
+KEY_MGMT_PSK = 0x100
+KEY_MGMT_802_1X = 0x200
+KEY_MGMT_SAE = 0x400
+
+# Perfil Wi-Fi salvo: name = connection.id, priority = autoconnect-priority,
+# timestamp = último uso (epoch, 0 se nunca), path = caminho D-Bus (None
+# quando lido pelo nmcli)
+Profile = namedtuple('Profile', 'name ssid uuid priority timestamp path')
+
+WIFI_CONNECTION_TYPE = '802-11-wireless'
+
+# BSSID no modo -t do nmcli: 6 octetos com os ':' escapados ('AA\\:BB\\:...')
+_ESCAPED_BSSID_LEN = 6 * 2 + 5 * 2
+
+_nm_client = None
+_nm_retry_at = 0.0
+_nm_lock = threading.Lock()
+
+
+def get_nm_client():
+    """
+    Cliente D-Bus do NetworkManager compartilhado pelo processo.
+
+    Criado na primeira chamada; se falhar, só tenta de novo depois de
+    NM_RETRY_INTERVAL segundos (jeepney ausente: nunca).
+
+    Retorna:
+        NMClient ou None (as funções deste módulo usam o nmcli)
+    """
+    global _nm_client, _nm_retry_at
+    with _nm_lock:
+        if _nm_client is None and time.monotonic() >= _nm_retry_at:
+            try:
+                from .nm_dbus import NMClient
+            except ImportError:
+                print("[INFO] jeepney não instalado, usando nmcli")
+                _nm_retry_at = float('inf')
+                return None
+            try:
+                _nm_client = NMClient(NM_INTERFACE)
+                print("[INFO] NetworkManager conectado via D-Bus")
+            except Exception as e:
+                print(f"[INFO] NetworkManager via D-Bus indisponível ({e}), "
+                      "usando nmcli")
+                _nm_retry_at = time.monotonic() + NM_RETRY_INTERVAL
+        return _nm_client
+
+
+def _drop_nm_client(error):
+    """Descarta o cliente após um erro; a próxima chamada reconecta."""
+    global _nm_client, _nm_retry_at
+    print(f"[ERRO] NetworkManager via D-Bus: {error}")
+    with _nm_lock:
+        client, _nm_client = _nm_client, None
+        _nm_retry_at = time.monotonic() + NM_RETRY_INTERVAL
+    if client is not None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+def parse_ssid_list(output):
+    """
+    Extrai os SSIDs da saída de 'nmcli -t -f SSID device wifi list'.
+
+    Args:
+        output: Texto retornado pelo nmcli
+
+    Retorna:
+        list: SSIDs na ordem do nmcli, sem duplicatas nem vazios
+    """
+    redes = []
+    ja_viu = set()
+
+    for linha in output.strip().split('\n'):
+        ssid = linha.strip()
+        # Evita duplicatas e SSIDs vazios
+        if ssid and ssid not in ja_viu:
+            redes.append(ssid)
+            ja_viu.add(ssid)
+
+    return redes
+
+
+def parse_profiles(output):
+    """
+    Extrai os perfis Wi-Fi de
+    'nmcli -t -f NAME,UUID,TYPE,AUTOCONNECT-PRIORITY,TIMESTAMP connection show'.
+
+    Só o nome pode ter ':' (escapado como '\\:'); o SSID é o próprio nome,
+    já que o nmcli não lista o SSID sem abrir cada perfil.
+
+    Retorna:
+        list: Profile das conexões Wi-Fi, na ordem do nmcli
+    """
+    profiles = []
+    for line in output.splitlines():
+        fields = line.rsplit(':', 4)
+        if len(fields) != 5 or fields[2] != WIFI_CONNECTION_TYPE:
+            continue
+        name, uuid, _, priority, timestamp = fields
+        name = name.replace('\\:', ':')
+        profiles.append(Profile(
+            name, name, uuid,
+            int(priority) if priority.lstrip('-').isdigit() else 0,
+            int(timestamp) if timestamp.isdigit() else 0,
+            None,
+        ))
+    return profiles
+
+
+def profile_from_settings(path, settings):
+    """Profile de um GetSettings do D-Bus (None se não for Wi-Fi)."""
+    connection = settings.get('connection', {})
+    if connection.get('type') != WIFI_CONNECTION_TYPE:
+        return None
+    ssid = bytes(settings.get(WIFI_CONNECTION_TYPE, {}).get('ssid', b''))
+    return Profile(
+        name=connection.get('id', ''),
+        ssid=ssid.decode('utf-8', 'replace'),
+        uuid=connection.get('uuid', ''),
+        priority=connection.get('autoconnect-priority', 0),
+        timestamp=connection.get('timestamp', 0),
+        path=path,
+    )
+
+
+def best_profiles(profiles):
+    """
+    Um perfil por SSID: o de maior prioridade e, no empate, o usado por
+    último (a escolha do próprio NetworkManager ao conectar sozinho).
+
+    Retorna:
+        dict: {ssid: Profile}
+    """
+    best = {}
+    for profile in profiles:
+        current = best.get(profile.ssid)
+        if current is None or ((profile.priority, profile.timestamp) >
+                               (current.priority, current.timestamp)):
+            best[profile.ssid] = profile
+    return best
+
+
+def dbus_profiles(nm):
+    """Perfis Wi-Fi lidos pelo NMClient ({ssid: Profile})."""
+    profiles = (profile_from_settings(path, settings)
+                for path, settings in nm.connection_settings().items())
+    return best_profiles(p for p in profiles if p is not None)
+
+
+def load_profiles():
+    """
+    Lê os perfis Wi-Fi salvos (D-Bus ou nmcli).
+
+    Para consultas repetidas use o ProfileRegistry (utils/wifi_profiles.py),
+    que guarda o resultado até o NetworkManager avisar de uma mudança.
+
+    Retorna:
+        dict: {ssid: Profile}
+
+    Levanta:
+        OSError, subprocess.CalledProcessError: nem D-Bus nem nmcli
+    """
+    nm = get_nm_client()
+    if nm is not None:
+        try:
+            return dbus_profiles(nm)
+        except Exception as e:
+            _drop_nm_client(e)
+
+    output = subprocess.check_output(
+        ["nmcli", "-t", "-f", "NAME,UUID,TYPE,AUTOCONNECT-PRIORITY,TIMESTAMP",
+         "connection", "show"],
+        text=True
+    )
+    return best_profiles(parse_profiles(output))
+
+
+def frequency_to_channel(frequency):
+    """Canal Wi-Fi de uma frequência em MHz (0 se fora das faixas)."""
+    if frequency == 2484:
+        return 14
+    if 2412 <= frequency < 2484:
+        return (frequency - 2407) // 5
+    if 5000 <= frequency < 5900:
+        return (frequency - 5000) // 5
+    if 5955 <= frequency <= 7115:
+        return (frequency - 5950) // 5
+    return 0
+
+
+def ap_security(flags, wpa_flags, rsn_flags):
+    """Segurança resumida de um AP do NetworkManager ('' = aberta)."""
+    if rsn_flags & KEY_MGMT_SAE:
+        return 'WPA3'
+    if rsn_flags & KEY_MGMT_802_1X or wpa_flags & KEY_MGMT_802_1X:
+        return 'WPA-EAP'
+    if rsn_flags:
+        return 'WPA2'
+    if wpa_flags:
+        return 'WPA'
+    if flags & AP_FLAGS_PRIVACY:
+        return 'WEP'
+    return ''
+
+
+def access_point_record(ap, seen_at=None):
+    """ScanRecord de um AccessPoint do NMClient."""
+    return ScanRecord(
+        ssid=ap.ssid,
+        bssid=ap.bssid,
+        signal=ap.strength,
+        channel=frequency_to_channel(ap.frequency),
+        security=ap_security(ap.flags, ap.wpa_flags, ap.rsn_flags),
+        seen_at=time.monotonic() if seen_at is None else seen_at,
+    )
+
+
+def parse_scan_records(output, seen_at=None):
+    """
+    Extrai os APs de 'nmcli -t -f SSID,BSSID,SIGNAL,CHAN,SECURITY device wifi list'.
+
+    No modo -t o nmcli escapa ':' dentro dos campos como '\\:'. Só o SSID
+    pode ter ':' livres; os três últimos campos não têm ':' e o BSSID tem
+    tamanho fixo, então a linha é cortada sem percorrer caractere por
+    caractere.
+
+    Retorna:
+        list: ScanRecord na ordem do nmcli (inclui redes ocultas, ssid '')
+    """
+    seen_at = time.monotonic() if seen_at is None else seen_at
+    records = []
+    for line in output.splitlines():
+        fields = line.rsplit(':', 3)
+        if len(fields) != 4:
+            continue
+        head, signal, channel, security = fields
+        if len(head) < _ESCAPED_BSSID_LEN + 1:
+            continue
+        ssid = head[:-_ESCAPED_BSSID_LEN - 1]
+        records.append(ScanRecord(
+            ssid.replace('\\:', ':') if '\\' in ssid else ssid,
+            head[-_ESCAPED_BSSID_LEN:].replace('\\:', ':'),
+            int(signal) if signal.isdigit() else 0,
+            int(channel) if channel.isdigit() else 0,
+            '' if security in ('', '--') else security.split()[-1],
+            seen_at,
+        ))
+    return records
+
+
+def scan_records(rescan=True):
+    """
+    Scan completo com os dados de cada AP (bloqueia até o fim do scan).
+
+    Args:
+        rescan: Pede um scan novo antes de listar (senão, usa o cache do
+                NetworkManager)
+
+    Retorna:
+        list: ScanRecord (lista vazia em caso de erro)
+    """
+    nm = get_nm_client()
+    if nm is not None:
+        try:
+            if rescan:
+                nm.request_scan(timeout=SCAN_TIMEOUT)
+            now = time.monotonic()
+            return [access_point_record(ap, now) for ap in nm.access_points()]
+        except Exception as e:
+            _drop_nm_client(e)
+
+    try:
+        output = subprocess.check_output(
+            ["sudo", "nmcli", "-t", "-f", "SSID,BSSID,SIGNAL,CHAN,SECURITY",
+             "device", "wifi", "list", "--rescan", "yes" if rescan else "no"],
+            text=True, timeout=30
+        )
+        return parse_scan_records(output)
+    except Exception as e:
+        print(f"Erro ao escanear redes: {e}")
+        return []
 
 
 def scan_wifi_networks():
@@ -15,6 +318,14 @@ def scan_wifi_networks():
     Retorna:
         list: Lista de SSIDs disponíveis (strings)
     """
+    nm = get_nm_client()
+    if nm is not None:
+        try:
+            nm.request_scan(timeout=SCAN_TIMEOUT)
+            return nm.ssids()
+        except Exception as e:
+            _drop_nm_client(e)
+
     try:
         # Força um rescan para garantir lista atualizada
         subprocess.run(["sudo", "nmcli", "dev", "wifi", "rescan"],
@@ -26,17 +337,7 @@ def scan_wifi_networks():
             text=True
         )
 
-        redes = []
-        ja_viu = set()
-
-        for linha in output.strip().split('\n'):
-            ssid = linha.strip()
-            # Evita duplicatas e SSIDs vazios
-            if ssid and ssid not in ja_viu:
-                redes.append(ssid)
-                ja_viu.add(ssid)
-
-        return redes
+        return parse_ssid_list(output)
     except Exception as e:
         print(f"Erro ao escanear redes: {e}")
         return []
@@ -44,27 +345,16 @@ def scan_wifi_networks():
 
 def get_known_wifi_ssids():
     """
-    Obtém lista de redes Wi-Fi já conhecidas (salvas no sistema).
+    Obtém as redes Wi-Fi já conhecidas (salvas no sistema).
+
+    Vem do registro compartilhado de perfis: só lê o NetworkManager de novo
+    depois de um aviso de mudança.
 
     Retorna:
-        list: Lista de SSIDs salvos (strings)
+        frozenset: SSIDs salvos (strings)
     """
-    try:
-        output = subprocess.check_output(
-            ["nmcli", "-t", "-f", "NAME", "connection", "show"],
-            text=True
-        )
-
-        ssids = []
-        for line in output.strip().split("\n"):
-            ssid = line.strip()
-            if ssid:
-                ssids.append(ssid)
-
-        return ssids
-    except Exception as e:
-        print(f"Erro ao obter redes conhecidas: {e}")
-        return []
+    from .wifi_profiles import get_profile_registry
+    return get_profile_registry().ssids()
 
 
 def connect_to_wifi(ssid, senha=None):
@@ -81,13 +371,24 @@ def connect_to_wifi(ssid, senha=None):
     Retorna:
         tuple: (sucesso: bool, mensagem: str)
     """
-    known_ssids = get_known_wifi_ssids()
+    from .wifi_profiles import get_profile_registry
+    profiles = get_profile_registry()
+
+    nm = get_nm_client()
+    if nm is not None:
+        try:
+            return nm.activate(ssid, senha, timeout=CONNECT_TIMEOUT,
+                               known=profiles.paths())
+        except Exception as e:
+            _drop_nm_client(e)
+
+    profile = profiles.get(ssid)
 
     try:
-        if ssid in known_ssids:
+        if profile is not None:
             # Rede já conhecida: ativa conexão salva
             result = subprocess.run(
-                ["sudo", "nmcli", "connection", "up", ssid],
+                ["sudo", "nmcli", "connection", "up", "uuid", profile.uuid],
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -127,6 +428,13 @@ def is_connected_to_network(ssid=None):
     Retorna:
         bool: True se conectado, False caso contrário
     """
+    nm = get_nm_client()
+    if nm is not None:
+        try:
+            return nm.connected() and (ssid is None or nm.active_ssid() == ssid)
+        except Exception as e:
+            _drop_nm_client(e)
+
     try:
         result = subprocess.check_output(
             ["nmcli", "-t", "-f", "STATE", "general"],